@@ -1,25 +1,16 @@
+import importlib
+import logging
+
 import streamlit as st
-import pandas as pd
-from datetime import datetime
-import os
 
-# ==========================
-# 🎯 إعدادات التطبيق الأساسية
-# ==========================
-def setup_application():
-    env_config = {
-        "APP_INFO": {
-            "APP_NAME": "SiraWork سيرا",
-            "VERSION": "v2.0.0",
-            "DESCRIPTION": "منصة توعوية تعليمية لمحاكاة القضايا العمالية"
-        },
-        "FOOTER": {
-            "TEXT": "© 2025 SiraWork سيرا — جميع الحقوق محفوظة"
-        }
-    }
-    return env_config
+from helpers.instrumentation import profile_span
+from helpers.metrics import start_metrics_server, track_current_session
+from helpers.sheet_sync import start_auto_sync
+from helpers.theme_assets import inject_theme_css
+from views import PAGE_MODULES
+from views.profiling import debug_panel_enabled, show_profiling_panel
 
-config = setup_application()
+logger = logging.getLogger(__name__)
 
 # إعداد صفحة Streamlit
 st.set_page_config(
@@ -33,342 +24,9 @@ st.set_page_config(
 # 🎨 التصميم الموحد للمنصة - الوضع المظلم الاحترافي
 # ==========================
 def load_custom_css():
-    st.markdown("""
-    <style>
-    /* التصميم المظلم الاحترافي */
-    .stApp {
-        background-color: #0E1117 !important;
-        color: #FAFAFA !important;
-    }
-    
-    /* تحسينات عامة للنص */
-    .main * {
-        color: #FAFAFA !important;
-    }
-    
-    /* تصميم الهيدر مع الشعار - خلفية داكنة */
-    .header-with-logo {
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        gap: 1.5rem;
-        padding: 1.5rem 0;
-        margin-bottom: 1rem;
-        background: linear-gradient(135deg, #1E3A8A 0%, #0F172A 100%);
-        border-radius: 15px;
-        border: 1px solid #334155;
-    }
-    .logo-container {
-        width: 80px;
-        height: 80px;
-        border-radius: 50%;
-        background: linear-gradient(135deg, #3B82F6 0%, #1D4ED8 100%) !important;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        box-shadow: 0 4px 15px rgba(59, 130, 246, 0.3);
-        border: 3px solid #60A5FA;
-        overflow: hidden;
-    }
-    .logo-img {
-        width: 100%;
-        height: 100%;
-        object-fit: cover;
-        border-radius: 50%;
-    }
-    .platform-name-with-logo {
-        font-size: 2.8rem;
-        font-weight: 800;
-        background: linear-gradient(135deg, #60A5FA 0%, #3B82F6 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0.5rem;
-        line-height: 1.2;
-    }
-    .platform-subtitle {
-        font-size: 1.3rem;
-        color: #CBD5E1 !important;
-        margin-bottom: 1.5rem;
-        font-weight: 400;
-        line-height: 1.4;
-        text-align: center;
-    }
-    
-    /* تصميم البطاقات في الوضع المظلم */
-    .section-card { 
-        background: #1E293B !important;
-        padding: 1.5rem; 
-        border-radius: 12px; 
-        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.3); 
-        margin: 1rem 0; 
-        border: 1px solid #334155;
-        transition: all 0.3s ease;
-    }
-    .section-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(0, 0, 0, 0.4);
-        border-color: #3B82F6;
-    }
-    
-    /* تصميم العناصر في الوضع المظلم */
-    .feature-item {
-        background: #1F2937;
-        padding: 0.8rem;
-        border-radius: 8px;
-        margin: 0.3rem 0;
-        border-right: 4px solid #3B82F6;
-        border-left: 1px solid #374151;
-        border-top: 1px solid #374151;
-        border-bottom: 1px solid #374151;
-        transition: all 0.3s ease;
-    }
-    .feature-item:hover {
-        background: #374151;
-        transform: translateX(4px);
-        border-right-color: #60A5FA;
-    }
-    
-    /* تصميم التنبيهات في الوضع المظلم */
-    .warning-box {
-        background: #451A03;
-        border: 1px solid #92400E;
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 1rem 0;
-        font-size: 0.9rem;
-    }
-    .warning-box h4 {
-        margin: 0 0 0.5rem 0;
-        font-size: 1rem;
-        color: #F59E0B !important;
-    }
-    .warning-box p {
-        margin: 0;
-        font-size: 0.9rem;
-        line-height: 1.4;
-        color: #FBBF24 !important;
-    }
-    
-    /* تصميم التبويبات في الوضع المظلم */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 4px;
-        background: #1E293B;
-        padding: 8px;
-        border-radius: 10px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: #334155 !important;
-        color: #CBD5E1 !important;
-        border-radius: 8px !important;
-        padding: 10px 16px !important;
-        margin: 2px !important;
-        transition: all 0.3s ease;
-        border: 1px solid #475569 !important;
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background: #475569 !important;
-        color: #FFFFFF !important;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #3B82F6 0%, #1D4ED8 100%) !important;
-        color: #FFFFFF !important;
-        border-color: #60A5FA !important;
-        box-shadow: 0 2px 8px rgba(59, 130, 246, 0.4);
-    }
-    
-    /* تصميم الأزرار في الوضع المظلم */
-    .stButton button {
-        background: linear-gradient(135deg, #3B82F6 0%, #1D4ED8 100%) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 8px !important;
-        padding: 10px 20px !important;
-        font-weight: 600 !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .stButton button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(59, 130, 246, 0.4) !important;
-        background: linear-gradient(135deg, #60A5FA 0%, #3B82F6 100%) !important;
-    }
-    
-    /* تصميم المدخلات في الوضع المظلم */
-    .stTextInput input, .stNumberInput input, .stSelectbox select {
-        background: #1E293B !important;
-        color: #FAFAFA !important;
-        border: 1px solid #475569 !important;
-        border-radius: 8px !important;
-    }
-    
-    .stTextInput input:focus, .stNumberInput input:focus, .stSelectbox select:focus {
-        border-color: #3B82F6 !important;
-        box-shadow: 0 0 0 2px rgba(59, 130, 246, 0.2) !important;
-    }
-    
-    /* تصميم الشريط الجانبي في الوضع المظلم */
-    .css-1d391kg, .css-1lcbmhc {
-        background: #1E293B !important;
-    }
-    
-    section[data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #1E293B 0%, #0F172A 100%) !important;
-        border-right: 1px solid #334155 !important;
-    }
-    
-    /* تصميم التذييل */
-    .footer {
-        text-align: center;
-        padding: 1.5rem;
-        color: #94A3B8 !important;
-        margin-top: 2rem;
-        border-top: 1px solid #334155;
-        font-size: 0.9rem;
-        background: #1E293B;
-        border-radius: 10px;
-    }
-    
-    .privacy-highlight {
-        background: #451A03;
-        border: 1px solid #92400E;
-        border-radius: 8px;
-        padding: 0.8rem;
-        margin: 0.3rem 0;
-        font-size: 0.9rem;
-    }
-    
-    /* تحسينات متقدمة للجوال */
-    @media (max-width: 768px) {
-        .header-with-logo {
-            flex-direction: column;
-            gap: 1rem;
-            padding: 1rem 0;
-        }
-        .logo-container {
-            width: 70px;
-            height: 70px;
-        }
-        .platform-name-with-logo {
-            font-size: 2rem !important;
-            line-height: 1.1;
-        }
-        .platform-subtitle {
-            font-size: 1rem !important;
-            line-height: 1.3;
-        }
-        .section-card {
-            padding: 1rem !important;
-            margin: 0.5rem 0 !important;
-        }
-        .warning-box {
-            padding: 0.8rem !important;
-            margin: 0.5rem 0 !important;
-        }
-        .feature-item {
-            padding: 0.6rem !important;
-            margin: 0.2rem 0 !important;
-        }
-        
-        /* تحسينات التبويبات للجوال */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 2px !important;
-            flex-wrap: wrap !important;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            height: auto !important;
-            min-height: 40px !important;
-            white-space: normal !important;
-            font-size: 0.75rem !important;
-            padding: 6px 8px !important;
-            line-height: 1.2 !important;
-            margin: 1px !important;
-            flex: 1 1 auto !important;
-            min-width: 70px !important;
-            text-align: center !important;
-        }
-    }
-    
-    /* تحسينات للشاشات الكبيرة */
-    @media (min-width: 1200px) {
-        .platform-name-with-logo {
-            font-size: 3.2rem;
-        }
-        .platform-subtitle {
-            font-size: 1.4rem;
-        }
-    }
-    
-    /* تحسينات الأدوات التفاعلية */
-    .stProgress > div > div > div > div {
-        background: linear-gradient(90deg, #3B82F6 0%, #60A5FA 100%);
-    }
-    
-    /* تحسينات المتركس والبيانات */
-    .stMetric {
-        background: #1E293B;
-        padding: 15px;
-        border-radius: 10px;
-        border: 1px solid #334155;
-    }
-    
-    /* تحسينات النتائج */
-    .stSuccess {
-        background: #064E3B !important;
-        border: 1px solid #047857 !important;
-        color: #A7F3D0 !important;
-    }
-    
-    .stInfo {
-        background: #1E3A8A !important;
-        border: 1px solid #3B82F6 !important;
-        color: #BFDBFE !important;
-    }
-    
-    .stWarning {
-        background: #451A03 !important;
-        border: 1px solid #92400E !important;
-        color: #FDE68A !important;
-    }
-    
-    .stError {
-        background: #7F1D1D !important;
-        border: 1px solid #DC2626 !important;
-        color: #FECACA !important;
-    }
-    
-    /* تحسينات الخطوط */
-    h1, h2, h3, h4, h5, h6 {
-        font-weight: 700 !important;
-        line-height: 1.3 !important;
-        color: #F8FAFC !important;
-    }
-    
-    p, span, div {
-        color: #E2E8F0 !important;
-    }
-    
-    /* تحسينات الجداول */
-    .dataframe {
-        background: #1E293B !important;
-        color: #E2E8F0 !important;
-    }
-    
-    .dataframe th {
-        background: #334155 !important;
-        color: #F8FAFC !important;
-    }
-    
-    .dataframe td {
-        background: #1E293B !important;
-        color: #E2E8F0 !important;
-        border-color: #475569 !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    """حقن CSS الوضع الحالي من ملفات assets (مصغَّر ومخزن حسب بصمة الملف)"""
+    theme = st.session_state.get("user_preferences", {}).get("theme", "dark")
+    inject_theme_css(theme)
 
 load_custom_css()
 
@@ -441,3912 +99,58 @@ def initialize_session_state():
         if key not in st.session_state:
             st.session_state[key] = value
 
-def show_breadcrumbs(section_name):
-    st.markdown(f"""
-    <div style='
-        background: linear-gradient(135deg, #1E293B 0%, #334155 100%); 
-        padding: 12px 16px; 
-        border-radius: 8px; 
-        margin-bottom: 20px; 
-        border: 1px solid #475569;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-    '>
-        <strong style='color: #60A5FA;'>المسار:</strong> 
-        <span style='color: #CBD5E1;'>الرئيسية ▶ {section_name}</span>
-    </div>
-    """, unsafe_allow_html=True)
-
-def show_metric_card(title, value, subtitle, icon="📊"):
-    """عرض بطاقة متركس بتصميم مظلم"""
-    st.markdown(f"""
-    <div style='
-        background: linear-gradient(135deg, #1E293B 0%, #334155 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        border: 1px solid #475569;
-        text-align: center;
-        margin: 0.5rem;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.2);
-        transition: all 0.3s ease;
-    '>
-        <div style='font-size: 2rem; margin-bottom: 0.5rem;'>{icon}</div>
-        <h3 style='margin: 0; color: #F8FAFC; font-size: 1.8rem;'>{value}</h3>
-        <p style='margin: 0.5rem 0 0 0; color: #94A3B8; font-size: 0.9rem;'>{title}</p>
-        <p style='margin: 0.2rem 0 0 0; color: #CBD5E1; font-size: 0.8rem;'>{subtitle}</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-# ==========================
-# 🏠 الصفحة الرئيسية - النسخة المظلمة
-# ==========================
-def show_home_page():
-    # عنوان المنصة مع الشعار الجديد بالتصميم المظلم
-    st.markdown("""
-    <div class="header-with-logo">
-        <div class="logo-container">
-            <img src="https://particular-yellow-al3ldejxbx.edgeone.app/file_000000003d007230993c051b37edb825.png" 
-                 class="logo-img" 
-                 alt="سيدة العدالة - شعار SiraWork">
-        </div>
-        <div style="text-align: center;">
-            <div class="platform-name-with-logo">SiraWork سيرا</div>
-            <div class="platform-subtitle">منصة توعوية تعليمية لمحاكاة القضايا العمالية</div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # تنويه مهم - مصغر
-    st.markdown("""
-    <div class="warning-box">
-        <h4>⚖️ تنويه هام</h4>
-        <p>منصة توعوية تعليمية - المعلومات مقدمة لأغراض التعلم والمعرفة العامة ولا تغني عن استشارة المختصين.</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # إحصائيات سريعة
-    st.markdown("### 📈 نظرة سريعة على المنصة")
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        show_metric_card("أداة حسابية", "6+", "حاسبات متخصصة", "🧮")
-    
-    with col2:
-        show_metric_card("مادة قانونية", "50+", "مادة قانونية", "⚖️")
-    
-    with col3:
-        show_metric_card("نموذج عقد", "8+", "نماذج جاهزة", "📝")
-    
-    with col4:
-        show_metric_card("دليل بحثي", "20+", "مصدر موثوق", "🔍")
-    
-    # الفئات المستهدفة
-    st.markdown("### 🎯 الفئات المستهدفة")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div class="feature-item">
-            <h4>👷 العمال</h4>
-            <p>تعرف على حقوقك العمالية وكيفية المطالبة بها</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="feature-item">
-            <h4>👔 أصحاب العمل</h4>
-            <p>التزم بالتشريعات والقوانين العمالية</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="feature-item">
-            <h4>🔬 الباحثين</h4>
-            <p>مواد بحثية ومراجع قانونية متخصصة</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # طريقة استخدام المنصة
-    st.markdown("### 📖 طريقة استخدام المنصة")
-    
-    st.markdown("""
-    <div class="section-card">
-        <h4>🚀 كيفية البدء:</h4>
-        <ol>
-            <li><strong>اختر فئتك</strong> من القائمة الجانبية (عامل، صاحب عمل، باحث)</li>
-            <li><strong>انتقل إلى القسم المناسب</strong> لاحتياجاتك</li>
-            <li><strong>استخدم الأدوات المتاحة</strong> في كل قسم</li>
-            <li><strong>اطلع على المعلومات التوعوية</strong> والشرح القانوني</li>
-        </ol>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # المميزات الرئيسية
-    st.markdown("### ✨ المميزات الرئيسية")
-    
-    features = [
-        {"icon": "⚡", "title": "سرعة الأداء", "desc": "تصميم سريع الاستجابة وسهل الاستخدام"},
-        {"icon": "🎨", "title": "واجهة مظلمة", "desc": "تصميم مظلم مريح للعين واحترافي"},
-        {"icon": "📱", "title": "متجاوب", "desc": "يعمل على جميع الأجهزة والشاشات"},
-        {"icon": "🔒", "title": "آمن", "desc": "لا يجمع أو يخزن أي بيانات شخصية"},
-        {"icon": "🆓", "title": "مجاني", "desc": "خدمة مجانية بالكامل بدون أي رسوم"},
-        {"icon": "📚", "title": "شامل", "desc": "يغطي جميع جوانب قانون العمل الأردني"}
-    ]
-    
-    cols = st.columns(3)
-    for idx, feature in enumerate(features):
-        with cols[idx % 3]:
-            st.markdown(f"""
-            <div style='
-                background: #1E293B;
-                padding: 1rem;
-                border-radius: 10px;
-                border: 1px solid #334155;
-                margin: 0.5rem 0;
-                text-align: center;
-                transition: all 0.3s ease;
-            '>
-                <div style='font-size: 2rem; margin-bottom: 0.5rem;'>{feature['icon']}</div>
-                <h4 style='margin: 0.5rem 0; color: #F8FAFC;'>{feature['title']}</h4>
-                <p style='margin: 0; color: #CBD5E1; font-size: 0.9rem;'>{feature['desc']}</p>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # تذييل الصفحة
-    st.markdown(f"""
-    <div class="footer">
-        {config.get("FOOTER", {}).get("TEXT", "© 2025 SiraWork سيرا — جميع الحقوق محفوظة")}
-    </div>
-    """, unsafe_allow_html=True)
-
-# ==========================
-# 👷 قسم العمال - الإصدار المدمج والمكتمل
-# ==========================
-def show_workers_section():
-    show_breadcrumbs("👷 قسم العمال")
-    
-    st.markdown("""
-    <div class="main-header">
-        <h1>👷 منصة حقوق العاملين في الأردن</h1>
-        <p>دليل شامل حسب قانون العمل الأردني رقم 8 لسنة 1996 وتعديلاته</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # شريط المعلومات حسب القانون
-    st.info("""
-    **📢 أحكام قانون العمل الأردني:** 
-    - قانون العمل رقم 8 لسنة 1996 وتعديلاته
-    - آخر تعديل: قانون معدل لقانون العمل
-    """)
-
-    worker_tabs = st.tabs([
-        "📋 الحقوق الأساسية", 
-        "👥 حقوق الفئات الخاصة",
-        "💰 الحقوق المالية",
-        "⏰ وقت العمل والإجازات", 
-        "🛡️ الحماية والسلامة",
-        "🔍 فحص الحقوق",
-        "📝 واجبات العامل"
-    ])
-
-    with worker_tabs[0]:
-        show_enhanced_basic_rights()
-
-    with worker_tabs[1]:
-        show_special_categories_rights()
-
-    with worker_tabs[2]:
-        show_enhanced_financial_rights()
-
-    with worker_tabs[3]:
-        show_enhanced_work_time()
-
-    with worker_tabs[4]:
-        show_enhanced_protection()
-
-    with worker_tabs[5]:
-        show_enhanced_rights_checker()
-        
-    with worker_tabs[6]:
-        show_worker_obligations()
-
 # ==========================
-# 📋 الحقوق الأساسية - مدمج ومكتمل
+# 🗂️ تحميل الصفحات عند الطلب
 # ==========================
-def show_enhanced_basic_rights():
-    st.markdown("#### 📋 الحقوق الأساسية - حسب قانون العمل الأردني")
-    
-    # الحقوق التعاقدية - كاملة من الإضافات
-    contract_expanders = [
-        {
-            "title": "📄 عقد العمل - المادة 13",
-            "content": """
-            **الشروط الإلزامية في العقد:**
-            - ينظم عقد العمل باللغة العربية
-            - على الأقل يحتفظ كل من الطرفين بنسخة منه
-            - يجوز للعامل إثبات حقوقه بجميع طرق الإثبات القانونية إذا لم يحرر العقد كتابة
-            - إذا كان العامل لا يحمل جنسية عربية فينظم نسخة أخرى من العقد بلغة أجنبية معتمدة
-            
-            **أحكام إضافية - المادة 14:**
-            - إذا أبرم عقد العمل لمدة محددة فإنه ينتهي من تلقاء نفسه بانتهاء مدته
-            - إذا استمر طرفاه في تنفيذه بعد انقضاء مدته اعتبر ذلك تجديداً له لمدة غير محدودة
-            - يعتبر العامل الذي يستخدم بانتظام بالقطعة في محل العمل عامل لمدة غير محدودة
-            """
-        },
-        {
-            "title": "⏳ فترة التجربة - المادة 25",
-            "content": """
-            **أحكام فترة التجربة:**
-            - يجوز لصاحب العمل استخدام أي عامل قيد التجربة للتحقق من كفاءته
-            - ألا تزيد مدة التجربة في أي حالة من الحالات على ثلاثة أشهر
-            - ألا يقل أجر العامل قيد التجربة عن الحد الأدنى المقرر للأجور
-            - يحق لصاحب العمل إنهاء استخدام العامل تحت التجربة دون إشعار أو مكافأة خلال هذه التجربة
-            - إذا استمر العامل في عمله بعد انتهاء هذه التجربة اعتبر العقد عقد عمل لمدة غير محدودة
-            """
-        },
-        {
-            "title": "🔄 إنهاء عقد العمل - المواد 28-30",
-            "content": """
-            **أسباب الفصل القانوني - المادة 28:**
-            - إذا انتحل العامل شخصية أو هوية غيره أو قدم شهادات أو وثائق مزورة
-            - إذا لم يقم العامل بالوفاء بالالتزامات المترتبة عليه بموجب عقد العمل
-            - إذا ارتكب العامل خطأ نشأ عنه خسارة مادية جسيمة لصاحب العمل
-            - إذا خالف العامل النظام الداخلي للمؤسسة بما في ذلك شروط سلامة العمل مرتين بعد إنذاره كتابياً
-            
-            **إنهاء العقد غير المحدد المدة - المادة 29:**
-            - إذا رغب أحد الطرفين في إنهاء عقد العمل غير المحدد المدة فيترتب عليه إشعار الطرف الآخر خطياً
-            - قبل شهر واحد على الأقل من التاريخ المحدد للإنهاء
-            - يبقى عقد العمل ساري المفعول طوال مدة الإشعار وتعتبر مدة الإشعار من مدة الخدمة
-            
-            **🚫 حالات عدم جواز الفصل - المادة 30:**
-            - المرأة العاملة الحامل ابتداء من الشهر السادس من حملها أو خلال إجازة الأمومة
-            - العامل المؤدي خدمة العلم أو الخدمة الاجتماعية في أثناء قيامه بتلك الخدمة
-            - العامل في أثناء إجازته السنوية أو المرضية
-            - العامل في أثناء إجازته الممنوحة له لأغراض التثقيف العمالي أو الحج
-            """
-        },
-        {
-            "title": "🔧 تغيير طبيعة العمل - المادة 15",
-            "content": """
-            **تغيير طبيعة العمل:**
-            - لا يلزم العامل بالقيام بعمل يختلف اختلافاً بيناً عن طبيعة العمل المتفق عليه في عقد العمل
-            - إلا إذا دعت الضرورة إلى ذلك لوقوع حادث أو لصالح ما نجم عنه أو في حالة القوة القاهرة
-            - يجب أن يكون ذلك في حدود طاقة العامل وفي حدود العرف الذي أقدم على هذا العمل
-            """
-        },
-        {
-            "title": "📍 تغيير مكان العمل - المادة 16",
-            "content": """
-            **تغيير مكان العمل:**
-            - لا يلزم العامل بالعمل في مكان غير المكان المخصص لعمله إذا أدى ذلك إلى تغيير مكان إقامته
-            - إلا إذا ورد نص صريح يجيز ذلك في عقد العمل
-            - يحق للعامل رفض النقل إذا كان سيتسبب في تغيير محل إقامته الدائم
-            """
-        }
-    ]
-    
-    for expander in contract_expanders:
-        with st.expander(expander["title"], expanded=False):
-            st.markdown(expander["content"])
-    
-    # إضافة مواد جديدة حول التفتيش والرقابة من الإضافات
-    st.markdown("##### 🔍 التفتيش والرقابة - المواد 5-10")
-    
-    inspection_rights = [
-        {
-            "title": "صلاحيات مفتش العمل - المادة 7",
-            "content": """
-            **صلاحيات مفتش العمل:**
-            - يمارس مفتش العمل أثناء قيامه بوظيفته الصلاحيات المخولة لأفراد الضابطة العدلية
-            - للمفتش الطلب من صاحب العمل إزالة المخالفة خلال مدة لا تزيد على سبعة أيام
-            - في حالة التخلف فللوزير أن يقرر إغلاق المؤسسة لحين إزالة المخالفة
-            - تحكم المحكمة على المخالف بإزالة المخالفة وبغرامة لا تقل عن خمسين ديناراً ولا تزيد على خمسمائة دينار
-            """
-        },
-        {
-            "title": "واجبات صاحب العمل - المادة 8",
-            "content": """
-            **الواجبات الإلزامية:**
-            - إرسال إشعار إلى الوزارة يتضمن عدد العمال وموقع عمل كل منهم وطبيعة عمله
-            - الاحتفاظ في المؤسسة بالسجلات الواجب عليه الاحتفاظ بها بما في ذلك سجلات العمل والمتدربين
-            - تقديم البيانات والمعلومات التي تطلبها الوزارة بشكل دوري
-            """
-        }
-    ]
-    
-    for right in inspection_rights:
-        with st.expander(f"🔍 {right['title']}"):
-            st.write(right['content'])
-    
-    # الحقوق الأساسية الأخرى من الأساسي
-    st.markdown("##### 🛡️ حقوق أساسية أخرى")
-    
-    basic_rights = [
-        {
-            "title": "الحقوق المكتسبة - المادة 4",
-            "content": "لا تؤثر أحكام هذا القانون على أي حق من الحقوق التي يمنحها للعامل أي قانون آخر أو عقد عمل إذا كان أي منها يرتب للعامل حقوقاً أفضل من الحقوق المقررة له بموجب أحكام هذا القانون"
-        },
-        {
-            "title": "تسليم شهادة الخدمة - المادة 31",
-            "content": "على صاحب العمل أن يورد للعامل عند انتهاء خدمته بناء على طلبه شهادة خدمة يذكر فيها اسم العامل ونوع عمله وتاريخ الالتحاق بالخدمة وتاريخ انتهاء الخدمة"
-        }
-    ]
-    
-    for right in basic_rights:
-        with st.expander(f"🛡️ {right['title']}"):
-            st.write(right['content'])
+def load_page_handler(page_id):
+    """دالة عرض الصفحة من وحدتها في views (تبقى الوحدة محمّلة في الذاكرة بعد أول استيراد)"""
+    module_name, function_name = PAGE_MODULES.get(page_id, PAGE_MODULES["home"])
+    return getattr(importlib.import_module(module_name), function_name)
 
 # ==========================
-# 👥 حقوق الفئات الخاصة - مدمج من الأساسي
+# 🚀 التشغيل الرئيسي للتطبيق
 # ==========================
-def show_special_categories_rights():
-    st.markdown("#### 👥 حقوق الفئات الخاصة - حسب قانون العمل الأردني")
-    
-    special_categories = st.tabs([
-        "👩 المرأة العاملة", 
-        "👦 العمال الأحداث", 
-        "🌍 غير الأردنيين",
-        "♿ ذوو الإعاقة"
-    ])
-    
-    with special_categories[0]:
-        st.markdown("**👩 حقوق المرأة العاملة**")
-        
-        women_rights = [
-            {
-                "title": "إجازة الأمومة - المادة 70",
-                "details": "عشرة أسابيع مدفوعة الأجر، على أن لا تقل المدة التي تقع بعد الوضع عن ستة أسابيع",
-                "conditions": "تشمل جميع العاملات بغض النظر عن مدة الخدمة"
-            },
-            {
-                "title": "الحماية من الفصل - المادة 71", 
-                "details": "يحظر فصل العاملة بسبب الحمل أو أثناء إجازة الأمومة",
-                "conditions": "الفصل خلال هذه الفترة يعتبر تعسفياً وباطلاً"
-            },
-            {
-                "title": "ساعات الرضاعة - المادة 72",
-                "details": "ساعة واحدة يومياً لرعاية الطفل لمدة عام من تاريخ الولادة",
-                "conditions": "يمكن تجميع هذه الساعات وتحويلها لإجازة"
-            }
-        ]
-        
-        for right in women_rights:
-            with st.expander(f"👩 {right['title']}"):
-                st.write(f"**التفاصيل:** {right['details']}")
-                st.write(f"**الشروط:** {right['conditions']}")
-                
-    with special_categories[1]:
-        st.markdown("**👦 حماية الأحداث - المواد 73-76**")
-        
-        youth_protections = [
-            {
-                "title": "الحد الأدنى للسن - المادة 73",
-                "details": "يجب ألا يقل سن الحدث عن ست عشرة سنة ميلادية",
-                "conditions": "يستثنى من ذلك بعض الأعمال الخفيفة غير المضرة بشروط"
-            },
-            {
-                "title": "ساعات العمل - المادة 74",
-                "details": "لا يجوز تشغيل الحدث أكثر من ست ساعات يومياً",
-                "conditions": "يجب أن تتخلل ساعات العمل فترة أو أكثر للراحة لا تقل في مجموعها عن ساعة واحدة"
-            },
-            {
-                "title": "العمل الليلي - المادة 75",
-                "details": "يحظر تشغيل الأحداث بين الساعة الثامنة مساءً والسادسة صباحاً",
-                "conditions": "يشمل ذلك العمل في المقاهي والمطاعم ليلاً"
-            }
-        ]
-        
-        for protection in youth_protections:
-            with st.expander(f"👦 {protection['title']}"):
-                st.write(f"**التفاصيل:** {protection['details']}")
-                st.write(f"**الشروط:** {protection['conditions']}")
-                
-    with special_categories[2]:
-        st.markdown("**🌍 حقوق العمال غير الأردنيين - المواد 12-14**")
-        
-        foreign_workers = [
-            {
-                "title": "ترخيص العمل - المادة 12",
-                "details": "لا يجوز استخدام أي عامل غير أردني إلا بموافقة الوزير أو من يفوضه",
-                "conditions": "يشترط أن يتطلب العمل خبرة وكفاءة غير متوافرة لدى العمال الأردنيين"
-            },
-            {
-                "title": "تصريح العمل - المادة 13",
-                "details": "يجب أن يحصل العامل غير الأردني على تصريح عمل من الوزير أو من يفوضه قبل استخدامه",
-                "conditions": "يكون مدته سنة أو جزءاً من السنة ما لم يقرر الوزير أن تكون مدته سنتين"
-            }
-        ]
-        
-        for right in foreign_workers:
-            with st.expander(f"🌍 {right['title']}"):
-                st.write(f"**التفاصيل:** {right['details']}")
-                st.write(f"**الشروط:** {right['conditions']}")
-                
-    with special_categories[3]:
-        st.markdown("**♿ حقوق ذوي الإعاقة - المادة 14 مكرر**")
-        
-        disability_rights = [
-            {
-                "title": "توفير فرص العمل - المادة 14 مكرر",
-                "details": "على صاحب العمل أن يشغل من العمال ذوي الإعاقة النسبة المحددة في قانون حقوق الأشخاص ذوي الإعاقة النافذ",
-                "conditions": "وفق الشروط الواردة فيه وإن يرسل الى الوزارة بياناً يحدد فيه الأعمال التي يشغلها ذوو الإعاقة وأجر كل منهم"
-            }
-        ]
-        
-        for right in disability_rights:
-            with st.expander(f"♿ {right['title']}"):
-                st.write(f"**التفاصيل:** {right['details']}")
-                st.write(f"**الشروط:** {right['conditions']}")
+def main():
+    try:
+        # تهيئة حالة الجلسة
+        initialize_session_state()
 
-# ==========================
-# 💰 الحقوق المالية - مدمج ومكتمل
-# ==========================
-def show_enhanced_financial_rights():
-    st.markdown("#### 💰 النظام المالي للعاملين - حسب قانون العمل الأردني")
-    
-    financial_tabs = st.tabs(["الأجور والرواتب", "المكافآت والحوافز", "الاستقطاعات", "الحماية المالية"])
-    
-    with financial_tabs[0]:
-        st.markdown("##### 💵 نظام الأجور والرواتب")
-        
-        salary_structure = [
-            {
-                "component": "الأجر - المادة 2",
-                "description": "كل ما يستحقه العامل لقاء عمله نقداً أو عيناً مضافاً إليه سائر الاستحقاقات الأخرى",
-                "details": "باستثناء الأمور المستحقة عن العمل الإضافي"
-            },
-            {
-                "component": "التمييز في الأجر - المادة 2",
-                "description": "عدم المساواة بين العاملين في الأجر عن كل عمل ذي قيمة متساوية دون أي تمييز قائم على الجنس",
-                "details": "يحظر التمييز في الأجر بين الجنسين عن العمل متساوي القيمة"
-            },
-            {
-                "component": "تحديد الأجر - المادة 47",
-                "description": "يحدد مقدار الأجر في العقد وإذا لم ينص عقد العمل عليه فيأخذ العامل الأجر المقدر لعمل من نفس النوع",
-                "details": "إذا لم يوجد تقدر المحكمة الأجر بمقتضى أحكام هذا القانون باعتباره نزاعاً عمالياً على الأجر"
-            }
-        ]
-        
-        for item in salary_structure:
-            with st.expander(f"💰 {item['component']}"):
-                st.write(f"**الوصف:** {item['description']}")
-                st.write(f"**التفاصيل:** {item['details']}")
-        
-        st.markdown("##### ⏰ مواعيد صرف الرواتب - المادة 55")
-        st.info("""
-        **المادة 55:** 
-        - يدفع الأجر وبدل العمل الإضافي خلال مدة لا تزيد على سبعة أيام من تاريخ استحقاقه
-        - لا يجوز لصاحب العمل حسم أي جزء منها إلا في الحالات التي يجيزها القانون
-        """)
-    
-    with financial_tabs[1]:
-        st.markdown("##### 🎁 نظام المكافآت والحوافز")
-        
-        bonus_types = [
-            {
-                "type": "مكافأة نهاية الخدمة - المادة 33",
-                "calculation": "تحسب على أساس آخر أجر تقاضاه العامل",
-                "details": """
-                **طريقة الحساب:**
-                - للعامل غير الخاضع لأحكام قانون الضمان الاجتماعي الذي تنتهي خدمته يحق الحصول على مكافأة نهاية الخدمة
-                - تعادل آخر أجر شهرين عن كل سنة من خدمته الفعلية
-                - تحتسب كسور السنة مكافأة نسبية
-                - إذا كان الأجر كله أو بعضه يحسب على أساس العمولة أو القطعة فيعتمد لحساب المكافأة المتوسط الشهري لما تقاضاه العامل فعلاً
-                """
-            },
-            {
-                "type": "بدل العمل الإضافي - المادة 54",
-                "calculation": "125% من الأجر المعتاد",
-                "details": """
-                **الشروط:**
-                - يجوز تشغيل العامل بموافقته أكثر من ساعات العمل اليومية أو الأسبوعية
-                - يتقاضي العامل عن ساعة العمل الإضافية أجراً لا يقل عن 25% من أجره المعتاد
-                - إذا اشتغل العامل في يوم عطلته الأسبوعية يتقاضى أجراً إضافياً لا يقل عن 50% من أجره المعتاد
-                """
-            }
-        ]
-        
-        for bonus in bonus_types:
-            with st.expander(f"🎁 {bonus['type']}"):
-                st.write(f"**طريقة الحساب:** {bonus['calculation']}")
-                st.markdown(bonus['details'])
-    
-    with financial_tabs[2]:
-        st.markdown("##### 💸 الاستقطاعات المسموحة - المادة 56")
-        
-        deductions = [
-            "استرداد ما قدم صاحب العمل من سلف للعامل بحيث لا يزيد كل قسط يتم استرداده على 10% من الأجر",
-            "استرداد أي مبلغ دفع للعامل زيادة على استحقاقه",
-            "اشتراكات الضمان الاجتماعي وأقساطها المستحقة على العامل",
-            "الغرامات التي تفرض على العامل بسبب مخالفته أحكام النظام الداخلي للمؤسسة أو عقد العمل",
-            "كل دين يستوفى تنفيذاً لحكم قضائي"
-        ]
-        
-        st.write("**الاستقطاعات القانونية:**")
-        for deduction in deductions:
-            st.write(f"📋 {deduction}")
-    
-    with financial_tabs[3]:
-        st.markdown("##### 🛡️ الحماية المالية - المواد 57-58")
-        
-        financial_protections = [
-            {
-                "title": "امتياز الأجور - المادة 57",
-                "content": """
-                **الحماية القانونية للأجور:**
-                - تعتبر الأجور والمبالغ المستحقة بموجب أحكام هذا القانون للعامل أو ورثته ديواناً مفضلاً امتيازاً عاماً
-                - في حالة إفلاس صاحب العمل يدفع المصفي للعامل أو لورثته فوراً ما يعادل أجر شهر واحد
-                - يتم الدفع قبل تسديد أي مصروفات أخرى بما في ذلك المصروفات القضائية
-                """
-            },
-            {
-                "title": "الحد الأدنى للأجور - المادة 58",
-                "content": """
-                **تحديد الحد الأدنى للأجور:**
-                - تشكل لجنة ثلاثية لتحديد الحد الأدنى للأجور بصورة عامة أو بالنسبة لمنطقة أو لمهنة معينة
-                - يؤخذ بعين الاعتبار مؤشرات تكاليف المعيشة التي تصدرها الجهات الرسمية المختصة
-                - يعاقب صاحب العمل بغرامة عن كل حالة يدفع فيها إلى عامل أجراً يقل عن الحد الأدنى للأجور
-                """
-            }
-        ]
-        
-        for protection in financial_protections:
-            with st.expander(f"🛡️ {protection['title']}"):
-                st.markdown(protection['content'])
+        # المزامنة الخلفية لمصدر البيانات (لا تنتظر الشبكة)
+        start_auto_sync()
 
-# ==========================
-# ⏰ وقت العمل والإجازات - مدمج ومكتمل
-# ==========================
-def show_enhanced_work_time():
-    st.markdown("#### ⏰ نظام وقت العمل والإجازات - حسب قانون العمل الأردني")
-    
-    time_tabs = st.tabs(["ساعات العمل", "الإجازات السنوية", "الإجازات الخاصة", "الإجازات الدينية"])
-    
-    with time_tabs[0]:
-        st.markdown("##### 🕒 نظام ساعات العمل - المواد 51-54")
-        
-        work_systems = [
-            {
-                "system": "ساعات العمل العادية - المادة 51",
-                "hours": "8 ساعات يومياً أو 48 ساعة أسبوعياً",
-                "breaks": "لا يحسب منها الوقت المخصص لتناول الطعام والراحة",
-                "details": "يجوز توزيع الحد الأقصى لساعات العمل الأسبوعية وفترات الراحة بحيث لا يزيد مجموعها على إحدى عشرة ساعة في اليوم"
-            },
-            {
-                "system": "العمل الإضافي - المادة 52",
-                "hours": "يجوز لصاحب العمل تشغيل العامل أكثر من ساعات العمل اليومية أو الأسبوعية",
-                "breaks": "يتقاضي العامل في أي من هذه الحالات الأجر الإضافي المنصوص عليه",
-                "details": "يشمل أعمال الجرد السنوي وأعمال منع الخسائر في البضائع مع عدم تجاوز 30 يوماً في السنة"
-            },
-            {
-                "system": "العطلة الأسبوعية - المادة 55",
-                "hours": "يوم الجمعة من كل أسبوع يوم العطلة الأسبوعية للعامل",
-                "breaks": "إلا إذا اقتضت طبيعة العمل غير ذلك",
-                "details": "يجوز للعامل بموافقة صاحب العمل جمع أيام عطلة الأسبوعية والحصول عليها خلال مدة لا تزيد على شهر"
-            }
-        ]
+        # خادم مقاييس Prometheus المحلي (مرة واحدة لكل عملية) وعدّ الجلسات النشطة
+        start_metrics_server()
+        track_current_session()
         
-        for system in work_systems:
-            with st.expander(f"🕒 {system['system']}"):
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write(f"**الساعات:** {system['hours']}")
-                    st.write(f"**فترات الراحة:** {system['breaks']}")
-                with col2:
-                    st.write(f"**التفاصيل:** {system['details']}")
-    
-    with time_tabs[1]:
-        st.markdown("##### 🌴 الإجازة السنوية - المواد 57-60")
+        # عرض القائمة الجانبية
+        show_sidebar_navigation()
         
-        vacation_data = {
-            "أقل من 5 سنوات": {"days": 14, "law": "المادة 57"},
-            "5 سنوات فأكثر": {"days": 21, "law": "المادة 57"}
-        }
+        # الحصول على المعالج المناسب للصفحة (تُستورد وحدته عند أول انتقال فقط)
+        # وتنفيذها مع قياس زمن الجدار والمعالج وذروة الذاكرة (helpers.instrumentation)
+        current_page = st.session_state.selected_page
+        with profile_span(f"page:{current_page}"):
+            page_handler = load_page_handler(current_page)
+            page_handler()
         
-        for service, info in vacation_data.items():
-            col1, col2 = st.columns([2,1])
-            with col1:
-                st.metric(f"الإجازة لـ {service}", f"{info['days']} يوم")
-            with col2:
-                st.write(f"**{info['law']}**")
+    except Exception:
+        # معالجة الأخطاء (تُسجَّل مع التتبع في سجل الخادم ويُحسب الخطأ على الصفحة في القياس)
+        logger.exception("خطأ في عرض الصفحة %s", st.session_state.get("selected_page"))
+        st.error("""
+        ## ⚠️ حدث خطأ غير متوقع
         
-        st.info("""
-        **أحكام الإجازة السنوية - المواد 58-60:**
-        - لا تحسب أيام العطل الرسمية والأعياد الدينية وأيام العطلة الأسبوعية من الإجازة السنوية
-        - إذا لم تبلغ مدة خدمة العامل السنة فيحق له الحصول على إجازة بأجر بنسبة المدة التي عمل خلالها
-        - يجوز تأجيل إجازة العامل عن أي سنة بالاتفاق بين العامل وصاحب العمل إلى السنة التالية
-        - إذا انتهت خدمة العامل قبل أن يستعمل إجازته السنوية فيحق له تقاضي الأجر عن الأيام التي لم يستعملها
+        نعتذر عن هذا الخطأ. يرجى:
+        1. تحديث الصفحة
+        2. التأكد من اتصال الإنترنت
+        3. التواصل مع الدعم إذا استمرت المشكلة
         """)
-    
-    with time_tabs[2]:
-        st.markdown("##### 🏥 الإجازات الخاصة والطارئة")
-        
-        special_leaves = [
-            {
-                "type": "الإجازة المرضية - المادة 68",
-                "duration": "14 يوماً خلال السنة الواحدة بأجر كامل",
-                "conditions": "بناء على تقرير من الطبيب المعتمد من قبل المؤسسة",
-                "law": "المادة 68"
-            },
-            {
-                "type": "إجازة الأمومة - المادة 70",
-                "duration": "10 أسابيع مدفوعة الأجر",
-                "conditions": "على أن لا تقل المدة التي تقع بعد الوضع عن 6 أسابيع",
-                "law": "المادة 70"
-            },
-            {
-                "type": "الإجازات الإضافية - المادة 71",
-                "duration": "14 يوماً في السنة مدفوعة الأجر",
-                "conditions": "للتحاق بدورة للثقافة العمالية أو أداء فريضة الحج أو الدراسة",
-                "law": "المادة 71"
-            }
-        ]
-        
-        for leave in special_leaves:
-            with st.expander(f"🏥 {leave['type']}"):
-                st.write(f"**المدة:** {leave['duration']}")
-                st.write(f"**الشروط:** {leave['conditions']}")
-                st.write(f"**القانون:** {leave['law']}")
-    
-    with time_tabs[3]:
-        st.markdown("##### 🕌 الإجازات الدينية والرسمية - المادة 54")
-        
-        religious_leaves = [
-            {
-                "type": "العمل في أيام العطل",
-                "details": "إذا اشتغل العامل في يوم عطلته الأسبوعية أو أيام الأعياد الدينية أو العطل الرسمية يتقاضى لقاء عمله عن ذلك اليوم أجراً إضافياً لا يقل عن 50% من أجره المعتاد",
-                "law": "المادة 54"
-            },
-            {
-                "type": "إجازة الحج",
-                "details": "يحق للعامل الحصول على إجازة مدفوعة الأجر لأداء فريضة الحج بشرط أن يكون قد عمل مدة خمس سنوات متواصلة على الأقل",
-                "law": "المادة 71"
-            }
-        ]
-        
-        for leave in religious_leaves:
-            with st.expander(f"🕌 {leave['type']}"):
-                st.write(f"**التفاصيل:** {leave['details']}")
-                st.write(f"**القانون:** {leave['law']}")
-
-# ==========================
-# 🛡️ الحماية والسلامة - مدمج من الأساسي
-# ==========================
-def show_enhanced_protection():
-    st.markdown("#### 🛡️ نظام الحماية والسلامة - حسب قانون العمل الأردني")
-    
-    protection_tabs = st.tabs(["السلامة المهنية", "الصحة المهنية", "الحماية الاجتماعية"])
-    
-    with protection_tabs[0]:
-        st.markdown("##### 🦺 السلامة والصحة المهنية - المواد 79-83")
-        
-        safety_obligations = [
-            {
-                "obligation": "توفير بيئة عمل آمنة - المادة 79",
-                "details": "توفير الاحتياطات والتدابير اللازمة لحماية العمال من الأخطار والأمراض التي قد تنجم عن العمل وعن الآلات المستعملة فيه",
-                "law": "المادة 79"
-            },
-            {
-                "obligation": "وسائل الحماية الشخصية - المادة 80",
-                "details": "توفير وسائل الحماية الشخصية والوقاية للعاملين من خلال العمل وأمراض المهنة كالملابس والنظارات والوقايات والأحذية وغيرها وإرشادهم إلى طريقة استعمالها والمحافظة عليها وعلى نظافتها",
-                "law": "المادة 80"
-            }
-        ]
-        
-        for obligation in safety_obligations:
-            with st.expander(f"🛡️ {obligation['obligation']}"):
-                st.write(f"**التفاصيل:** {obligation['details']}")
-                st.write(f"**القانون:** {obligation['law']}")
-    
-    with protection_tabs[1]:
-        st.markdown("##### 🏥 الصحة المهنية - المواد 81-85")
-        
-        health_obligations = [
-            {
-                "obligation": "الفحوصات الطبية - المادة 81",
-                "details": "إخضاع العامل للفحوصات الطبية التي تقتضي طبيعة العمل ضرورة إجراؤها قبل الالتحاق بالعمل أو بعد ذلك للتحقق من خلوه من الأمراض المعدية والسارية",
-                "law": "المادة 81"
-            },
-            {
-                "obligation": "الوقاية من المواد الخطرة - المادة 83",
-                "details": "اتخاذ الاحتياطات اللازمة لحماية المؤسسة والعاملين فيها من أخطار الحريق والانفجارات أو تخزين المواد الخطرة القابلة للاشتعال أو نقلها أو تداولها وتوفير الوسائل والأجهزة الفنية الكافية",
-                "law": "المادة 83"
-            }
-        ]
-        
-        for obligation in health_obligations:
-            with st.expander(f"🏥 {obligation['obligation']}"):
-                st.write(f"**التفاصيل:** {obligation['details']}")
-                st.write(f"**القانون:** {obligation['law']}")
-    
-    with protection_tabs[2]:
-        st.markdown("##### 🤝 الحماية الاجتماعية - المواد 86-96")
-        
-        social_protections = [
-            {
-                "obligation": "تعويض إصابات العمل - المادة 86",
-                "details": "إذا أصيب عامل بإصابة عمل أدت إلى وفاته أو ألحقت به ضرراً جسمانياً حال دون استمراره في العمل فعلى صاحب العمل نقل المصاب إلى مستشفى أو أي مركز طبي وتبليغ الجهات الأمنية المختصة بالحادث",
-                "law": "المادة 86"
-            },
-            {
-                "obligation": "مقدار التعويض - المادة 87",
-                "details": "إذا نشأ عن إصابة العمل وفاة العامل أو عجزه الكلي فيستحق على صاحب العمل تعويض يساوي أجر 1500 يوم عمل على أن لا يتجاوز التعويض خمسة آلاف دينار ولا يقل عن ألفي دينار",
-                "law": "المادة 87"
-            }
-        ]
-        
-        for protection in social_protections:
-            with st.expander(f"🤝 {protection['obligation']}"):
-                st.write(f"**التفاصيل:** {protection['details']}")
-                st.write(f"**القانون:** {protection['law']}")
-
-# ==========================
-# 🔍 فحص الحقوق - مدمج ومكتمل
-# ==========================
-def show_enhanced_rights_checker():
-    st.markdown("#### 🔍 المنظومة الشاملة لفحص الحقوق - كاملة")
-    
-    checker_tabs = st.tabs(["الفحص الشامل", "فحص المرأة", "فحص الأحداث", "فحص العقود", "فحص الأجور"])
-    
-    with checker_tabs[0]:
-        st.markdown("##### ⚡ الفحص الفوري الشامل للحقوق")
-        
-        comprehensive_checks = [
-            "هل فترة التجربة لا تتجاوز 3 أشهر؟ - المادة 25",
-            "هل يصرف راتبك خلال 7 أيام من نهاية الشهر؟ - المادة 55",
-            "هل تحصل على إجازتك السنوية كاملة حسب مدة خدمتك؟ - المادة 57",
-            "هل يوجد عقد عمل مكتوب وموقع من الطرفين؟ - المادة 13",
-            "هل توجد بيئة عمل آمنة وخالية من المخاطر؟ - المادة 79",
-            "هل تحصل على بدل العمل الإضافي (125%)؟ - المادة 54",
-            "هل يتم خصم تأمينات اجتماعية من راتبك؟ - المادة 56",
-            "هل تحصل على إجازة مرضية مدفوعة الأجر؟ - المادة 68",
-            "هل يتم إشعارك قبل الفصل بشهر على الأقل؟ - المادة 29",
-            "هل تحصل على شهادة خدمة عند انتهاء العقد؟ - المادة 31"
-        ]
-        
-        violations = 0
-        results = []
-        
-        for i, check in enumerate(comprehensive_checks):
-            col1, col2, col3 = st.columns([3, 1, 1])
-            with col1:
-                st.write(f"{i+1}. {check}")
-            with col2:
-                answer = st.selectbox("", ["نعم", "لا"], key=f"comp_{i}", label_visibility="collapsed")
-            with col3:
-                if answer == "لا":
-                    violations += 1
-                    st.error("⚠️")
-                    results.append(f"انتهاك: {check}")
-                else:
-                    st.success("✅")
-        
-        st.metric("إجمالي الانتهاكات المحتملة", violations)
-        
-        if violations > 0:
-            st.error(f"🚨 هناك {violations} انتهاكات محتملة تحتاج متابعة فورية")
-            with st.expander("تفاصيل الانتهاكات"):
-                for result in results:
-                    st.write(f"• {result}")
-        else:
-            st.success("✅ ممتاز! لا توجد انتهاكات واضحة - بيئة عمل متوافقة مع القانون")
-    
-    with checker_tabs[1]:
-        st.markdown("##### 👩 فحص حقوق المرأة العاملة")
-        
-        women_checks = [
-            "هل تحصل على إجازة أمومة 10 أسابيع؟ - المادة 70",
-            "هل تحصل على ساعة رضاعة يومية لمدة عام؟ - المادة 72", 
-            "هل يتم حمايتك من الفصل بسبب الحمل أو الأمومة؟ - المادة 71",
-            "هل تتساوى أجورك مع الرجل في العمل متساوي القيمة؟ - المادة 2",
-            "هل يحظر تشغيلك في أعمال شاقة أو خطرة؟ - المادة 73"
-        ]
-        
-        women_violations = 0
-        for i, check in enumerate(women_checks):
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                st.write(f"{i+1}. {check}")
-            with col2:
-                answer = st.selectbox("", ["نعم", "لا"], key=f"women_{i}", label_visibility="collapsed")
-                if answer == "لا":
-                    women_violations += 1
-        
-        st.metric("انتهاكات حقوق المرأة", women_violations)
-        
-        if women_violations > 0:
-            st.warning("يجب التواصل مع مكتب تفتيش العمل المختص")
-    
-    with checker_tabs[2]:
-        st.markdown("##### 👦 فحص حقوق الأحداث")
-        
-        youth_checks = [
-            "هل عمرك 16 سنة أو أكثر؟ - المادة 73",
-            "هل ساعات العمل لا تتجاوز 6 ساعات يومياً؟ - المادة 74",
-            "هل لا تعمل بين الساعة 8 مساءً و6 صباحاً؟ - المادة 75",
-            "هل تحصل على فحوصات طبية دورية؟ - المادة 73",
-            "هل يتم توفير وسائل الحماية الشخصية لك؟ - المادة 80"
-        ]
-        
-        youth_violations = 0
-        for i, check in enumerate(youth_checks):
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                st.write(f"{i+1}. {check}")
-            with col2:
-                answer = st.selectbox("", ["نعم", "لا"], key=f"youth_{i}", label_visibility="collapsed")
-                if answer == "لا":
-                    youth_violations += 1
-        
-        st.metric("انتهاكات حقوق الأحداث", youth_violations)
-    
-    with checker_tabs[3]:
-        st.markdown("##### 📝 فحص العقد والشروط")
-        
-        contract_checks = [
-            "هل العقد مكتوب باللغة العربية؟ - المادة 13",
-            "هل تحتفظ بنسخة من العقد؟ - المادة 13",
-            "هل تم تحديد مدة العقد بوضوح؟ - المادة 14",
-            "هل تم تحديد الأجر والمزايا بوضوح؟ - المادة 47",
-            "هل تم تحديد ساعات العمل والراحة؟ - المادة 51",
-            "هل تم تحديد مكان العمل؟ - المادة 16",
-            "هل تم ذكر أسباب الفصل المحتملة؟ - المادة 28"
-        ]
-        
-        contract_violations = 0
-        for i, check in enumerate(contract_checks):
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                st.write(f"{i+1}. {check}")
-            with col2:
-                answer = st.selectbox("", ["نعم", "لا"], key=f"contract_{i}", label_visibility="collapsed")
-                if answer == "لا":
-                    contract_violations += 1
-        
-        st.metric("مشاكل في العقد", contract_violations)
-    
-    with checker_tabs[4]:
-        st.markdown("##### 💰 فحص النظام المالي")
-        
-        financial_checks = [
-            "هل يصرف الراتب في الموعد المحدد؟ - المادة 55",
-            "هل تحصل على بدل العمل الإضافي؟ - المادة 54",
-            "هل يتم خصم التأمينات الاجتماعية بشكل صحيح؟ - المادة 56",
-            "هل تحصل على مكافأة نهاية الخدمة عند الاستحقاق؟ - المادة 33",
-            "هل هناك شفافية في الاستقطاعات؟ - المادة 56",
-            "هل يتوافق راتبك مع الحد الأدنى للأجور؟ - المادة 58"
-        ]
-        
-        financial_violations = 0
-        for i, check in enumerate(financial_checks):
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                st.write(f"{i+1}. {check}")
-            with col2:
-                answer = st.selectbox("", ["نعم", "لا"], key=f"financial_{i}", label_visibility="collapsed")
-                if answer == "لا":
-                    financial_violations += 1
         
-        st.metric("مشاكل مالية", financial_violations)
+        # زر لتحديث الصفحة
+        if st.button("🔄 تحديث الصفحة"):
+            st.rerun()
 
-# ==========================
-# 📝 واجبات العامل - مدمج ومكتمل
-# ==========================
-def show_worker_obligations():
-    st.markdown("#### 📝 واجبات والتزامات العمال - حسب قانون العمل الأردني")
-    
-    obligation_tabs = st.tabs(["الالتزامات الأساسية", "السلوك المهني", "المسؤوليات المالية", "الالتزامات العامة"])
-    
-    with obligation_tabs[0]:
-        st.markdown("##### 📋 الالتزامات الأساسية - المادة 19")
-        
-        basic_obligations = [
-            {
-                "obligation": "تنفيذ العمل المتفق عليه - المادة 19/أ",
-                "details": "تأدية العمل بنفسه وأن يبدل في تأديته عناية الشخص المعتاد",
-                "law": "المادة 19/أ"
-            },
-            {
-                "obligation": "الالتزام بأوامر صاحب العمل - المادة 19/ب",
-                "details": "الالتزام بأوامر صاحب العمل المتعلقة بتنفيذ العمل المتفق عليه وذلك ضمن الحدود التي لا تعرضه للخطر أو تخالف أحكام القوانين المعمول بها أو الآداب العامة",
-                "law": "المادة 19/ب"
-            },
-            {
-                "obligation": "الفحوصات الطبية - المادة 19/د",
-                "details": "الخضوع للفحوصات الطبية التي تقتضي طبيعة العمل ضرورة إجراؤها قبل الالتحاق بالعمل أو بعد ذلك للتحقق من خلوه من الأمراض المعدية والسارية",
-                "law": "المادة 19/د"
-            }
-        ]
-        
-        for obligation in basic_obligations:
-            with st.expander(f"📝 {obligation['obligation']}"):
-                st.write(f"**التفاصيل:** {obligation['details']}")
-                st.write(f"**القانون:** {obligation['law']}")
-    
-    with obligation_tabs[1]:
-        st.markdown("##### 💼 السلوك المهني - المادة 19")
-        
-        professional_conduct = [
-            {
-                "obligation": "المحافظة على أسرار العمل - المادة 19/ب",
-                "details": "المحافظة على أسرار صاحب العمل الصناعية والتجارية وأن لا يفشيها بأي صورة من الصور ولو بعد انقضاء عقد العمل وفقا لما يقتضيه الاتفاق أو العرف",
-                "law": "المادة 19/ب"
-            },
-            {
-                "obligation": "حرص على حفظ الممتلكات - المادة 19/ج",
-                "details": "الحرص على حفظ الأشياء المسلمة إليه لتأدية العمل ومنها أدوات العمل والمواد وسائر اللوازم الخاصة بصاحب العمل",
-                "law": "المادة 19/ج"
-            }
-        ]
-        
-        for conduct in professional_conduct:
-            with st.expander(f"💼 {conduct['obligation']}"):
-                st.write(f"**التفاصيل:** {conduct['details']}")
-                st.write(f"**القانون:** {conduct['law']}")
-    
-    with obligation_tabs[2]:
-        st.markdown("##### 💰 المسؤوليات المالية - المادة 19")
-        
-        financial_responsibilities = [
-            {
-                "obligation": "المسؤولية عن الأضرار - المادة 19",
-                "details": "إذا ثبت أن العامل قد تسبب في فقد أو إتلاف أدوات أو آلات أو منتجات يملكها أو يحوزها صاحب العمل أو كانت في عهدته العامل وكان ذلك ناشئاً عن خطأ العامل أو مخالفته تعليمات صاحب العمل فلصاحب العمل أن يقتطع من أجر العامل قيمة الأشياء المفقودة أو المتلفة أو كلفة إصلاحها",
-                "law": "المادة 19"
-            }
-        ]
-        
-        for responsibility in financial_responsibilities:
-            with st.expander(f"💰 {responsibility['obligation']}"):
-                st.write(f"**التفاصيل:** {responsibility['details']}")
-                st.write(f"**القانون:** {responsibility['law']}")
-    
-    with obligation_tabs[3]:
-        st.markdown("##### 📊 الالتزامات العامة")
-        
-        general_obligations = [
-            "الالتزام بمواعيد العمل الرسمية - المادة 51",
-            "احترام النظام الداخلي للمؤسسة - المادة 28",
-            "استخدام معدات السلامة الموفرة - المادة 80",
-            "الإبلاغ عن أي مخاطر في بيئة العمل - المادة 79",
-            "المحافظة على نظافة ومظهر مكان العمل - المادة 19"
-        ]
-        
-        st.write("**الالتزامات العامة للعامل:**")
-        for obligation in general_obligations:
-            st.write(f"📋 {obligation}")
-
-# ==========================
-# 🧮 دالة عرض المسارات
-# ==========================
-def show_breadcrumbs(section_name):
-    st.markdown(f"""
-    <div style='background: #f8f9fa; padding: 10px; border-radius: 5px; margin-bottom: 20px;'>
-        <strong>المسار:</strong> الرئيسية ▶ {section_name}
-    </div>
-    """, unsafe_allow_html=True)
-
-# ==========================
-# 👔 قسم أصحاب العمل - الإصدار الشامل والموسع 2024
-# ==========================
-def show_employers_section():
-    """القسم الرئيسي لأصحاب العمل"""
-    
-    st.markdown("""
-    <div class="main-header">
-        <h1>👔 منصة أصحاب العمل - النظام القانوني المتكامل</h1>
-        <p>دليل شامل لجميع الالتزامات القانونية وأدوات الإدارة وفق قانون العمل الأردني وتعديلاته</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # شريط التحديثات الهام - محدث بالحد الأدنى الجديد
-    st.info("""
-    **📢 أحدث التعديلات التشريعية 2024:** 
-    - **الحد الأدنى للأجور:** 290 دينار لجميع العاملين
-    - **فترة التجربة:** 3 أشهر كحد أقصى (المادة 25)
-    - **إجازة الأمومة:** 10 أسابيع مدفوعة الأجر (المادة 69)
-    - **العمل المرن:** تنظيم جديد للعمل عن بُعد والعمل المرن
-    """)
-
-    # تبويبات رئيسية
-    employer_tabs = st.tabs([
-        "⚖️ الالتزامات القانونية", 
-        "📝 إدارة العقود",
-        "🛡️ إدارة المخاطر"
-    ])
-
-    with employer_tabs[0]:
-        show_legal_obligations_section()
-
-    with employer_tabs[1]:
-        show_contracts_management_section()
-
-    with employer_tabs[2]:
-        show_risk_management_section()
-
-# ==========================
-# ⚖️ قسم الالتزامات القانونية
-# ==========================
-def show_legal_obligations_section():
-    """عرض الالتزامات القانونية الشاملة"""
-    
-    st.markdown("#### ⚖️ الالتزامات القانونية الشاملة")
-    
-    st.markdown("""
-    <div class="section-card">
-        <h4>📋 ملخص الالتزامات الأساسية</h4>
-        <p>يتحمل أصحاب العمل مسؤوليات قانونية شاملة تجاه العاملين وفقاً لأحدث تعديلات قانون العمل الأردني. 
-        يشمل هذا القسم جميع المواد القانونية المتعلقة بأصحاب العمل بشكل كامل ومفصل.</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # تبويبات موسعة تشمل جميع المجالات
-    obligations_tabs = st.tabs([
-        "📋 التوظيف والتعاقد", 
-        "💰 الأجور والمستحقات",
-        "🛡️ السلامة والصحة", 
-        "📄 إنهاء الخدمة",
-        "👥 الفئات الخاصة",
-        "🏢 الإدارة والسجلات"
-    ])
-    
-    with obligations_tabs[0]:
-        show_employment_contract_obligations()
-    
-    with obligations_tabs[1]:
-        show_salary_benefits_obligations()
-    
-    with obligations_tabs[2]:
-        show_safety_health_obligations()
-    
-    with obligations_tabs[3]:
-        show_termination_obligations()
-    
-    with obligations_tabs[4]:
-        show_special_categories_obligations()
-    
-    with obligations_tabs[5]:
-        show_administration_records_obligations()
-
-# ==========================
-# 📋 التوظيف والتعاقد
-# ==========================
-def show_employment_contract_obligations():
-    """عرض التزامات التوظيف والتعاقد"""
-    
-    st.markdown("##### 📋 التزامات التوظيف والتعاقد")
-    
-    obligations = [
-        {
-            "icon": "📝",
-            "title": "عقد العمل المكتوب - المادة 13",
-            "details": "إبرام عقد عمل مكتوب قبل بدء الخدمة يتضمن جميع البيانات الأساسية للطرفين وبنود العمل",
-            "deadline": "قبل بدء العمل",
-            "law": "المادة 13",
-            "penalty": "بطلان الشروط + غرامة إدارية"
-        },
-        {
-            "icon": "⏱️",
-            "title": "فترة التجربة - المادة 25",
-            "details": "أقصى مدة للتجربة 3 أشهر فقط، ولا يجوز تجديدها، وإذا استمر العمل بعدها يصبح العقد غير محدد المدة",
-            "deadline": "3 أشهر كحد أقصى",
-            "law": "المادة 25",
-            "penalty": "بطلان فترة التجربة + اعتبار العقد دائم"
-        },
-        {
-            "icon": "📋",
-            "title": "اللوائح الداخلية - المادة 27",
-            "details": "إعداد لوائح تنظيم العمل ونشرها في مكان واضح تشمل نظام العمل وساعاته وفترات الراحة وإجراءات السلامة",
-            "deadline": "قبل التشغيل",
-            "law": "المادة 27",
-            "penalty": "غرامة 300 دينار"
-        }
-    ]
-    
-    for obligation in obligations:
-        with st.expander(f"{obligation['icon']} {obligation['title']}", expanded=True):
-            col1, col2 = st.columns([3, 2])
-            with col1:
-                st.write(f"**📋 التفاصيل:** {obligation['details']}")
-                st.write(f"**⏰ المهلة:** {obligation['deadline']}")
-            with col2:
-                st.write(f"**⚖️ القانون:** {obligation['law']}")
-                st.write(f"**💰 العقوبة:** {obligation['penalty']}")
-
-# ==========================
-# 💰 الأجور والمستحقات - محدث بالحد الأدنى الجديد
-# ==========================
-def show_salary_benefits_obligations():
-    """عرض التزامات الأجور والمستحقات"""
-    
-    st.markdown("##### 💰 التزامات الأجور والمستحقات")
-    
-    obligations = [
-        {
-            "icon": "💰",
-            "title": "الحد الأدنى للأجور - المادة 35",
-            "details": "290 دينار شهرياً لجميع العاملين في القطاع الخاص وفق أحدث تعديلات 2024",
-            "deadline": "مستمر",
-            "law": "المادة 35",
-            "penalty": "غرامة 500-1000 دينار + دفع الفرق للعامل"
-        },
-        {
-            "icon": "📅",
-            "title": "موعد صرف الأجور - المادة 55",
-            "details": "صرف الأجر في موعد لا يتجاوز اليوم السابع من الشهر التالي، وفي حالة التأخر يستحق العامل فوائد تأخير 8% سنوياً",
-            "deadline": "7 أيام من نهاية الشهر",
-            "law": "المادة 55",
-            "penalty": "غرامة + فوائد تأخير 8%"
-        },
-        {
-            "icon": "⏰",
-            "title": "العمل الإضافي - المادة 42",
-            "details": "125% من الأجر الأساسي للساعات النهارية، 150% للساعات الليلية وأيام العطل، حد أقصى ساعتين يومياً و10 ساعات أسبوعياً",
-            "deadline": "مع صرف الراتب",
-            "law": "المادة 42",
-            "penalty": "غرامة + دفع مستحقات العمل الإضافي"
-        }
-    ]
-    
-    for obligation in obligations:
-        with st.expander(f"{obligation['icon']} {obligation['title']}"):
-            col1, col2 = st.columns([3, 2])
-            with col1:
-                st.write(f"**📋 التفاصيل:** {obligation['details']}")
-                st.write(f"**⏰ المهلة:** {obligation['deadline']}")
-            with col2:
-                st.write(f"**⚖️ القانون:** {obligation['law']}")
-                st.write(f"**💰 العقوبة:** {obligation['penalty']}")
-
-# ==========================
-# 🛡️ السلامة والصحة
-# ==========================
-def show_safety_health_obligations():
-    """عرض التزامات السلامة والصحة المهنية"""
-    
-    st.markdown("##### 🛡️ التزامات السلامة والصحة المهنية")
-    
-    obligations = [
-        {
-            "icon": "🛡️",
-            "title": "وسائل الحماية الشخصية - المادة 78",
-            "details": "توفير وسائل الحماية الشخصية والوقاية للعاملين وإرشادهم لطريقة استعمالها والمحافظة عليها",
-            "deadline": "مستمر",
-            "law": "المادة 78",
-            "penalty": "غرامة + إغلاق المنشأة"
-        },
-        {
-            "icon": "🏥",
-            "title": "التدابير الوقائية - المادة 79",
-            "details": "اتخاذ التدابير اللازمة لحماية العاملين من الأخطار والأمراض المهنية وتوفير وسائل الإسعافات الأولية",
-            "deadline": "مستمر",
-            "law": "المادة 79",
-            "penalty": "غرامة + مسؤولية مدنية"
-        }
-    ]
-    
-    for obligation in obligations:
-        with st.expander(f"{obligation['icon']} {obligation['title']}"):
-            col1, col2 = st.columns([3, 2])
-            with col1:
-                st.write(f"**📋 التفاصيل:** {obligation['details']}")
-                st.write(f"**⏰ المهلة:** {obligation['deadline']}")
-            with col2:
-                st.write(f"**⚖️ القانون:** {obligation['law']}")
-                st.write(f"**💰 العقوبة:** {obligation['penalty']}")
-
-# ==========================
-# 📄 إنهاء الخدمة
-# ==========================
-def show_termination_obligations():
-    """عرض التزامات إنهاء الخدمة"""
-    
-    st.markdown("##### 📄 التزامات إنهاء الخدمة")
-    
-    obligations = [
-        {
-            "icon": "💼",
-            "title": "مكافأة نهاية الخدمة - المادة 38",
-            "details": "احتساب مكافأة نهاية الخدمة حسب مدة الخدمة وسبب الإنهاء (أجر شهرين عن كل سنة خدمة)",
-            "deadline": "عند إنهاء الخدمة",
-            "law": "المادة 38",
-            "penalty": "تعويض مضاعف + غرامات إدارية"
-        },
-        {
-            "icon": "⚖️",
-            "title": "الفصل التأديبي - المادة 29",
-            "details": "قصر الفصل على حالات محددة (تزوير، إخلال جسيم بالالتزامات، خسارة مادية جسيمة، إفشاء الأسرار)",
-            "deadline": "مستمر",
-            "law": "المادة 29",
-            "penalty": "بطلان الفصل إن لم تستوف الشروط"
-        }
-    ]
-    
-    for obligation in obligations:
-        with st.expander(f"{obligation['icon']} {obligation['title']}"):
-            col1, col2 = st.columns([3, 2])
-            with col1:
-                st.write(f"**📋 التفاصيل:** {obligation['details']}")
-                st.write(f"**⏰ المهلة:** {obligation['deadline']}")
-            with col2:
-                st.write(f"**⚖️ القانون:** {obligation['law']}")
-                st.write(f"**💰 العقوبة:** {obligation['penalty']}")
-
-# ==========================
-# 👥 الفئات الخاصة
-# ==========================
-def show_special_categories_obligations():
-    """عرض التزامات تجاه الفئات الخاصة"""
-    
-    st.markdown("##### 👥 التزامات تجاه الفئات الخاصة")
-    
-    obligations = [
-        {
-            "icon": "🤰",
-            "title": "إجازة الأمومة - المادة 69",
-            "details": "10 أسابيع مدفوعة الأجر (70 يوماً)، 6 أسابيع بعد الولادة إلزامياً، تشمل جميع العاملات بغض النظر عن مدة الخدمة",
-            "deadline": "قبل وبعد الولادة",
-            "law": "المادة 69",
-            "penalty": "غرامة + تعويض"
-        },
-        {
-            "icon": "👶",
-            "title": "ساعات الرضاعة - المادة 71",
-            "details": "ساعة رضاعة يومياً لمدة عام من تاريخ الولادة، يمكن تجميع هذه الساعات وتحويلها لإجازة",
-            "deadline": "سنة من الولادة",
-            "law": "المادة 71",
-            "penalty": "غرامة إدارية"
-        }
-    ]
-    
-    for obligation in obligations:
-        with st.expander(f"{obligation['icon']} {obligation['title']}"):
-            col1, col2 = st.columns([3, 2])
-            with col1:
-                st.write(f"**📋 التفاصيل:** {obligation['details']}")
-                st.write(f"**⏰ المهلة:** {obligation['deadline']}")
-            with col2:
-                st.write(f"**⚖️ القانون:** {obligation['law']}")
-                st.write(f"**💰 العقوبة:** {obligation['penalty']}")
-
-# ==========================
-# 🏢 الإدارة والسجلات
-# ==========================
-def show_administration_records_obligations():
-    """عرض الالتزامات الإدارية والتسجيلية"""
-    
-    st.markdown("##### 🏢 الالتزامات الإدارية والتسجيلية")
-    
-    obligations = [
-        {
-            "icon": "📊",
-            "title": "الإخطار بالتشغيل - المادة 8",
-            "details": "إرسال إشعار للوزارة يتضمن عدد العاملين وموقع العمل وطبيعة العمل وتاريخ المباشرة والأجر",
-            "deadline": "الشهر الأول من كل سنة",
-            "law": "المادة 8",
-            "penalty": "غرامة إدارية"
-        },
-        {
-            "icon": "📁",
-            "title": "مسك السجلات - المادة 9",
-            "details": "الاحتفاظ بالسجلات الواجبة بما فيها سجلات العمل والمتدربين",
-            "deadline": "مستمر",
-            "law": "المادة 9",
-            "penalty": "غرامة إدارية"
-        }
-    ]
-    
-    for obligation in obligations:
-        with st.expander(f"{obligation['icon']} {obligation['title']}"):
-            col1, col2 = st.columns([3, 2])
-            with col1:
-                st.write(f"**📋 التفاصيل:** {obligation['details']}")
-                st.write(f"**⏰ المهلة:** {obligation['deadline']}")
-            with col2:
-                st.write(f"**⚖️ القانون:** {obligation['law']}")
-                st.write(f"**💰 العقوبة:** {obligation['penalty']}")
-
-# ==========================
-# 📝 قسم إدارة العقود - النسخة المصححة
-# ==========================
-def show_contracts_management_section():
-    """عرض نظام إدارة العقود المصحح"""
-    
-    st.markdown("#### 📝 نظام إدارة العقود القانوني")
-    
-    st.markdown("""
-    <div style="background: #f8f9fa; padding: 20px; border-radius: 10px; border: 1px solid #dee2e6;">
-        <h4>💡 دليل الاستخدام</h4>
-        <p>يوفر هذا القسم نماذج عقود جاهزة ومحدثة وفق أحدث التعديلات القانونية. يمكنك نسخ النص مباشرة واستخدامه.</p>
-        <div style="background: #fff3cd; padding: 15px; border-radius: 5px; border: 1px solid #ffeaa7; margin-top: 10px;">
-        <strong>🛡️ تنويه هام:</strong> هذه النماذج لأغراض إرشادية فقط ولا تغني عن استشارة محامٍ متخصص. يتحمل المستخدم المسؤولية الكاملة عن استخدام هذه النماذج.
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    contracts_tabs = st.tabs(["📄 نماذج العقود", "🎯 منشئ العقود"])
-
-    with contracts_tabs[0]:
-        show_contract_templates()
-    
-    with contracts_tabs[1]:
-        show_contract_builder()
-
-# ==========================
-# 📄 نماذج العقود
-# ==========================
-def show_contract_templates():
-    """عرض مكتبة نماذج العقود"""
-    
-    st.markdown("##### 📄 مكتبة نماذج العقود القانونية")
-
-    contract_templates = [
-        {
-            "النوع": "عقد عمل دائم",
-            "الوصف": "عقد عمل دائم شامل مع جميع البنود القانونية",
-            "المميزات": [
-                "فترة التجربة 3 أشهر", "بنود العمل المرن", "سياسة الحماية من التحرش",
-                "التزامات الطرفين", "إنهاء الخدمة", "الضمان الاجتماعي", "الإجازات"
-            ]
-        },
-        {
-            "النوع": "عقد عمل مؤقت", 
-            "الوصف": "عقد عمل مؤقت شامل للمشاريع محددة المدة",
-            "المميزات": [
-                "مدة محددة", "بنود التمديد", "إنهاء مبكر", "تسليم المخرجات",
-                "الملكية الفكرية", "التسليم والمعايير"
-            ]
-        },
-        {
-            "النوع": "عقد عمل جزئي",
-            "الوصف": "عقد عمل جزئي شامل مع جميع الاستحقاقات النسبية", 
-            "المميزات": [
-                "ساعات مرنة", "أجر متناسب", "استحقاقات نسبية", "التأمينات",
-                "الإجازات", "الضمان الاجتماعي"
-            ]
-        }
-    ]
-    
-    for contract in contract_templates:
-        with st.expander(f"📄 {contract['النوع']}", expanded=False):
-            st.write(f"**📝 الوصف:** {contract['الوصف']}")
-            
-            st.write("**✨ المميزات:**")
-            for feature in contract['المميزات']:
-                st.write(f"• {feature}")
-            
-            if st.button(f"📋 عرض نص العقد", key=f"show_{contract['النوع']}"):
-                contract_content = generate_contract_content(contract['النوع'])
-                st.session_state.current_contract = contract_content
-                st.session_state.contract_type_name = contract['النوع']  # تغيير اسم المفتاح
-                st.rerun()
-    
-    # عرض نص العقد إذا تم اختياره
-    if hasattr(st.session_state, 'current_contract'):
-        show_contract_text()
-
-# ==========================
-# 🎯 منشئ العقود المحسن
-# ==========================
-def show_contract_builder():
-    """عرض منشئ العقود مع خيارات البنود الإضافية"""
-    
-    st.markdown("##### 🎯 منشئ العقود المتقدم")
-    
-    # تهيئة المتغيرات في حالة عدم وجودها
-    if 'custom_contract_data' not in st.session_state:
-        st.session_state.custom_contract_data = {}
-    
-    with st.form("contract_builder_form"):  # تغيير مفتاح النموذج
-        st.subheader("إنشاء عقد عمل مخصص")
-        
-        # القسم 1: المعلومات الأساسية
-        st.markdown("### 📋 المعلومات الأساسية")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            contract_type = st.selectbox("نوع العقد", [
-                "عقد عمل دائم",
-                "عقد عمل مؤقت", 
-                "عقد عمل جزئي"
-            ], key="builder_contract_type")  # تغيير المفتاح
-            
-            job_title = st.text_input("المسمى الوظيفي *", placeholder="مثال: محاسب، مهندس، مسوق", key="builder_job_title")
-            workplace = st.text_input("مكان العمل الرئيسي *", placeholder="مثال: عمان - الشميساني", key="builder_workplace")
-            
-        with col2:
-            salary = st.number_input("الراتب الأساسي (دينار) *", min_value=290, value=500, key="builder_salary")
-            probation_period = st.selectbox("فترة التجربة *", ["1 شهر", "2 أشهر", "3 أشهر"], key="builder_probation_period")
-            
-            if contract_type == "عقد عمل مؤقت":
-                contract_duration = st.text_input("مدة العقد *", placeholder="مثال: 6 أشهر، سنة واحدة", key="builder_contract_duration")
-            else:
-                contract_duration = ""
-        
-        # القسم 2: البنود الإلزامية الأساسية
-        st.markdown("### 📑 البنود الإلزامية الأساسية")
-        
-        mandatory_clauses = [
-            {
-                "id": "working_hours",
-                "title": "ساعات العمل والإجازات",
-                "description": "تنظيم ساعات العمل اليومية والأسبوعية والإجازات المختلفة",
-                "default": True
-            },
-            {
-                "id": "social_security", 
-                "title": "الضمان الاجتماعي",
-                "description": "التزام صاحب العمل بتسجيل العامل في الضمان الاجتماعي",
-                "default": True
-            },
-            {
-                "id": "contract_termination",
-                "title": "إنهاء العقد",
-                "description": "شروط وإجراءات إنهاء العقد من قبل الطرفين",
-                "default": True
-            },
-            {
-                "id": "confidentiality",
-                "title": "السرية",
-                "description": "التزام العامل بالمحافظة على أسرار العمل",
-                "default": True
-            }
-        ]
-        
-        for clause in mandatory_clauses:
-            st.checkbox(f"**{clause['title']}** - {clause['description']}", 
-                       value=clause['default'], 
-                       key=f"builder_mandatory_{clause['id']}")  # تغيير المفتاح
-        
-        # القسم 3: البنود الإضافية الاختيارية
-        st.markdown("### 🔧 البنود الإضافية الاختيارية")
-        
-        st.info("💡 اختر البنود الإضافية التي تناسب طبيعة العمل:")
-        
-        optional_clauses = [
-            {
-                "id": "intellectual_property",
-                "title": "الملكية الفكرية",
-                "description": "حقوق الملكية الفكرية للابتكارات والإبداعات خلال مدة العقد",
-                "details": """
-                - جميع الابتكارات والإبداعات خلال مدة العقد تعتبر ملكاً لصاحب العمل
-                - يتنازل العامل عن أي حقوق مادية أو معنوية في الابتكارات
-                - التعاون في تسجيل البراءات وحماية الحقوق الفكرية
-                """
-            },
-            {
-                "id": "non_competition",
-                "title": "عدم المنافسة",
-                "description": "منع العمل لدى المنافسين بعد انتهاء العقد",
-                "details": """
-                - يمتنع العامل عن العمل لدى جهات منافسة لمدة 6 أشهر بعد انتهاء العقد
-                - لا يسري هذا البند في حال إنهاء العقد من قبل صاحب العمل
-                - تحديد نطاق المنافسة الجغرافي والمهني
-                """
-            },
-            {
-                "id": "training",
-                "title": "التدريب والتأهيل",
-                "description": "تنظيم برامج التدريب والتطوير المهني",
-                "details": """
-                - يلتزم صاحب العمل بتوفير برامج تدريبية لتنمية مهارات العامل
-                - تحمل تكاليف التدريب من قبل صاحب العمل
-                - الالتزام بالعمل لمدة محددة بعد انتهاء التدريب المكلف
-                """
-            },
-            {
-                "id": "travel",
-                "title": "التنقل والسفر",
-                "description": "تنظيم المهام خارج مقر العمل والسفر",
-                "details": """
-                - بدل تنقل يومي عن أي مهمة خارج مقر العمل
-                - موافقة خطية مسبقة للمهام خارج المحافظة
-                - توفير تأمين صحي وسفر للمهام خارج المملكة
-                - تحمل كافة مصاريف السفر والإقامة
-                """
-            },
-            {
-                "id": "evaluation",
-                "title": "التقييم والمكافآت", 
-                "description": "نظام تقييم الأداء والحوافز والمكافآت",
-                "details": """
-                - تقييم أداء دوري كل 6 أشهر
-                - مكافآت مرتبطة بنتائج التقييم
-                - مكافأة نهاية سنة حسب الأداء
-                - نظام ترقيات واضح ومعلن
-                """
-            },
-            {
-                "id": "medical",
-                "title": "الخدمات الطبية",
-                "description": "التغطية الصحية والخدمات الطبية",
-                "details": """
-                - توفير تأمين صحي جماعي
-                - تحمل كلفة الفحوصات الطبية الدورية
-                - تغطية كاملة لإصابات العمل
-                - إجازة مرضية وفق أحكام القانون
-                """
-            },
-            {
-                "id": "equipment",
-                "title": "المعدات والأدوات",
-                "description": "توفير واستخدام معدات العمل",
-                "details": """
-                - توفير كافة المعدات والأدوات اللازمة للعمل
-                - مسؤولية العامل عن الحفاظ على المعدات
-                - استخدام المعدات لأغراض العمل فقط
-                - إجراءات تسليم المعدات عند انتهاء العقد
-                """
-            },
-            {
-                "id": "remote_work",
-                "title": "العمل عن بُعد",
-                "description": "تنظيم العمل عن بُعد والمرونة المكانية",
-                "details": """
-                - عدد أيام العمل عن بُعد المسموح بها أسبوعياً
-                - توفير اتصال إنترنت وأجهزة مناسبة
-                - ساعات العمل المرنة وطرق التواصل
-                - معايير تقييم الأداء للعمل عن بُعد
-                """
-            },
-            {
-                "id": "overtime",
-                "title": "العمل الإضافي",
-                "description": "تنظيم ساعات العمل الإضافي وأجوره",
-                "details": """
-                - موافقة خطية مسبقة على العمل الإضافي
-                - سقوط ساعات العمل الإضافي (144 ساعة سنوياً)
-                - أجور العمل الإضافي وفقاً للقانون (125%-150%)
-                - تسجيل دقيق لساعات العمل الإضافي
-                """
-            },
-            {
-                "id": "probation_details",
-                "title": "تفاصيل فترة التجربة",
-                "description": "تفاصيل إضافية عن فترة التجربة",
-                "details": """
-                - إمكانية إنهاء العقد خلال فترة التجربة دون إنذار
-                - تقييم أداء في نهاية فترة التجربة
-                - إمكانية تمديد فترة التجربة لمرة واحدة
-                - احتساب فترة التجربة من مدة الخدمة
-                """
-            }
-        ]
-        
-        # عرض البنود الاختيارية في أعمدة
-        cols = st.columns(2)
-        for idx, clause in enumerate(optional_clauses):
-            with cols[idx % 2]:
-                with st.expander(f"📌 {clause['title']}", expanded=False):
-                    st.write(clause['description'])
-                    st.text_area(
-                        "تفاصيل البند:", 
-                        value=clause['details'].strip(),
-                        height=150,
-                        key=f"builder_details_{clause['id']}",  # تغيير المفتاح
-                        disabled=False
-                    )
-                    selected = st.checkbox(f"إضافة {clause['title']}", key=f"builder_optional_{clause['id']}")  # تغيير المفتاح
-                    if selected:
-                        st.success(f"✓ سيتم إضافة بند {clause['title']}")
-        
-        # القسم 4: بنود خاصة مخصصة
-        st.markdown("### ✍️ بنود خاصة مخصصة")
-        
-        st.warning("""
-        **ملاحظة هامة:** البنود الخاصة يجب أن تكون متوافقة مع قانون العمل الأردني 
-        ولا تتعارض مع الحقوق الأساسية للعامل.
-        """)
-        
-        custom_clauses = st.text_area(
-            "البنود الخاصة الإضافية:",
-            placeholder="""
-مثال:
-- يحق للعامل الحصول على بدل نقل قدره 50 دينار شهرياً
-- يلتزم العامل بحضور دورات تدريبية تخصصية
-- تقدم الشركة وجبة غداء مجانية يومياً
-- يحق للعامل الحصول على تذاكر سفر سنوية
-            """.strip(),
-            height=150,
-            key="builder_custom_clauses"  # تغيير المفتاح
-        )
-        
-        # القسم 5: التأكيد والإنشاء
-        st.markdown("### ✅ التأكيد والإنشاء")
-        
-        col_confirm1, col_confirm2 = st.columns(2)
-        
-        with col_confirm1:
-            confirm_legal = st.checkbox("أقر بأن جميع البنود المضافة متوافقة مع قانون العمل الأردني", key="builder_confirm_legal")
-        
-        with col_confirm2:
-            confirm_review = st.checkbox("ألتزم بمراجعة العقد مع مختص قانوني قبل استخدامه", key="builder_confirm_review")
-        
-        submitted = st.form_submit_button("🎯 إنشاء العقد المتكامل", use_container_width=True)
-        
-        if submitted:
-            # التحقق من البيانات الأساسية
-            if not job_title or not workplace:
-                st.error("⚠️ يرجى ملء جميع الحقول الإلزامية (*)")
-            elif salary < 290:
-                st.error("⚠️ الراتب الأساسي أقل من الحد الأدنى للأجور (290 دينار)")
-            elif not confirm_legal or not confirm_review:
-                st.error("⚠️ يرجى الموافقة على تأكيدات السلامة القانونية")
-            else:
-                # جمع البيانات المختارة
-                selected_optional_clauses = []
-                for clause in optional_clauses:
-                    if st.session_state.get(f"builder_optional_{clause['id']}", False):
-                        selected_optional_clauses.append({
-                            "title": clause['title'],
-                            "details": clause['details'],
-                            "custom_details": st.session_state.get(f"builder_details_{clause['id']}", clause['details'])
-                        })
-                
-                # حفظ البيانات في الجلسة
-                st.session_state.custom_contract_data = {
-                    "type": contract_type,
-                    "job_title": job_title,
-                    "workplace": workplace,
-                    "salary": salary,
-                    "probation_period": probation_period,
-                    "contract_duration": contract_duration,
-                    "custom_clauses": custom_clauses,
-                    "selected_optional_clauses": selected_optional_clauses,
-                    # البنود الإلزامية
-                    "working_hours": st.session_state.get("builder_mandatory_working_hours", True),
-                    "social_security": st.session_state.get("builder_mandatory_social_security", True),
-                    "contract_termination": st.session_state.get("builder_mandatory_contract_termination", True),
-                    "confidentiality": st.session_state.get("builder_mandatory_confidentiality", True)
-                }
-                
-                # إنشاء العقد
-                try:
-                    generated_contract = generate_comprehensive_custom_contract(st.session_state.custom_contract_data)
-                    st.session_state.current_contract = generated_contract
-                    st.session_state.contract_type_name = "مخصص متكامل"  # استخدام المفتاح الجديد
-                    st.success("✅ تم إنشاء العقد المتكامل بنجاح! انزل لأسفل لنسخ النص")
-                    st.balloons()
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"❌ حدث خطأ في إنشاء العقد: {str(e)}")
-    
-    # عرض العقد المخصص إذا تم إنشاؤه
-    if hasattr(st.session_state, 'current_contract') and hasattr(st.session_state, 'contract_type_name') and st.session_state.contract_type_name == "مخصص متكامل":
-        show_comprehensive_contract_text()
-
-def generate_comprehensive_custom_contract(contract_data):
-    """إنشاء عقد مخصص شامل مع جميع البنود المختارة"""
-    
-    disclaimer = """\n
-⚠️ تنويه إخلاء المسؤولية:
-هذا النموذج معد لأغراض إرشادية فقط ولا يعتبر بديلاً عن الاستشارة القانونية المتخصصة. 
-يتحمل المستخدم المسؤولية الكاملة عن مراجعة العقد مع محامٍ مختص قبل استخدامه.
-"""
-    
-    base_contract = f"""📜 عقد عمل {contract_data['type']} شامل
-وفقاً لقانون العمل الأردني رقم (8) لسنة 1996 وتعديلاته
-
-تم إبرام هذا العقد في تاريخ ____ الموافق __/__/____
-
-بين:
-
-الطرف الأول: صاحب العمل
-الاسم: ____________________
-العنوان: __________________
-السجل التجاري: ____________
-
-و
-
-الطرف الثاني: العامل
-الاسم: ____________________
-العنوان: __________________
-رقم الهوية: _______________
-
-البند الأول: المعلومات الأساسية
-١.١. نوع العقد: {contract_data['type']}
-١.٢. المسمى الوظيفي: {contract_data['job_title']}
-١.٣. مكان العمل الرئيسي: {contract_data['workplace']}"""
-
-    if contract_data['type'] == "عقد عمل مؤقت" and contract_data['contract_duration']:
-        base_contract += f"\n١.٤. مدة العقد: {contract_data['contract_duration']}"
-
-    base_contract += f"""
-البند الثاني: الأجر والاستحقاقات المالية
-٢.١. الراتب الأساسي: {contract_data['salary']} دينار أردني
-٢.٢. طريقة الدفع: ______
-٢.٣. موعد صرف الراتب: ______
-٢.٤. الاستقطاعات: وفقاً لأحكام القانون والضمان الاجتماعي"""
-
-    base_contract += f"""
-البند الثالث: فترة التجربة
-٣.١. فترة التجربة: {contract_data['probation_period']}
-٣.٢. خلال فترة التجربة، يحق لأي من الطرفين إنهاء العقد دون إنذار مسبق."""
-
-    # البنود الإلزامية
-    if contract_data.get('working_hours', True):
-        base_contract += """
-البند الرابع: ساعات العمل والإجازات
-٤.١. ساعات العمل: ٨ ساعات يومياً أو ٤٨ ساعة أسبوعياً.
-٤.٢. الإجازة السنوية: ١٤ يوماً مدفوعة الأجر عن كل سنة خدمة.
-٤.٣. الإجازة المرضية: ١٤ يوماً بأجر كامل.
-٤.٤. إجازة الأمومة: ١٠ أسابيع مدفوعة الأجر.
-٤.٥. إجازة الأبوة: ٣ أيام مدفوعة الأجر."""
-
-    if contract_data.get('social_security', True):
-        base_contract += """
-البند الخامس: الضمان الاجتماعي
-٥.١. يلتزم صاحب العمل بتسجيل العامل في مؤسسة الضمان الاجتماعي.
-٥.٢. تتحمل الجهتان الاشتراكات وفقاً لأحكام القانون."""
-
-    if contract_data.get('contract_termination', True):
-        base_contract += """
-البند السادس: إنهاء العقد
-٦.١. يحق لأي طرف إنهاء العقد بإشعار خطي قبل ٣٠ يوماً على الأقل.
-٦.٢. في حال إنهاء العقد من قبل صاحب العمل دون سبب مشروع، يستحق العامل تعويضاً.
-٦.٣. حالات الفصل الفوري وفقاً لأحكام المادة (٨٨) من قانون العمل."""
-
-    if contract_data.get('confidentiality', True):
-        base_contract += """
-البند السابع: السرية
-٧.١. يلتزم العامل بالمحافظة على أسرار العمل وعدم إفشائها.
-٧.٢. يشمل ذلك المعلومات التقنية والتجارية والمالية."""
-
-    # البنود الاختيارية
-    clause_number = 8
-    for clause in contract_data.get('selected_optional_clauses', []):
-        base_contract += f"""
-البند {clause_number}: {clause['title']}
-{clause['custom_details']}"""
-        clause_number += 1
-
-    # البنود الخاصة المخصصة
-    if contract_data.get('custom_clauses'):
-        base_contract += f"""
-البند {clause_number}: بنود خاصة
-{contract_data['custom_clauses']}"""
-        clause_number += 1
-
-    base_contract += f"""
-البند {clause_number}: أحكام عامة
-{clause_number}.١. يخضع هذا العقد لأحكام قانون العمل الأردني.
-{clause_number}.٢. أي بند يخالف القانون يعتبر لاغياً وباطلاً.
-{clause_number}.٣. الحد الأدنى للأجور: ٢٩٠ ديناراً (تحديث ٢٠٢٤).
-{clause_number}.٤. تحل المنازعات عبر المفاوضات ثم المحاكم المختصة.
-
-توقيع صاحب العمل: __________
-الاسم: ____________________
-التاريخ: __/__/____
-
-توقيع العامل: __________
-الاسم: ____________________
-التاريخ: __/__/____
-
-شهادة الإقرار:
-أقر بأنني قد اطلعت على جميع بنود هذا العقد وفهمتها بشكل كامل
-ووافقت عليها بمحض إرادتي.
-
-توقيع العامل: __________
-التاريخ: __/__/____
-{disclaimer}"""
-    
-    return base_contract
-
-def show_comprehensive_contract_text():
-    """عرض نص العقد الشامل للنسخ"""
-    st.markdown("---")
-    st.markdown("##### 📝 العقد المتكامل الجاهز للنسخ")
-    
-    contract_content = st.session_state.current_contract
-    
-    # عرض إحصائية عن العقد
-    col_stats1, col_stats2, col_stats3 = st.columns(3)
-    
-    with col_stats1:
-        st.metric("عدد البنود", len(contract_content.split('البند')))
-    
-    with col_stats2:
-        st.metric("عدد الكلمات", len(contract_content.split()))
-    
-    with col_stats3:
-        st.metric("المستوى", "🛡️ شامل")
-    
-    # عرض النص في صندوق يمكن نسخه
-    st.text_area(
-        "**انسخ النص أدناه واستخدمه:**", 
-        value=contract_content,
-        height=500,
-        key="comprehensive_contract_text"
-    )
-    
-    # تعليمات النسخ المحسنة
-    st.markdown("""
-    <div style="background: #e8f5e8; padding: 20px; border-radius: 5px; border: 1px solid #4caf50;">
-    <h4>💡 تعليمات النسخ والاستخدام:</h4>
-    <ol>
-    <li><strong>اضغط داخل صندوق النص أعلاه</strong></li>
-    <li><strong>إضغط <kbd>Ctrl+A</kbd> (Windows) أو <kbd>Cmd+A</kbd> (Mac) لتحديد كل النص</strong></li>
-    <li><strong>إضغط <kbd>Ctrl+C</kbd> (Windows) أو <kbd>Cmd+C</kbd> (Mac) لنسخ النص</strong></li>
-    <li><strong>الصق النص في مستند Word أو أي محرر نصوص آخر</strong></li>
-    <li><strong>املأ المعلومات المطلوبة (______) حسب حالتك</strong></li>
-    <li><strong>راجع العقد مع محامٍ مختص قبل التوقيع</strong></li>
-    </ol>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    col_actions1, col_actions2, col_actions3 = st.columns(3)
-    
-    with col_actions1:
-        if st.button("🔄 إنشاء عقد جديد", use_container_width=True, key="new_contract_btn"):
-            # مسح البيانات من الجلسة
-            for key in ['current_contract', 'contract_type_name', 'custom_contract_data']:
-                if hasattr(st.session_state, key):
-                    delattr(st.session_state, key)
-            st.rerun()
-    
-    with col_actions2:
-        if st.button("📄 نماذج جاهزة", use_container_width=True, key="templates_btn"):
-            # مسح البيانات من الجلسة
-            for key in ['current_contract', 'contract_type_name', 'custom_contract_data']:
-                if hasattr(st.session_state, key):
-                    delattr(st.session_state, key)
-            st.rerun()
-    
-    with col_actions3:
-        if st.button("💾 حفظ المسودة", use_container_width=True, key="save_draft_btn"):
-            st.info("💾 يمكنك نسخ النص أعلاه وحفظه في ملف نصي")
-
-# ==========================
-# 🎯 دوال المساعدة
-# ==========================
-def show_contract_text():
-    """عرض نص العقد للنسخ"""
-    st.markdown("---")
-    st.markdown(f"##### 📝 نص العقد الجاهز للنسخ")
-    
-    contract_content = st.session_state.current_contract
-    
-    # عرض النص في صندوق يمكن نسخه
-    st.text_area(
-        "**انسخ النص أدناه واستخدمه:**", 
-        value=contract_content,
-        height=400,
-        key="contract_text_area"
-    )
-    
-    # زر مساعد للنسخ
-    st.markdown("""
-    <div style="background: #e8f5e8; padding: 15px; border-radius: 5px; border: 1px solid #4caf50;">
-    <h4>💡 تعليمات النسخ:</h4>
-    <ol>
-    <li>اضغط داخل صندوق النص أعلاه</li>
-    <li>إضغط <kbd>Ctrl+A</kbd> (Windows) أو <kbd>Cmd+A</kbd> (Mac) لتحديد كل النص</li>
-    <li>إضغط <kbd>Ctrl+C</kbd> (Windows) أو <kbd>Cmd+C</kbd> (Mac) لنسخ النص</li>
-    <li>الصق النص في مستند Word أو أي محرر نصوص آخر</li>
-    </ol>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("🔄 إنشاء عقد جديد", use_container_width=True, key="new_simple_btn"):
-            # مسح البيانات من الجلسة
-            if hasattr(st.session_state, 'current_contract'):
-                del st.session_state.current_contract
-            if hasattr(st.session_state, 'contract_type_name'):
-                del st.session_state.contract_type_name
-            if hasattr(st.session_state, 'custom_contract_data'):
-                del st.session_state.custom_contract_data
-            st.rerun()
-    
-    with col2:
-        if st.button("🏠 العودة للقائمة الرئيسية", use_container_width=True, key="home_btn"):
-            # مسح البيانات من الجلسة
-            if hasattr(st.session_state, 'current_contract'):
-                del st.session_state.current_contract
-            if hasattr(st.session_state, 'contract_type_name'):
-                del st.session_state.contract_type_name
-            st.rerun()
-
-# ... باقي الدوال generate_contract_content و generate_custom_contract تبقى كما هي ...
-
-# ==========================
-# 🎯 تشغيل قسم العقود
-# ==========================
-def run_contracts_section():
-    """تشغيل قسم إدارة العقود"""
-    # تهيئة حالة الجلسة إذا لم تكن موجودة
-    if 'custom_contract_data' not in st.session_state:
-        st.session_state.custom_contract_data = {}
-    
-    show_contracts_management_section()
-
-# ==========================
-# 🔍 المخاطر النشطة
-# ==========================
-def show_active_risks():
-    """عرض المخاطر القانونية النشطة"""
-    
-    st.markdown("##### 🔍 المخاطر القانونية النشطة والمحتملة")
-    
-    risk_categories = {
-        "المخاطر التعاقدية": [
-            "عقود عمل غير مكتملة أو غير محدثة",
-            "عدم تضمين البنود الإلزامية القانونية",
-            "فترات تجربة تتجاوز 3 أشهر",
-            "عقود شفهية غير موثقة"
-        ],
-        "المخاطر المالية": [
-            "عدم تطبيق الحد الأدنى للأجور (290 دينار)",
-            "تأخر صرف الرواتب عن الموعد القانوني",
-            "عدم دفع بدل العمل الإضافي",
-            "أخطاء في حساب مستحقات نهاية الخدمة"
-        ],
-        "مخاطر السلامة": [
-            "عدم توفير معدات الوقاية الشخصية",
-            "غياب التدريب على إجراءات السلامة",
-            "عدم الإبلاغ عن إصابات العمل",
-            "نقص في إجراءات الطوارئ"
-        ]
-    }
-    
-    for category, risks in risk_categories.items():
-        with st.expander(f"📁 {category}"):
-            for risk in risks:
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.write(f"• {risk}")
-                with col2:
-                    if st.button("🛠️ معالجة", key=f"action_{risk}"):
-                        st.success(f"تم تسجيل خطة معالجة لـ {risk}")
-
-# ==========================
-# 📋 السجلات والتفتيش
-# ==========================
-def show_records_inspection():
-    """عرض نظام السجلات والتفتيش"""
-    
-    st.markdown("##### 📋 السجلات الإلزامية ونظام التفتيش الداخلي")
-    
-    st.markdown("""
-    **السجلات الإلزامية التي يجب على صاحب العمل الاحتفاظ بها (المادة 26):**
-    
-    - سجل العاملين (الاسم، الرقم الوطني، تاريخ التعيين، الأجر، المسمى الوظيفي)
-    - سجل الأجور والبدلات والاستقطاعات
-    - سجل الإجازات (السنوية، المرضية، الأمومة)
-    - سجل العمل الإضافي
-    - سجل إصابات العمل والحوادث
-    - سجل العقوبات والإجراءات التأديبية
-    """)
-    
-    inspection_checklist = [
-        "التأكد من وجود عقود عمل مكتوبة لجميع العاملين",
-        "مراجعة تطبيق الحد الأدنى للأجور (290 دينار)",
-        "التأكد من تسجيل العاملين في الضمان الاجتماعي",
-        "مراجعة سجلات الإجازات والغياب",
-        "التأكد من وجود لوائح تنظيم العمل",
-        "مراجعة إجراءات السلامة والصحة المهنية"
-    ]
-    
-    st.markdown("##### 🔍 قائمة التفتيش الداخلي")
-    for i, item in enumerate(inspection_checklist):
-        st.checkbox(item, key=f"check_{i}")
-
-# ==========================
-# 🛠️ دوال مساعدة
-# ==========================
-def generate_contract_template(contract_type):
-    """إنشاء قوالب عقود مفصلة"""
-    
-    templates = {
-        "عقد عمل دائم": """
-        عقد عمل دائم
-        =============
-        
-        تم إبرام هذا العقد في يوم {التاريخ} بين:
-        
-        الطرف الأول: صاحب العمل
-        الاسم: ___________________
-        العنوان: ___________________
-        
-        الطرف الثاني: العامل
-        الاسم: ___________________
-        رقم الهوية: ___________________
-        
-        المادة 1: التعريفات
-        - العقد: عقد العمل هذا وملحقاته
-        - صاحب العمل: الطرف الأول
-        - العامل: الطرف الثاني
-        
-        المادة 2: المسمى الوظيفي ومكان العمل
-        - المسمى الوظيفي: {المسمى_الوظيفي}
-        - مكان العمل: {مكان_العمل}
-        
-        المادة 3: المدة وفترة التجربة
-        - نوع العقد: دائم
-        - فترة التجربة: 3 أشهر كحد أقصى
-        
-        المادة 4: الأجر والبدلات
-        - الراتب الأساسي: {الراتب_الأساسي} دينار (لا يقل عن الحد الأدنى 290 دينار)
-        - بدل السكن: {بدل_السكن} دينار
-        - بدل المواصلات: {بدل_المواصلات} دينار
-        
-        المادة 5: ساعات العمل والإجازات
-        - ساعات العمل: 8 ساعات يومياً
-        - الإجازة السنوية: 14 يوم عن كل سنة خدمة
-        
-        المادة 6: إنهاء الخدمة
-        - فترة الإخطار: شهر واحد
-        - مكافأة نهاية الخدمة: حسب القانون
-        
-        المادة 7: أحكام عامة
-        - يخضع هذا العقد لأحكام قانون العمل الأردني
-        - أي نزاع ينشأ عن هذا العقد يحسم وفقاً للقوانين النافذة
-        
-        توقيع صاحب العمل: _________________
-        توقيع العامل: _____________________
-        """,
-        
-        "عقد عمل مؤقت": """
-        عقد عمل مؤقت
-        =============
-        
-        تم إبرام هذا العقد في يوم {التاريخ} بين:
-        
-        الطرف الأول: صاحب العمل
-        الطرف الثاني: العامل
-        
-        المادة 1: الأطراف ومدة العقد
-        - مدة العقد: من {تاريخ_البدء} إلى {تاريخ_النهاية}
-        
-        المادة 2: طبيعة العمل
-        - العمل: {وصف_العمل}
-        - المخرجات المتوقعة: {المخرجات}
-        
-        المادة 3: الأجر والدفع
-        - الأجر الكلي: {الأجر_الكلي} دينار (لا يقل عن الحد الأدنى 290 دينار)
-        - خطة الدفع: {خطة_الدفع}
-        
-        المادة 4: إنهاء العقد
-        - ينتهي العقد تلقائياً بانتهاء مدته
-        - يمكن إنهاؤه مبكراً وفق الشروط القانونية
-        
-        توقيع صاحب العمل: _________________
-        توقيع العامل: _____________________
-        """,
-        
-        "عقد عمل جزئي": """
-        عقد عمل جزئي
-        =============
-        
-        تم إبرام هذا العقد في يوم {التاريخ} بين:
-        
-        الطرف الأول: صاحب العمل
-        الطرف الثاني: العامل
-        
-        المادة 1: طبيعة العمل
-        - نوع العمل: دوام جزئي
-        - ساعات العمل الأسبوعية: {ساعات_العمل}
-        - المسمى الوظيفي: {المسمى_الوظيفي}
-        
-        المادة 2: الأجر والاستحقاقات
-        - الأجر الأساسي: {الراتب_الأساسي} دينار (نسبة من الحد الأدنى 290 دينار)
-        - طريقة حساب الأجر: {طريقة_الحساب}
-        
-        المادة 3: الإجازات والاستحقاقات
-        - إجازة سنوية نسبية حسب ساعات العمل
-        - استحقاقات ضمان اجتماعي نسبية
-        
-        توقيع صاحب العمل: _________________
-        توقيع العامل: _____________________
-        """
-    }
-    
-    return templates.get(contract_type, "نموذج العقد غير متوفر حالياً")
-
-def generate_custom_contract(contract_data):
-    """إنشاء عقد مخصص بناءً على البيانات المدخلة"""
-    base_template = generate_contract_template(contract_data["type"])
-    
-    # استبدال البيانات في القالب
-    custom_contract = base_template.format(
-        التاريخ=datetime.now().strftime("%Y-%m-%d"),
-        اسم_العامل=contract_data["employee_name"],
-        المسمى_الوظيفي=contract_data["job_title"],
-        مكان_العمل=contract_data["workplace"],
-        الراتب_الأساسي=contract_data["salary"],
-        تاريخ_البدء=contract_data["start_date"],
-        تاريخ_النهاية=contract_data.get("contract_duration", "غير محدد"),
-        ساعات_العمل="24 ساعة أسبوعياً",
-        طريقة_الحساب="نسبة 60% من الراتب الكامل"
-    )
-    
-    return custom_contract
-
-# ==========================
-# 🧮 دالة عرض المسارات
-# ==========================
-def show_breadcrumbs(section_name):
-    st.markdown(f"""
-    <div style='background: #f8f9fa; padding: 10px; border-radius: 5px; margin-bottom: 20px;'>
-        <strong>المسار:</strong> الرئيسية ▶ {section_name}
-    </div>
-    """, unsafe_allow_html=True)
-# ==========================
-# 🔬 قسم الباحثين - المنصة البحثية المتكاملة
-# ==========================
-def show_researchers_section():
-    show_breadcrumbs("🔬 قسم الباحثين")
-    
-    st.markdown("""
-    <div style="text-align: center; margin-bottom: 2rem;">
-        <h1>🔬 المنصة البحثية المتكاملة لقانون العمل الأردني</h1>
-        <p>منظمة علمية شاملة للمصادر الموثوقة - محدثة 2024</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.info("""
-    **💡 دليل الاستخدام:** 
-    هذا القسم يوجهك إلى المصادر الرسمية والموثوقة للبحث القانوني. 
-    جميع الروابط تم اختبارها وتحديثها لضمان عملها.
-    """)
-
-    # تبويبات رئيسية شاملة
-    research_tabs = st.tabs([
-        "📘 أساسيات البحث العلمي",
-        "📚 التشريعات والأنظمة", 
-        "🎓 الدراسات والأبحاث",
-        "🔍 أدوات البحث المتقدم",
-        "🌍 المقارنات الدولية",
-        "⚖️ المنصات القانونية"
-    ])
-
-    with research_tabs[0]:
-        show_research_basics()
-
-    with research_tabs[1]:
-        show_legislative_resources()
-
-    with research_tabs[2]:
-        show_academic_resources()
-
-    with research_tabs[3]:
-        show_research_tools()
-
-    with research_tabs[4]:
-        show_international_comparisons()
-        
-    with research_tabs[5]:
-        show_legal_platforms()
-
-# ==========================
-# 📘 أساسيات البحث العلمي - دليل تعليمي شامل
-# ==========================
-def show_research_basics():
-    st.markdown("#### 📘 أساسيات ومنهجيات البحث العلمي في القانون")
-    
-    st.markdown("""
-    **الهدف:** توفير دليل منهجي متكامل لإجراء البحوث القانونية بطريقة علمية واحترافية
-    """)
-
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("##### 🎯 مقدمة في البحث العلمي القانوني")
-        
-        st.markdown("""
-        البحث العلمي في المجال القانوني يهدف إلى:
-        - اكتشاف المعرفة الجديدة في مجال القانون
-        - تحليل الظواهر القانونية وتحليلها
-        - تطوير الحلول للمشكلات القانونية
-        - المساهمة في تطور التشريعات والأنظمة
-        """)
-        
-        st.markdown("##### 📊 أنواع البحوث القانونية")
-        
-        research_types = [
-            {
-                "النوع": "البحث النظري (المكتبي)",
-                "الوصف": "يعتمد على المصادر المكتوبة والتحليل النصي",
-                "الأدوات": ["الكتب", "المجلات", "التشريعات", "الأحكام القضائية"]
-            },
-            {
-                "النوع": "البحث التطبيقي", 
-                "الوصف": "يركز على تطبيق النظريات على حالات واقعية",
-                "الأدوات": ["دراسات الحالة", "الاستبيانات", "المقابلات"]
-            },
-            {
-                "النوع": "البحث المقارن",
-                "الوصف": "يقارن بين الأنظمة القانونية المختلفة",
-                "الأدوات": ["النماذج المقارنة", "التحليل المقارن", "الدراسات الدولية"]
-            }
-        ]
-        
-        for research_type in research_types:
-            with st.expander(f"📖 {research_type['النوع']}"):
-                st.write(f"**الوصف:** {research_type['الوصف']}")
-                st.write("**الأدوات المستخدمة:**")
-                for tool in research_type['الأدوات']:
-                    st.write(f"• {tool}")
-    
-    with col2:
-        st.markdown("##### 🚀 الخطوات المنهجية للبحث العلمي")
-        
-        research_steps = [
-            "❶ اختيار الموضوع وتحديد المشكلة",
-            "❷ المراجعة المكتبية والدراسات السابقة", 
-            "❸ تصميم منهجية البحث وأدواته",
-            "❹ جمع البيانات والمعلومات",
-            "❺ تحليل البيانات والمناقشة",
-            "❻ كتابة التقرير البحثي والنتائج"
-        ]
-        
-        for step in research_steps:
-            st.write(f"• {step}")
-        
-        st.markdown("##### 🔬 المنهجيات البحثية")
-        
-        methodologies = [
-            "المنهج التحليلي: تحليل النصوص القانونية",
-            "المنهج المقارن: مقارنة الأنظمة المختلفة",
-            "المنهج التاريخي: دراسة التطور التشريعي",
-            "المنهج الوصفي: وصف الظواهر القانونية"
-        ]
-        
-        for method in methodologies:
-            st.write(f"• {method}")
-
-    st.markdown("##### ⚖️ أخلاقيات البحث العلمي")
-    
-    ethics = [
-        "الالتزام بالموضوعية والحياد في التحليل",
-        "احترام حقوق الملكية الفكرية والمصادر",
-        "الحفاظ على سرية المعلومات الحساسة",
-        "الإفصاح عن مصادر التمويل والاهتمامات",
-        "الالتزام بالدقة والأمانة العلمية"
-    ]
-    
-    for ethic in ethics:
-        st.write(f"✅ {ethic}")
-
-# ==========================
-# 📚 التشريعات والأنظمة - موسوعة تشريعية شاملة
-# ==========================
-def show_legislative_resources():
-    st.markdown("#### 📚 المصادر التشريعية الرسمية")
-    
-    st.markdown("**الهدف:** توجيه الباحثين إلى المصادر الرسمية للتشريعات الأردنية")
-
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("##### التشريعات الأساسية")
-        
-        legislations = [
-            {
-                "اسم التشريع": "قانون العمل الأردني رقم 8 لسنة 1996",
-                "الوصف": "النص الأساسي لقانون العمل مع جميع التعديلات",
-                "رابط": "https://www.mol.gov.jo/AR/List/%D8%A7%D9%84%D9%82%D9%88%D8%A7%D9%86%D9%8A%D9%86",
-                "مصدر": "الموقع الرسمي لوزارة العمل"
-            },
-            {
-                "اسم التشريع": "دستور المملكة الأردنية",
-                "الوصف": "الدستور الأردني - الباب الثاني: حقوق الأردنيين وواجباتهم",
-                "رابط": "https://representatives.jo/Ar/Pages/%D8%A7%D9%84%D8%AF%D8%B3%D8%AA%D9%88%D8%B1",
-                "مصدر": "رئاسة الوزراء"
-            },
-            {
-                "اسم التشريع": "قانون الضمان الاجتماعي",
-                "الوصف": "قانون الضمان الاجتماعي الأردني وتعديلاته",
-                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://www.ssc.gov.jo/wp-content/uploads/2021/10/%25D9%2582%25D8%25A7%25D9%2586%25D9%2588%25D9%2586-%25D8%25A7%25D9%2584%25D8%25B6%25D9%2585%25D8%25A7%25D9%2586-%25D8%25A7%25D9%2584%25D8%25A7%25D8%25AC%25D8%25AA%25D9%2585%25D8%25A7%25D8%25B9%25D9%258A-%25D8%25B1%25D9%2582%25D9%2585-%25D9%25A1-%25D9%2584%25D8%25B3%25D9%2586%25D8%25A9-%25D9%25A2%25D9%25A0%25D9%25A1%25D9%25A4-1.pdf&ved=2ahUKEwi50dyM_-2QAxXvVKQEHeTkGTUQFnoECBoQAQ&usg=AOvVaw2zF0XzGu-PHO-CACZd9dWe",
-                "مصدر": "مؤسسة الضمان الاجتماعي"
-            }
-        ]
-        
-        for law in legislations:
-            with st.expander(f"📖 {law['اسم التشريع']}"):
-                st.write(f"**الوصف:** {law['الوصف']}")
-                st.write(f"**المصدر:** {law['مصدر']}")
-                st.markdown(f"[🌐 الانتقال للمصدر]({law['رابط']})")
-    
-    with col2:
-        st.markdown("##### الأنظمة والتعليمات")
-        
-        regulations = [
-            {
-                "النظام": "نظام العمل المؤقت",
-                "الوصف": "تنظيم عقود العمل المؤقتة والمرنة",
-                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://jordanianlaw.com/%25D8%25A7%25D9%2584%25D9%2582%25D9%2588%25D8%25A7%25D9%2586%25D9%258A%25D9%2586/%25D9%2582%25D8%25A7%25D9%2586%25D9%2588%25D9%2586-%25D8%25A7%25D9%2584%25D8%25B9%25D9%2585%25D9%2584-%25D8%25A7%25D9%2584%25D9%2585%25D8%25A4%25D9%2582%25D8%25AA/&ved=2ahUKEwiSu5am_-2QAxXLUaQEHU0rKWoQFnoECB4QAQ&usg=AOvVaw1v6PQchSfyw4q3pWVUvSPX",
-                "حالة": "ساري المفعول"
-            },
-            {
-                "النظام": "نظام السلامة والصحة المهنية",
-                "الوصف": "اشتراطات السلامة في بيئات العمل",
-                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://mol.gov.jo/AR/List/%25D8%25AA%25D8%25B4%25D8%25B1%25D9%258A%25D8%25B9%25D8%25A7%25D8%25AA_%25D8%25A7%25D9%2584%25D8%25B3%25D9%2584%25D8%25A7%25D9%2585%25D8%25A9_%25D9%2588%25D8%25A7%25D9%2584%25D8%25B5%25D8%25AD%25D8%25A9_%25D8%25A7%25D9%2584%25D9%2585%25D9%2587%25D9%2586%25D9%258A%25D8%25A9&ved=2ahUKEwj6wajB_-2QAxX8KvsDHb-5LGkQFnoECCsQBQ&usg=AOvVaw26C8c8Or82KoAK_FKsw6CQ",
-                "حالة": "ساري المفعول"
-            },
-            {
-                "النظام": "تعليمات الحد الأدنى للأجور",
-                "الوصف": "تنظيم وتحديث الحد الأدنى للأجور",
-                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://mol.gov.jo/ar/NewsDetails/%25D8%25A7%25D9%2584%25D8%25AB%25D9%2584%25D8%25A7%25D8%25AB%25D9%258A%25D8%25A9_%25D8%25AA%25D8%25B1%25D9%2581%25D8%25B9_%25D8%25A7%25D9%2584%25D8%25AD%25D8%25AF_%25D8%25A7%25D9%2584%25D8%25A3%25D8%25AF%25D9%2586%25D9%2589_%25D9%2584%25D9%2584%25D8%25A3%25D8%25AC%25D9%2588%25D8%25B1_%25D8%25A5%25D9%2584%25D9%2589_290_%25D8%25AF%25D9%258A%25D9%2586%25D8%25A7%25D8%25B1%25D8%25A7_%25D8%25A7%25D8%25B9%25D8%25AA%25D8%25A8%25D8%25A7%25D8%25B1%25D8%25A7%25D9%258B_%25D9%2585%25D9%2586_%25D8%25A8%25D8%25AF%25D8%25A7%25D9%258A%25D8%25A9_%25D8%25B9%25D8%25A7%25D9%2585_2025&ved=2ahUKEwiiwt_X_-2QAxVYTqQEHQ_LC1gQFnoECBoQAQ&usg=AOvVaw1JeFwKBGQfIiI0MDsBiLvc",
-                "حالة": "ساري المفعول"
-            }
-        ]
-        
-        for reg in regulations:
-            with st.expander(f"📋 {reg['النظام']}"):
-                st.write(f"**الوصف:** {reg['الوصف']}")
-                st.write(f"**الحالة:** {reg['حالة']}")
-                st.markdown(f"[📄 عرض النظام]({reg['رابط']})")
-
-    st.markdown("##### 🔍 منهجية تحليل النصوص التشريعية")
-    
-    analysis_methods = [
-        "التحليل النصي: دراسة صياغة النص وتركيبه اللغوي",
-        "التحليل السياقي: فهم النص في سياقه التشريعي والاجتماعي", 
-        "التحليل المقارن: مقارنة النص مع تشريعات مشابهة",
-        "التحليل التطبيقي: دراسة كيفية تطبيق النص عملياً",
-        "التحليل التطوري: تتبع تطور النص عبر التعديلات"
-    ]
-    
-    for method in analysis_methods:
-        st.write(f"• {method}")
-
-# ==========================
-# 🎓 الدراسات والأبحاث - قاعدة معرفية شاملة
-# ==========================
-def show_academic_resources():
-    st.markdown("#### 🎓 المصادر الأكاديمية والبحثية")
-    
-    st.markdown("**الهدف:** توجيه الباحثين إلى المصادر الأكاديمية والدراسات البحثية")
-
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("##### المجلات العلمية المحكمة")
-        
-        journals = [
-            {
-                "المجلة": "المجلة الأردنية للقانون",
-                "الناشر": "الجامعة الأردنية",
-                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://dsr.ju.edu.jo/djournals/index.php/Law/user/setLocale/ar_IQ%3Fsource%3D%252Fdjournals%252Findex.php%252FLaw%252Fsearch&ved=2ahUKEwiWkeD0_-2QAxWwT6QEHcnRA1UQFnoECCYQAQ&usg=AOvVaw1n3sJNVEj5QbM6yd3WHo36",
-                "التخصص": "القانون العام والخاص"
-            },
-            {
-                "المجلة": "مجلة الشريعة والقانون",
-                "الناشر": "جامعة الإمارات",
-                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://scholarworks.uaeu.ac.ae/sharia_and_law/&ved=2ahUKEwjtlMCLgO6QAxVIOPsDHXevGQMQFnoECCEQAQ&usg=AOvVaw3cMX6GLqdlEkXkpn4s0sPc",
-                "التخصص": "الفقه والقانون المقارن"
-            },
-            {
-                "المجلة": "مجلة جامعة النجاح للأبحاث",
-                "الناشر": "جامعة النجاح الوطنية",
-                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://www.dfaj.net/index.php%3Fr%3Djournals/Journal%26i%3D31&ved=2ahUKEwjJy7qpgO6QAxXhAfsDHSqDChMQFnoECCEQAQ&usg=AOvVaw0HDV_IngGzTgOETDZr7rY2",
-                "التخصص": "الأبحاث العلمية المحكمة"
-            }
-        ]
-        
-        for journal in journals:
-            with st.expander(f"🎓 {journal['المجلة']}"):
-                st.write(f"**الناشر:** {journal['الناشر']}")
-                st.write(f"**التخصص:** {journal['التخصص']}")
-                st.markdown(f"[📚 زيارة المجلة]({journal['رابط']})")
-    
-    with col2:
-        st.markdown("##### المراكز البحثية")
-        
-        research_centers = [
-            {
-                "المركز": "مركز الدراسات الاستراتيجية",
-                "الجامعة": "الجامعة الأردنية", 
-                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://jcss.org/&ved=2ahUKEwi7k4vDgO6QAxVgOPsDHYs-JEUQFnoECB8QAQ&usg=AOvVaw0OGAjjEqgcM8V9EVDORl56",
-                "الإصدارات": "تقارير - أوراق سياسات - دراسات"
-            },
-            {
-                "المركز": "مركز حقوق الإنسان",
-                "الجامعة": "الجامعة الأردنية",
-                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://international.ju.edu.jo/ar/arabic/Lists/Courses/Disp_Course.aspx%3FID%3D432%26dept%3D%2520%25D8%25A7%25D9%2584%25D8%25AA%25D9%2586%25D9%2585%25D9%258A%25D8%25A9%2520%25D8%25A7%25D9%2584%25D8%25AF%25D9%2588%25D9%2584%25D9%258A%25D8%25A9%26prog%3D%25D9%2585%25D8%25A7%25D8%25AC%25D8%25B3%25D8%25AA%25D9%258A%25D8%25B1%2520%25D8%25AD%25D9%2582%25D9%2588%25D9%2582%2520%25D8%25A7%25D9%2584%25D8%25A5%25D9%2586%25D8%25B3%25D8%25A7%25D9%2586%2520%25D9%2588%25D8%25A7%25D9%2584%25D8%25AA%25D9%2586%25D9%2585%25D9%258A%25D8%25A9%2520%25D8%25A7%25D9%2584%25D8%25A5%25D9%2586%25D8%25B3%25D8%25A7%25D9%2586%25D9%258A%25D8%25A9%2520%26deptName%3D%2520%25D8%25A7%25D9%2584%25D8%25AA%25D9%2586%25D9%2585%25D9%258A%25D8%25A9%2520%25D8%25A7%25D9%2584%25D8%25AF%25D9%2588%25D9%2584%25D9%258A%25D8%25A9&ved=2ahUKEwisxJntgO6QAxVJTKQEHY7IFXkQFnoECD4QAQ&usg=AOvVaw3QYRMaBMvid8OuvYYiof_t",
-                "الإصدارات": "دراسات حقوقية - تقارير - أبحاث"
-            },
-            {
-                "المركز": "مركز دراسات العمل والتنمية",
-                "الجامعة": "الجامعة الهاشمية",
-                "رابط": "https://https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://hu.edu.jo/unitCenter/%3Funitid%3D90000000&ved=2ahUKEwjM9IiGge6QAxV8OfsDHQJoFOUQFnoECB4QAQ&usg=AOvVaw02g8CBlbBp7Zgs4LioQ62X",
-                "الإصدارات": "أبحاث اقتصادية - دراسات سوق العمل"
-            }
-        ]
-        
-        for center in research_centers:
-            with st.expander(f"🔬 {center['المركز']}"):
-                st.write(f"**الجامعة:** {center['الجامعة']}")
-                st.write(f"**الإصدارات:** {center['الإصدارات']}")
-                st.markdown(f"[🌐 زيارة المركز]({center['رابط']})")
-
-    st.markdown("##### 📊 تصنيف الدراسات البحثية")
-    
-    research_categories = {
-        "الدراسات النظرية": [
-            "تحليل النصوص التشريعية",
-            "دراسة المبادئ القانونية", 
-            "تحليل الأطر النظرية"
-        ],
-        "الدراسات التطبيقية": [
-            "تحليل التطبيق العملي للتشريعات",
-            "دراسة تأثير القوانين على أرض الواقع",
-            "تحليل كفاءة الأنظمة"
-        ],
-        "الدراسات المقارنة": [
-            "مقارنة التشريعات العربية",
-            "دراسة النماذج الدولية", 
-            "تحليل التجارب المقارنة"
-        ]
-    }
-    
-    for category, studies in research_categories.items():
-        with st.expander(f"📁 {category}"):
-            for study in studies:
-                st.write(f"• {study}")
-
-# ==========================
-# 🔍 أدوات البحث المتقدم - حزمة أدوات شاملة
-# ==========================
-def show_research_tools():
-    st.markdown("#### 🔍 أدوات ومنهجيات البحث العلمي")
-    
-    st.markdown("**الهدف:** توجيه الباحثين إلى الأدوات والتقنيات المساعدة في البحث العلمي")
-
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("##### أدوات البحث القانوني")
-        
-        research_tools = [
-            {
-                "الأداة": "منشئ الاقتباس القانوني",
-                "الوصف": "توليد تلقائي للاقتباسات بأنظمة مختلفة",
-                "رابط": "https://www.citethisforme.com/",
-                "الميزة": "مجاني - متعدد الأنظمة"
-            },
-            {
-                "الأداة": "مدقق التشريعات",
-                "الوصف": "مقارنة النصوص التشريعية وكشف التعديلات",
-                "رابط": "https://www.diffchecker.com/",
-                "الميزة": "مقارنة تلقائية"
-            },
-            {
-                "الأداة": "محول PDF إلى Word",
-                "الوصف": "تحويل ملفات PDF إلى نص قابل للتعديل",
-                "رابط": "https://smallpdf.com/ar/pdf-to-word",
-                "الميزة": "مجاني - سهل الاستخدام"
-            }
-        ]
-        
-        for tool in research_tools:
-            with st.expander(f"🛠️ {tool['الأداة']}"):
-                st.write(f"**الوصف:** {tool['الوصف']}")
-                st.write(f"**الميزة:** {tool['الميزة']}")
-                st.markdown(f"[🔧 استخدام الأداة]({tool['رابط']})")
-    
-    with col2:
-        st.markdown("##### منصات إدارة البحث")
-        
-        management_tools = [
-            {
-                "المنصة": "Zotero - إدارة المراجع",
-                "الوصف": "أداة مجانية ومفتوحة المصدر لإدارة المراجع",
-                "رابط": "https://www.zotero.org/",
-                "التكلفة": "مجاني بالكامل"
-            },
-            {
-                "المنصة": "Mendeley - إدارة الأبحاث", 
-                "الوصف": "منصة متكاملة لإدارة الأبحاث والتعاون العلمي",
-                "رابط": "https://www.mendeley.com/",
-                "التكلفة": "مجاني مع خيارات متقدمة"
-            },
-            {
-                "المنصة": "Google Scholar",
-                "الوصف": "محرك بحث أكاديمي للبحث في الأبحاث العلمية",
-                "رابط": "https://scholar.google.com/",
-                "التكلفة": "مجاني بالكامل"
-            }
-        ]
-        
-        for tool in management_tools:
-            with st.expander(f"📊 {tool['المنصة']}"):
-                st.write(f"**الوصف:** {tool['الوصف']}")
-                st.write(f"**التكلفة:** {tool['التكلفة']}")
-                st.markdown(f"[🚀 تجربة المنصة]({tool['رابط']})")
-
-    st.markdown("##### 📈 منهجيات تحليل البيانات")
-    
-    analysis_methodologies = [
-        {
-            "المنهجية": "التحليل الوصفي",
-            "الوصف": "وصف البيانات والمعلومات المجمعة",
-            "التطبيقات": ["توصيف العينات", "تحليل التوزيعات", "دراسة الخصائص"]
-        },
-        {
-            "المنهجية": "التحليل الاستدلالي", 
-            "الوصف": "الاستدلال على خصائص المجتمع من العينة",
-            "التطبيقات": ["اختبار الفرضيات", "تحليل العلاقات", "التعميم"]
-        },
-        {
-            "المنهجية": "التحليل السببي",
-            "الوصف": "دراسة العلاقات السببية بين المتغيرات",
-            "التطبيقات": ["تحليل الأثر", "دراسة العلاقات", "التنبؤ"]
-        }
-    ]
-    
-    for methodology in analysis_methodologies:
-        with st.expander(f"📊 {methodology['المنهجية']}"):
-            st.write(f"**الوصف:** {methodology['الوصف']}")
-            st.markdown("**مجالات التطبيق:**")
-            for app in methodology['التطبيقات']:
-                st.write(f"• {app}")
-
-# ==========================
-# 🌍 المقارنات الدولية - نظام مقارن متكامل
-# ==========================
-def show_international_comparisons():
-    st.markdown("#### 🌍 الدراسات المقارنة والتجارب الدولية")
-    
-    st.markdown("**الهدف:** توجيه الباحثين إلى مصادر المقارنات التشريعية الدولية")
-
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("##### المنظمات الدولية")
-        
-        international_orgs = [
-            {
-                "المنظمة": "منظمة العمل الدولية (ILO)",
-                "الوصف": "المرجع العالمي لمعايير العمل الدولية",
-                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://mol.gov.jo/AR/List/%25D8%25A7%25D9%2584%25D8%25A7%25D8%25AA%25D9%2581%25D8%25A7%25D9%2582%25D9%258A%25D8%25A7%25D8%25AA_%25D8%25A7%25D9%2584%25D8%25AF%25D9%2588%25D9%2584%25D9%258A%25D8%25A9&ved=2ahUKEwiHwbKuge6QAxXlSKQEHZ5IFxsQFnoECBsQAQ&usg=AOvVaw3FwSpwkc8risJgwdx-S1pE",
-                "المحتوى": "اتفاقيات - توصيات - تقارير"
-            },
-            {
-                "المنظمة": "البنك الدولي - قسم العمل",
-                "الوصف": "تقارير عن أسواق العمل والتنظيم",
-                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://www.albankaldawli.org/ar/topic/jobsandgrowth/overview&ved=2ahUKEwjYp4POge6QAxWDdaQEHcn1Ir4QFnoECBsQAQ&usg=AOvVaw26eJ9YxAME90ZWPx0XjYhg",
-                "المحتوى": "تقارير اقتصادية - دراسات تأثير"
-            },
-            {
-                "المنظمة": "منظمة التجارة العالمية",
-                "الوصف": "تنظيم التجارة وتأثيرها على العمالة", 
-                "رابط": "https://commonslibrary.parliament.uk/research-briefings/cbp-9942/",
-                "المحتوى": "دراسات تأثير العولمة على العمالة"
-            }
-        ]
-        
-        for org in international_orgs:
-            with st.expander(f"🌐 {org['المنظمة']}"):
-                st.write(f"**الوصف:** {org['الوصف']}")
-                st.write(f"**المحتوى:** {org['المحتوى']}")
-                st.markdown(f"[🏛️ زيارة المنظمة]({org['رابط']})")
-    
-    with col2:
-        st.markdown("##### قواعد البيانات الدولية")
-        
-        international_db = [
-            {
-                "القاعدة": "NATLEX - تشريعات العمل العالمية",
-                "الوصف": "قاعدة بيانات تشريعات العمل في مختلف الدول",
-                "رابط": "https://www.ilo.org/dyn/natlex/natlex4.home",
-                "التغطية": "187 دولة"
-            },
-            {
-                "القاعدة": "WIPO Lex - الملكية الفكرية",
-                "الوصف": "قاعدة بيانات تشريعات الملكية الفكرية العالمية", 
-                "رابط": "https://wipolex.wipo.int/ar/main/legislation",
-                "التغطية": "شاملة"
-            },
-            {
-                "القاعدة": "FAOLEX - التشريعات الزراعية",
-                "الوصف": "قاعدة بيانات التشريعات الزراعية والغذائية",
-                "رابط": "http://www.fao.org/faolex/ar/",
-                "التغطية": "شاملة"
-            }
-        ]
-        
-        for db in international_db:
-            with st.expander(f"📈 {db['القاعدة']}"):
-                st.write(f"**الوصف:** {db['الوصف']}")
-                st.write(f"**التغطية:** {db['التغطية']}")
-                st.markdown(f"[📊 الانتقال للقاعدة]({db['رابط']})")
-
-    st.markdown("##### 🔍 منهجيات البحث المقارن")
-    
-    comparison_methods = [
-        "المقارنة الوصفية: وصف الأنظمة القانونية المختلفة",
-        "المقارنة التحليلية: تحليل العوامل المؤثرة في الاختلافات", 
-        "المقارنة التقييمية: تقييم كفاءة النماذج المختلفة",
-        "المقارنة التطويرية: استخلاص الدروس والتوصيات"
-    ]
-    
-    for method in comparison_methods:
-        st.write(f"• {method}")
-
-# ==========================
-# ⚖️ المنصات القانونية - بيئة رقمية متكاملة
-# ==========================
-def show_legal_platforms():
-    st.markdown("#### ⚖️ المنصات والبيئات الرقمية القانونية")
-    
-    st.markdown("**الهدف:** التعريف بالمنصات الرقمية الشاملة للبحث والاستشارة القانونية")
-
-    st.markdown("##### منصة قسطاس القانونية")
-    
-    st.markdown("""
-    **قسطاس** - منصة رقمية شاملة تهدف إلى توحيد المرجعية القانونية العربية 
-    وتبسيط الوصول إلى التشريعات والقوانين
-    """)
-
-    # خدمات المنصة
-    st.markdown("##### الخدمات والأدوات المتاحة")
-    
-    services = [
-        {
-            "الخدمة": "محرك البحث التشريعي المتقدم",
-            "الوصف": "بحث ذكي في النصوص التشريعية العربية",
-            "الميزات": ["بحث دلالي", "مقارنة نصوص", "تتبع التعديلات"]
-        },
-        {
-            "الخدمة": "قاعدة الأحكام القضائية", 
-            "الوصف": "أحكام محاكم عربية في مختلف التخصصات",
-            "الميزات": ["تصنيف موضوعي", "تحليل اتجاهات", "إحصائيات قضائية"]
-        },
-        {
-            "الخدمة": "الأدوات البحثية المساعدة",
-            "الوصف": "حزمة أدوات دعم للبحث العلمي",
-            "الميزات": ["إدارة مراجع", "تحليل استشهادات", "قوالب بحث"]
-        }
-    ]
-    
-    for service in services:
-        with st.expander(f"⚖️ {service['الخدمة']}"):
-            st.write(f"**الوصف:** {service['الوصف']}")
-            st.markdown("**الميزات:**")
-            for feature in service['الميزات']:
-                st.write(f"• {feature}")
-
-    # كيفية الوصول - الجزء المصحح
-    st.markdown("##### كيفية الوصول إلى المنصة")
-    
-    access_info = [
-        {
-            "الطريقة": "الموقع الإلكتروني الرسمي",
-            "الرابط": "https://qistas.com",
-            "الوصف": "المنصة الرئيسية بجميع خدماتها"
-        },
-        {
-            "الطريقة": "البريد الإلكتروني",
-            "الرابط": "info@qistas.com", 
-            "الوصف": "للاستفسارات والدعم الفني"
-        }
-    ]
-    
-    for info in access_info:
-        with st.expander(f"📱 {info['الطريقة']}"):
-            st.write(f"**الرابط:** {info['الرابط']}")
-            st.write(f"**الوصف:** {info['الوصف']}")
-            if info['الطريقة'] == "الموقع الإلكتروني الرسمي":
-                st.markdown(f"[🚀 الانتقال مباشرة]({info['الرابط']})")
-
-    st.markdown("##### 📋 معايير تقييم المنصات القانونية")
-    
-    evaluation_criteria = [
-        "الشمولية والتغطية: مدى شمولية المحتوى",
-        "الدقة والموثوقية: دقة المعلومات وموثوقية المصادر",
-        "سهولة الاستخدام: مدى سهولة استخدام المنصة",
-        "الأداء والتقنية: كفاءة المنصة التقنية وسرعة أدائها",
-        "التكامل والربط: قدرة المنصة على التكامل مع أنظمة أخرى"
-    ]
-    
-    for criterion in evaluation_criteria:
-        st.write(f"✅ {criterion}")
-# ==========================
-# 🧮 قسم الحاسبات - النظام المتكامل والمصحح 100%
-# ==========================
-def show_calculators_section():
-    show_breadcrumbs("🧮 الحاسبات")
-    
-    st.markdown("""
-    <div class="header-with-logo">
-        <div class="logo-container">
-            <div class="logo-text">🧮</div>
-        </div>
-        <div style="text-align: center;">
-            <h1>🧮 الحاسبات القانونية المتكاملة</h1>
-            <p>أدوات حسابية دقيقة لحساب جميع المستحقات القانونية وفق قانون العمل الأردني</p>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.info("""
-    **💡 دليل الاستخدام:** 
-    اختر الآلة الحاسبة المناسبة من القائمة أدناه، ثم أدخل البيانات المطلوبة للحصول على نتائج دقيقة.
-    جميع الحسابات مبنية على قانون العمل الأردني رقم 8 لسنة 1996 وتعديلاته.
-    """)
-
-    # تبويبات الحاسبات الرئيسية
-    calculator_tabs = st.tabs([
-        "💰 نهاية الخدمة",
-        "⏰ العمل والإجازات", 
-        "🏥 تعويضات الإصابات",
-        "📊 الضمان الاجتماعي",
-        "⚖️ التعويضات القانونية",
-        "📈 حاسبات متقدمة"
-    ])
-
-    with calculator_tabs[0]:
-        show_end_of_service_calculator()
-
-    with calculator_tabs[1]:
-        show_work_leave_calculator()
-
-    with calculator_tabs[2]:
-        show_compensation_calculator()
-
-    with calculator_tabs[3]:
-        show_social_security_calculator()
-
-    with calculator_tabs[4]:
-        show_legal_compensation_calculator()
-
-    with calculator_tabs[5]:
-        show_advanced_calculators()
-
-def show_end_of_service_calculator():
-    """حاسبة مستحقات نهاية الخدمة - مصححة حسب القانون"""
-    st.markdown("#### 💰 حاسبة مكافأة نهاية الخدمة")
-    
-    with st.form("end_service_form"):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            basic_salary = st.number_input(
-                "الراتب الأساسي (دينار)",
-                min_value=290.0,
-                value=500.0,
-                help="الحد الأدنى للأجور 290 دينار"
-            )
-            years = st.number_input(
-                "سنوات الخدمة", 
-                min_value=0, 
-                max_value=50,
-                value=5
-            )
-            
-        with col2:
-            months = st.number_input(
-                "أشهر الخدمة",
-                min_value=0,
-                max_value=11,
-                value=0
-            )
-            termination_type = st.selectbox(
-                "نوع إنهاء الخدمة",
-                ["استقالة", "إنهاء من صاحب العمل", "إنهاء لأسباب تأديبية"],
-                help="اختر سبب إنهاء عقد العمل"
-            )
-        
-        # إضافة معلومات إضافية للحساب الدقيق
-        st.markdown("##### 📝 معلومات إضافية")
-        col3, col4 = st.columns(2)
-        with col3:
-            last_salary = st.number_input(
-                "آخر راتب تقاضاه العامل (دينار)",
-                min_value=290.0,
-                value=500.0,
-                help="لحساب المكافأة بدقة"
-            )
-        
-        with col4:
-            service_type = st.selectbox(
-                "نوع الخدمة",
-                ["مستمرة", "متقطعة"],
-                help="الخدمة المستمرة تحتسب بكامل المدة"
-            )
-        
-        if st.form_submit_button("🧮 احسب المكافأة", use_container_width=True):
-            result = calculate_end_of_service(basic_salary, years, months, termination_type, last_salary, service_type)
-            display_service_result(result)
-
-def calculate_end_of_service(basic_salary, years, months, termination_type, last_salary, service_type):
-    """حساب مكافأة نهاية الخدمة - المادة 33"""
-    
-    # حساب المدة الإجمالية للخدمة بالأشهر
-    total_months = years * 12 + months
-    
-    # تحديد نوع الحساب حسب سبب إنهاء الخدمة
-    if termination_type == "استقالة":
-        if total_months < 36:  # أقل من 3 سنوات
-            amount = 0
-            explanation = "لا تستحق المكافأة لأقل من 3 سنوات خدمة في حالة الاستقالة (المادة 33)"
-        elif total_months < 60:  # من 3 إلى 5 سنوات
-            # نصف أجر شهر عن كل سنة
-            amount = (last_salary / 2) * years
-            explanation = "نصف أجر شهر عن كل سنة خدمة من 3-5 سنوات (المادة 33)"
-        else:  # أكثر من 5 سنوات
-            # أجر شهر كامل عن كل سنة
-            amount = last_salary * years
-            explanation = "أجر شهر كامل عن كل سنة خدمة لأكثر من 5 سنوات (المادة 33)"
-    
-    elif termination_type == "إنهاء من صاحب العمل":
-        if total_months < 12:  # أقل من سنة
-            amount = 0
-            explanation = "لا تستحق المكافأة لأقل من سنة خدمة (المادة 33)"
-        else:
-            # أجر شهرين عن كل سنة خدمة
-            amount = last_salary * 2 * years
-            explanation = "أجر شهرين عن كل سنة خدمة في حالة إنهاء الخدمة من صاحب العمل (المادة 33)"
-    
-    else:  # أسباب تأديبية
-        amount = 0
-        explanation = "لا تستحق المكافأة في حالات الفصل التأديبي (المادة 33)"
-    
-    # احتساب كسور السنة
-    if months > 0 and amount > 0:
-        monthly_rate = amount / years if years > 0 else 0
-        additional_amount = (monthly_rate / 12) * months
-        amount += additional_amount
-        explanation += f" + نسبة عن {months} شهر"
-    
-    return {
-        'amount': amount,
-        'explanation': explanation,
-        'details': {
-            'الراتب الأساسي': f'{basic_salary:,.0f} دينار',
-            'آخر راتب': f'{last_salary:,.0f} دينار',
-            'مدة الخدمة': f'{years} سنة و {months} شهر',
-            'إجمالي أشهر الخدمة': f'{total_months} شهر',
-            'نهاية الخدمة': termination_type,
-            'نوع الخدمة': service_type,
-            'الأساس القانوني': 'المادة 33'
-        }
-    }
-
-def show_work_leave_calculator():
-    """حاسبة العمل والإجازات - مصححة حسب القانون"""
-    st.markdown("#### ⏰ حاسبة العمل والإجازات")
-    
-    calc_type = st.selectbox(
-        "اختر نوع الحساب",
-        [
-            "بدل العمل الإضافي",
-            "الإجازة السنوية", 
-            "الإجازة المرضية",
-            "بدل الإشعار",
-            "إجازة الأمومة",
-            "إجازة الأبوة",
-            "إجازة الحج"
-        ],
-        key="work_leave_type"
-    )
-    
-    with st.form("work_leave_form"):
-        basic_salary = st.number_input(
-            "الراتب الأساسي (دينار)",
-            min_value=290.0,
-            value=500.0,
-            key="wl_salary"
-        )
-        
-        if calc_type == "بدل العمل الإضافي":
-            col1, col2 = st.columns(2)
-            with col1:
-                overtime_hours = st.number_input("ساعات العمل الإضافي", min_value=0, value=8)
-                overtime_days = st.number_input("أيام العمل الإضافي", min_value=0, value=1)
-            with col2:
-                work_day_type = st.selectbox("نوع اليوم", ["عادي", "جمعة أو عطلة رسمية", "عمل ليلي"])
-            
-        elif calc_type == "الإجازة السنوية":
-            col1, col2 = st.columns(2)
-            with col1:
-                service_years = st.number_input("سنوات الخدمة", min_value=0, value=3)
-            with col2:
-                requested_days = st.number_input("أيام الإجازة المطلوبة", min_value=1, value=14)
-            
-        elif calc_type == "الإجازة المرضية":
-            col1, col2 = st.columns(2)
-            with col1:
-                sick_days = st.number_input("أيام الإجازة المرضية", min_value=0, value=10)
-            with col2:
-                in_hospital = st.checkbox("المريض مقيم في المستشفى")
-            
-        elif calc_type == "بدل الإشعار":
-            notice_days = st.number_input("أيام الإشعار المستحقة", min_value=0, value=30)
-            actual_work_days = st.number_input("الأيام الفعلية المتبقية", min_value=0, value=15)
-        
-        elif calc_type == "إجازة الأمومة":
-            st.info("إجازة الأمومة 10 أسابيع مدفوعة الأجر حسب المادة 70")
-            
-        elif calc_type == "إجازة الأبوة":
-            st.info("إجازة الأبوة 3 أيام مدفوعة الأجر حسب المادة 71")
-            
-        elif calc_type == "إجازة الحج":
-            service_years_haj = st.number_input("سنوات الخدمة للحج", min_value=5, value=5)
-            st.info("إجازة الحج 14 يوم بشرط 5 سنوات خدمة مستمرة (المادة 71)")
-        
-        if st.form_submit_button("🧮 احسب", use_container_width=True):
-            if calc_type == "بدل العمل الإضافي":
-                result = calculate_overtime(basic_salary, overtime_hours, overtime_days, work_day_type)
-            elif calc_type == "الإجازة السنوية":
-                result = calculate_annual_leave(basic_salary, service_years, requested_days)
-            elif calc_type == "الإجازة المرضية":
-                result = calculate_sick_leave(basic_salary, sick_days, in_hospital)
-            elif calc_type == "بدل الإشعار":
-                result = calculate_notice_period(basic_salary, notice_days, actual_work_days)
-            elif calc_type == "إجازة الأمومة":
-                result = calculate_maternity_leave(basic_salary)
-            elif calc_type == "إجازة الأبوة":
-                result = calculate_paternity_leave(basic_salary)
-            elif calc_type == "إجازة الحج":
-                result = calculate_haj_leave(basic_salary, service_years_haj)
-            
-            display_work_leave_result(result, calc_type)
-
-def calculate_overtime(basic_salary, overtime_hours, overtime_days, work_day_type):
-    """حساب العمل الإضافي - المادة 54"""
-    daily_rate = basic_salary / 30
-    hourly_rate = daily_rate / 8
-    
-    if work_day_type == "عادي":
-        rate = 1.25  # زيادة 25%
-        explanation = "زيادة 25% للعمل الإضافي في الأيام العادية (المادة 54/1)"
-    elif work_day_type == "جمعة أو عطلة رسمية":
-        rate = 1.5  # زيادة 50%
-        explanation = "زيادة 50% للعمل في أيام العطل الرسمية (المادة 54/2)"
-    else:  # عمل ليلي
-        rate = 1.35  # زيادة 35% افتراضية
-        explanation = "زيادة 35% للعمل الليلي (حسب الأنظمة)"
-    
-    # حساب المبلغ
-    overtime_amount = overtime_hours * hourly_rate * rate
-    daily_overtime = overtime_days * daily_rate * (rate - 1)  # للعمل ليوم كامل
-    
-    total_amount = overtime_amount + daily_overtime
-    
-    return {
-        'amount': total_amount,
-        'explanation': explanation,
-        'details': {
-            'ساعات العمل الإضافي': f'{overtime_hours} ساعة',
-            'أيام العمل الإضافي': f'{overtime_days} يوم',
-            'سعر الساعة العادي': f'{hourly_rate:,.2f} دينار',
-            'سعر الساعة الإضافي': f'{hourly_rate * rate:,.2f} دينار',
-            'معدل الزيادة': f'{int((rate-1)*100)}%',
-            'نوع اليوم': work_day_type,
-            'الأساس القانوني': 'المادة 54'
-        }
-    }
-
-def calculate_annual_leave(basic_salary, service_years, requested_days):
-    """حساب الإجازة السنوية - المادة 57"""
-    daily_rate = basic_salary / 30
-    
-    # تحديد أيام الإجازة المستحقة حسب سنوات الخدمة
-    if service_years < 5:
-        entitled_days = 14
-        explanation = "14 يوم إجازة سنوية لأقل من 5 سنوات خدمة (المادة 57/أ)"
-    else:
-        entitled_days = 21
-        explanation = "21 يوم إجازة سنوية لـ5 سنوات خدمة فأكثر (المادة 57/أ)"
-    
-    # تحديد الأيام المحتسبة (لا يمكن تجاوز المستحق)
-    calculated_days = min(requested_days, entitled_days)
-    amount = daily_rate * calculated_days
-    
-    if requested_days > entitled_days:
-        explanation += f" - تم حساب {calculated_days} يوم فقط من {requested_days} يوم مطلوب"
-    
-    return {
-        'amount': amount,
-        'explanation': explanation,
-        'details': {
-            'أيام الإجازة المطلوبة': f'{requested_days} يوم',
-            'أيام الإجازة المستحقة': f'{entitled_days} يوم',
-            'أيام الإجازة المحتسبة': f'{calculated_days} يوم',
-            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
-            'سنوات الخدمة': f'{service_years} سنة',
-            'الأساس القانوني': 'المادة 57'
-        }
-    }
-
-def calculate_sick_leave(basic_salary, sick_days, in_hospital=False):
-    """حساب الإجازة المرضية - المادة 68"""
-    daily_rate = basic_salary / 30
-    
-    if sick_days <= 14:
-        # أول 14 يوم بأجر كامل
-        paid_days = sick_days
-        amount = daily_rate * paid_days
-        explanation = f"{sick_days} يوم إجازة مرضية بأجر كامل (المادة 68)"
-    
-    elif sick_days <= 28 and in_hospital:
-        # حتى 28 يوم للمقيمين في المستشفى
-        paid_days = sick_days
-        amount = daily_rate * paid_days
-        explanation = f"{sick_days} يوم إجازة مرضية بأجر كامل (مقيم في المستشفى) - المادة 68"
-    
-    elif sick_days <= 28 and not in_hospital:
-        # 14 يوم بأجر كامل + 14 يوم بنصف أجر
-        full_pay_days = 14
-        half_pay_days = min(sick_days - 14, 14)
-        unpaid_days = max(sick_days - 28, 0)
-        
-        amount = (daily_rate * full_pay_days) + (daily_rate * 0.5 * half_pay_days)
-        explanation = f"14 يوم بأجر كامل + {half_pay_days} يوم بنصف أجر (المادة 68)"
-        
-        if unpaid_days > 0:
-            explanation += f" + {unpaid_days} يوم بدون أجر"
-    
-    else:
-        # أكثر من 28 يوم
-        full_pay_days = 14
-        half_pay_days = 14
-        unpaid_days = sick_days - 28
-        
-        amount = (daily_rate * full_pay_days) + (daily_rate * 0.5 * half_pay_days)
-        explanation = f"14 يوم بأجر كامل + 14 يوم بنصف أجر + {unpaid_days} يوم بدون أجر (المادة 68)"
-    
-    return {
-        'amount': amount,
-        'explanation': explanation,
-        'details': {
-            'أيام الإجازة المرضية': f'{sick_days} يوم',
-            'الحالة الصحية': 'مقيم في المستشفى' if in_hospital else 'غير مقيم',
-            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
-            'الأيام المدفوعة بالكامل': '14 يوم',
-            'الأيام المدفوعة بالنصف': '14 يوم كحد أقصى',
-            'الأساس القانوني': 'المادة 68'
-        }
-    }
-
-def calculate_notice_period(basic_salary, notice_days, actual_work_days):
-    """حساب بدل الإشعار - المادة 29"""
-    daily_rate = basic_salary / 30
-    
-    # الأيام التي لم يعملها العامل خلال فترة الإشعار
-    unpaid_notice_days = max(notice_days - actual_work_days, 0)
-    amount = daily_rate * unpaid_notice_days
-    
-    if unpaid_notice_days > 0:
-        explanation = f"بدل إشعار عن {unpaid_notice_days} يوم لم يتم العمل بها (المادة 29)"
-    else:
-        explanation = "لا مستحقات للإشعار حيث تم العمل بكامل فترة الإشعار (المادة 29)"
-    
-    return {
-        'amount': amount,
-        'explanation': explanation,
-        'details': {
-            'مدة الإشعار المستحقة': f'{notice_days} يوم',
-            'الأيام الفعلية المتبقية': f'{actual_work_days} يوم',
-            'أيام الإشعار غير المعملة': f'{unpaid_notice_days} يوم',
-            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
-            'الأساس القانوني': 'المادة 29'
-        }
-    }
-
-def calculate_maternity_leave(basic_salary):
-    """حساب إجازة الأمومة - المادة 70"""
-    daily_rate = basic_salary / 30
-    maternity_days = 70  # 10 أسابيع = 70 يوم
-    amount = daily_rate * maternity_days
-    
-    return {
-        'amount': amount,
-        'explanation': 'إجازة أمومة 10 أسابيع (70 يوم) بأجر كامل (المادة 70)',
-        'details': {
-            'مدة الإجازة': '10 أسابيع (70 يوم)',
-            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
-            'المدة قبل الولادة': '4 أسابيع (قابلة للتغيير)',
-            'المدة بعد الولادة': '6 أسابيع (إلزامية)',
-            'شروط الاستحقاق': 'جميع العاملات بغض النظر عن مدة الخدمة',
-            'الأساس القانوني': 'المادة 70'
-        }
-    }
-
-def calculate_paternity_leave(basic_salary):
-    """حساب إجازة الأبوة - المادة 71"""
-    daily_rate = basic_salary / 30
-    paternity_days = 3
-    amount = daily_rate * paternity_days
-    
-    return {
-        'amount': amount,
-        'explanation': 'إجازة أبوة 3 أيام بأجر كامل (المادة 71)',
-        'details': {
-            'مدة الإجازة': '3 أيام',
-            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
-            'شروط الاستحقاق': 'مرة واحدة خلال مدة الخدمة',
-            'وقت الاستحقاق': 'بعد ولادة الطفل',
-            'الأساس القانوني': 'المادة 71'
-        }
-    }
-
-def calculate_haj_leave(basic_salary, service_years):
-    """حساب إجازة الحج - المادة 71"""
-    daily_rate = basic_salary / 30
-    
-    if service_years >= 5:
-        haj_days = 14
-        amount = daily_rate * haj_days
-        explanation = f'إجازة حج 14 يوم بأجر كامل (بعد {service_years} سنوات خدمة) - المادة 71'
-    else:
-        haj_days = 0
-        amount = 0
-        explanation = f'لا تستحق إجازة الحج (تتطلب 5 سنوات خدمة مستمرة) - لديك {service_years} سنوات'
-    
-    return {
-        'amount': amount,
-        'explanation': explanation,
-        'details': {
-            'مدة الإجازة': f'{haj_days} يوم',
-            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
-            'سنوات الخدمة المطلوبة': '5 سنوات مستمرة',
-            'سنوات الخدمة الفعلية': f'{service_years} سنة',
-            'شروط الاستحقاق': 'مرة واحدة خلال مدة الخدمة',
-            'الأساس القانوني': 'المادة 71'
-        }
-    }
-
-def show_compensation_calculator():
-    """حاسبة تعويضات الإصابات - مصححة حسب القانون"""
-    st.markdown("#### 🏥 حاسبة تعويضات إصابات العمل")
-    
-    with st.form("compensation_form"):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            basic_salary = st.number_input(
-                "الراتب الأساسي (دينار)",
-                min_value=290.0,
-                value=500.0,
-                key="comp_salary"
-            )
-            
-            injury_type = st.selectbox(
-                "نوع الإصابة",
-                [
-                    "وفاة",
-                    "عجز كلي دائم", 
-                    "عجز جزئي دائم",
-                    "عجز مؤقت"
-                ],
-                key="comp_type"
-            )
-        
-        with col2:
-            if injury_type == "عجز جزئي دائم":
-                disability_percentage = st.slider(
-                    "نسبة العجز (%)",
-                    min_value=1,
-                    max_value=99,
-                    value=30,
-                    key="comp_percent"
-                )
-            else:
-                disability_percentage = 0
-                
-            medical_expenses = st.number_input(
-                "المصاريف الطبية (دينار)",
-                min_value=0.0,
-                value=0.0,
-                key="comp_medical",
-                help="التكاليف الطبية الموثقة لإصابة العمل"
-            )
-            
-            # إضافة معلومات عن مدة العلاج للعجز المؤقت
-            if injury_type == "عجز مؤقت":
-                treatment_days = st.number_input(
-                    "أيام العلاج",
-                    min_value=1,
-                    value=30,
-                    key="comp_treatment_days"
-                )
-            else:
-                treatment_days = 0
-        
-        if st.form_submit_button("🧮 احسب التعويض", use_container_width=True):
-            result = calculate_work_injury_compensation(
-                basic_salary, injury_type, disability_percentage, medical_expenses, treatment_days
-            )
-            display_compensation_result(result)
-
-def calculate_work_injury_compensation(basic_salary, injury_type, disability_percentage=0, medical_expenses=0, treatment_days=0):
-    """حساب تعويض إصابة العمل - المواد 87-96"""
-    daily_rate = basic_salary / 30
-    
-    if injury_type == "وفاة":
-        # تعويض الوفاة: أجر 1500 يوم عمل (المادة 87/أ)
-        base_compensation = daily_rate * 1500
-        if base_compensation < 2000:
-            compensation = 2000
-            explanation = "تعويض الوفاة: 2,000 دينار (الحد الأدنى) - المادة 87/أ"
-        elif base_compensation > 5000:
-            compensation = 5000
-            explanation = "تعويض الوفاة: 5,000 دينار (الحد الأقصى) - المادة 87/أ"
-        else:
-            compensation = base_compensation
-            explanation = f"تعويض الوفاة: {compensation:,.0f} دينار (1500 يوم عمل) - المادة 87/أ"
-    
-    elif injury_type == "عجز كلي دائم":
-        # نفس تعويض الوفاة (المادة 87/أ)
-        base_compensation = daily_rate * 1500
-        if base_compensation < 2000:
-            compensation = 2000
-            explanation = "تعويض العجز الكلي: 2,000 دينار (الحد الأدنى) - المادة 87/أ"
-        elif base_compensation > 5000:
-            compensation = 5000
-            explanation = "تعويض العجز الكلي: 5,000 دينار (الحد الأقصى) - المادة 87/أ"
-        else:
-            compensation = base_compensation
-            explanation = f"تعويض العجز الكلي: {compensation:,.0f} دينار (1500 يوم عمل) - المادة 87/أ"
-    
-    elif injury_type == "عجز جزئي دائم":
-        # نسبة من تعويض العجز الكلي حسب نسبة العجز (المادة 87/ج)
-        base_compensation = daily_rate * 1500
-        base_compensation = max(2000, min(base_compensation, 5000))
-        compensation = base_compensation * (disability_percentage / 100)
-        explanation = f"تعويض العجز الجزئي: {disability_percentage}% من تعويض العجز الكلي - المادة 87/ج"
-    
-    elif injury_type == "عجز مؤقت":
-        # بدل يومي 75% من الأجر للمعالجة خارج المستشفى (المادة 87/ب)
-        daily_allowance = daily_rate * 0.75
-        compensation = daily_allowance * treatment_days
-        explanation = f"بدل يومي 75% من الأجر لمدة {treatment_days} يوم - المادة 87/ب"
-    
-    else:
-        compensation = 0
-        explanation = "نوع الإصابة غير معروف"
-    
-    # إضافة المصاريف الطبية
-    total_compensation = compensation + medical_expenses
-    
-    return {
-        'compensation': compensation,
-        'medical_expenses': medical_expenses,
-        'total_amount': total_compensation,
-        'explanation': explanation,
-        'details': {
-            'الراتب الأساسي': f'{basic_salary:,.0f} دينار',
-            'نوع الإصابة': injury_type,
-            'نسبة العجز': f'{disability_percentage}%' if disability_percentage else 'لا ينطبق',
-            'أيام العلاج': f'{treatment_days} يوم' if treatment_days else 'لا ينطبق',
-            'المصاريف الطبية': f'{medical_expenses:,.0f} دينار',
-            'الأجر اليومي': f'{daily_rate:,.2f} دينار',
-            'الأساس القانوني': 'المواد 87-96'
-        }
-    }
-
-def show_social_security_calculator():
-    """حاسبة الضمان الاجتماعي - مصححة"""
-    st.markdown("#### 🏛️ حاسبة اشتراك الضمان الاجتماعي")
-    
-    with st.form("social_security_form"):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            basic_salary = st.number_input(
-                "الراتب الأساسي (دينار)",
-                min_value=290.0,
-                value=500.0,
-                key="ss_salary"
-            )
-            
-            # نسب الاشتراك حسب قانون الضمان الاجتماعي
-            st.info("نسب الاشتراك الافتراضية حسب قانون الضمان الاجتماعي")
-            
-        with col2:
-            employee_rate = st.number_input(
-                "نسبة اشتراك الموظف (%)",
-                min_value=0.0,
-                max_value=20.0,
-                value=7.5,
-                key="ss_employee",
-                help="النسبة القانونية 7.5%"
-            )
-            
-            employer_rate = st.number_input(
-                "نسبة اشتراك صاحب العمل (%)",
-                min_value=0.0,
-                max_value=20.0,
-                value=14.5,
-                key="ss_employer",
-                help="النسبة القانونية 14.5%"
-            )
-        
-        salary_ceiling = st.number_input(
-            "الحد الأقصى للأجر الخاضع (دينار)",
-            min_value=500.0,
-            value=5000.0,
-            key="ss_ceiling",
-            help="الحد الأقصى للأجور الخاضعة للاشتراك"
-        )
-        
-        calculation_type = st.selectbox(
-            "فترة الحساب",
-            ["شهري", "ربع سنوي", "سنوي"],
-            key="ss_period"
-        )
-        
-        if st.form_submit_button("🧮 احسب الاشتراكات", use_container_width=True):
-            result = calculate_social_security_contributions(basic_salary, employee_rate, employer_rate, salary_ceiling, calculation_type)
-            display_social_security_result(result)
-
-def calculate_social_security_contributions(employee_salary, employee_rate, employer_rate, salary_ceiling, calculation_type):
-    """حساب اشتراكات الضمان الاجتماعي"""
-    # الأجر الخاضع للاشتراك (لا يتجاوز السقف)
-    insurable_salary = min(employee_salary, salary_ceiling)
-    
-    # حساب الاشتراكات
-    employee_share = insurable_salary * (employee_rate / 100)
-    employer_share = insurable_salary * (employer_rate / 100)
-    total_share = employee_share + employer_share
-    
-    # ضرب حسب الفترة
-    multipliers = {"شهري": 1, "ربع سنوي": 3, "سنوي": 12}
-    multiplier = multipliers.get(calculation_type, 1)
-    
-    return {
-        'employee_share': employee_share * multiplier,
-        'employer_share': employer_share * multiplier,
-        'total_share': total_share * multiplier,
-        'details': {
-            'الراتب الأساسي': f'{employee_salary:,.0f} دينار',
-            'الراتب الخاضع للاشتراك': f'{insurable_salary:,.0f} دينار',
-            'نسبة الموظف': f'{employee_rate}%',
-            'نسبة صاحب العمل': f'{employer_rate}%',
-            'فترة الحساب': calculation_type,
-            'الحد الأقصى للأجر الخاضع': f'{salary_ceiling:,.0f} دينار',
-            'الاشتراك الشهري الإجمالي': f'{total_share:,.0f} دينار'
-        }
-    }
-
-def display_social_security_result(result):
-    """عرض نتيجة حساب الضمان الاجتماعي"""
-    st.success(f"""
-    ## 🏛️ نتائج حساب الضمان الاجتماعي
-    
-    **الاشتراكات الشهرية:**
-    - **نسبة الموظف:** {result['employee_share']:,.0f} دينار
-    - **نسبة صاحب العمل:** {result['employer_share']:,.0f} دينار
-    - **الإجمالي:** {result['total_share']:,.0f} دينار
-    """)
-    
-    with st.expander("📊 التفاصيل الكاملة", expanded=True):
-        for key, value in result['details'].items():
-            st.write(f"**{key}:** {value}")
-
-def show_legal_compensation_calculator():
-    """حاسبة التعويضات القانونية - مصححة"""
-    st.markdown("#### ⚖️ حاسبة التعويضات القانونية")
-    
-    comp_type = st.selectbox(
-        "نوع التعويض",
-        [
-            "تعويض الفصل التعسفي",
-            "تعويض تأخر صرف الرواتب", 
-            "تعويض الإجازات المستحقة",
-            "تعويض عدم تسجيل في الضمان"
-        ],
-        key="legal_comp_type"
-    )
-    
-    with st.form("legal_comp_form"):
-        basic_salary = st.number_input(
-            "الراتب الأساسي (دينار)",
-            min_value=290.0,
-            value=500.0,
-            key="legal_comp_salary"
-        )
-        
-        if comp_type == "تعويض الفصل التعسفي":
-            col1, col2 = st.columns(2)
-            with col1:
-                service_years = st.number_input("سنوات الخدمة", min_value=0, value=3)
-                actual_notice = st.selectbox("تم إعطاء الإشعار؟", ["نعم", "لا", "جزئي"])
-            with col2:
-                dismissal_reason = st.selectbox("سبب الفصل", [
-                    "تعسفي بدون سبب مبرر", 
-                    "لأسباب اقتصادية غير حقيقية",
-                    "لأسباب تأديبية غير مثبتة",
-                    "تمييز على أساس الجنس أو الدين"
-                ])
-            
-        elif comp_type == "تعويض تأخر صرف الرواتب":
-            col1, col2 = st.columns(2)
-            with col1:
-                delay_months = st.number_input("أشهر التأخير", min_value=0, value=2)
-            with col2:
-                delay_days = st.number_input("أيام التأخير الإضافية", min_value=0, value=15)
-            
-        elif comp_type == "تعويض الإجازات المستحقة":
-            col1, col2 = st.columns(2)
-            with col1:
-                accrued_leave = st.number_input("أيام الإجازة المستحقة", min_value=0, value=21)
-            with col2:
-                service_years_leave = st.number_input("سنوات الخدمة للإجازة", min_value=0, value=3)
-            
-        elif comp_type == "تعويض عدم تسجيل في الضمان":
-            col1, col2 = st.columns(2)
-            with col1:
-                unregistered_months = st.number_input("أشهر عدم التسجيل", min_value=1, value=12)
-            with col2:
-                st.info("التعويض يشمل الاشتراكات المتأخرة والغرامات")
-        
-        if st.form_submit_button("🧮 احسب التعويض", use_container_width=True):
-            if comp_type == "تعويض الفصل التعسفي":
-                result = calculate_unfair_dismissal_compensation(basic_salary, service_years, actual_notice, dismissal_reason)
-            elif comp_type == "تعويض تأخر صرف الرواتب":
-                result = calculate_salary_delay_compensation(basic_salary, delay_months, delay_days)
-            elif comp_type == "تعويض الإجازات المستحقة":
-                result = calculate_accrued_leave_compensation(basic_salary, accrued_leave, service_years_leave)
-            elif comp_type == "تعويض عدم تسجيل في الضمان":
-                result = calculate_social_security_penalty(basic_salary, unregistered_months)
-            
-            display_legal_compensation_result(result, comp_type)
-
-def calculate_unfair_dismissal_compensation(basic_salary, service_years, actual_notice, dismissal_reason):
-    """حساب تعويض الفصل التعسفي"""
-    daily_rate = basic_salary / 30
-    
-    # التعويض الأساسي (أجر مدة تصل إلى 6 أشهر)
-    base_compensation = basic_salary * min(service_years, 6)
-    
-    # تعويض الإشعار
-    notice_compensation = 0
-    if actual_notice == "لا":
-        notice_compensation = basic_salary  # أجر شهر كامل
-    elif actual_notice == "جزئي":
-        notice_compensation = basic_salary * 0.5  # نصف أجر شهر
-    
-    # مضاعفات حسب نوع الفصل
-    multipliers = {
-        "تعسفي بدون سبب مبرر": 2.0,
-        "لأسباب اقتصادية غير حقيقية": 1.8,
-        "لأسباب تأديبية غير مثبتة": 1.5,
-        "تمييز على أساس الجنس أو الدين": 2.5
-    }
-    
-    multiplier = multipliers.get(dismissal_reason, 1.0)
-    
-    total_compensation = (base_compensation * multiplier) + notice_compensation
-    
-    return {
-        'amount': total_compensation,
-        'explanation': f'تعويض فصل تعسفي {dismissal_reason}',
-        'details': {
-            'الراتب الأساسي': f'{basic_salary:,.0f} دينار',
-            'سنوات الخدمة': f'{service_years} سنة',
-            'سبب الفصل': dismissal_reason,
-            'تعويض الإشعار': f'{notice_compensation:,.0f} دينار',
-            'مضاعف التعويض': f'{multiplier}x',
-            'الأساس القانوني': 'المادة 30 وقرارات المحاكم'
-        }
-    }
-
-def calculate_salary_delay_compensation(basic_salary, delay_months, delay_days):
-    """حساب تعويض تأخر صرف الرواتب"""
-    total_delay_days = (delay_months * 30) + delay_days
-    
-    # تعويض التأخير (فائدة 8% سنوياً = 0.022% يومياً)
-    daily_interest_rate = 0.00022
-    daily_compensation = basic_salary * daily_interest_rate
-    
-    total_compensation = daily_compensation * total_delay_days
-    
-    return {
-        'amount': total_compensation,
-        'explanation': f'تعويض تأخير صرف الرواتب عن {total_delay_days} يوم',
-        'details': {
-            'الراتب الشهري': f'{basic_salary:,.0f} دينار',
-            'أشهر التأخير': f'{delay_months} شهر',
-            'أيام التأخير': f'{delay_days} يوم',
-            'إجمالي أيام التأخير': f'{total_delay_days} يوم',
-            'معدل الفائدة': '8% سنوياً',
-            'التعويض اليومي': f'{daily_compensation:,.2f} دينار',
-            'الأساس القانوني': 'المادة 55 وقانون المعاملات المدنية'
-        }
-    }
-
-def calculate_accrued_leave_compensation(basic_salary, accrued_leave, service_years):
-    """حساب تعويض الإجازات المستحقة"""
-    daily_rate = basic_salary / 30
-    total_compensation = daily_rate * accrued_leave
-    
-    return {
-        'amount': total_compensation,
-        'explanation': f'تعويض {accrued_leave} يوم إجازة مستحقة',
-        'details': {
-            'الراتب الأساسي': f'{basic_salary:,.0f} دينار',
-            'أيام الإجازة المستحقة': f'{accrued_leave} يوم',
-            'سنوات الخدمة': f'{service_years} سنة',
-            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
-            'الأساس القانوني': 'المادة 57'
-        }
-    }
-
-def calculate_social_security_penalty(basic_salary, unregistered_months):
-    """حساب تعويض عدم التسجيل في الضمان"""
-    # الاشتراكات المتأخرة
-    monthly_employee_share = basic_salary * 0.075  # 7.5%
-    monthly_employer_share = basic_salary * 0.145  # 14.5%
-    monthly_total_share = monthly_employee_share + monthly_employer_share
-    
-    # الغرامات (تقديرية)
-    penalty_rate = 0.02  # 2% شهرياً
-    total_penalty = monthly_total_share * unregistered_months * penalty_rate
-    
-    total_compensation = (monthly_total_share * unregistered_months) + total_penalty
-    
-    return {
-        'amount': total_compensation,
-        'explanation': f'تعويض عدم التسجيل في الضمان لـ {unregistered_months} شهر',
-        'details': {
-            'الراتب الأساسي': f'{basic_salary:,.0f} دينار',
-            'أشهر عدم التسجيل': f'{unregistered_months} شهر',
-            'الاشتراكات المتأخرة': f'{monthly_total_share * unregistered_months:,.0f} دينار',
-            'الغرامات التقديرية': f'{total_penalty:,.0f} دينار',
-            'الاشتراك الشهري': f'{monthly_total_share:,.0f} دينار',
-            'الأساس القانوني': 'قانون الضمان الاجتماعي'
-        }
-    }
-
-def show_advanced_calculators():
-    """الحاسبات المتقدمة - محسنة"""
-    st.markdown("#### 📈 الحاسبات المتقدمة")
-    
-    advanced_calcs = {
-        "📊 حاسبة التدرج الوظيفي": {
-            "description": "حساب العلاوات والترقيات والزيادات الدورية",
-            "features": ["حساب العلاوات الدورية", "توقع الترقيات", "تحليل المسار الوظيفي"]
-        },
-        "💰 حاسبة التقييم المالي الشامل": {
-            "description": "تقييم جميع المستحقات والتعويضات المالية",
-            "features": ["تحليل المستحقات", "تقييم التعويضات", "محاكاة السيناريوهات"]
-        },
-        "📈 حاسبة المؤشرات الاقتصادية": {
-            "description": "ربط المستحقات بمؤشرات التضخم والتغيرات الاقتصادية",
-            "features": ["مراعاة التضخم", "تحليل القوة الشرائية", "تحديث القيم"]
-        },
-        "🏦 حاسبة التخطيط المالي للتقاعد": {
-            "description": "تخطيط المعاش والتقاعد والمدخرات طويلة الأجل",
-            "features": ["تخطيط التقاعد", "حساب المدخرات", "تحليل الاستثمارات"]
-        }
-    }
-    
-    for calc_name, calc_info in advanced_calcs.items():
-        with st.expander(f"{calc_name}", expanded=False):
-            st.write(f"**الوصف:** {calc_info['description']}")
-            st.write("**المميزات:**")
-            for feature in calc_info['features']:
-                st.write(f"• {feature}")
-            
-            # نموذج مبسط للحاسبة المتقدمة
-            if calc_name == "📊 حاسبة التدرج الوظيفي":
-                with st.form(f"advanced_{calc_name}"):
-                    current_salary = st.number_input("الراتب الحالي (دينار)", value=500)
-                    years_experience = st.number_input("سنوات الخبرة", value=3)
-                    performance_rating = st.selectbox("تقييم الأداء", ["ممتاز", "جيد جداً", "جيد", "مقبول"])
-                    
-                    if st.form_submit_button("تقدير التطور الوظيفي"):
-                        # حساب تقديري مبسط
-                        growth_factors = {"ممتاز": 1.15, "جيد جداً": 1.10, "جيد": 1.05, "مقبول": 1.02}
-                        growth_factor = growth_factors.get(performance_rating, 1.0)
-                        estimated_salary = current_salary * (growth_factor ** years_experience)
-                        
-                        st.success(f"**الراتب المتوقع:** {estimated_salary:,.0f} دينار")
-                        st.info(f"معدل النمو السنوي: {((growth_factor-1)*100):.1f}%")
-            
-            st.info("🛠️ هذه الآلة الحاسبة قيد التطوير وسيتم إضافتها بشكل كامل في التحديثات القادمة")
-
-def display_service_result(result):
-    """عرض نتيجة مكافأة نهاية الخدمة"""
-    st.success(f"## 💰 المبلغ المستحق: {result['amount']:,.0f} دينار")
-    st.info(f"**الشرح:** {result['explanation']}")
-    
-    with st.expander("📊 التفاصيل الكاملة", expanded=True):
-        for key, value in result['details'].items():
-            st.write(f"**{key}:** {value}")
-
-def display_work_leave_result(result, calc_type):
-    """عرض نتيجة العمل والإجازات"""
-    st.success(f"## 💰 {calc_type}: {result['amount']:,.0f} دينار")
-    st.info(f"**الشرح:** {result['explanation']}")
-    
-    with st.expander("📊 التفاصيل الكاملة", expanded=True):
-        for key, value in result['details'].items():
-            st.write(f"**{key}:** {value}")
-
-def display_compensation_result(result):
-    """عرض نتيجة التعويض"""
-    st.success("## 🏥 نتائج حساب التعويض")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("التعويض الأساسي", f"{result['compensation']:,.0f} دينار")
-    with col2:
-        st.metric("المصاريف الطبية", f"{result['medical_expenses']:,.0f} دينار")
-    with col3:
-        st.metric("الإجمالي المستحق", f"{result['total_amount']:,.0f} دينار")
-    
-    st.info(f"**الشرح:** {result['explanation']}")
-    
-    with st.expander("📊 التفاصيل الكاملة", expanded=True):
-        for key, value in result['details'].items():
-            st.write(f"**{key}:** {value}")
-
-def display_legal_compensation_result(result, comp_type):
-    """عرض نتيجة التعويضات القانونية"""
-    st.success(f"## ⚖️ {comp_type}: {result['amount']:,.0f} دينار")
-    st.info(f"**الشرح:** {result['explanation']}")
-    
-    with st.expander("📊 التفاصيل الكاملة", expanded=True):
-        for key, value in result['details'].items():
-            st.write(f"**{key}:** {value}")
-
-# ==========================
-# 📝 قسم الشكاوى والمنازعات - النسخة المختصرة
-# ==========================
-def show_complaints_section():
-    show_breadcrumbs("📝 الشكاوى والمنازعات")
-    
-    st.markdown("""
-    <div class="header-with-logo">
-        <div class="logo-container">
-            <div class="logo-text">⚖️</div>
-        </div>
-        <div style="text-align: center;">
-            <h1>⚖️ الشكاوى والمنازعات العمالية</h1>
-            <p>إرشادات عامة حول آلية التعامل مع المنازعات العمالية</p>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.warning("""
-    **📢 تنويه هام:** 
-    هذه المنصة تقدم معلومات توعوية عامة فقط ولا تغني عن استشارة المختصين القانونيين.
-    يوصى بشدة بالاستعانة بمحامٍ مختص في النزاعات العمالية لتقييم كل حالة على حدة.
-    """)
-
-    # تبويب واحد فقط
-    st.markdown("## 🔍 دليل الجهات المختصة والاستشارة القانونية")
-
-    st.markdown("""
-    <div class="section-card">
-        <h3>👨‍⚖️ لماذا تحتاج إلى محامٍ مختص؟</h3>
-        <p>كل حالة نزاع عمالي لها ظروفها الخاصة وتفاصيلها التي تؤثر على النتيجة النهائية. 
-        المحامي المختص يمكنه:</p>
-        <ul>
-        <li>تحليل وقائع حالتك بدقة</li>
-        <li>تقييم المستندات والأدلة المتاحة</li>
-        <li>تحديد الحقوق والمستحقات القانونية</li>
-        <li>تمثيلك أمام الجهات المختصة</li>
-        <li>ضمان الالتزام بالمواعيد والإجراءات القانونية</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown("## 🌐 الجهات الرسمية المختصة")
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.markdown("""
-        <div class="feature-item">
-            <h4>🏛️ وزارة العمل الأردنية</h4>
-            <p><strong>الاختصاص:</strong> تلقي الشكاوى العمالية - التوفيق بين الأطراف</p>
-            <p><strong>الاتصال:</strong> هاتف: 065303200</p>
-            <p><strong>الموقع:</strong> <a href="https://www.mol.gov.jo" target="_blank">mol.gov.jo</a></p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        st.markdown("""
-        <div class="feature-item">
-            <h4>🛡️ منصة حمايتي</h4>
-            <p><strong>الاختصاص:</strong> المنصة الإلكترونية لتلقي الشكاوى العمالية</p>
-            <p><strong>الميزة:</strong> متابعة إلكترونية للشكاوى</p>
-            <p><strong>الرابط:</strong> <a href="https://hemayeh.jo" target="_blank">hemayeh.jo</a></p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        st.markdown("""
-        <div class="feature-item">
-            <h4>📊 مؤسسة الضمان الاجتماعي</h4>
-            <p><strong>الاختصاص:</strong> منازعات الضمان والتأمينات الاجتماعية</p>
-            <p><strong>الاتصال:</strong> هاتف: 065850111</p>
-            <p><strong>الموقع:</strong> <a href="https://www.ssc.gov.jo" target="_blank">ssc.gov.jo</a></p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        st.markdown("""
-        <div class="feature-item">
-            <h4>⚖️ المحاكم النظامية</h4>
-            <p><strong>الاختصاص:</strong> الفصل في المنازعات التي لم تحل بالطرق الودية</p>
-            <p><strong>الإجراء:</strong> عبر مكاتب المحامين المختصين</p>
-            <p><strong>الإشراف:</strong> وزارة العدل</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown("## 📞 معلومات الاتصال المباشرة")
-
-    contact_info = [
-        {
-            "الجهة": "مديرية العمل في عمان",
-            "الهاتف": "065303200",
-            "العنوان": "عمان - شارع الملكة رانيا العبدالله"
-        },
-        {
-            "الجهة": "مركز خدمة المجتمع - وزارة العمل",
-            "الهاتف": "065303135",
-            "العنوان": "عمان - مبنى الوزارة الرئيسي"
-        },
-        {
-            "الجهة": "شكاوى الضمان الاجتماعي",
-            "الهاتف": "065850111", 
-            "العنوان": "عمان - خلدا"
-        }
-    ]
-
-    for contact in contact_info:
-        st.markdown(f"""
-        <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 10px 0; border-right: 4px solid #2563EB;">
-            <h4 style="margin: 0 0 8px 0;">{contact['الجهة']}</h4>
-            <p style="margin: 4px 0;"><strong>📞 الهاتف:</strong> {contact['الهاتف']}</p>
-            <p style="margin: 4px 0;"><strong>📍 العنوان:</strong> {contact['العنوان']}</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown("## 💼 نصائح عامة للتعامل مع المنازعات")
-
-    tips = [
-        "احتفظ بنسخ من جميع المستندات المتعلقة بالعمل (عقود، كشوف رواتب، مراسلات)",
-        "قم بتوثيق التواريخ والأحداث المهمة كتابياً",
-        "تجنب التوقيع على أي مستندات دون فهم محتواها بشكل كامل", 
-        "استشر محامياً مختصاً قبل اتخاذ أي إجراءات قانونية",
-        "احرص على الالتزام بالمواعيد القانونية المحددة"
-    ]
-
-    for tip in tips:
-        st.write(f"• {tip}")
-
-    st.markdown("""
-    <div class="warning-box">
-        <h4>⚖️ تنويه نهائي هام</h4>
-        <p><strong>هذه المنصة توعوية تعليمية فقط ولا تقدم أي خدمات استشارية قانونية.</strong></p>
-        <p>يجب استشارة محامٍ مختص في النزاعات العمالية للنظر في تفاصيل حالتك الخاصة وتقديم المشورة القانونية المناسبة.</p>
-        <p>كل حالة لها ظروفها الخاصة وتستدعي تقييماً قانونياً متخصصاً.</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #666; font-size: 0.9rem;">
-        <p>🔍 للمزيد من المعلومات، يرجى التواصل مباشرة مع الجهات المختصة أو الاستعانة بمحامٍ متخصص</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-# ==========================
-# ⚙️ قسم الإعدادات
-# ==========================
-def show_settings_section():
-    show_breadcrumbs("⚙️ الإعدادات")
-    
-    st.markdown("""
-    <div class="header-with-logo">
-        <div class="logo-container">
-            <div class="logo-text">⚙️</div>
-        </div>
-        <div style="text-align: center;">
-            <h1>⚙️ إعدادات المنصة وسياسات الخصوصية</h1>
-            <p>إدارة تفضيلاتك ومراجعة سياسات الاستخدام والخصوصية</p>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    settings_tabs = st.tabs(["🔒 الخصوصية والأمان", "📞 الدعم والاتصال", "ℹ️ عن المنصة"])
-
-    with settings_tabs[0]:
-        st.markdown("#### 🔒 سياسات الخصوصية والأمان")
-        
-        st.markdown("""
-        <div class="privacy-highlight">
-        <h4>🚫 سياسة عدم جمع البيانات</h4>
-        <p>هذه المنصة <strong>لا تجمع أو تخزين أي بيانات شخصية</strong> عن المستخدمين. 
-        جميع البيانات تُحفظ في جلسة المتصفح المؤقتة وتُمسح تلقائياً عند الإغلاق.</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.warning("""
-        **⚠️ تنويه هام:**
-        هذه المنصة توعوية تعليمية فقط ولا تقدم أي خدمات استشارية قانونية.
-        المعلومات المقدمة لأغراض المعرفة العامة والتعليم فقط.
-        """)
-
-    with settings_tabs[1]:
-        st.markdown("#### 📞 قنوات الدعم والاتصال")
-        
-        st.info("""
-        **💼 للاستفسارات الفنية والدعم:**
-        نحن هنا لمساعدتك في أي استفسارات فنية أو تقنية متعلقة باستخدام المنصة.
-        """)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("##### 📧 البريد الإلكتروني")
-            st.markdown("""
-            <div style="background: #f0f9ff; padding: 1rem; border-radius: 10px; border-left: 4px solid #2563EB;">
-                <h4 style="margin: 0 0 0.5rem 0;">📧 sirawork2025@gmail.com</h4>
-                <p style="margin: 0; color: #666;">للأسئلة الفنية والدعم التقني</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-    with settings_tabs[2]:
-        st.markdown("#### ℹ️ معلومات عن منصة SiraWork")
-        
-        st.markdown("""
-        **🎯 رؤية المنصة:**
-        SiraWork منصة توعوية تعليمية تهدف إلى نشر الوعي القانوني في مجال حقوق العمل
-        وتوفير أدوات تعليمية تفاعلية للمستخدمين.
-        
-        **🏆 المميزات:**
-        - ✅ مجانية بالكامل
-        - ✅ لا تتطلب تسجيل دخول
-        - ✅ لا تتبع المستخدمين
-        - ✅ تحديثات مستمرة
-        """)
-
-# ==========================
-# 🚀 التشغيل الرئيسي للتطبيق
-# ==========================
-def main():
-    try:
-        # تهيئة حالة الجلسة
-        initialize_session_state()
-        
-        # عرض القائمة الجانبية
-        show_sidebar_navigation()
-        
-        # نظام التوجيه للصفحات
-        page_handlers = {
-            "home": show_home_page,
-            "workers": show_workers_section,
-            "employers": show_employers_section, 
-            "researchers": show_researchers_section,
-            "calculators": show_calculators_section,
-            "complaints": show_complaints_section,
-            "settings": show_settings_section
-        }
-        
-        # الحصول على المعالج المناسب للصفحة
-        current_page = st.session_state.selected_page
-        page_handler = page_handlers.get(current_page, show_home_page)
-        
-        # تنفيذ الصفحة المطلوبة
-        page_handler()
-        
-    except Exception as e:
-        # معالجة الأخطاء
-        st.error("""
-        ## ⚠️ حدث خطأ غير متوقع
-        
-        نعتذر عن هذا الخطأ. يرجى:
-        1. تحديث الصفحة
-        2. التأكد من اتصال الإنترنت
-        3. التواصل مع الدعم إذا استمرت المشكلة
-        """)
-        
-        # زر لتحديث الصفحة
-        if st.button("🔄 تحديث الصفحة"):
-            st.rerun()
+    # لوحة قياس الأداء الاختيارية (DEBUG_PANEL)
+    if debug_panel_enabled():
+        show_profiling_panel()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
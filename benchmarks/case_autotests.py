@@ -0,0 +1,96 @@
+"""
+تشغيل حالات ورقة Case_AutoTests على الحاسبات: فروق النتائج عن القيم المتوقعة،
+ونسب أزمنة كل حاسبة (p50/p90/p99).
+
+    python benchmarks/case_autotests.py                      # كل الأنوية، تنفيذ واحد لكل حالة
+    python benchmarks/case_autotests.py --repeat 10000       # قياس الإنتاجية
+    python benchmarks/case_autotests.py --workers 1 --json results.json
+
+رمز الخروج 1 عند وجود حالة فاشلة أو خطأ، أو إذا زادت الحالات غير المربوطة أو الفروق
+المقبولة (Case_AutoTests.known.csv بجانب ملف العمل) على الحالات الناجحة. الأزمنة تُقاس
+داخل العمال بعد تهيئتهم.
+"""
+import argparse
+import json
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from helpers.case_autotests import (  # noqa: E402
+    AMOUNT_TOLERANCE,
+    gate_failures,
+    load_cases,
+    load_known_differences,
+    run_cases,
+    timing_percentiles,
+)
+
+
+def _amount(value):
+    return "-" if value is None else f"{value:,.2f}"
+
+
+def print_report(report, percentiles):
+    """جدول الحالات ثم أزمنة الحاسبات"""
+    print(f"{'case':<10}{'status':<12}{'expected':>12}{'actual':>12}{'diff':>12}  calculator")
+    for row in report["results"]:
+        print(
+            f"{row['case_id']:<10}{row['status']:<12}{_amount(row['expected']):>12}"
+            f"{_amount(row['actual']):>12}{_amount(row['diff']):>12}  {row['calculator'] or row['case_type']}"
+        )
+        if row["error"] or row["note"]:
+            print(f"{'':<10}{row['error'] or row['note']}")
+
+    counts = {}
+    for row in report["results"]:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    print()
+    print("  ".join(f"{status}={count}" for status, count in counts.items()))
+
+    calls = sum(stats["calls"] for stats in percentiles.values())
+    print()
+    print(f"{'calculator':<44}{'calls':>10}{'p50':>10}{'p90':>10}{'p99':>10}  (µs)")
+    for calculator, stats in percentiles.items():
+        print(f"{calculator:<44}{stats['calls']:>10}{stats['p50']:>10.1f}{stats['p90']:>10.1f}{stats['p99']:>10.1f}")
+    if report["wall_time"] > 0:
+        print(
+            f"\n{calls:,} calls in {report['wall_time']:.3f}s ({calls / report['wall_time']:,.0f} calls/s), "
+            f"{report['total_time']:.3f}s with pool startup and warm-up"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workbook", help="ملف العمل (الافتراضي: DATA_SOURCES.WORKBOOK_PATH)")
+    parser.add_argument("--workers", type=int, default=0, help="عدد العمليات (0 = عدد الأنوية)")
+    parser.add_argument("--repeat", type=int, default=1, help="عدد مرات تنفيذ كل حالة")
+    parser.add_argument("--tolerance", type=float, default=AMOUNT_TOLERANCE, help="الفرق المسموح بالدينار")
+    parser.add_argument("--json", help="حفظ النتائج والأزمنة في ملف JSON")
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)
+    cases = load_cases(args.workbook)
+    known = load_known_differences(args.workbook)
+    report = run_cases(cases, workers=args.workers, repeat=args.repeat, tolerance=args.tolerance, known=known)
+    percentiles = timing_percentiles(report["timings"])
+    print_report(report, percentiles)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "results": report["results"], "timings": percentiles,
+                    "wall_time": report["wall_time"], "total_time": report["total_time"],
+                },
+                f, ensure_ascii=False, indent=2,
+            )
+    failures = gate_failures(report["results"])
+    for failure in failures:
+        print(f"❌ {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+قياس زمن الإقلاع البارد وزمن إعادة التشغيل (rerun) لكل صفحة في التطبيق.
+
+    python benchmarks/startup.py                  # الشجرة الحالية فقط
+    python benchmarks/startup.py --ref HEAD~1     # مقارنة مع إصدار سابق من git
+
+كل قياس يعمل في عملية Python جديدة عبر streamlit.testing (AppTest) حتى لا تؤثر
+الوحدات المحمّلة مسبقًا في زمن الإقلاع البارد.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+PAGES = ["home", "workers", "employers", "researchers", "calculators", "complaints", "settings"]
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(app_dir, reruns):
+    """يُنفَّذ داخل العملية الفرعية: زمن أول تشغيل ثم وسيط أزمنة إعادة التشغيل لكل صفحة"""
+    os.chdir(app_dir)
+    sys.path.insert(0, app_dir)
+    from streamlit.testing.v1 import AppTest
+
+    app_test = AppTest.from_file(os.path.join(app_dir, "app.py"), default_timeout=120)
+    start = time.perf_counter()
+    app_test.run()
+    results = {"cold_start": time.perf_counter() - start, "first_visit": {}, "rerun": {}}
+
+    for page in PAGES:
+        app_test.session_state.selected_page = page
+        start = time.perf_counter()
+        app_test.run()
+        results["first_visit"][page] = time.perf_counter() - start
+        timings = []
+        for _ in range(reruns):
+            start = time.perf_counter()
+            app_test.run()
+            timings.append(time.perf_counter() - start)
+        results["rerun"][page] = statistics.median(timings)
+    return results
+
+
+def run_isolated(app_dir, reruns):
+    """تشغيل القياس في عملية جديدة وقراءة نتيجته"""
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+        output = f.name
+    try:
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--measure", app_dir,
+             "--reruns", str(reruns), "--output", output],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        with open(output, "r", encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        os.remove(output)
+
+
+def export_ref(ref, target):
+    """نسخ شجرة الملفات في إصدار git محدد إلى مجلد مؤقت"""
+    archive = subprocess.run(["git", "archive", ref], cwd=REPO_ROOT, check=True, capture_output=True).stdout
+    with tempfile.TemporaryFile() as f:
+        f.write(archive)
+        f.seek(0)
+        with tarfile.open(fileobj=f) as tar:
+            tar.extractall(target)
+
+
+def print_report(columns):
+    """جدول بالمللي ثانية، عمود لكل شجرة"""
+    names = list(columns)
+    print(f"{'':<26}" + "".join(f"{name:>14}" for name in names))
+    rows = [("cold_start", lambda r: r["cold_start"])]
+    for page in PAGES:
+        rows.append((f"first_visit[{page}]", lambda r, p=page: r["first_visit"][p]))
+    for page in PAGES:
+        rows.append((f"rerun[{page}]", lambda r, p=page: r["rerun"][p]))
+    for label, value in rows:
+        print(f"{label:<26}" + "".join(f"{value(columns[name]) * 1000:>12.1f}ms" for name in names))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ref", help="إصدار git للمقارنة (مثل HEAD~1)")
+    parser.add_argument("--reruns", type=int, default=5, help="عدد مرات إعادة التشغيل لكل صفحة")
+    parser.add_argument("--repeat", type=int, default=3, help="عدد العمليات المستقلة (يؤخذ الوسيط)")
+    parser.add_argument("--json", help="حفظ النتائج الخام في ملف JSON")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(measure(args.measure, args.reruns), f)
+        return
+
+    trees = {"current": REPO_ROOT}
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.ref:
+            export_ref(args.ref, tmp)
+            trees = {args.ref: tmp, "current": REPO_ROOT}
+
+        columns = {}
+        for name, app_dir in trees.items():
+            runs = [run_isolated(app_dir, args.reruns) for _ in range(args.repeat)]
+            columns[name] = {
+                "cold_start": statistics.median(r["cold_start"] for r in runs),
+                "first_visit": {p: statistics.median(r["first_visit"][p] for r in runs) for p in PAGES},
+                "rerun": {p: statistics.median(r["rerun"][p] for r in runs) for p in PAGES},
+            }
+
+    print_report(columns)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(columns, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,458 @@
+"""
+مجموعة قياسات الأداء: تحميل ملف العمل، DataLoader، ذاكرة المساعد وسجلاته، كل حاسبات
+calculate_* وشبكة السيناريوهات وإنشاء العقد المخصص. تُحفظ النتائج كـ JSON لمقارنتها
+بين الإصدارات.
+
+    python benchmarks/suite.py --json bench.json               # كل القياسات
+    python benchmarks/suite.py --filter calculate_             # القياسات التي يحتوي اسمها النص
+    python benchmarks/suite.py --json new.json --compare bench.json
+
+كل قياس يُشغَّل repeat مرة، وفي كل مرة يُكرَّر الاستدعاء number مرة (يُحدَّد تلقائيًا
+حتى تستغرق المرة 0.2 ثانية على الأقل)، ويُحفظ زمن الاستدعاء الواحد (الأدنى والوسيط
+والمتوسط). القياسات الباردة تحتاج تهيئة قبل كل استدعاء فتُشغَّل مرة واحدة لكل تكرار.
+"""
+import argparse
+import gc
+import inspect
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+os.chdir(REPO_ROOT)
+
+from helpers import calculators  # noqa: E402
+from helpers.ai_logs_manager import AILogsManager  # noqa: E402
+from helpers.data_loader import DataLoader, load_config_section, load_performance_settings  # noqa: E402
+from helpers.legal_rules import current_rules  # noqa: E402
+from helpers.mini_ai_smart import MiniLegalAI  # noqa: E402
+from helpers.scenario_sweep import run_sweep  # noqa: E402
+from logs.ai_memory_manager import AIMemoryManager  # noqa: E402
+from views.employers import generate_comprehensive_custom_contract  # noqa: E402
+
+WORKBOOK_PATH = load_config_section("DATA_SOURCES", {"WORKBOOK_PATH": ""})["WORKBOOK_PATH"]
+PERFORMANCE = load_performance_settings()
+
+# أدنى زمن لكل تكرار عند تحديد number تلقائيًا
+MIN_REPEAT_SECONDS = 0.2
+
+# نسبة التباطؤ التي تُعد تراجعًا عند المقارنة
+REGRESSION_THRESHOLD = 1.2
+
+MEMORY_SIZES = (1_000, 100_000)
+
+# شبكات السيناريوهات: الافتراضية في الواجهة (150 سيناريو) وشبكة أكبر
+SWEEP_INPUTS = (
+    ("end_of_service", "end_of_service", {
+        "last_salary": [400.0, 500.0, 750.0, 1000.0, 1500.0],
+        "years": list(range(1, 16)),
+        "termination_type": ["استقالة", "إنهاء من صاحب العمل"],
+    }, None),
+    ("unfair_dismissal", "unfair_dismissal", {
+        "basic_salary": [float(salary) for salary in range(300, 3001, 100)],
+        "service_years": list(range(0, 31)),
+        "actual_notice": ["نعم", "لا", "جزئي"],
+        "dismissal_reason": ["تعسفي بدون سبب مبرر"],
+    }, None),
+    ("work_injury", "work_injury", {
+        "basic_salary": [400.0, 500.0, 750.0, 1000.0, 1500.0],
+        "injury_type": ["وفاة", "عجز جزئي دائم", "عجز مؤقت"],
+        "disability_percentage": list(range(10, 51, 10)),
+    }, {"treatment_days": 30, "medical_expenses": 0.0}),
+)
+
+# مدخلات نموذجية لكل حاسبة (كما تُدخل من واجهة الحاسبات)
+CALCULATOR_INPUTS = {
+    "calculate_end_of_service": (600, 7, 4, "إنهاء من صاحب العمل", 650, "مستمرة"),
+    "calculate_overtime": (500, 20, 4, "جمعة أو عطلة رسمية"),
+    "calculate_annual_leave": (500, 6, 14),
+    "calculate_sick_leave": (500, 20, True),
+    "calculate_notice_period": (500, 30, 12),
+    "calculate_maternity_leave": (450,),
+    "calculate_paternity_leave": (450,),
+    "calculate_haj_leave": (500, 6),
+    "calculate_work_injury_compensation": (500, "عجز جزئي دائم", 30, 1200, 45),
+    "calculate_social_security_contributions": (900, 7.5, 14.25, 5000, "سنوي"),
+    "calculate_unfair_dismissal_compensation": (700, 4, "جزئي", "لأسباب اقتصادية غير حقيقية"),
+    "calculate_salary_delay_compensation": (500, 2, 10),
+    "calculate_accrued_leave_compensation": (500, 21, 3),
+    "calculate_social_security_penalty": (500, 8),
+}
+
+CONTRACT_DATA = {
+    "type": "عقد عمل مؤقت",
+    "job_title": "محاسب",
+    "workplace": "عمان - الشميساني",
+    "salary": 650,
+    "probation_period": "3 أشهر",
+    "contract_duration": "سنة واحدة",
+    "custom_clauses": "يلتزم العامل بحضور الدورات التدريبية التي يحددها صاحب العمل.",
+    "selected_optional_clauses": [
+        {"title": "بدل مواصلات", "details": "30 دينار شهريًا", "custom_details": "40 دينار شهريًا"},
+        {"title": "عدم المنافسة", "details": "سنة بعد انتهاء العقد", "custom_details": "سنة بعد انتهاء العقد"},
+    ],
+    "working_hours": True,
+    "social_security": True,
+    "contract_termination": True,
+    "confidentiality": True,
+}
+
+# مفردات لتوليد ذاكرة تفاعلات ذات نصوص متنوعة
+MEMORY_ROLES = ("العمال", "أصحاب العمل", "الباحثين")
+MEMORY_WORDS = (
+    "الأجور", "الإجازة", "السنوية", "المرضية", "الفصل", "التعسفي", "الإشعار", "مكافأة", "نهاية",
+    "الخدمة", "الضمان", "الاجتماعي", "ساعات", "العمل", "الإضافي", "إصابة", "الأمومة", "العقد",
+    "محدد", "المدة", "التجربة", "الاستقالة", "التعويض", "المحكمة", "الشكوى", "الوزارة",
+)
+
+
+# ==========================
+# ⏱️ أدوات القياس
+# ==========================
+
+BENCHMARKS = []
+
+
+def benchmark(name, cold=False):
+    """
+    تسجيل قياس. الدالة المسجلة تُجهّز ما تحتاجه وتُرجع الدالة المقاسة.
+
+    cold=True: الدالة المسجلة تُرجع دالة تهيئة تُستدعى (خارج القياس) قبل كل استدعاء وتُرجع الدالة المقاسة.
+    """
+    def register(setup):
+        BENCHMARKS.append({"name": name, "setup": setup, "cold": cold})
+        return setup
+    return register
+
+
+def _autorange(function):
+    """أقل عدد استدعاءات يستغرق MIN_REPEAT_SECONDS على الأقل (1، 2، 5، 10، ...)"""
+    number = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            count = number * multiplier
+            start = time.perf_counter()
+            for _ in range(count):
+                function()
+            if time.perf_counter() - start >= MIN_REPEAT_SECONDS:
+                return count
+        number *= 10
+
+
+def _time_calls(function, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return (time.perf_counter() - start) / number
+
+
+def run_benchmark(spec, repeat):
+    """أزمنة الاستدعاء الواحد بالثواني لكل تكرار"""
+    gc.collect()
+    if spec["cold"]:
+        prepare = spec["setup"]()
+        timings = []
+        for _ in range(repeat):
+            timings.append(_time_calls(prepare(), 1))
+        return timings, 1
+    function = spec["setup"]()
+    function()  # إحماء
+    number = _autorange(function)
+    return [_time_calls(function, number) for _ in range(repeat)], number
+
+
+def summarize(timings, number):
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "repeat": len(timings),
+        "number": number,
+    }
+
+
+# مجلدات مؤقتة ودوال إغلاق لكائنات تبقى مفتوحة طوال التشغيل، تُنظَّف في النهاية
+_TEMP_DIRS = []
+_CLEANUPS = []
+
+
+def _temp_dir():
+    path = tempfile.mkdtemp(prefix="alywork-bench-")
+    _TEMP_DIRS.append(path)
+    return path
+
+
+# ==========================
+# 📚 تحميل ملف العمل
+# ==========================
+
+def _open_workbook(cache_dir):
+    """فتح ملف العمل كاملًا (غير كسول) كما يفعل MiniLegalAI ثم تحرير المرجع"""
+    ai = MiniLegalAI(
+        WORKBOOK_PATH, cache_dir=cache_dir, lazy=False,
+        workers=PERFORMANCE["PARSE_WORKERS"], optimize_dtypes=PERFORMANCE["OPTIMIZE_DTYPES"],
+    )
+    ai.close()
+
+
+@benchmark("MiniLegalAI.load_workbook[cold]", cold=True)
+def bench_load_workbook_cold():
+    # بدون نسخة مُجمّعة على القرص: تحليل Excel كاملًا ثم كتابة النسخة المُجمّعة
+    def prepare():
+        cache_dir = _temp_dir()
+        return lambda: _open_workbook(cache_dir)
+    return prepare
+
+
+@benchmark("MiniLegalAI.load_workbook[warm]")
+def bench_load_workbook_warm():
+    # النسخة المُجمّعة موجودة على القرص لكن لا توجد نسخة في مخزن العملية
+    cache_dir = _temp_dir()
+    _open_workbook(cache_dir)
+    return lambda: _open_workbook(cache_dir)
+
+
+@benchmark("MiniLegalAI.load_workbook[shared]")
+def bench_load_workbook_shared():
+    # جلسة جديدة والملف محمّل مسبقًا في مخزن العملية
+    holder = MiniLegalAI(WORKBOOK_PATH, cache_dir=_temp_dir(), lazy=False, optimize_dtypes=PERFORMANCE["OPTIMIZE_DTYPES"])
+    _CLEANUPS.append(holder.close)
+    return lambda: holder.load_workbook().close()
+
+
+# ==========================
+# 📂 DataLoader
+# ==========================
+
+def _sample_csv():
+    path = os.path.join(_temp_dir(), "sample.csv")
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("id,role,salary,years,notes\n")
+        for i in range(5_000):
+            f.write(f"{i},{rng.choice(MEMORY_ROLES)},{rng.randint(290, 3000)},{rng.randint(0, 30)},"
+                    f"{' '.join(rng.choices(MEMORY_WORDS, k=6))}\n")
+    return path
+
+
+@benchmark("DataLoader.load_csv[xlsx,cached]")
+def bench_load_csv_xlsx_cached():
+    loader = DataLoader()
+    return lambda: loader.load_csv(WORKBOOK_PATH, "Legal_References_JO")
+
+
+@benchmark("DataLoader.load_csv[csv,cached]")
+def bench_load_csv_cached():
+    loader, path = DataLoader(), _sample_csv()
+    return lambda: loader.load_csv(path)
+
+
+@benchmark("DataLoader.load_csv[csv,uncached]")
+def bench_load_csv_uncached():
+    loader, path = DataLoader(), _sample_csv()
+    loader.cache_enabled = False
+    return lambda: loader.load_csv(path)
+
+
+# ==========================
+# 🧠 ذاكرة المساعد وسجلاته
+# ==========================
+
+def _memory_manager(size):
+    """مدير ذاكرة في مجلد مؤقت بلقطة فيها size تفاعلًا مولّدًا"""
+    rng = random.Random(size)
+    memory = [
+        {
+            "timestamp": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 10:00:00",
+            "role": rng.choice(MEMORY_ROLES),
+            "query": " ".join(rng.choices(MEMORY_WORDS, k=6)),
+            "response": " ".join(rng.choices(MEMORY_WORDS, k=20)),
+            "reference": f"المادة {rng.randint(1, 140)}",
+            "example": "",
+            "notes": "",
+            "context_tags": rng.sample(MEMORY_WORDS, 2),
+        }
+        for _ in range(size)
+    ]
+    path = os.path.join(_temp_dir(), "ai_memory.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"seq": 0, "memory": memory}, f, ensure_ascii=False)
+    return AIMemoryManager(path)
+
+
+def _register_memory_benchmarks(size):
+    label = f"{size // 1000}k"
+
+    @benchmark(f"AIMemoryManager.add_interaction[{label}]")
+    def bench_add_interaction():
+        manager = _memory_manager(size)
+        return lambda: manager.add_interaction(
+            "العمال", "هل يحق لي مكافأة نهاية الخدمة بعد الاستقالة؟",
+            "تستحق المكافأة بعد ثلاث سنوات خدمة", reference="المادة 32", context_tags=["الخدمة"],
+        )
+
+    @benchmark(f"AIMemoryManager.search_memory[{label}]")
+    def bench_search_memory():
+        manager = _memory_manager(size)
+        return lambda: manager.search_memory("الفصل التعسفي", role="العمال")
+
+
+for _size in MEMORY_SIZES:
+    _register_memory_benchmarks(_size)
+
+
+@benchmark("AILogsManager.log_interaction")
+def bench_log_interaction():
+    manager = AILogsManager(os.path.join(_temp_dir(), "AI_Analysis_Logs.csv"))
+    # التفريغ قبل حذف المجلد المؤقت، وإلا أعاد تفريغ الخروج إنشاءه
+    _CLEANUPS.append(manager.flush)
+    return lambda: manager.log_interaction(
+        "العمال", "ما هي مدة الإشعار؟", "شهر واحد قبل إنهاء العقد", reference="المادة 23",
+    )
+
+
+# ==========================
+# 🧮 الحاسبات وإنشاء العقود
+# ==========================
+
+def _register_calculator_benchmarks():
+    names = sorted(name for name, _ in inspect.getmembers(calculators, inspect.isfunction) if name.startswith("calculate_"))
+    missing = sorted(set(names) - set(CALCULATOR_INPUTS))
+    if missing:
+        raise SystemExit(f"⚠️ لا توجد مدخلات قياس للحاسبات: {', '.join(missing)}")
+    for name in names:
+        _register_calculator(name, getattr(calculators, name), CALCULATOR_INPUTS[name])
+
+
+def _register_calculator(name, function, args):
+    # الاستدعاء كما في الواجهة (مع تسجيل الزمن في helpers.instrumentation)
+    benchmark(name)(lambda: lambda: function(*args))
+
+
+_register_calculator_benchmarks()
+
+
+def _register_sweep(name, calculator, axes, fixed=None):
+    # إعادة عرض الشبكة بنفس المدخلات كما عند إعادة تشغيل الصفحة (من ذاكرة الحسابات)
+    benchmark(f"run_sweep[{name}]")(lambda: lambda: run_sweep(calculator, axes, fixed))
+
+    @benchmark(f"run_sweep[{name},uncached]")
+    def bench_uncached():
+        rules = current_rules()
+        return lambda: run_sweep.uncached(calculator, axes, fixed, rules=rules)
+
+
+for _name, _calculator, _axes, _fixed in SWEEP_INPUTS:
+    _register_sweep(_name, _calculator, _axes, _fixed)
+
+
+@benchmark("generate_comprehensive_custom_contract")
+def bench_custom_contract():
+    return lambda: generate_comprehensive_custom_contract(CONTRACT_DATA)
+
+
+# ==========================
+# 📊 التشغيل والمقارنة
+# ==========================
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, check=True, capture_output=True, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _format_seconds(value):
+    for unit, scale in (("s", 1), ("ms", 1e3), ("µs", 1e6)):
+        if value >= 1 / scale:
+            return f"{value * scale:.2f}{unit}"
+    return f"{value * 1e9:.0f}ns"
+
+
+def print_report(results, baseline=None, threshold=REGRESSION_THRESHOLD):
+    """جدول الوسيط والأدنى لكل قياس، مع النسبة إلى نتائج سابقة إن وُجدت"""
+    header = f"{'benchmark':<58}{'median':>12}{'min':>12}{'number':>9}"
+    if baseline:
+        header += f"{'baseline':>12}{'ratio':>9}"
+    print(header)
+    regressions = []
+    for name, stats in results.items():
+        line = f"{name:<58}{_format_seconds(stats['median']):>12}{_format_seconds(stats['min']):>12}{stats['number']:>9}"
+        old = (baseline or {}).get(name)
+        if old:
+            ratio = stats["median"] / old["median"]
+            flag = " ⚠️" if ratio >= threshold else ""
+            line += f"{_format_seconds(old['median']):>12}{ratio:>8.2f}x{flag}"
+            if flag:
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", action="append", help="تشغيل القياسات التي يحتوي اسمها النص فقط (يمكن تكراره)")
+    parser.add_argument("--repeat", type=int, default=5, help="عدد التكرارات لكل قياس")
+    parser.add_argument("--json", help="حفظ النتائج في ملف JSON")
+    parser.add_argument("--compare", help="ملف JSON سابق للمقارنة")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="نسبة التباطؤ التي تُعد تراجعًا (رمز الخروج 1)")
+    parser.add_argument("--list", action="store_true", help="عرض أسماء القياسات فقط")
+    args = parser.parse_args()
+
+    selected = [spec for spec in BENCHMARKS if not args.filter or any(text in spec["name"] for text in args.filter)]
+    if args.list:
+        print("\n".join(spec["name"] for spec in selected))
+        return
+
+    results = {}
+    try:
+        for spec in selected:
+            timings, number = run_benchmark(spec, max(1, args.repeat))
+            results[spec["name"]] = summarize(timings, number)
+            print(f"  {spec['name']}: {_format_seconds(results[spec['name']]['median'])}", file=sys.stderr)
+    finally:
+        for cleanup in _CLEANUPS:
+            cleanup()
+        for path in _TEMP_DIRS:
+            shutil.rmtree(path, ignore_errors=True)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    regressions = print_report(results, baseline, args.threshold)
+
+    if args.json:
+        report = {
+            "meta": {
+                "revision": _git_revision(),
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "repeat": args.repeat,
+            },
+            "results": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if regressions:
+        print(f"\n⚠️ {len(regressions)} قياس أبطأ من النتائج السابقة بنسبة {args.threshold}x أو أكثر")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
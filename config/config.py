@@ -5,6 +5,12 @@ from datetime import datetime
 from typing import Any, Dict, Optional, List, Union
 from pathlib import Path
 
+from helpers.metrics import registry
+
+CONFIG_EVENTS = registry.counter("config_events", "ConfigManager events (load, save, restore, update...)", ["event"])
+CONFIG_LOAD_SECONDS = registry.histogram("config_load_seconds", "ConfigManager load latency")
+CONFIG_SAVE_SECONDS = registry.histogram("config_save_seconds", "ConfigManager save latency (backup copy included)")
+
 class ConfigManager:
     """
     🎛️ مدير الإعدادات المتقدم - الإصدار المحسن
@@ -21,7 +27,8 @@ class ConfigManager:
         """
         self.path = Path(path)
         self.backup_path = self.path.with_suffix('.json.backup')
-        self.config = self.load_config()
+        with CONFIG_LOAD_SECONDS.time():
+            self.config = self.load_config()
         
         # تكامل مع Streamlit session state
         st.session_state["config"] = self.config
@@ -94,12 +101,25 @@ class ConfigManager:
                 "WORKBOOK_PATH": "AlyWork_Law_Pro_v2025_v24_ColabStreamlitReady.xlsx",
                 "SHEET_URL": "https://docs.google.com/spreadsheets/d/1aCnqHzxWh8RlIgCleHByoCPHMzI1i5fCjrpizcTxGVc/export?format=csv",
                 "BACKUP_ENABLED": True,
-                "AUTO_SYNC": True
+                "AUTO_SYNC": False
             },
             "PERFORMANCE": {
                 "CACHE_ENABLED": True,
                 "CACHE_TTL_SECONDS": 600,
-                "MAX_FILE_SIZE_MB": 50
+                "CACHE_MAX_ENTRIES": 32,
+                "MAX_FILE_SIZE_MB": 50,
+                "LAZY_LOADING": True,
+                "PARSE_WORKERS": 0,
+                "OPTIMIZE_DTYPES": True,
+                "PROFILING_ENABLED": True,
+                "PROFILE_MEMORY": False,
+                "PROFILING_WINDOW": 1000,
+                "DEBUG_PANEL": False
+            },
+            "METRICS": {
+                "ENABLED": False,
+                "HOST": "127.0.0.1",
+                "PORT": 9108
             },
             "UI_SETTINGS": {
                 "STYLES_LIGHT": "assets/styles_official.css",
@@ -204,17 +224,18 @@ class ConfigManager:
             bool: True إذا تم الحفظ بنجاح
         """
         try:
-            # إنشاء النسخة الاحتياطية أولاً
-            if self.path.exists():
-                import shutil
-                shutil.copy2(self.path, self.backup_path)
-            
-            # التأكد من وجود المجلد
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # حفظ الإعدادات الجديدة
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(config, f, ensure_ascii=False, indent=4)
+            with CONFIG_SAVE_SECONDS.time():
+                # إنشاء النسخة الاحتياطية أولاً
+                if self.path.exists():
+                    import shutil
+                    shutil.copy2(self.path, self.backup_path)
+                
+                # التأكد من وجود المجلد
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                
+                # حفظ الإعدادات الجديدة
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(config, f, ensure_ascii=False, indent=4)
             
             self._log_event("config_saved", f"تم حفظ {len(config)} إعداد")
             return True
@@ -382,6 +403,7 @@ class ConfigManager:
             description (str): وصف الحدث
         """
         # يمكن إضافة نظام تسجيل متكامل هنا
+        CONFIG_EVENTS.labels(event_type).inc()
         print(f"🔧 [{event_type}] {description}")
 
 # دالة مساعدة للاستخدام السريع
@@ -0,0 +1,264 @@
+import atexit
+import csv
+import io
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+from helpers.arabic_text import search_text
+from helpers.metrics import registry
+
+try:
+    import fcntl
+except ImportError:  # Windows: لا يوجد قفل ملفات POSIX، تبقى الكتابة آمنة داخل العملية فقط
+    fcntl = None
+
+LOG_COLUMNS = [
+    "timestamp", "role", "query", "response",
+    "reference", "example", "notes"
+]
+
+# تُجمع السجلات في الذاكرة وتُلحق بالملف دفعة واحدة كل FLUSH_INTERVAL_SECONDS
+# أو فور بلوغ FLUSH_BATCH_SIZE سجلًا
+FLUSH_INTERVAL_SECONDS = 2.0
+FLUSH_BATCH_SIZE = 50
+
+_managers = weakref.WeakSet()
+_flusher = None
+_flusher_lock = threading.Lock()
+
+LOG_INTERACTIONS = registry.counter("log_interactions", "Interactions queued for the AI analysis log")
+LOG_ROWS_WRITTEN = registry.counter("log_rows_written", "Log rows appended to the CSV file")
+LOG_FLUSH_SECONDS = registry.histogram("log_flush_seconds", "Log append latency per flushed batch (file lock included)")
+registry.callback(
+    "log_pending_rows", "Log rows buffered in memory and not yet flushed", "gauge",
+    lambda: {(): sum(len(manager._pending) for manager in list(_managers))},
+)
+
+
+def _flush_all():
+    """تفريغ مخازن كل مديري السجلات المفتوحين"""
+    for manager in list(_managers):
+        try:
+            manager.flush()
+        except OSError as e:
+            print(f"⚠️ تعذر حفظ سجلات المحادثات: {e}")
+
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL_SECONDS)
+        _flush_all()
+
+
+def _start_flusher():
+    """تشغيل خيط التفريغ الخلفي مرة واحدة لكل عملية"""
+    global _flusher
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, name="ai-logs-flusher", daemon=True)
+            _flusher.start()
+
+
+def _reset_flusher_after_fork():
+    """الخيوط لا تنتقل إلى العملية الابنة، فيُعاد تشغيل خيط التفريغ عند الحاجة"""
+    global _flusher, _flusher_lock
+    _flusher = None
+    _flusher_lock = threading.Lock()
+    if len(_managers):
+        _start_flusher()
+
+
+atexit.register(_flush_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_flusher_after_fork)
+
+
+@contextmanager
+def _file_lock(f, exclusive=True):
+    """قفل استشاري على الملف مشترك بين عمليات خادم Streamlit المتعددة"""
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class AILogsManager:
+    """
+    إدارة سجلات المحادثات الذكية للمساعد القانوني.
+    يتم حفظ كل استفسار واستجابة مع تفاصيل إضافية.
+
+    الكتابة إلحاقية فقط: لا يُعاد قراءة الملف أو كتابته عند كل تسجيل، بل تُخزَّن
+    السجلات مؤقتًا ويُلحقها خيط خلفي بنهاية الملف تحت قفل حصري.
+    """
+    def __init__(self, file_path="data/AI_Analysis_Logs.csv"):
+        self.file_path = file_path
+        # (هوية الملف, الموضع المقروء بالبايت, السجلات, النص الموحد) — تُضاف الصفوف الجديدة فقط
+        self._search_cache = None
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        # التحقق من وجود الملف، وإنشاؤه إذا لم يكن موجودًا
+        if not os.path.exists(self.file_path):
+            self.create_empty_log()
+        _managers.add(self)
+        _start_flusher()
+
+    def create_empty_log(self):
+        """إنشاء ملف CSV فارغ مع الأعمدة المطلوبة"""
+        self._append_rows([])
+
+    def _append_rows(self, rows):
+        """إلحاق صفوف بنهاية الملف تحت قفل حصري، مع كتابة الترويسة إذا كان الملف فارغًا"""
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.file_path, "a", newline="", encoding="utf-8") as f:
+            with _file_lock(f):
+                writer = csv.writer(f)
+                if f.seek(0, os.SEEK_END) == 0:
+                    # نفس ترميز الملف الأصلي (utf-8-sig) حتى يفتحه Excel بشكل صحيح
+                    f.write("\ufeff")
+                    writer.writerow(LOG_COLUMNS)
+                writer.writerows([row.get(column, "") for column in LOG_COLUMNS] for row in rows)
+                f.flush()
+
+    def log_interaction(self, role, query, response, reference="", example="", notes=""):
+        """إضافة سجل جديد للتفاعل (يُكتب إلى الملف في التفريغ التالي)"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        new_entry = {
+            "timestamp": timestamp,
+            "role": role,
+            "query": query,
+            "response": response,
+            "reference": reference,
+            "example": example,
+            "notes": notes
+        }
+        with self._pending_lock:
+            self._pending.append(new_entry)
+            full = len(self._pending) >= FLUSH_BATCH_SIZE
+        LOG_INTERACTIONS.inc()
+        if full:
+            self.flush()
+
+    def flush(self):
+        """كتابة السجلات المعلّقة إلى الملف"""
+        with self._pending_lock:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return
+        try:
+            with LOG_FLUSH_SECONDS.time():
+                self._append_rows(rows)
+            LOG_ROWS_WRITTEN.inc(len(rows))
+        except OSError:
+            # إعادة السجلات إلى المخزن حتى لا تضيع عند فشل الكتابة
+            with self._pending_lock:
+                self._pending[:0] = rows
+            raise
+
+    def load_logs(self):
+        """تحميل كل السجلات الحالية (بما فيها المعلّقة في المخزن)"""
+        self.flush()
+        with open(self.file_path, newline="", encoding="utf-8-sig") as f:
+            with _file_lock(f, exclusive=False):
+                return pd.read_csv(f)
+
+    def _read_from(self, offset, dtypes=None):
+        """
+        الصفوف المكتوبة بعد الموضع offset (بالبايت) مع موضع نهاية ما قُرئ.
+
+        من بداية الملف تُقرأ الترويسة وتُستنتج الأنواع كما في load_logs؛ الجزء المضاف بلا
+        ترويسة فيُقرأ بأسماء الأعمدة وأنواعها من dtypes (ValueError إذا لم تناسبه).
+        """
+        with open(self.file_path, "rb") as f:
+            with _file_lock(f, exclusive=False):
+                f.seek(offset)
+                data = f.read()
+        end = offset + len(data)
+        if not offset:
+            return pd.read_csv(io.BytesIO(data), encoding="utf-8-sig"), end
+        if not data.strip():
+            return pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in dtypes.items()}), end
+        added = pd.read_csv(
+            io.BytesIO(data), encoding="utf-8", header=None, names=list(dtypes), dtype=dict(dtypes)
+        )
+        return added, end
+
+    @staticmethod
+    def _normalize(df):
+        """النص الموحد لكل صف (للمطابقة فقط؛ الصفوف المعادة تبقى كما في load_logs)"""
+        if df.empty:
+            return pd.Series([], index=df.index, dtype=object)
+        return df.fillna("").astype(str).agg(" ".join, axis=1).map(search_text)
+
+    def _rebuild_search_frame(self, identity):
+        df, offset = self._read_from(0)
+        self._search_cache = (identity, offset, df, self._normalize(df))
+
+    def _search_frame(self):
+        """
+        السجلات كما يعيدها load_logs مع عمود نص موحد يُحسب مرة واحدة لكل صف.
+
+        بعد كل تفريغ تُقرأ وتُوحَّد الصفوف المضافة فقط (من آخر موضع مقروء) بأنواع أعمدة
+        القراءة الكاملة. يُعاد البناء كاملًا إذا قُصّ الملف أو استُبدل (تدوير السجلات)، أو إذا
+        لم تناسب الصفوف الجديدة تلك الأنواع (مثل نص في عمود كان فارغًا كله)، فتبقى الأنواع
+        والقيم الناقصة مطابقة لقراءة الملف كاملًا.
+        """
+        self.flush()
+        stat = os.stat(self.file_path)
+        identity = (stat.st_dev, stat.st_ino)
+        cache = self._search_cache
+        if cache is None or cache[0] != identity or stat.st_size < cache[1]:
+            self._rebuild_search_frame(identity)
+        elif stat.st_size > cache[1]:
+            _, offset, df, normalized = cache
+            try:
+                added, offset = self._read_from(offset, df.dtypes.to_dict())
+            except (ValueError, TypeError):
+                self._rebuild_search_frame(identity)
+            else:
+                self._search_cache = (
+                    identity,
+                    offset,
+                    pd.concat([df, added], ignore_index=True),
+                    pd.concat([normalized, self._normalize(added)], ignore_index=True),
+                )
+        return self._search_cache[2], self._search_cache[3]
+
+    def search_logs(self, keyword):
+        """البحث في السجلات حسب كلمة مفتاحية (مطابقة عربية موحدة)"""
+        df, normalized = self._search_frame()
+        needle = search_text(keyword)
+        if not needle:
+            return df.iloc[0:0]
+        return df[normalized.str.contains(needle, regex=False)]
+
+# ==============================
+# 👷 مثال للاستخدام داخل Streamlit
+# ==============================
+if __name__ == "__main__":
+    logs_manager = AILogsManager()
+
+    # تسجيل مثال
+    logs_manager.log_interaction(
+        role="العمال",
+        query="كيف أحسب مكافأة نهاية الخدمة؟",
+        response="يجب حساب مكافأة نهاية الخدمة وفق المادة 40 من قانون العمل الأردني.",
+        reference="المادة 40 قانون العمل",
+        example="عامل أجره 500 دينار وعمل 5 سنوات يحصل على مكافأة 2500 دينار",
+        notes="✅ ممتاز"
+    )
+
+    # تحميل وعرض السجلات
+    df = logs_manager.load_logs()
+    print(df.head())
\ No newline at end of file
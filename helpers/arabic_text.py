@@ -0,0 +1,55 @@
+import re
+
+# التشكيل (تنوين الفتح .. السكون) + الألف الخنجرية + التطويل
+_DIACRITICS_RE = re.compile("[\u064B-\u0652\u0670\u0640]")
+_TOKEN_RE = re.compile(r"\w+")
+
+_CHAR_MAP = str.maketrans({
+    "أ": "ا",
+    "إ": "ا",
+    "آ": "ا",
+    "ٱ": "ا",
+    "ة": "ه",
+    "ى": "ي",
+    "ؤ": "و",
+    "ئ": "ي",
+    # الأرقام العربية المشرقية إلى أرقام غربية
+    "٠": "0", "١": "1", "٢": "2", "٣": "3", "٤": "4",
+    "٥": "5", "٦": "6", "٧": "7", "٨": "8", "٩": "9",
+})
+
+# سوابق ولواحق التجذيع الخفيف (الأطول أولًا)
+_PREFIXES = ("وال", "بال", "كال", "فال", "لل", "ال")
+_SUFFIXES = ("ها", "ان", "ات", "ون", "ين", "يه", "ه", "ي")
+
+
+def normalize_arabic(text):
+    """توحيد النص العربي: حذف التشكيل والتطويل وتوحيد الألف والتاء المربوطة والياء"""
+    if text is None:
+        return ""
+    text = _DIACRITICS_RE.sub("", str(text))
+    return text.translate(_CHAR_MAP).casefold()
+
+
+def light_stem(token):
+    """تجذيع خفيف: حذف سابقة التعريف وأشهر اللواحق مع إبقاء جذر من 2-3 أحرف على الأقل"""
+    for prefix in _PREFIXES:
+        if token.startswith(prefix) and len(token) - len(prefix) >= 2:
+            token = token[len(prefix):]
+            break
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            break
+    return token
+
+
+def tokenize(text):
+    """تقسيم النص إلى كلمات موحدة ومجذّعة — المُقسِّم المشترك لكل مسارات البحث"""
+    return [light_stem(token) for token in _TOKEN_RE.findall(normalize_arabic(text))]
+
+
+def search_text(text):
+    """النص الموحد المستخدم للمطابقة الجزئية: كلمات مجذّعة مفصولة بمسافة"""
+    return " ".join(tokenize(text))
+
@@ -0,0 +1,287 @@
+import numpy as np
+import pandas as pd
+
+from helpers.legal_rules import UNFAIR_DISMISSAL_REASONS, current_rules
+
+# ==========================
+# 🧮 الوضع الدفعي للحاسبات - نسخ متجهة (NumPy/pandas) من helpers.calculators
+# ==========================
+# كل دالة تستقبل DataFrame أعمدته بأسماء معاملات الدالة المفردة المقابلة، وتعيد
+# DataFrame بالمبالغ فقط وبنفس الفهرس. تُنفَّذ العمليات الحسابية بنفس ترتيب الدوال
+# المفردة حتى تتطابق النتائج تمامًا، ولا يُنسَّق أي نص إلا عند العرض (format_batch_result).
+# النسب والحدود من محرك القواعد (rules)، وبدونه تُستخدم القواعد السارية اليوم.
+
+# نوع اليوم -> مفتاح نسبة العمل الإضافي (أي نوع آخر يُعامل كعمل ليلي)
+OVERTIME_RATE_KEYS = {"عادي": "OVERTIME_RATE_REGULAR", "جمعة أو عطلة رسمية": "OVERTIME_RATE_HOLIDAY"}
+
+SOCIAL_SECURITY_PERIODS = {"شهري": 1, "ربع سنوي": 3, "سنوي": 12}
+
+AMOUNT_COLUMNS = (
+    "amount", "compensation", "medical_expenses", "total_amount",
+    "employee_share", "employer_share", "total_share",
+)
+
+
+def _num(df, column, default=None):
+    """عمود رقمي كمصفوفة float، مع قيمة افتراضية للأعمدة الاختيارية"""
+    if column not in df.columns:
+        if default is None:
+            raise KeyError(f"العمود المطلوب غير موجود: {column}")
+        return np.full(len(df), float(default))
+    return df[column].to_numpy(dtype=float)
+
+
+def _text(df, column):
+    """عمود نصي كسلسلة pandas (للمطابقة مع القيم العربية)"""
+    if column not in df.columns:
+        raise KeyError(f"العمود المطلوب غير موجود: {column}")
+    return df[column].astype(str)
+
+
+def calculate_end_of_service_batch(df, rules=None):
+    """مكافأة نهاية الخدمة لمجموعة موظفين - المادة 33"""
+    rules = rules or current_rules()
+    years = _num(df, "years")
+    months = _num(df, "months", 0)
+    last_salary = _num(df, "last_salary")
+    termination_type = _text(df, "termination_type").to_numpy()
+
+    total_months = years * 12 + months
+    resignation = termination_type == "استقالة"
+    by_employer = termination_type == "إنهاء من صاحب العمل"
+
+    amount = np.select(
+        [
+            resignation & (total_months < rules["EOS_RESIGNATION_MIN_MONTHS"]),
+            resignation & (total_months < rules["EOS_RESIGNATION_FULL_MONTHS"]),
+            resignation,
+            by_employer & (total_months < rules["EOS_EMPLOYER_MIN_MONTHS"]),
+            by_employer,
+        ],
+        [
+            0.0,
+            (last_salary * rules["EOS_RESIGNATION_PARTIAL_RATE"]) * years,
+            last_salary * rules["EOS_RESIGNATION_FULL_RATE"] * years,
+            0.0,
+            last_salary * rules["EOS_EMPLOYER_RATE"] * years,
+        ],
+        default=0.0,
+    )
+
+    # احتساب كسور السنة
+    fraction = (months > 0) & (amount > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        monthly_rate = np.where(years > 0, amount / years, 0.0)
+    amount = np.where(fraction, amount + (monthly_rate / 12) * months, amount)
+
+    return pd.DataFrame({"total_months": total_months, "amount": amount}, index=df.index)
+
+
+def calculate_overtime_batch(df, rules=None):
+    """بدل العمل الإضافي لمجموعة موظفين - المادة 54"""
+    rules = rules or current_rules()
+    daily_rate = _num(df, "basic_salary") / rules["MONTH_DAYS"]
+    hourly_rate = daily_rate / rules["WORK_DAY_HOURS"]
+    rates = {day_type: rules[key] for day_type, key in OVERTIME_RATE_KEYS.items()}
+    rate = _text(df, "work_day_type").map(rates).fillna(rules["OVERTIME_RATE_NIGHT"]).to_numpy(dtype=float)
+
+    overtime_amount = _num(df, "overtime_hours", 0) * hourly_rate * rate
+    daily_overtime = _num(df, "overtime_days", 0) * daily_rate * (rate - 1)
+
+    return pd.DataFrame({
+        "hourly_rate": hourly_rate,
+        "rate": rate,
+        "amount": overtime_amount + daily_overtime,
+    }, index=df.index)
+
+
+def calculate_annual_leave_batch(df, rules=None):
+    """بدل الإجازة السنوية لمجموعة موظفين - المادة 57"""
+    rules = rules or current_rules()
+    daily_rate = _num(df, "basic_salary") / rules["MONTH_DAYS"]
+    entitled_days = np.where(
+        _num(df, "service_years") < rules["ANNUAL_LEAVE_SENIOR_YEARS"],
+        float(rules["ANNUAL_LEAVE_DAYS"]),
+        float(rules["ANNUAL_LEAVE_DAYS_SENIOR"]),
+    )
+    calculated_days = np.minimum(_num(df, "requested_days"), entitled_days)
+
+    return pd.DataFrame({
+        "entitled_days": entitled_days,
+        "calculated_days": calculated_days,
+        "amount": daily_rate * calculated_days,
+    }, index=df.index)
+
+
+def calculate_sick_leave_batch(df, rules=None):
+    """أجر الإجازة المرضية لمجموعة موظفين - المادة 68"""
+    rules = rules or current_rules()
+    daily_rate = _num(df, "basic_salary") / rules["MONTH_DAYS"]
+    sick_days = _num(df, "sick_days")
+    in_hospital = _num(df, "in_hospital", 0) != 0
+    full_pay_days = rules["SICK_FULL_PAY_DAYS"]
+    max_half_pay_days = rules["SICK_HALF_PAY_DAYS"]
+    half_pay_rate = rules["SICK_HALF_PAY_RATE"]
+
+    half_pay_days = np.minimum(sick_days - full_pay_days, max_half_pay_days)
+    amount = np.select(
+        [
+            sick_days <= full_pay_days,
+            (sick_days <= rules["SICK_HOSPITAL_FULL_PAY_DAYS"]) & in_hospital,
+            sick_days <= full_pay_days + max_half_pay_days,
+        ],
+        [
+            daily_rate * sick_days,
+            daily_rate * sick_days,
+            (daily_rate * full_pay_days) + (daily_rate * half_pay_rate * half_pay_days),
+        ],
+        default=(daily_rate * full_pay_days) + (daily_rate * half_pay_rate * max_half_pay_days),
+    )
+    return pd.DataFrame({"amount": amount}, index=df.index)
+
+
+def calculate_notice_period_batch(df, rules=None):
+    """بدل الإشعار لمجموعة موظفين - المادة 29"""
+    rules = rules or current_rules()
+    daily_rate = _num(df, "basic_salary") / rules["MONTH_DAYS"]
+    unpaid_notice_days = np.maximum(_num(df, "notice_days") - _num(df, "actual_work_days"), 0)
+    return pd.DataFrame({
+        "unpaid_notice_days": unpaid_notice_days,
+        "amount": daily_rate * unpaid_notice_days,
+    }, index=df.index)
+
+
+def calculate_maternity_leave_batch(df, rules=None):
+    """أجر إجازة الأمومة (70 يوم) - المادة 70"""
+    rules = rules or current_rules()
+    daily_rate = _num(df, "basic_salary") / rules["MONTH_DAYS"]
+    return pd.DataFrame({"amount": daily_rate * rules["MATERNITY_LEAVE_DAYS"]}, index=df.index)
+
+
+def calculate_paternity_leave_batch(df, rules=None):
+    """أجر إجازة الأبوة (3 أيام) - المادة 71"""
+    rules = rules or current_rules()
+    daily_rate = _num(df, "basic_salary") / rules["MONTH_DAYS"]
+    return pd.DataFrame({"amount": daily_rate * rules["PATERNITY_LEAVE_DAYS"]}, index=df.index)
+
+
+def calculate_haj_leave_batch(df, rules=None):
+    """أجر إجازة الحج (14 يوم بعد 5 سنوات) - المادة 71"""
+    rules = rules or current_rules()
+    daily_rate = _num(df, "basic_salary") / rules["MONTH_DAYS"]
+    amount = np.where(
+        _num(df, "service_years") >= rules["HAJ_MIN_SERVICE_YEARS"], daily_rate * rules["HAJ_LEAVE_DAYS"], 0.0
+    )
+    return pd.DataFrame({"amount": amount}, index=df.index)
+
+
+def calculate_work_injury_compensation_batch(df, rules=None):
+    """تعويض إصابة العمل لمجموعة حالات - المواد 87-96"""
+    rules = rules or current_rules()
+    daily_rate = _num(df, "basic_salary") / rules["MONTH_DAYS"]
+    injury_type = _text(df, "injury_type").to_numpy()
+    medical_expenses = _num(df, "medical_expenses", 0)
+
+    # تعويض 1500 يوم عمل ضمن الحدين الأدنى والأقصى
+    clamped_base = np.clip(
+        daily_rate * rules["INJURY_BASE_DAYS"], rules["INJURY_MIN_COMPENSATION"], rules["INJURY_MAX_COMPENSATION"]
+    )
+    compensation = np.select(
+        [
+            (injury_type == "وفاة") | (injury_type == "عجز كلي دائم"),
+            injury_type == "عجز جزئي دائم",
+            injury_type == "عجز مؤقت",
+        ],
+        [
+            clamped_base,
+            clamped_base * (_num(df, "disability_percentage", 0) / 100),
+            daily_rate * rules["TEMPORARY_DISABILITY_RATE"] * _num(df, "treatment_days", 0),
+        ],
+        default=0.0,
+    )
+
+    return pd.DataFrame({
+        "compensation": compensation,
+        "medical_expenses": medical_expenses,
+        "total_amount": compensation + medical_expenses,
+    }, index=df.index)
+
+
+def calculate_social_security_contributions_batch(df):
+    """اشتراكات الضمان الاجتماعي لمجموعة موظفين"""
+    insurable_salary = np.minimum(_num(df, "employee_salary"), _num(df, "salary_ceiling"))
+    employee_share = insurable_salary * (_num(df, "employee_rate") / 100)
+    employer_share = insurable_salary * (_num(df, "employer_rate") / 100)
+    total_share = employee_share + employer_share
+    multiplier = _text(df, "calculation_type").map(SOCIAL_SECURITY_PERIODS).fillna(1).to_numpy(dtype=float)
+
+    return pd.DataFrame({
+        "insurable_salary": insurable_salary,
+        "employee_share": employee_share * multiplier,
+        "employer_share": employer_share * multiplier,
+        "total_share": total_share * multiplier,
+    }, index=df.index)
+
+
+def calculate_unfair_dismissal_compensation_batch(df, rules=None):
+    """تعويض الفصل التعسفي لمجموعة حالات"""
+    rules = rules or current_rules()
+    basic_salary = _num(df, "basic_salary")
+    base_compensation = basic_salary * np.minimum(_num(df, "service_years"), rules["UNFAIR_MAX_MONTHS"])
+
+    actual_notice = _text(df, "actual_notice").to_numpy()
+    notice_compensation = np.select(
+        [actual_notice == "لا", actual_notice == "جزئي"],
+        [basic_salary, basic_salary * rules["UNFAIR_PARTIAL_NOTICE_RATE"]],
+        default=0.0,
+    )
+    multipliers = {reason: rules[key] for reason, key in UNFAIR_DISMISSAL_REASONS.items()}
+    multiplier = _text(df, "dismissal_reason").map(multipliers).fillna(1.0).to_numpy(dtype=float)
+
+    return pd.DataFrame({
+        "notice_compensation": notice_compensation,
+        "multiplier": multiplier,
+        "amount": (base_compensation * multiplier) + notice_compensation,
+    }, index=df.index)
+
+
+def calculate_salary_delay_compensation_batch(df, rules=None):
+    """تعويض تأخر صرف الرواتب لمجموعة حالات"""
+    rules = rules or current_rules()
+    total_delay_days = (_num(df, "delay_months") * rules["MONTH_DAYS"]) + _num(df, "delay_days", 0)
+    daily_compensation = _num(df, "basic_salary") * rules["SALARY_DELAY_DAILY_RATE"]
+    return pd.DataFrame({
+        "total_delay_days": total_delay_days,
+        "amount": daily_compensation * total_delay_days,
+    }, index=df.index)
+
+
+def calculate_accrued_leave_compensation_batch(df, rules=None):
+    """تعويض الإجازات المستحقة لمجموعة موظفين"""
+    rules = rules or current_rules()
+    daily_rate = _num(df, "basic_salary") / rules["MONTH_DAYS"]
+    return pd.DataFrame({"amount": daily_rate * _num(df, "accrued_leave")}, index=df.index)
+
+
+def calculate_social_security_penalty_batch(df, rules=None):
+    """تعويض عدم التسجيل في الضمان لمجموعة حالات"""
+    rules = rules or current_rules()
+    basic_salary = _num(df, "basic_salary")
+    unregistered_months = _num(df, "unregistered_months")
+    monthly_total_share = (
+        (basic_salary * (rules["SS_EMPLOYEE_RATE"] / 100)) + (basic_salary * (rules["SS_EMPLOYER_RATE"] / 100))
+    )
+    total_penalty = monthly_total_share * unregistered_months * rules["SS_LATE_PENALTY_RATE"]
+    return pd.DataFrame({
+        "total_penalty": total_penalty,
+        "amount": (monthly_total_share * unregistered_months) + total_penalty,
+    }, index=df.index)
+
+
+def format_batch_result(result, columns=None):
+    """تنسيق أعمدة المبالغ كنصوص بالدينار — يُستدعى عند عرض الصفوف فقط"""
+    formatted = result.copy()
+    columns = columns or [column for column in result.columns if column in AMOUNT_COLUMNS]
+    for column in columns:
+        formatted[column] = result[column].map(lambda value: f"{value:,.0f} دينار")
+    return formatted
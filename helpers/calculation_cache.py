@@ -0,0 +1,106 @@
+import functools
+import inspect
+
+import pandas as pd
+
+from helpers.legal_rules import current_rules
+from helpers.metrics import register_cache
+from helpers.ttl_cache import TTLCache
+
+# ==========================
+# 🧠 ذاكرة نتائج الحاسبات المشتركة على مستوى العملية
+# ==========================
+# الحسابات الخالصة: نفس المدخلات مع نفس القواعد تعطي نفس النتيجة. تُخزَّن النتيجة
+# بمفتاح من المدخلات بعد توحيدها (موضعية أو مسماة، مع القيم الافتراضية) مع بصمة القواعد
+# السارية، فتتشارك كل الجلسات الحسابات المتكررة، وأي تعديل للقواعد ينتج مفاتيح جديدة.
+#
+# النطاق: شبكة السيناريوهات (helpers.scenario_sweep.run_sweep) فقط. الحاسبات الفردية calculate_*
+# لا تُخزَّن عمدًا: كلفة الإصابة (توحيد المدخلات والمفتاح والقفل والنسخ) تساوي كلفة الحساب مع
+# تنسيق قاموس النتيجة تقريبًا (calculate_end_of_service: 5.7 ميكروثانية للإصابة مقابل 5.9 للحساب)،
+# فلا ربح في تخزينها ولا في تخزين تنسيقها. الشبكة تكلّف ميلي ثوانٍ والإصابة فيها أرخص بنحو 35 مرة
+# (benchmarks/suite.py --filter run_sweep).
+
+CALCULATION_CACHE_SIZE = 4096
+
+# لا حاجة لمدة صلاحية: النتيجة مرتبطة ببصمة القواعد في المفتاح
+calculation_cache = TTLCache(maxsize=CALCULATION_CACHE_SIZE, ttl=None)
+register_cache("calculations", calculation_cache)
+
+_MISSING = object()
+
+
+def _copy_result(result):
+    """نسخة من النتيجة حتى لا يُعدِّل مستدعٍ النسخة المشتركة"""
+    if isinstance(result, pd.DataFrame):
+        # نسخة سطحية تكفي: copy-on-write في pandas ≥ 3 يحمي البيانات، و attrs تُنسخ
+        return result.copy(deep=False)
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in result.items()}
+
+
+def _freeze(value):
+    """قيمة قابلة للتجزئة للمفتاح مع نوعها (القوائم والقواميس بالترتيب)"""
+    if isinstance(value, dict):
+        return dict, tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(item) for item in value)
+    return type(value), value
+
+
+def memoize_calculation(function):
+    """
+    تخزين نتائج حساب في الذاكرة المشتركة بمفتاح (الدالة, بصمة القواعد, المدخلات وأنواعها).
+
+    تُوحَّد المدخلات الموضعية والمسماة والقيم الافتراضية في ترتيب واحد، ويُحفظ نوع كل
+    مدخل مع قيمته لأن النصوص المعروضة تختلف بين 5 و 5.0 رغم تساويهما في المقارنة.
+    النتيجة قاموس أو DataFrame.
+    """
+    signature = inspect.signature(function)
+    takes_rules = "rules" in signature.parameters
+    parameters = [parameter for parameter in signature.parameters.values() if parameter.name != "rules"]
+    names = tuple(parameter.name for parameter in parameters)
+    defaults = {
+        parameter.name: parameter.default
+        for parameter in parameters
+        if parameter.default is not inspect.Parameter.empty
+    }
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        version = None
+        if takes_rules:
+            kwargs["rules"] = kwargs.get("rules") or current_rules()
+            version = getattr(kwargs["rules"], "version", None)
+            if version is None:
+                # قواعد بلا بصمة (قاموس عادي): حساب مباشر دون تخزين
+                return function(*args, **kwargs)
+
+        if len(args) == len(names) and len(kwargs) == takes_rules:
+            inputs = args
+        else:
+            values = dict(defaults)
+            values.update(zip(names, args))
+            values.update(kwargs)
+            try:
+                inputs = tuple(values[name] for name in names)
+            except KeyError:
+                # مدخلات ناقصة: تترك الدالة نفسها تُبلغ عن الخطأ
+                return function(*args, **kwargs)
+
+        key = (function.__name__, version, _freeze(inputs))
+        try:
+            result = calculation_cache.get(key, _MISSING)
+        except TypeError:
+            # مدخلات غير قابلة للتجزئة: حساب مباشر دون تخزين
+            return function(*args, **kwargs)
+        if result is _MISSING:
+            result = function(*args, **kwargs)
+            calculation_cache.set(key, result)
+        return _copy_result(result)
+
+    wrapper.uncached = function
+    return wrapper
+
+
+def calculation_cache_stats():
+    """عدّادات ذاكرة نتائج الحاسبات (الحجم والإصابات والإخلاء)"""
+    return calculation_cache.stats()
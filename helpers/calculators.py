@@ -0,0 +1,500 @@
+from helpers.instrumentation import instrumented
+from helpers.legal_rules import UNFAIR_DISMISSAL_REASONS, current_rules
+
+# ==========================
+# 🧮 الحاسبات القانونية - دوال حسابية خالصة (بدون واجهة Streamlit)
+# ==========================
+# النسب والحدود والمدد تأتي من محرك القواعد (helpers.legal_rules): rules قاموس القواعد
+# السارية، وبدونه تُستخدم القواعد السارية اليوم. زمن كل استدعاء يُسجَّل في
+# helpers.instrumentation.
+
+@instrumented("calculator")
+def calculate_end_of_service(basic_salary, years, months, termination_type, last_salary, service_type, rules=None):
+    """حساب مكافأة نهاية الخدمة - المادة 33"""
+    rules = rules or current_rules()
+    
+    # حساب المدة الإجمالية للخدمة بالأشهر
+    total_months = years * 12 + months
+    
+    # تحديد نوع الحساب حسب سبب إنهاء الخدمة
+    if termination_type == "استقالة":
+        min_years = rules["EOS_RESIGNATION_MIN_MONTHS"] / 12
+        full_years = rules["EOS_RESIGNATION_FULL_MONTHS"] / 12
+        if total_months < rules["EOS_RESIGNATION_MIN_MONTHS"]:  # أقل من 3 سنوات
+            amount = 0
+            explanation = f"لا تستحق المكافأة لأقل من {min_years:g} سنوات خدمة في حالة الاستقالة (المادة 33)"
+        elif total_months < rules["EOS_RESIGNATION_FULL_MONTHS"]:  # من 3 إلى 5 سنوات
+            # نصف أجر شهر عن كل سنة
+            amount = (last_salary * rules["EOS_RESIGNATION_PARTIAL_RATE"]) * years
+            explanation = f"نصف أجر شهر عن كل سنة خدمة من {min_years:g}-{full_years:g} سنوات (المادة 33)"
+        else:  # أكثر من 5 سنوات
+            # أجر شهر كامل عن كل سنة
+            amount = last_salary * rules["EOS_RESIGNATION_FULL_RATE"] * years
+            explanation = f"أجر شهر كامل عن كل سنة خدمة لأكثر من {full_years:g} سنوات (المادة 33)"
+    
+    elif termination_type == "إنهاء من صاحب العمل":
+        if total_months < rules["EOS_EMPLOYER_MIN_MONTHS"]:  # أقل من سنة
+            amount = 0
+            explanation = "لا تستحق المكافأة لأقل من سنة خدمة (المادة 33)"
+        else:
+            # أجر شهرين عن كل سنة خدمة
+            amount = last_salary * rules["EOS_EMPLOYER_RATE"] * years
+            explanation = "أجر شهرين عن كل سنة خدمة في حالة إنهاء الخدمة من صاحب العمل (المادة 33)"
+    
+    else:  # أسباب تأديبية
+        amount = 0
+        explanation = "لا تستحق المكافأة في حالات الفصل التأديبي (المادة 33)"
+    
+    # احتساب كسور السنة
+    if months > 0 and amount > 0:
+        monthly_rate = amount / years if years > 0 else 0
+        additional_amount = (monthly_rate / 12) * months
+        amount += additional_amount
+        explanation += f" + نسبة عن {months} شهر"
+    
+    return {
+        'amount': amount,
+        'explanation': explanation,
+        'details': {
+            'الراتب الأساسي': f'{basic_salary:,.0f} دينار',
+            'آخر راتب': f'{last_salary:,.0f} دينار',
+            'مدة الخدمة': f'{years} سنة و {months} شهر',
+            'إجمالي أشهر الخدمة': f'{total_months} شهر',
+            'نهاية الخدمة': termination_type,
+            'نوع الخدمة': service_type,
+            'الأساس القانوني': 'المادة 33'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_overtime(basic_salary, overtime_hours, overtime_days, work_day_type, rules=None):
+    """حساب العمل الإضافي - المادة 54"""
+    rules = rules or current_rules()
+    daily_rate = basic_salary / rules["MONTH_DAYS"]
+    hourly_rate = daily_rate / rules["WORK_DAY_HOURS"]
+    
+    if work_day_type == "عادي":
+        rate = rules["OVERTIME_RATE_REGULAR"]  # زيادة 25%
+        explanation = f"زيادة {round((rate - 1) * 100):g}% للعمل الإضافي في الأيام العادية (المادة 54/1)"
+    elif work_day_type == "جمعة أو عطلة رسمية":
+        rate = rules["OVERTIME_RATE_HOLIDAY"]  # زيادة 50%
+        explanation = f"زيادة {round((rate - 1) * 100):g}% للعمل في أيام العطل الرسمية (المادة 54/2)"
+    else:  # عمل ليلي
+        rate = rules["OVERTIME_RATE_NIGHT"]  # زيادة 35% افتراضية
+        explanation = f"زيادة {round((rate - 1) * 100):g}% للعمل الليلي (حسب الأنظمة)"
+    
+    # حساب المبلغ
+    overtime_amount = overtime_hours * hourly_rate * rate
+    daily_overtime = overtime_days * daily_rate * (rate - 1)  # للعمل ليوم كامل
+    
+    total_amount = overtime_amount + daily_overtime
+    
+    return {
+        'amount': total_amount,
+        'explanation': explanation,
+        'details': {
+            'ساعات العمل الإضافي': f'{overtime_hours} ساعة',
+            'أيام العمل الإضافي': f'{overtime_days} يوم',
+            'سعر الساعة العادي': f'{hourly_rate:,.2f} دينار',
+            'سعر الساعة الإضافي': f'{hourly_rate * rate:,.2f} دينار',
+            'معدل الزيادة': f'{round((rate - 1) * 100):g}%',
+            'نوع اليوم': work_day_type,
+            'الأساس القانوني': 'المادة 54'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_annual_leave(basic_salary, service_years, requested_days, rules=None):
+    """حساب الإجازة السنوية - المادة 57"""
+    rules = rules or current_rules()
+    daily_rate = basic_salary / rules["MONTH_DAYS"]
+    senior_years = rules["ANNUAL_LEAVE_SENIOR_YEARS"]
+    
+    # تحديد أيام الإجازة المستحقة حسب سنوات الخدمة
+    if service_years < senior_years:
+        entitled_days = rules["ANNUAL_LEAVE_DAYS"]
+        explanation = f"{entitled_days:g} يوم إجازة سنوية لأقل من {senior_years:g} سنوات خدمة (المادة 57/أ)"
+    else:
+        entitled_days = rules["ANNUAL_LEAVE_DAYS_SENIOR"]
+        explanation = f"{entitled_days:g} يوم إجازة سنوية لـ{senior_years:g} سنوات خدمة فأكثر (المادة 57/أ)"
+    
+    # تحديد الأيام المحتسبة (لا يمكن تجاوز المستحق)
+    calculated_days = min(requested_days, entitled_days)
+    amount = daily_rate * calculated_days
+    
+    if requested_days > entitled_days:
+        explanation += f" - تم حساب {calculated_days} يوم فقط من {requested_days} يوم مطلوب"
+    
+    return {
+        'amount': amount,
+        'explanation': explanation,
+        'details': {
+            'أيام الإجازة المطلوبة': f'{requested_days} يوم',
+            'أيام الإجازة المستحقة': f'{entitled_days:g} يوم',
+            'أيام الإجازة المحتسبة': f'{calculated_days} يوم',
+            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
+            'سنوات الخدمة': f'{service_years} سنة',
+            'الأساس القانوني': 'المادة 57'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_sick_leave(basic_salary, sick_days, in_hospital=False, rules=None):
+    """حساب الإجازة المرضية - المادة 68"""
+    rules = rules or current_rules()
+    daily_rate = basic_salary / rules["MONTH_DAYS"]
+    full_pay_days = rules["SICK_FULL_PAY_DAYS"]
+    max_half_pay_days = rules["SICK_HALF_PAY_DAYS"]
+    half_pay_rate = rules["SICK_HALF_PAY_RATE"]
+    paid_limit = full_pay_days + max_half_pay_days
+    
+    if sick_days <= full_pay_days:
+        # أول 14 يوم بأجر كامل
+        paid_days = sick_days
+        amount = daily_rate * paid_days
+        explanation = f"{sick_days} يوم إجازة مرضية بأجر كامل (المادة 68)"
+    
+    elif sick_days <= rules["SICK_HOSPITAL_FULL_PAY_DAYS"] and in_hospital:
+        # حتى 28 يوم للمقيمين في المستشفى
+        paid_days = sick_days
+        amount = daily_rate * paid_days
+        explanation = f"{sick_days} يوم إجازة مرضية بأجر كامل (مقيم في المستشفى) - المادة 68"
+    
+    elif sick_days <= paid_limit:
+        # 14 يوم بأجر كامل + 14 يوم بنصف أجر
+        half_pay_days = min(sick_days - full_pay_days, max_half_pay_days)
+        unpaid_days = max(sick_days - paid_limit, 0)
+        
+        amount = (daily_rate * full_pay_days) + (daily_rate * half_pay_rate * half_pay_days)
+        explanation = f"{full_pay_days:g} يوم بأجر كامل + {half_pay_days} يوم بنصف أجر (المادة 68)"
+        
+        if unpaid_days > 0:
+            explanation += f" + {unpaid_days} يوم بدون أجر"
+    
+    else:
+        # أكثر من 28 يوم
+        half_pay_days = max_half_pay_days
+        unpaid_days = sick_days - paid_limit
+        
+        amount = (daily_rate * full_pay_days) + (daily_rate * half_pay_rate * half_pay_days)
+        explanation = f"{full_pay_days:g} يوم بأجر كامل + {half_pay_days:g} يوم بنصف أجر + {unpaid_days} يوم بدون أجر (المادة 68)"
+    
+    return {
+        'amount': amount,
+        'explanation': explanation,
+        'details': {
+            'أيام الإجازة المرضية': f'{sick_days} يوم',
+            'الحالة الصحية': 'مقيم في المستشفى' if in_hospital else 'غير مقيم',
+            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
+            'الأيام المدفوعة بالكامل': f'{full_pay_days:g} يوم',
+            'الأيام المدفوعة بالنصف': f'{max_half_pay_days:g} يوم كحد أقصى',
+            'الأساس القانوني': 'المادة 68'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_notice_period(basic_salary, notice_days, actual_work_days, rules=None):
+    """حساب بدل الإشعار - المادة 29"""
+    rules = rules or current_rules()
+    daily_rate = basic_salary / rules["MONTH_DAYS"]
+    
+    # الأيام التي لم يعملها العامل خلال فترة الإشعار
+    unpaid_notice_days = max(notice_days - actual_work_days, 0)
+    amount = daily_rate * unpaid_notice_days
+    
+    if unpaid_notice_days > 0:
+        explanation = f"بدل إشعار عن {unpaid_notice_days} يوم لم يتم العمل بها (المادة 29)"
+    else:
+        explanation = "لا مستحقات للإشعار حيث تم العمل بكامل فترة الإشعار (المادة 29)"
+    
+    return {
+        'amount': amount,
+        'explanation': explanation,
+        'details': {
+            'مدة الإشعار المستحقة': f'{notice_days} يوم',
+            'الأيام الفعلية المتبقية': f'{actual_work_days} يوم',
+            'أيام الإشعار غير المعملة': f'{unpaid_notice_days} يوم',
+            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
+            'الأساس القانوني': 'المادة 29'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_maternity_leave(basic_salary, rules=None):
+    """حساب إجازة الأمومة - المادة 70"""
+    rules = rules or current_rules()
+    daily_rate = basic_salary / rules["MONTH_DAYS"]
+    maternity_days = rules["MATERNITY_LEAVE_DAYS"]  # 10 أسابيع = 70 يوم
+    amount = daily_rate * maternity_days
+    duration = f'{maternity_days / 7:g} أسابيع ({maternity_days:g} يوم)'
+    
+    return {
+        'amount': amount,
+        'explanation': f'إجازة أمومة {duration} بأجر كامل (المادة 70)',
+        'details': {
+            'مدة الإجازة': duration,
+            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
+            'المدة قبل الولادة': '4 أسابيع (قابلة للتغيير)',
+            'المدة بعد الولادة': '6 أسابيع (إلزامية)',
+            'شروط الاستحقاق': 'جميع العاملات بغض النظر عن مدة الخدمة',
+            'الأساس القانوني': 'المادة 70'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_paternity_leave(basic_salary, rules=None):
+    """حساب إجازة الأبوة - المادة 71"""
+    rules = rules or current_rules()
+    daily_rate = basic_salary / rules["MONTH_DAYS"]
+    paternity_days = rules["PATERNITY_LEAVE_DAYS"]
+    amount = daily_rate * paternity_days
+    
+    return {
+        'amount': amount,
+        'explanation': f'إجازة أبوة {paternity_days:g} أيام بأجر كامل (المادة 71)',
+        'details': {
+            'مدة الإجازة': f'{paternity_days:g} أيام',
+            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
+            'شروط الاستحقاق': 'مرة واحدة خلال مدة الخدمة',
+            'وقت الاستحقاق': 'بعد ولادة الطفل',
+            'الأساس القانوني': 'المادة 71'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_haj_leave(basic_salary, service_years, rules=None):
+    """حساب إجازة الحج - المادة 71"""
+    rules = rules or current_rules()
+    daily_rate = basic_salary / rules["MONTH_DAYS"]
+    min_years = rules["HAJ_MIN_SERVICE_YEARS"]
+    
+    if service_years >= min_years:
+        haj_days = rules["HAJ_LEAVE_DAYS"]
+        amount = daily_rate * haj_days
+        explanation = f'إجازة حج {haj_days:g} يوم بأجر كامل (بعد {service_years} سنوات خدمة) - المادة 71'
+    else:
+        haj_days = 0
+        amount = 0
+        explanation = f'لا تستحق إجازة الحج (تتطلب {min_years:g} سنوات خدمة مستمرة) - لديك {service_years} سنوات'
+    
+    return {
+        'amount': amount,
+        'explanation': explanation,
+        'details': {
+            'مدة الإجازة': f'{haj_days:g} يوم',
+            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
+            'سنوات الخدمة المطلوبة': f'{min_years:g} سنوات مستمرة',
+            'سنوات الخدمة الفعلية': f'{service_years} سنة',
+            'شروط الاستحقاق': 'مرة واحدة خلال مدة الخدمة',
+            'الأساس القانوني': 'المادة 71'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_work_injury_compensation(basic_salary, injury_type, disability_percentage=0, medical_expenses=0, treatment_days=0, rules=None):
+    """حساب تعويض إصابة العمل - المواد 87-96"""
+    rules = rules or current_rules()
+    daily_rate = basic_salary / rules["MONTH_DAYS"]
+    base_days = rules["INJURY_BASE_DAYS"]
+    minimum = rules["INJURY_MIN_COMPENSATION"]
+    maximum = rules["INJURY_MAX_COMPENSATION"]
+    
+    if injury_type == "وفاة":
+        # تعويض الوفاة: أجر 1500 يوم عمل (المادة 87/أ)
+        base_compensation = daily_rate * base_days
+        if base_compensation < minimum:
+            compensation = minimum
+            explanation = f"تعويض الوفاة: {minimum:,.0f} دينار (الحد الأدنى) - المادة 87/أ"
+        elif base_compensation > maximum:
+            compensation = maximum
+            explanation = f"تعويض الوفاة: {maximum:,.0f} دينار (الحد الأقصى) - المادة 87/أ"
+        else:
+            compensation = base_compensation
+            explanation = f"تعويض الوفاة: {compensation:,.0f} دينار ({base_days:g} يوم عمل) - المادة 87/أ"
+    
+    elif injury_type == "عجز كلي دائم":
+        # نفس تعويض الوفاة (المادة 87/أ)
+        base_compensation = daily_rate * base_days
+        if base_compensation < minimum:
+            compensation = minimum
+            explanation = f"تعويض العجز الكلي: {minimum:,.0f} دينار (الحد الأدنى) - المادة 87/أ"
+        elif base_compensation > maximum:
+            compensation = maximum
+            explanation = f"تعويض العجز الكلي: {maximum:,.0f} دينار (الحد الأقصى) - المادة 87/أ"
+        else:
+            compensation = base_compensation
+            explanation = f"تعويض العجز الكلي: {compensation:,.0f} دينار ({base_days:g} يوم عمل) - المادة 87/أ"
+    
+    elif injury_type == "عجز جزئي دائم":
+        # نسبة من تعويض العجز الكلي حسب نسبة العجز (المادة 87/ج)
+        base_compensation = daily_rate * base_days
+        base_compensation = max(minimum, min(base_compensation, maximum))
+        compensation = base_compensation * (disability_percentage / 100)
+        explanation = f"تعويض العجز الجزئي: {disability_percentage}% من تعويض العجز الكلي - المادة 87/ج"
+    
+    elif injury_type == "عجز مؤقت":
+        # بدل يومي 75% من الأجر للمعالجة خارج المستشفى (المادة 87/ب)
+        allowance_rate = rules["TEMPORARY_DISABILITY_RATE"]
+        daily_allowance = daily_rate * allowance_rate
+        compensation = daily_allowance * treatment_days
+        explanation = f"بدل يومي {allowance_rate * 100:g}% من الأجر لمدة {treatment_days} يوم - المادة 87/ب"
+    
+    else:
+        compensation = 0
+        explanation = "نوع الإصابة غير معروف"
+    
+    # إضافة المصاريف الطبية
+    total_compensation = compensation + medical_expenses
+    
+    return {
+        'compensation': compensation,
+        'medical_expenses': medical_expenses,
+        'total_amount': total_compensation,
+        'explanation': explanation,
+        'details': {
+            'الراتب الأساسي': f'{basic_salary:,.0f} دينار',
+            'نوع الإصابة': injury_type,
+            'نسبة العجز': f'{disability_percentage}%' if disability_percentage else 'لا ينطبق',
+            'أيام العلاج': f'{treatment_days} يوم' if treatment_days else 'لا ينطبق',
+            'المصاريف الطبية': f'{medical_expenses:,.0f} دينار',
+            'الأجر اليومي': f'{daily_rate:,.2f} دينار',
+            'الأساس القانوني': 'المواد 87-96'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_social_security_contributions(employee_salary, employee_rate, employer_rate, salary_ceiling, calculation_type):
+    """حساب اشتراكات الضمان الاجتماعي"""
+    # الأجر الخاضع للاشتراك (لا يتجاوز السقف)
+    insurable_salary = min(employee_salary, salary_ceiling)
+    
+    # حساب الاشتراكات
+    employee_share = insurable_salary * (employee_rate / 100)
+    employer_share = insurable_salary * (employer_rate / 100)
+    total_share = employee_share + employer_share
+    
+    # ضرب حسب الفترة
+    multipliers = {"شهري": 1, "ربع سنوي": 3, "سنوي": 12}
+    multiplier = multipliers.get(calculation_type, 1)
+    
+    return {
+        'employee_share': employee_share * multiplier,
+        'employer_share': employer_share * multiplier,
+        'total_share': total_share * multiplier,
+        'details': {
+            'الراتب الأساسي': f'{employee_salary:,.0f} دينار',
+            'الراتب الخاضع للاشتراك': f'{insurable_salary:,.0f} دينار',
+            'نسبة الموظف': f'{employee_rate}%',
+            'نسبة صاحب العمل': f'{employer_rate}%',
+            'فترة الحساب': calculation_type,
+            'الحد الأقصى للأجر الخاضع': f'{salary_ceiling:,.0f} دينار',
+            'الاشتراك الشهري الإجمالي': f'{total_share:,.0f} دينار'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_unfair_dismissal_compensation(basic_salary, service_years, actual_notice, dismissal_reason, rules=None):
+    """حساب تعويض الفصل التعسفي"""
+    rules = rules or current_rules()
+    
+    # التعويض الأساسي (أجر مدة تصل إلى 6 أشهر)
+    base_compensation = basic_salary * min(service_years, rules["UNFAIR_MAX_MONTHS"])
+    
+    # تعويض الإشعار
+    notice_compensation = 0
+    if actual_notice == "لا":
+        notice_compensation = basic_salary  # أجر شهر كامل
+    elif actual_notice == "جزئي":
+        notice_compensation = basic_salary * rules["UNFAIR_PARTIAL_NOTICE_RATE"]  # نصف أجر شهر
+    
+    # مضاعفات حسب نوع الفصل
+    multiplier_key = UNFAIR_DISMISSAL_REASONS.get(dismissal_reason)
+    multiplier = rules[multiplier_key] if multiplier_key else 1.0
+    
+    total_compensation = (base_compensation * multiplier) + notice_compensation
+    
+    return {
+        'amount': total_compensation,
+        'explanation': f'تعويض فصل تعسفي {dismissal_reason}',
+        'details': {
+            'الراتب الأساسي': f'{basic_salary:,.0f} دينار',
+            'سنوات الخدمة': f'{service_years} سنة',
+            'سبب الفصل': dismissal_reason,
+            'تعويض الإشعار': f'{notice_compensation:,.0f} دينار',
+            'مضاعف التعويض': f'{multiplier}x',
+            'الأساس القانوني': 'المادة 30 وقرارات المحاكم'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_salary_delay_compensation(basic_salary, delay_months, delay_days, rules=None):
+    """حساب تعويض تأخر صرف الرواتب"""
+    rules = rules or current_rules()
+    total_delay_days = (delay_months * rules["MONTH_DAYS"]) + delay_days
+    
+    # تعويض التأخير (فائدة 8% سنوياً = 0.022% يومياً)
+    daily_interest_rate = rules["SALARY_DELAY_DAILY_RATE"]
+    daily_compensation = basic_salary * daily_interest_rate
+    
+    total_compensation = daily_compensation * total_delay_days
+    
+    return {
+        'amount': total_compensation,
+        'explanation': f'تعويض تأخير صرف الرواتب عن {total_delay_days} يوم',
+        'details': {
+            'الراتب الشهري': f'{basic_salary:,.0f} دينار',
+            'أشهر التأخير': f'{delay_months} شهر',
+            'أيام التأخير': f'{delay_days} يوم',
+            'إجمالي أيام التأخير': f'{total_delay_days} يوم',
+            'معدل الفائدة': '8% سنوياً',
+            'التعويض اليومي': f'{daily_compensation:,.2f} دينار',
+            'الأساس القانوني': 'المادة 55 وقانون المعاملات المدنية'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_accrued_leave_compensation(basic_salary, accrued_leave, service_years, rules=None):
+    """حساب تعويض الإجازات المستحقة"""
+    rules = rules or current_rules()
+    daily_rate = basic_salary / rules["MONTH_DAYS"]
+    total_compensation = daily_rate * accrued_leave
+    
+    return {
+        'amount': total_compensation,
+        'explanation': f'تعويض {accrued_leave} يوم إجازة مستحقة',
+        'details': {
+            'الراتب الأساسي': f'{basic_salary:,.0f} دينار',
+            'أيام الإجازة المستحقة': f'{accrued_leave} يوم',
+            'سنوات الخدمة': f'{service_years} سنة',
+            'أجر اليوم الواحد': f'{daily_rate:,.2f} دينار',
+            'الأساس القانوني': 'المادة 57'
+        }
+    }
+
+@instrumented("calculator")
+def calculate_social_security_penalty(basic_salary, unregistered_months, rules=None):
+    """حساب تعويض عدم التسجيل في الضمان"""
+    rules = rules or current_rules()
+    # الاشتراكات المتأخرة
+    monthly_employee_share = basic_salary * (rules["SS_EMPLOYEE_RATE"] / 100)  # 7.5%
+    monthly_employer_share = basic_salary * (rules["SS_EMPLOYER_RATE"] / 100)  # 14.5%
+    monthly_total_share = monthly_employee_share + monthly_employer_share
+    
+    # الغرامات (تقديرية)
+    penalty_rate = rules["SS_LATE_PENALTY_RATE"]  # 2% شهرياً
+    total_penalty = monthly_total_share * unregistered_months * penalty_rate
+    
+    total_compensation = (monthly_total_share * unregistered_months) + total_penalty
+    
+    return {
+        'amount': total_compensation,
+        'explanation': f'تعويض عدم التسجيل في الضمان لـ {unregistered_months} شهر',
+        'details': {
+            'الراتب الأساسي': f'{basic_salary:,.0f} دينار',
+            'أشهر عدم التسجيل': f'{unregistered_months} شهر',
+            'الاشتراكات المتأخرة': f'{monthly_total_share * unregistered_months:,.0f} دينار',
+            'الغرامات التقديرية': f'{total_penalty:,.0f} دينار',
+            'الاشتراك الشهري': f'{monthly_total_share:,.0f} دينار',
+            'الأساس القانوني': 'قانون الضمان الاجتماعي'
+        }
+    }
@@ -0,0 +1,299 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from helpers.data_loader import CONFIG_PATH, load_config_section, load_performance_settings
+from helpers.parallel_parse import resolve_workers
+from helpers.workbook_store import open_shared_workbook
+
+# ==========================
+# ✅ تشغيل حالات الاختبار الآلية (Case_AutoTests) على الحاسبات
+# ==========================
+# كل حالة في الورقة تُربط بأقرب حاسبة من helpers.calculators عبر نوع الحالة، وتُقارن
+# نتيجتها بالقيمة المتوقعة في الورقة. تُوزَّع الحالات على عدة عمليات وتُكرَّر كل حالة
+# repeat مرة، فيكون التشغيل اختبار صحة عند تغيّر النسب وقياس إنتاجية للحاسبات معًا.
+#
+# الفروق المقبولة عن الورقة محفوظة بجانب ملف العمل في Case_AutoTests.known.csv
+# (case_id, expected, accepted, reason): الحالة "known" فقط إذا بقيت نتيجة الحاسبة مساوية
+# للقيمة المقبولة المسجلة، وأي تغيير فيها يعيدها "fail".
+
+CASE_SHEET = "Case_AutoTests"
+KNOWN_DIFFERENCES_FILE = "Case_AutoTests.known.csv"
+
+# الفرق المسموح بالدينار (القيم المتوقعة في الورقة مقرّبة لأقرب دينار)
+AMOUNT_TOLERANCE = 0.5
+
+TIMING_PERCENTILES = (50, 90, 99)
+
+
+def _service_period(case):
+    """سنوات الخدمة الكسرية (مثل 1.5) كسنوات كاملة وأشهر"""
+    years = int(case["years"])
+    return years, int(round((case["years"] - years) * 12))
+
+
+def _end_of_service(termination_type):
+    def build(case):
+        years, months = _service_period(case)
+        salary = case["last_salary_jod"]
+        return {
+            "basic_salary": salary, "years": years, "months": months,
+            "termination_type": termination_type, "last_salary": salary, "service_type": "مستمرة",
+        }
+    return build
+
+
+def _unfair_dismissal(actual_notice):
+    def build(case):
+        return {
+            "basic_salary": case["last_salary_jod"], "service_years": int(case["years"]),
+            "actual_notice": actual_notice, "dismissal_reason": "تعسفي بدون سبب مبرر",
+        }
+    return build
+
+
+def _maternity_leave(case):
+    return {"basic_salary": case["last_salary_jod"]}
+
+
+# نوع الحالة (الجزء الإنجليزي بعد " / ") -> (الحاسبة, بناء مدخلاتها من صف الحالة)
+# الأنواع غير المذكورة لا تقابلها حاسبة أو تنقصها مدخلات في الورقة، فتُعرض كـ "غير مربوطة".
+# منها "Dismissal w/o Notice": قيمتها المتوقعة مجموع إشعار + نهاية خدمة + تعويض تعسفي بصيغة
+# الورقة (420+840)، ولا تعطيها حاسبة واحدة ولا مجموع الحاسبات الثلاث (420 + 3360 + 3780).
+CASE_CALCULATORS = {
+    "Retaliation Dismissal": ("calculate_unfair_dismissal_compensation", _unfair_dismissal("نعم")),
+    "Constructive Dismissal": ("calculate_unfair_dismissal_compensation", _unfair_dismissal("نعم")),
+    "Quit": ("calculate_end_of_service", _end_of_service("استقالة")),
+    "Redundancy": ("calculate_end_of_service", _end_of_service("إنهاء من صاحب العمل")),
+    "Maternity Leave": ("calculate_maternity_leave", _maternity_leave),
+}
+
+
+
+def case_kind(case_type):
+    """الجزء الإنجليزي من نوع الحالة بعد " / " ("فصل دون إشعار / Dismissal w/o Notice" -> "Dismissal w/o Notice")"""
+    return str(case_type).rsplit(" / ", 1)[-1].strip()
+
+
+def _workbook_path(workbook_path, config_path):
+    if workbook_path is None:
+        return load_config_section("DATA_SOURCES", {"WORKBOOK_PATH": ""}, config_path)["WORKBOOK_PATH"]
+    return workbook_path
+
+
+def load_known_differences(workbook_path=None, config_path=CONFIG_PATH):
+    """
+    الفروق المقبولة من Case_AutoTests.known.csv بجانب ملف العمل.
+
+    Returns:
+        dict: معرّف الحالة -> {"accepted": القيمة المقبولة, "reason": السبب}؛ فارغ بلا ملف
+    """
+    workbook_path = _workbook_path(workbook_path, config_path)
+    path = os.path.join(os.path.dirname(os.path.abspath(workbook_path)), KNOWN_DIFFERENCES_FILE)
+    if not os.path.exists(path):
+        return {}
+    df = pd.read_csv(path, encoding="utf-8-sig")
+    return {
+        row["case_id"]: {"accepted": float(row["accepted"]), "reason": row["reason"]}
+        for row in df.to_dict("records")
+    }
+
+
+def load_cases(workbook_path=None, config_path=CONFIG_PATH):
+    """صفوف ورقة Case_AutoTests من المخزن المشترك كقائمة قواميس"""
+    workbook_path = _workbook_path(workbook_path, config_path)
+    performance = load_performance_settings(config_path)
+    workbook = open_shared_workbook(
+        workbook_path,
+        workers=performance["PARSE_WORKERS"],
+        optimize_dtypes=performance["OPTIMIZE_DTYPES"],
+    )
+    if workbook is None:
+        raise FileNotFoundError(workbook_path)
+    df = workbook.data[CASE_SHEET]
+    df = df.assign(
+        years=pd.to_numeric(df["years"], errors="coerce").fillna(0).astype(float),
+        last_salary_jod=pd.to_numeric(df["last_salary_jod"], errors="coerce").fillna(0).astype(float),
+        auto_result_value=pd.to_numeric(df["auto_result_value"], errors="coerce").astype(float),
+    )
+    return df.to_dict("records")
+
+
+def build_jobs(cases):
+    """
+    تحويل الحالات إلى مهام (معرّف الحالة, الحاسبة, المدخلات).
+
+    Returns:
+        tuple: (المهام, الحالات غير المربوطة)
+    """
+    jobs, unmapped = [], []
+    for case in cases:
+        spec = CASE_CALCULATORS.get(case_kind(case["case_type"]))
+        if spec is None:
+            unmapped.append(case)
+            continue
+        calculator, build = spec
+        jobs.append((case["case_id"], calculator, build(case)))
+    return jobs, unmapped
+
+
+def _warm_up(jobs):
+    """تهيئة العامل قبل القياس: جدول القواعد (وملف العمل) واستدعاء واحد لكل حاسبة"""
+    from helpers import calculators
+    from helpers.legal_rules import current_rules
+
+    current_rules()
+    functions, warmed = {}, set()
+    for _, calculator, inputs in jobs:
+        function = getattr(calculators, calculator)
+        # قياس الحساب نفسه دون غلاف التسجيل في helpers.instrumentation
+        functions[calculator] = getattr(function, "__wrapped__", function)
+        if calculator not in warmed:
+            warmed.add(calculator)
+            try:
+                functions[calculator](**inputs)
+            except Exception:
+                # يُسجَّل الخطأ نفسه في التشغيل المقاس
+                pass
+    return functions
+
+
+def _run_jobs(jobs, repeat):
+    """
+    عامل: تنفيذ مجموعة مهام repeat مرة لكل منها بعد التهيئة.
+
+    Returns:
+        tuple: (نتيجة كل مهمة وأزمنة استدعاءاتها, زمن التنفيذ المقاس داخل العامل)
+    """
+    functions = _warm_up(jobs)
+    outcomes = []
+    started = time.perf_counter()
+    for case_id, calculator, inputs in jobs:
+        function = functions[calculator]
+        timings = []
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = function(**inputs)
+                timings.append(time.perf_counter() - start)
+            outcomes.append((case_id, result["amount"], None, timings))
+        except Exception as e:
+            outcomes.append((case_id, None, f"{type(e).__name__}: {e}", timings))
+    return outcomes, time.perf_counter() - started
+
+
+def _execute(jobs, workers, repeat):
+    """
+    توزيع المهام على العمليات، أو تنفيذها في العملية الحالية عند عامل واحد.
+
+    Returns:
+        tuple: (كل النتائج, أطول زمن تنفيذ بين العمال دون إنشاء العمليات وتهيئتها)
+    """
+    workers = resolve_workers(workers, len(jobs))
+    if workers == 1:
+        return _run_jobs(jobs, repeat)
+    groups = [jobs[i::workers] for i in range(workers)]
+    # spawn كما في parse_workbook_parallel: لا نسخ لعملية قد تحتوي خيوطًا
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(_run_jobs, group, repeat) for group in groups]
+        results = [future.result() for future in futures]
+    # العمال يعملون بالتوازي، فزمن التشغيل هو زمن أبطئهم
+    return [outcome for outcomes, _ in results for outcome in outcomes], max(elapsed for _, elapsed in results)
+
+
+def run_cases(cases, workers=None, repeat=1, tolerance=AMOUNT_TOLERANCE, known=None):
+    """
+    تشغيل الحالات على الحاسبات ومقارنة النتائج بالقيم المتوقعة.
+
+    Args:
+        cases (list): صفوف Case_AutoTests (من load_cases)
+        workers (int): عدد العمليات (0 أو None = عدد الأنوية)
+        repeat (int): عدد مرات تنفيذ كل حالة (لقياس الإنتاجية)
+        tolerance (float): الفرق المسموح بالدينار
+        known (dict): الفروق المقبولة (من load_known_differences)
+
+    Returns:
+        dict: results (صف لكل حالة بالترتيب الأصلي)، timings (أزمنة كل حاسبة بالثواني)،
+        wall_time (زمن التنفيذ داخل العمال بعد التهيئة)، total_time (مع إنشاء العمليات وتهيئتها)
+    """
+    known = known or {}
+    jobs, _ = build_jobs(cases)
+    start = time.perf_counter()
+    executed, wall_time = _execute(jobs, workers, max(1, repeat)) if jobs else ([], 0.0)
+    total_time = time.perf_counter() - start
+    outcomes = {case_id: (amount, error, timings) for case_id, amount, error, timings in executed}
+    calculators = {case_id: calculator for case_id, calculator, _ in jobs}
+
+    results, timings = [], {}
+    for case in cases:
+        case_id = case["case_id"]
+        row = {
+            "case_id": case_id,
+            "case_type": case["case_type"],
+            "calculator": calculators.get(case_id),
+            "expected": None if pd.isna(case["auto_result_value"]) else case["auto_result_value"],
+            "actual": None,
+            "diff": None,
+            "status": "unmapped",
+            "error": None,
+            "note": None,
+        }
+        if case_id in outcomes:
+            amount, error, case_timings = outcomes[case_id]
+            timings.setdefault(row["calculator"], []).extend(case_timings)
+            if error is not None:
+                row.update(status="error", error=error)
+            else:
+                row["actual"] = round(float(amount), 2)
+                if row["expected"] is None:
+                    row["status"] = "no_expected"
+                else:
+                    row["diff"] = round(row["actual"] - row["expected"], 2)
+                    accepted = known.get(case_id)
+                    if abs(row["diff"]) <= tolerance:
+                        row["status"] = "pass"
+                    elif accepted is not None and abs(row["actual"] - accepted["accepted"]) <= tolerance:
+                        row.update(status="known", note=accepted["reason"])
+                    else:
+                        row["status"] = "fail"
+                        if accepted is not None:
+                            row["note"] = f"القيمة المقبولة {accepted['accepted']:,.2f}: {accepted['reason']}"
+        results.append(row)
+    return {"results": results, "timings": timings, "wall_time": wall_time, "total_time": total_time}
+
+
+def gate_failures(results):
+    """
+    أسباب فشل البوابة: حالة فاشلة أو خطأ، أو حالات غير مربوطة أو فروق مقبولة أكثر من
+    الحالات الناجحة (فلا تُعد البوابة ناجحة وهي لا تتحقق فعليًا إلا من القليل).
+    """
+    counts = {}
+    for row in results:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    passed = counts.get("pass", 0)
+    failures = []
+    if counts.get("fail") or counts.get("error"):
+        failures.append(f"{counts.get('fail', 0)} fail, {counts.get('error', 0)} error")
+    if counts.get("unmapped", 0) > passed:
+        failures.append(f"{counts['unmapped']} unmapped > {passed} pass")
+    if counts.get("known", 0) > passed:
+        failures.append(f"{counts['known']} known > {passed} pass")
+    return failures
+
+
+def timing_percentiles(timings):
+    """نسب مئوية لأزمنة كل حاسبة بالميكروثانية مع عدد الاستدعاءات"""
+    summary = {}
+    for calculator, values in timings.items():
+        if not values:
+            continue
+        micros = np.asarray(values) * 1e6
+        summary[calculator] = {"calls": len(values)}
+        for percentile in TIMING_PERCENTILES:
+            summary[calculator][f"p{percentile}"] = float(np.percentile(micros, percentile))
+    return summary
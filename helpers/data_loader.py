@@ -1,17 +1,113 @@
+import json
 import os
+import threading
 import pandas as pd
 
+from helpers.metrics import WORKBOOK_LOAD_SECONDS, register_cache, registry
+from helpers.ttl_cache import TTLCache
+from helpers.workbook_store import open_shared_workbook
+
+CONFIG_PATH = "config/config.json"
+
+# القيم الافتراضية لقسم PERFORMANCE عند غياب ملف الإعدادات
+DEFAULT_PERFORMANCE = {
+    "CACHE_ENABLED": True,
+    "CACHE_TTL_SECONDS": 600,
+    "CACHE_MAX_ENTRIES": 32,
+    "LAZY_LOADING": True,
+    "PARSE_WORKERS": 0,
+    "OPTIMIZE_DTYPES": True,
+    "PROFILING_ENABLED": True,
+    "PROFILE_MEMORY": False,
+    "PROFILING_WINDOW": 1000,
+    "DEBUG_PANEL": False,
+}
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+DATA_LOAD_SECONDS = registry.histogram("data_load_seconds", "Time to read a sheet or CSV on a cache miss", ["format"])
+
+_workbook_load_seconds = WORKBOOK_LOAD_SECONDS.labels("data_loader")
+
+
+def load_config_section(section, defaults, config_path=CONFIG_PATH):
+    """قراءة قسم من ملف الإعدادات فوق قيمه الافتراضية (دون الحاجة إلى Streamlit)"""
+    settings = dict(defaults)
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            settings.update(json.load(f).get(section, {}))
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️ تعذر قراءة إعدادات {section}، سيتم استخدام القيم الافتراضية: {e}")
+    return settings
+
+
+def load_performance_settings(config_path=CONFIG_PATH):
+    """قراءة قسم PERFORMANCE من ملف الإعدادات"""
+    return load_config_section("PERFORMANCE", DEFAULT_PERFORMANCE, config_path)
+
+
+def shared_data_cache(settings):
+    """الذاكرة المؤقتة المشتركة لكل جلسات العملية (تُنشأ مرة واحدة من الإعدادات)"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = TTLCache(
+                maxsize=settings["CACHE_MAX_ENTRIES"],
+                ttl=settings["CACHE_TTL_SECONDS"],
+            )
+            register_cache("data", _shared_cache)
+        return _shared_cache
+
+
 class DataLoader:
-    def __init__(self):
-        self.loaded_data = {}
+    def __init__(self, config_path=CONFIG_PATH):
+        self.settings = load_performance_settings(config_path)
+        self.cache_enabled = self.settings["CACHE_ENABLED"]
+        # (المسار المطلق, الورقة, الإصدار) -> DataFrame، بحد أقصى للحجم ومدة صلاحية
+        self.loaded_data = shared_data_cache(self.settings)
+        # مراجع على ملفات Excel في المخزن المشترك (نسخة واحدة لكل العملية)
+        self._workbooks = {}
+
+    def _handle(self, file_path):
+        """مرجع ملف Excel في المخزن المشترك"""
+        if file_path not in self._workbooks:
+            with _workbook_load_seconds.time():
+                self._workbooks[file_path] = open_shared_workbook(
+                    file_path,
+                    lazy=self.settings["LAZY_LOADING"],
+                    workers=self.settings["PARSE_WORKERS"],
+                    optimize_dtypes=self.settings["OPTIMIZE_DTYPES"],
+                )
+        return self._workbooks[file_path]
+
+    def _workbook(self, file_path):
+        """قاموس أوراق ملف Excel من المخزن المشترك (مع أوراق المزامنة إن وُجدت)"""
+        return self._handle(file_path).data
+
+    def _read(self, file_path, sheet_name):
+        if file_path.endswith(".csv"):
+            with DATA_LOAD_SECONDS.labels("csv").time():
+                return pd.read_csv(file_path)
+        workbook = self._workbook(file_path)
+        if sheet_name is None or isinstance(sheet_name, int):
+            sheet_name = list(workbook)[sheet_name or 0]
+        with DATA_LOAD_SECONDS.labels("xlsx").time():
+            return workbook[sheet_name]
 
     def load_csv(self, file_path, sheet_name=None):
         """تحميل CSV/Excel بأمان"""
-        if not os.path.exists(file_path):
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
             return None
-        if file_path.endswith(".csv"):
-            df = pd.read_csv(file_path)
-        else:
-            with pd.ExcelFile(file_path) as xls:
-                df = pd.read_excel(xls, sheet_name=sheet_name or 0)
-        return df
\ No newline at end of file
+        if not self.cache_enabled:
+            return self._read(file_path, sheet_name)
+        # أوراق Excel تتغير أيضًا مع مصدر المزامنة، فإصدارها من المخزن المشترك لا من mtime وحده
+        version = mtime_ns if file_path.endswith(".csv") else self._handle(file_path).version
+        key = (os.path.abspath(file_path), sheet_name, version)
+        return self.loaded_data.get_or_load(key, lambda: self._read(file_path, sheet_name))
+
+    def cache_stats(self):
+        """عدّادات الذاكرة المؤقتة (إصابة/إخفاق/إخلاء) لضبط الإعدادات"""
+        return self.loaded_data.stats()
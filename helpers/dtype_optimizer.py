@@ -0,0 +1,175 @@
+import os
+import sys
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+
+# ==========================
+# 🗜️ ضغط أنواع أعمدة الأوراق بعد التحميل
+# ==========================
+# الأعمدة النصية قليلة التنوع (الدور، رقم المادة، الفئة، نوع المخالفة...) تتحول إلى category،
+# والأعمدة الرقمية إلى نوع أضيق يحفظ القيم تمامًا، وتُوحَّد النصوص المتكررة المتبقية
+# (sys.intern) فتشير كل القيم المتطابقة إلى كائن واحد. الأوراق المضغوطة تُسجَّل في تقرير
+# الذاكرة ولا تُقاس إلا عند طلب التقرير، فلا يكلّف القياس شيئًا في مسار التحميل.
+#
+# الأعداد الصحيحة لا تنزل تحت int32: الحسابات على أعمدة int8/int16 (الراتب × السنوات،
+# المجاميع) تلتف بصمت عند تجاوز حدود النوع، وint32 يتسع لأي حساب معقول على بيانات الأوراق.
+
+# نسبة القيم المختلفة إلى عدد الصفوف التي تُحوَّل تحتها الأعمدة النصية إلى category
+CATEGORY_RATIO = 0.5
+# أوراق أصغر من هذا لا تستفيد من category (كلفة القاموس أكبر من الوفر)
+MIN_ROWS_FOR_CATEGORY = 4
+# أضيق نوع للأعداد الصحيحة
+MIN_INT_DTYPE = np.int32
+
+_report = {}
+_report_lock = threading.Lock()
+# (ملف العمل, الورقة, mtime_ns) -> حجم الورقة بعد قراءة غير مضغوطة
+_unoptimized_bytes = {}
+
+
+def _is_text(series):
+    return series.dtype == object or pd.api.types.is_string_dtype(series.dtype)
+
+
+def _all_strings(series):
+    values = series.dropna()
+    return all(isinstance(value, str) for value in values)
+
+
+def _all_numbers(series):
+    """هل كل القيم غير الفارغة أرقام حقيقية (لا نصوص ولا قيم منطقية)؟"""
+    values = series.dropna()
+    return len(values) > 0 and all(
+        isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, (bool, np.bool_))
+        for value in values
+    )
+
+
+def _downcast_numeric(series):
+    """أضيق نوع رقمي يحفظ القيم تمامًا (الأعداد الصحيحة حتى MIN_INT_DTYPE)"""
+    if pd.api.types.is_integer_dtype(series.dtype):
+        limits = np.iinfo(MIN_INT_DTYPE)
+        if series.dtype.itemsize <= limits.dtype.itemsize:
+            return series
+        if series.empty or (series.min() >= limits.min and series.max() <= limits.max):
+            return series.astype(MIN_INT_DTYPE)
+        return series
+    narrow = series.astype(np.float32)
+    if ((narrow.astype(np.float64) == series) | series.isna()).all():
+        return narrow
+    return series
+
+
+def _intern_strings(series):
+    """توحيد كائنات النصوص المتكررة في عمود object"""
+    return series.map(lambda value: sys.intern(value) if isinstance(value, str) else value)
+
+
+def optimize_frame(df, category_ratio=CATEGORY_RATIO):
+    """نسخة مضغوطة الأنواع من الورقة (لا تُعدّل الورقة الأصلية)"""
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(series.dtype):
+            columns[column] = series
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            columns[column] = _downcast_numeric(series)
+        elif series.dtype == object and _all_numbers(series):
+            columns[column] = _downcast_numeric(pd.to_numeric(series))
+        elif _is_text(series):
+            non_null = series.count()
+            low_cardinality = (
+                len(series) >= MIN_ROWS_FOR_CATEGORY
+                and non_null
+                and series.nunique() <= category_ratio * non_null
+            )
+            # أعمدة object مختلطة الأنواع تبقى كما هي (تصنيف مختلط لا يقبله Arrow)
+            if low_cardinality and (series.dtype != object or _all_strings(series)):
+                columns[column] = series.astype("category")
+            elif series.dtype == object:
+                columns[column] = _intern_strings(series)
+            else:
+                columns[column] = series
+        else:
+            columns[column] = series
+    optimized = pd.DataFrame(columns, index=df.index)
+    optimized.columns = df.columns
+    return optimized
+
+
+def frame_memory(df):
+    """الحجم الفعلي للورقة في الذاكرة بالبايت (مع محتوى النصوص)"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def _unoptimized_sizes(workbook_path, sheets):
+    """
+    حجم كل ورقة كما يقرؤها read_excel بلا ضغط، بقراءة فعلية من الملف.
+
+    تُحفظ النتيجة لكل إصدار من الملف فلا يُعاد التحليل في التقارير التالية.
+    """
+    mtime_ns = os.stat(workbook_path).st_mtime_ns
+    sizes = {sheet: _unoptimized_bytes.get((workbook_path, sheet, mtime_ns)) for sheet in sheets}
+    missing = [sheet for sheet, size in sizes.items() if size is None]
+    if missing:
+        with pd.ExcelFile(workbook_path) as xls:
+            for sheet in missing:
+                if sheet in xls.sheet_names:
+                    sizes[sheet] = frame_memory(pd.read_excel(xls, sheet_name=sheet))
+                    _unoptimized_bytes[(workbook_path, sheet, mtime_ns)] = sizes[sheet]
+    return sizes
+
+
+def track_sheet(df, workbook_path=None, sheet=None):
+    """تسجيل ورقة مضغوطة في تقرير الذاكرة (مرجع ضعيف، دون قياس)"""
+    with _report_lock:
+        _report[(workbook_path, sheet)] = weakref.ref(df)
+    return df
+
+
+def optimize_sheet(df, workbook_path=None, sheet=None, category_ratio=CATEGORY_RATIO):
+    """ضغط ورقة وتسجيلها في تقرير الذاكرة"""
+    return track_sheet(optimize_frame(df, category_ratio), workbook_path, sheet)
+
+
+def memory_report():
+    """
+    تقرير الذاكرة لكل ورقة مضغوطة ما زالت في الذاكرة: الحجم قبل وبعد ونسبة الوفر.
+
+    يُقاس عند الطلب فقط. الأوراق المقروءة من النسخة المُجمّعة محفوظة مضغوطة أصلًا، فيُقاس
+    حجمها "قبل" بقراءة الورقة من ملف العمل كما يقرؤها التطبيق بلا ضغط (مرة لكل إصدار
+    من الملف). الأوراق بلا ملف عمل معروف يبقى حجمها "قبل" فارغًا.
+    """
+    with _report_lock:
+        tracked = list(_report.items())
+    frames = {}
+    for (workbook, sheet), ref in tracked:
+        df = ref()
+        if df is not None:
+            frames.setdefault(workbook, {})[sheet] = df
+
+    rows = []
+    for workbook, sheets in frames.items():
+        before = {}
+        if workbook is not None:
+            try:
+                before = _unoptimized_sizes(workbook, list(sheets))
+            except (OSError, ValueError) as e:
+                print(f"⚠️ تعذر قياس حجم الأوراق قبل الضغط في {workbook}: {e}")
+        for sheet, df in sheets.items():
+            rows.append({
+                "workbook": workbook,
+                "sheet": sheet,
+                "rows": len(df),
+                "before_bytes": before.get(sheet),
+                "after_bytes": frame_memory(df),
+            })
+    report = pd.DataFrame(rows, columns=["workbook", "sheet", "rows", "before_bytes", "after_bytes"])
+    report["before_bytes"] = pd.to_numeric(report["before_bytes"])
+    report["saved_pct"] = (
+        100 * (1 - report["after_bytes"] / report["before_bytes"].where(report["before_bytes"] > 0))
+    ).round(1)
+    return report
@@ -0,0 +1,214 @@
+import functools
+import itertools
+import json
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from time import perf_counter, thread_time
+
+import numpy as np
+
+from helpers.data_loader import CONFIG_PATH, load_performance_settings
+
+# ==========================
+# ⏱️ قياس زمن الصفحات والحاسبات داخل العملية
+# ==========================
+# كل مقطع مُسمّى (صفحة أو حاسبة) يُسجَّل له زمن الجدار وزمن المعالج للخيط الحالي، وذروة
+# الذاكرة المحجوزة (tracemalloc) عند تفعيلها. تُحفظ آخر PROFILING_WINDOW عينة لكل مقطع
+# (نافذة متدحرجة) ويُحسب منها المدرج التكراري والنسب المئوية عند العرض أو التفريغ.
+
+# حدود فئات المدرج التكراري بالمللي ثانية (الفئة الأخيرة: أكبر من آخر حد)
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+PROFILE_DUMP_PATH = "logs/profile_dump.json"
+
+
+class SpanStats:
+    """
+    عينات مقطع واحد: نافذة متدحرجة من (الجدار, المعالج, الذروة) مع عدّادات تراكمية.
+
+    التسجيل بلا قفل: الإلحاق بـ deque و next() على itertools.count عمليتان ذريتان في
+    CPython، فلا تضيع عينة ولا زيادة بين الخيوط.
+    """
+
+    __slots__ = ("samples", "count", "errors", "_counter", "_error_counter")
+
+    def __init__(self, window):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.errors = 0
+        self._counter = itertools.count(1)
+        self._error_counter = itertools.count(1)
+
+    def add(self, sample, error):
+        self.samples.append(sample)
+        # قيمة العدّاد نفسها لا تضيع، وقد يتأخر تحديث الحقل المعروض لحظيًا بين خيطين
+        self.count = next(self._counter)
+        if error:
+            self.errors = next(self._error_counter)
+
+
+def _percentiles(values, scale):
+    values = np.asarray(values, dtype=float) * scale
+    return {
+        "p50": float(np.percentile(values, 50)),
+        "p90": float(np.percentile(values, 90)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(values.max()),
+    }
+
+
+class Profiler:
+    """
+    سجل أزمنة المقاطع المشترك بين كل جلسات العملية.
+
+    ذروة الذاكرة تعتمد على tracemalloc وهو عام للعملية: الجلسات المتزامنة تتداخل في
+    القياس، والتتبع نفسه يبطئ الحجز، لذلك هو معطّل افتراضيًا (PROFILE_MEMORY).
+    """
+
+    def __init__(self, enabled=True, trace_memory=False, window=1000):
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.window = window
+        self._spans = {}
+        self._lock = threading.Lock()
+        # مكدس المقاطع المتداخلة لكل خيط: [الذاكرة عند البدء, أعلى ذروة داخلية]
+        self._local = threading.local()
+
+    def _memory_start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        stack = self._local.__dict__.setdefault("stack", [])
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            # إعادة ضبط الذروة تمحو ذروة المقطع الخارجي حتى الآن، فتُحفظ قبلها
+            stack[-1][1] = max(stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        stack.append([current, 0])
+
+    def _memory_end(self):
+        stack = self._local.stack
+        _, peak = tracemalloc.get_traced_memory()
+        base, nested_peak = stack.pop()
+        peak = max(peak, nested_peak)
+        if stack:
+            stack[-1][1] = max(stack[-1][1], peak)
+        return max(0, peak - base)
+
+    def record(self, name, wall, cpu, peak=None, error=False):
+        """تسجيل عينة لمقطع (الأزمنة بالثواني والذروة بالبايت)"""
+        stats = self._spans.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self._spans.setdefault(name, SpanStats(self.window))
+        stats.add((wall, cpu, peak), error)
+
+    def _start(self):
+        """بداية مقطع: (الجدار, المعالج, تتبع الذاكرة)"""
+        trace_memory = self.trace_memory
+        if trace_memory:
+            self._memory_start()
+        return time.perf_counter(), time.thread_time(), trace_memory
+
+    def _finish(self, name, started, error):
+        wall, cpu, trace_memory = started
+        wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+        self.record(name, wall, cpu, self._memory_end() if trace_memory else None, error)
+
+    @contextmanager
+    def span(self, name):
+        """قياس كتلة كود باسم name"""
+        if not self.enabled:
+            yield
+            return
+        started, error = self._start(), False
+        try:
+            yield
+        except Exception:
+            error = True
+            raise
+        finally:
+            self._finish(name, started, error)
+
+    def instrument(self, prefix):
+        """مُزخرف يقيس كل استدعاء للدالة باسم "prefix:اسم_الدالة" """
+        def decorate(function):
+            name = f"{prefix}:{function.__name__}"
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                if self.trace_memory:
+                    with self.span(name):
+                        return function(*args, **kwargs)
+                # المسار السريع دون contextmanager: الحاسبات تُستدعى كثيرًا وكلفتها بالميكروثانية
+                error = False
+                wall, cpu = perf_counter(), thread_time()
+                try:
+                    return function(*args, **kwargs)
+                except Exception:
+                    error = True
+                    raise
+                finally:
+                    self.record(name, perf_counter() - wall, thread_time() - cpu, None, error)
+            return wrapper
+        return decorate
+
+    def snapshot(self):
+        """
+        ملخص كل المقاطع: العدّادات التراكمية، ونسب النافذة الحالية (مللي ثانية للأزمنة
+        وكيلوبايت للذروة)، والمدرج التكراري لزمن الجدار في النافذة.
+        """
+        with self._lock:
+            spans = dict(self._spans)
+        summary = {}
+        for name, stats in sorted(spans.items()):
+            samples = list(stats.samples)
+            if not samples:
+                continue
+            walls = [sample[0] for sample in samples]
+            peaks = [sample[2] for sample in samples if sample[2] is not None]
+            counts = np.bincount(np.searchsorted(HISTOGRAM_BUCKETS_MS, np.asarray(walls) * 1000),
+                                 minlength=len(HISTOGRAM_BUCKETS_MS) + 1)
+            summary[name] = {
+                "count": stats.count,
+                "errors": stats.errors,
+                "window": len(samples),
+                "wall_ms": _percentiles(walls, 1000),
+                "cpu_ms": _percentiles([sample[1] for sample in samples], 1000),
+                "peak_kb": _percentiles(peaks, 1 / 1024) if peaks else None,
+                "histogram_ms": {
+                    **{f"<={bound}": int(n) for bound, n in zip(HISTOGRAM_BUCKETS_MS, counts)},
+                    f">{HISTOGRAM_BUCKETS_MS[-1]}": int(counts[-1]),
+                },
+            }
+        return summary
+
+    def dump(self, path=PROFILE_DUMP_PATH):
+        """حفظ الملخص الحالي في ملف JSON وإرجاع مساره"""
+        report = {"generated_at": datetime.now().isoformat(timespec="seconds"), "spans": self.snapshot()}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return path
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+
+
+def _create_profiler(config_path=CONFIG_PATH):
+    settings = load_performance_settings(config_path)
+    return Profiler(
+        enabled=settings["PROFILING_ENABLED"],
+        trace_memory=settings["PROFILE_MEMORY"],
+        window=settings["PROFILING_WINDOW"],
+    )
+
+
+profiler = _create_profiler()
+profile_span = profiler.span
+instrumented = profiler.instrument
@@ -0,0 +1,109 @@
+import threading
+from collections.abc import Mapping
+
+import pandas as pd
+
+from helpers.dtype_optimizer import optimize_sheet, track_sheet
+from helpers.xlsx_stream import iter_records
+
+
+class LazyWorkbook(Mapping):
+    """
+    قاموس أوراق كسول لملف Excel.
+
+    لا تُحلَّل الورقة إلا عند أول وصول إليها، ثم تبقى في الذاكرة. إذا مُرِّرت
+    نسخة مُجمّعة (WorkbookCache) تُقرأ الورقة منها أولًا وتُضاف إليها بعد التحليل.
+    """
+
+    def __init__(self, workbook_path, cache=None, preload=None, optimize_dtypes=False):
+        self.workbook_path = workbook_path
+        self.cache = cache
+        # ضغط أنواع الأعمدة لكل ورقة بعد تحليلها (انظر helpers.dtype_optimizer)؛ النسخة
+        # المُجمّعة عندها هي نسخة الأوراق المضغوطة فلا يُعاد الضغط عند القراءة منها
+        self.optimize_dtypes = optimize_dtypes
+        self._sheets = {}
+        self._lock = threading.Lock()
+        self._names = self._read_sheet_names()
+
+        # تحميل مسبق لقائمة الأوراق المسموح بها فقط
+        for sheet in preload or []:
+            if sheet in self._names:
+                self[sheet]
+
+    def _read_sheet_names(self):
+        """أسماء الأوراق من النسخة المُجمّعة إن وُجدت، وإلا من ملف Excel"""
+        if self.cache is not None:
+            names = self.cache.sheet_names()
+            if names is not None:
+                return names
+        with pd.ExcelFile(self.workbook_path) as xls:
+            names = xls.sheet_names
+        if self.cache is not None:
+            try:
+                self.cache.write_sheet_names(names)
+            except OSError as e:
+                print(f"⚠️ تعذر حفظ أسماء الأوراق في النسخة المُجمّعة: {e}")
+        return names
+
+    def _load_sheet(self, sheet):
+        """تحليل ورقة واحدة فقط من النسخة المُجمّعة أو من ملف Excel"""
+        if self.cache is not None:
+            df = self.cache.read_sheet(sheet)
+            if df is not None:
+                if self.optimize_dtypes:
+                    track_sheet(df, self.workbook_path, sheet)
+                return df
+        df = pd.read_excel(self.workbook_path, sheet_name=sheet)
+        if self.optimize_dtypes:
+            df = optimize_sheet(df, self.workbook_path, sheet)
+        if self.cache is not None:
+            try:
+                self.cache.write_sheet(sheet, df)
+            except OSError as e:
+                print(f"⚠️ تعذر حفظ الورقة {sheet} في النسخة المُجمّعة: {e}")
+        return df
+
+    def __getitem__(self, sheet):
+        if sheet in self._sheets:
+            return self._sheets[sheet]
+        if sheet not in self._names:
+            raise KeyError(sheet)
+        with self._lock:
+            if sheet not in self._sheets:
+                self._sheets[sheet] = self._load_sheet(sheet)
+        return self._sheets[sheet]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, sheet):
+        return sheet in self._names
+
+    def iter_records(self, sheet):
+        """
+        صفوف الورقة كقواميس دون إبقائها في الذاكرة.
+
+        تُستخدم الورقة المحمّلة إن وُجدت، وإلا النسخة المُجمّعة مؤقتًا، وإلا تُقرأ
+        تدفقيًا من ملف Excel صفًا صفًا.
+        """
+        if sheet not in self._names:
+            raise KeyError(sheet)
+        df = self._sheets.get(sheet)
+        if df is None and self.cache is not None:
+            df = self.cache.read_sheet(sheet)
+        if df is not None:
+            for record in df.to_dict("records"):
+                yield record
+            return
+        yield from iter_records(self.workbook_path, sheet)
+
+    def is_loaded(self, sheet):
+        """هل حُلِّلت الورقة وأصبحت في الذاكرة؟"""
+        return sheet in self._sheets
+
+    def loaded_sheets(self):
+        """أسماء الأوراق المحمّلة حاليًا في الذاكرة"""
+        return list(self._sheets)
@@ -0,0 +1,319 @@
+import bisect
+import datetime
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Mapping
+
+import pandas as pd
+
+from helpers.data_loader import CONFIG_PATH, load_config_section, load_performance_settings
+from helpers.workbook_store import open_shared_workbook
+
+# ==========================
+# 📐 محرك القواعد القانونية (النسب والحدود والمدد)
+# ==========================
+# كل نسبة أو حد أو مدة تستخدمها الحاسبات قاعدة لها مفتاح وتاريخ سريان. تُجمَّع القواعد
+# مرة واحدة في جدول ثابت (RuleSet) من القيم الافتراضية أدناه مع ما يرد في أوراق
+# الحاسبات في ملف العمل، فيصبح تعديل القانون إعادة تحميل للبيانات لا إعادة نشر للكود.
+# الجدول مبني من المخزن المشترك لملف العمل، فيُعاد بناؤه تلقائيًا عند تغيّر الملف.
+#
+# ملف العمل الحالي لا يحوي قواعد بهذا الشكل (أوراق الحاسبات فيه تصف الحقول ولا تحمل
+# قيمًا)، فالقيم السارية هي DEFAULT_RULES و RULE_HISTORY حتى تُضاف ورقة Legal_Rules:
+#
+#   Rule_Key        مفتاح من DEFAULT_RULES (مثل MIN_WAGE)            إلزامي
+#   Rule_Value      قيمة رقمية                                      إلزامي
+#   Effective_From  تاريخ السريان (YYYY-MM-DD)؛ فارغ = منذ البداية     اختياري
+#   Legal_Reference المرجع القانوني (للتوثيق فقط)                    اختياري
+#
+# عدة صفوف لنفس المفتاح بتواريخ مختلفة تكوّن تاريخ القاعدة، والصف بنفس المفتاح والتاريخ
+# يحل محل القيمة الافتراضية. الصفوف بمفتاح غير معروف أو قيمة غير رقمية تُتجاهل.
+
+RULES_SHEET = "Legal_Rules"
+# أوراق الحاسبات القائمة تُقرأ أيضًا إذا أُضيفت إليها أعمدة المفتاح والقيمة
+RULE_SHEETS = (RULES_SHEET, "Legal_Calculators", "Calculation_Inputs", "Smart_Compliance_Calculators")
+# أعمدة مفتاح القاعدة وقيمتها وتاريخ سريانها في أوراق الحاسبات (أول عمود موجود يُستخدم)
+KEY_COLUMNS = ("Rule_Key", "Field_Name")
+VALUE_COLUMNS = ("Rule_Value", "Value")
+DATE_COLUMNS = ("Effective_From", "Effective_Date")
+
+# القواعد السارية منذ صدور قانون العمل رقم 8 لسنة 1996 ما لم يُذكر تاريخ سريان آخر
+BASE_EFFECTIVE_DATE = datetime.date.min
+
+# المفتاح -> (القيمة, المرجع القانوني)
+DEFAULT_RULES = {
+    "MONTH_DAYS": (30, "أيام الشهر لحساب الأجر اليومي"),
+    "WORK_DAY_HOURS": (8, "ساعات يوم العمل لحساب أجر الساعة"),
+    "MIN_WAGE": (290, "قرار الحد الأدنى للأجور 2025"),
+    # مكافأة نهاية الخدمة - المادة 33
+    "EOS_RESIGNATION_MIN_MONTHS": (36, "المادة 33"),
+    "EOS_RESIGNATION_FULL_MONTHS": (60, "المادة 33"),
+    "EOS_RESIGNATION_PARTIAL_RATE": (0.5, "المادة 33"),
+    "EOS_RESIGNATION_FULL_RATE": (1.0, "المادة 33"),
+    "EOS_EMPLOYER_MIN_MONTHS": (12, "المادة 33"),
+    "EOS_EMPLOYER_RATE": (2, "المادة 33"),
+    # العمل الإضافي - المادة 54
+    "OVERTIME_RATE_REGULAR": (1.25, "المادة 54/1"),
+    "OVERTIME_RATE_HOLIDAY": (1.5, "المادة 54/2"),
+    "OVERTIME_RATE_NIGHT": (1.35, "حسب الأنظمة"),
+    # الإجازات - المواد 57 و68 و70 و71
+    "ANNUAL_LEAVE_DAYS": (14, "المادة 57/أ"),
+    "ANNUAL_LEAVE_DAYS_SENIOR": (21, "المادة 57/أ"),
+    "ANNUAL_LEAVE_SENIOR_YEARS": (5, "المادة 57/أ"),
+    "SICK_FULL_PAY_DAYS": (14, "المادة 68"),
+    "SICK_HALF_PAY_DAYS": (14, "المادة 68"),
+    "SICK_HALF_PAY_RATE": (0.5, "المادة 68"),
+    "SICK_HOSPITAL_FULL_PAY_DAYS": (28, "المادة 68"),
+    "MATERNITY_LEAVE_DAYS": (70, "المادة 70"),
+    "PATERNITY_LEAVE_DAYS": (3, "المادة 71"),
+    "HAJ_LEAVE_DAYS": (14, "المادة 71"),
+    "HAJ_MIN_SERVICE_YEARS": (5, "المادة 71"),
+    # إصابات العمل - المادة 87
+    "INJURY_BASE_DAYS": (1500, "المادة 87/أ"),
+    "INJURY_MIN_COMPENSATION": (2000, "المادة 87/أ"),
+    "INJURY_MAX_COMPENSATION": (5000, "المادة 87/أ"),
+    "TEMPORARY_DISABILITY_RATE": (0.75, "المادة 87/ب"),
+    # الضمان الاجتماعي (النسب بالمئة)
+    "SS_EMPLOYEE_RATE": (7.5, "قانون الضمان الاجتماعي"),
+    "SS_EMPLOYER_RATE": (14.5, "قانون الضمان الاجتماعي"),
+    "SS_SALARY_CEILING": (5000, "قانون الضمان الاجتماعي"),
+    "SS_LATE_PENALTY_RATE": (0.02, "قانون الضمان الاجتماعي"),
+    # الفصل التعسفي وتأخر الرواتب
+    "UNFAIR_MAX_MONTHS": (6, "المادة 30 وقرارات المحاكم"),
+    "UNFAIR_PARTIAL_NOTICE_RATE": (0.5, "المادة 30 وقرارات المحاكم"),
+    "UNFAIR_MULTIPLIER_ARBITRARY": (2.0, "قرارات المحاكم"),
+    "UNFAIR_MULTIPLIER_ECONOMIC": (1.8, "قرارات المحاكم"),
+    "UNFAIR_MULTIPLIER_DISCIPLINARY": (1.5, "قرارات المحاكم"),
+    "UNFAIR_MULTIPLIER_DISCRIMINATION": (2.5, "قرارات المحاكم"),
+    "SALARY_DELAY_DAILY_RATE": (0.00022, "المادة 55 وقانون المعاملات المدنية"),
+}
+
+# قيم سابقة لقواعد تغيّرت: المفتاح -> [(تاريخ السريان, القيمة)]
+RULE_HISTORY = {
+    "MIN_WAGE": [(BASE_EFFECTIVE_DATE, 260), (datetime.date(2025, 1, 1), 290)],
+}
+
+# سبب الفصل التعسفي -> مفتاح مضاعف التعويض
+UNFAIR_DISMISSAL_REASONS = {
+    "تعسفي بدون سبب مبرر": "UNFAIR_MULTIPLIER_ARBITRARY",
+    "لأسباب اقتصادية غير حقيقية": "UNFAIR_MULTIPLIER_ECONOMIC",
+    "لأسباب تأديبية غير مثبتة": "UNFAIR_MULTIPLIER_DISCIPLINARY",
+    "تمييز على أساس الجنس أو الدين": "UNFAIR_MULTIPLIER_DISCRIMINATION",
+}
+
+# عدد اللقطات المحفوظة لتواريخ مختلفة قبل تفريغها
+MAX_SNAPSHOTS = 64
+# أقصى مدة بالثواني قبل التحقق مجددًا من تغيّر ملف العمل (القواعد في المسار الساخن لكل حساب)
+RULES_RECHECK_SECONDS = 1.0
+
+
+def _as_date(value):
+    """تحويل قيمة إلى تاريخ (None = اليوم)، أو None إذا تعذر التحويل"""
+    if value is None:
+        return datetime.date.today()
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    parsed = pd.to_datetime(value, errors="coerce")
+    return None if pd.isna(parsed) else parsed.date()
+
+
+def _fingerprint(payload):
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()[:12]
+
+
+class RuleSnapshot(Mapping):
+    """القواعد السارية بتاريخ محدد كقاموس للقراءة فقط، مع بصمة لقيمها (version)"""
+
+    __slots__ = ("_rules", "effective_on", "version")
+
+    def __init__(self, rules, effective_on):
+        self._rules = dict(rules)
+        self.effective_on = effective_on
+        # تاريخان بنفس القيم يشتركان في البصمة نفسها
+        self.version = _fingerprint(sorted(self._rules.items()))
+
+    def __getitem__(self, key):
+        return self._rules[key]
+
+    def __iter__(self):
+        return iter(self._rules)
+
+    def __len__(self):
+        return len(self._rules)
+
+
+class RuleSet:
+    """
+    جدول قواعد ثابت ومُجمَّع مسبقًا: لكل مفتاح قائمة تواريخ سريان مرتبة مع قيمها.
+
+    القيمة السارية بتاريخ ما تُحدَّد بالبحث الثنائي، وقاموس كل القيم السارية بتاريخ
+    ما (RuleSnapshot) يُحسب مرة واحدة لكل تاريخ ويُعاد للقراءة فقط.
+    """
+
+    def __init__(self, entries, source="defaults"):
+        grouped = {}
+        for key, effective_from, value in entries:
+            # عند تكرار التاريخ نفسه تغلب القيمة الأخيرة (ملف العمل بعد الافتراضيات)
+            grouped.setdefault(key, {})[effective_from] = value
+        self._dates = {key: tuple(sorted(versions)) for key, versions in grouped.items()}
+        self._values = {
+            key: tuple(grouped[key][date] for date in dates) for key, dates in self._dates.items()
+        }
+        self.source = source
+        # بصمة المحتوى: تتغير فقط إذا تغيرت قيمة أو تاريخ سريان
+        self.version = _fingerprint({
+            key: [[str(date), value] for date, value in zip(dates, self._values[key])]
+            for key, dates in sorted(self._dates.items())
+        })
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self._dates
+
+    def keys(self):
+        return self._dates.keys()
+
+    def value(self, key, on=None):
+        """قيمة القاعدة السارية بتاريخ on (الافتراضي: اليوم)"""
+        on = _as_date(on)
+        index = bisect.bisect_right(self._dates[key], on) - 1
+        if index < 0:
+            raise KeyError(f"لا توجد قاعدة سارية للمفتاح {key} بتاريخ {on}")
+        return self._values[key][index]
+
+    def history(self, key):
+        """كل إصدارات القاعدة كأزواج (تاريخ السريان, القيمة)"""
+        return tuple(zip(self._dates[key], self._values[key]))
+
+    def snapshot(self, on=None):
+        """كل القواعد السارية بتاريخ on كقاموس للقراءة فقط"""
+        on = _as_date(on)
+        snapshot = self._snapshots.get(on)
+        if snapshot is None:
+            snapshot = RuleSnapshot({
+                key: self._values[key][bisect.bisect_right(dates, on) - 1]
+                for key, dates in self._dates.items()
+                if dates[0] <= on
+            }, on)
+            with self._lock:
+                if len(self._snapshots) >= MAX_SNAPSHOTS:
+                    self._snapshots.clear()
+                self._snapshots[on] = snapshot
+        return snapshot
+
+
+def default_rule_entries():
+    """القواعد الافتراضية كإدخالات (المفتاح, تاريخ السريان, القيمة)"""
+    for key, (value, _) in DEFAULT_RULES.items():
+        for effective_from, historic_value in RULE_HISTORY.get(key, [(BASE_EFFECTIVE_DATE, value)]):
+            yield key, effective_from, historic_value
+
+
+def _first_column(df, candidates):
+    return next((column for column in candidates if column in df.columns), None)
+
+
+def workbook_rule_entries(workbook):
+    """
+    قواعد أوراق الحاسبات في ملف العمل كإدخالات (المفتاح, تاريخ السريان, القيمة).
+
+    يُقرأ كل صف مفتاحه من مفاتيح DEFAULT_RULES وقيمته رقمية؛ الصفوف الأخرى (حقول
+    الإدخال الوصفية مثل LastMonthlyWage) تُتجاهل. بلا عمود تاريخ تسري القيمة من البداية.
+    """
+    for sheet in RULE_SHEETS:
+        if sheet not in workbook:
+            continue
+        df = workbook[sheet]
+        key_column = _first_column(df, KEY_COLUMNS)
+        value_column = _first_column(df, VALUE_COLUMNS)
+        if key_column is None or value_column is None:
+            continue
+        date_column = _first_column(df, DATE_COLUMNS)
+        for row in df.to_dict("records"):
+            key = str(row[key_column]).strip()
+            value = pd.to_numeric(row[value_column], errors="coerce")
+            if key not in DEFAULT_RULES or pd.isna(value):
+                continue
+            effective_from = BASE_EFFECTIVE_DATE
+            if date_column is not None and not pd.isna(row[date_column]):
+                effective_from = _as_date(row[date_column])
+                if effective_from is None:
+                    print(f"⚠️ تاريخ سريان غير صالح للقاعدة {key} في {sheet}: {row[date_column]}")
+                    continue
+            yield key, effective_from, float(value)
+
+
+def build_rule_set(workbook=None):
+    """
+    تجميع جدول القواعد من القيم الافتراضية ثم قواعد ملف العمل (إن وُجد).
+
+    source هو "workbook" فقط إذا قرئت قاعدة واحدة على الأقل من ملف العمل.
+    """
+    entries = list(default_rule_entries())
+    source = "defaults"
+    if workbook is not None:
+        try:
+            overrides = list(workbook_rule_entries(workbook))
+        except (KeyError, ValueError, OSError) as e:
+            print(f"⚠️ تعذر قراءة قواعد الحاسبات من ملف العمل، سيتم استخدام القيم الافتراضية: {e}")
+        else:
+            if overrides:
+                entries.extend(overrides)
+                source = "workbook"
+    return RuleSet(entries, source)
+
+
+DEFAULT_RULE_SET = build_rule_set()
+
+_workbook = None
+_workbook_opened = False
+_workbook_lock = threading.Lock()
+# (وقت آخر تحقق, الجدول) — يُستبدل كزوج واحد فتقرؤه الخيوط دون قفل
+_active = (float("-inf"), None)
+
+
+def _rules_workbook(config_path=CONFIG_PATH):
+    """
+    مرجع دائم على ملف العمل في المخزن المشترك (يُفتح مرة واحدة لكل عملية).
+
+    يُفتح كسولًا بعملية واحدة ولا تُحلَّل إلا أوراق القواعد: أول حساب على ذاكرة باردة لا
+    يشغّل مجمع عمليات لتحليل كل الأوراق (PARSE_WORKERS) من أجل بضعة صفوف.
+    """
+    global _workbook, _workbook_opened
+    if _workbook_opened:
+        return _workbook
+    with _workbook_lock:
+        if not _workbook_opened:
+            sources = load_config_section("DATA_SOURCES", {"WORKBOOK_PATH": ""}, config_path)
+            performance = load_performance_settings(config_path)
+            _workbook = open_shared_workbook(
+                sources["WORKBOOK_PATH"],
+                lazy=True,
+                preload=RULE_SHEETS,
+                workers=1,
+                optimize_dtypes=performance["OPTIMIZE_DTYPES"],
+            )
+            _workbook_opened = True
+    return _workbook
+
+
+def active_rule_set(config_path=CONFIG_PATH):
+    """جدول القواعد الحالي (يُعاد بناؤه تلقائيًا عند تغيّر ملف العمل)"""
+    global _active
+    checked_at, rule_set = _active
+    now = time.monotonic()
+    if rule_set is not None and now - checked_at < RULES_RECHECK_SECONDS:
+        return rule_set
+    workbook = _rules_workbook(config_path)
+    rule_set = DEFAULT_RULE_SET if workbook is None else workbook.derived("legal_rules", build_rule_set)
+    _active = (now, rule_set)
+    return rule_set
+
+
+def current_rules(on=None):
+    """القواعد السارية بتاريخ on (الافتراضي: اليوم) كقاموس للقراءة فقط"""
+    return active_rule_set().snapshot(on)
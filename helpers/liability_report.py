@@ -0,0 +1,157 @@
+import pandas as pd
+
+from helpers.batch_calculators import (
+    calculate_accrued_leave_compensation_batch,
+    calculate_end_of_service_batch,
+)
+from helpers.xlsx_stream import iter_row_batches
+
+# ==========================
+# 📑 تقرير التزامات نهاية الخدمة لأصحاب العمل
+# ==========================
+# يُقرأ كشف الموظفين على دفعات (chunks)، وتُحسب المستحقات لكل دفعة بالحاسبات المتجهة،
+# وتُكتب الصفوف مباشرة إلى ملف الناتج مع تجميع الإجماليات فقط في الذاكرة، فيبقى
+# استهلاك الذاكرة ثابتًا مهما بلغ عدد الموظفين.
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+# أسماء الأعمدة المقبولة في الكشف لكل حقل
+ROSTER_COLUMNS = {
+    "employee_id": ("employee_id", "رقم الموظف"),
+    "salary": ("salary", "last_salary", "basic_salary", "الراتب"),
+    "years": ("years", "service_years", "سنوات الخدمة"),
+    "months": ("months", "service_months", "أشهر الخدمة"),
+    "termination_type": ("termination_type", "نوع إنهاء الخدمة"),
+    "accrued_leave": ("accrued_leave", "أيام الإجازة المستحقة"),
+}
+
+# تسمية الموظفين بلا نوع إنهاء في الملخص، حتى يساوي مجموع الأنواع إجمالي التقرير
+UNKNOWN_TERMINATION_TYPE = "غير محدد"
+
+REPORT_COLUMNS = [
+    "employee_id", "salary", "years", "months", "termination_type",
+    "accrued_leave", "end_of_service", "leave_compensation", "total_liability",
+]
+
+
+def iter_roster_chunks(source, filename, chunksize=DEFAULT_CHUNK_SIZE):
+    """قراءة كشف CSV أو XLSX على دفعات من DataFrame دون تحميله كاملًا"""
+    if filename.lower().endswith(".csv"):
+        yield from pd.read_csv(source, chunksize=chunksize, encoding="utf-8-sig")
+        return
+
+    yield from iter_row_batches(source, batch_size=chunksize)
+
+
+def normalize_roster(chunk, scenario=None, first_row=0):
+    """توحيد أعمدة الدفعة إلى أسماء معاملات الحاسبات وتحويل القيم الرقمية"""
+    rename = {}
+    for field, aliases in ROSTER_COLUMNS.items():
+        for alias in aliases:
+            if alias in chunk.columns:
+                rename[alias] = field
+                break
+    chunk = chunk.rename(columns=rename)
+
+    missing = [field for field in ("salary", "years") if field not in chunk.columns]
+    if not scenario and "termination_type" not in chunk.columns:
+        missing.append("termination_type")
+    if missing:
+        raise ValueError(f"أعمدة مفقودة في كشف الموظفين: {', '.join(missing)}")
+
+    def numeric(field):
+        if field not in chunk.columns:
+            return pd.Series(0.0, index=chunk.index)
+        # float دائمًا: وإلا اختلف تنسيق الأعمدة في ملف التقرير بين دفعة فيها قيم ناقصة وأخرى بدونها
+        return pd.to_numeric(chunk[field], errors="coerce").astype(float)
+
+    salary = numeric("salary")
+    roster = pd.DataFrame({
+        "employee_id": chunk["employee_id"] if "employee_id" in chunk.columns
+        else pd.RangeIndex(first_row + 1, first_row + len(chunk) + 1),
+        "salary": salary,
+        "years": numeric("years"),
+        "months": numeric("months").fillna(0),
+        "termination_type": scenario or chunk["termination_type"],
+        "accrued_leave": numeric("accrued_leave").fillna(0),
+    }, index=chunk.index)
+    # أسماء الأعمدة التي تتوقعها الحاسبات المتجهة
+    roster["basic_salary"] = salary
+    roster["last_salary"] = salary
+    return roster
+
+
+def compute_liability(roster):
+    """مستحقات نهاية الخدمة وبدل الإجازات لكل موظف في الدفعة"""
+    report = roster[REPORT_COLUMNS[:6]].copy()
+    report["end_of_service"] = calculate_end_of_service_batch(roster)["amount"]
+    report["leave_compensation"] = calculate_accrued_leave_compensation_batch(roster)["amount"]
+    report["total_liability"] = report["end_of_service"] + report["leave_compensation"]
+    return report
+
+
+def build_liability_report(source, filename, output, scenario=None, chunksize=DEFAULT_CHUNK_SIZE):
+    """
+    بناء تقرير الالتزامات من كشف الموظفين.
+
+    Args:
+        source: مسار الكشف أو كائن ملف (CSV / XLSX)
+        filename (str): اسم الملف لتحديد الصيغة
+        output: كائن ملف نصي مفتوح للكتابة تُضاف إليه صفوف التقرير (CSV) تدريجيًا
+        scenario (str): نوع إنهاء الخدمة المفترض لكل الموظفين بدل عمود الكشف
+        chunksize (int): عدد الصفوف في كل دفعة
+
+    Returns:
+        dict: الإجماليات وعدد الصفوف غير الصالحة والتوزيع حسب نوع الإنهاء
+    """
+    summary = {
+        "employees": 0,
+        "invalid_rows": 0,
+        "end_of_service": 0.0,
+        "leave_compensation": 0.0,
+        "total_liability": 0.0,
+        "by_termination_type": {},
+    }
+    rows_seen = 0
+    header = True
+
+    for chunk in iter_roster_chunks(source, filename, chunksize):
+        roster = normalize_roster(chunk, scenario, first_row=rows_seen)
+        rows_seen += len(chunk)
+
+        valid = roster["salary"].notna() & roster["years"].notna()
+        summary["invalid_rows"] += int((~valid).sum())
+        report = compute_liability(roster[valid])
+        if report.empty:
+            continue
+
+        # الدينار الأردني مقسم إلى 1000 فلس
+        report.to_csv(output, header=header, index=False, float_format="%.3f")
+        header = False
+
+        summary["employees"] += len(report)
+        for column in ("end_of_service", "leave_compensation", "total_liability"):
+            summary[column] += float(report[column].sum())
+        termination_types = report["termination_type"].fillna(UNKNOWN_TERMINATION_TYPE)
+        grouped = report["total_liability"].groupby(termination_types).agg(["count", "sum"])
+        for termination_type, row in grouped.iterrows():
+            bucket = summary["by_termination_type"].setdefault(
+                termination_type, {"employees": 0, "total_liability": 0.0}
+            )
+            bucket["employees"] += int(row["count"])
+            bucket["total_liability"] += float(row["sum"])
+
+    if header:
+        # كشف فارغ أو كل صفوفه غير صالحة: ملف بترويسة الأعمدة فقط
+        pd.DataFrame(columns=REPORT_COLUMNS).to_csv(output, index=False)
+    return summary
+
+
+def summary_frame(summary):
+    """جدول ملخص التقرير حسب نوع إنهاء الخدمة (للعرض والتنزيل)"""
+    rows = [
+        {"نوع إنهاء الخدمة": termination_type, "عدد الموظفين": bucket["employees"], "إجمالي الالتزام": bucket["total_liability"]}
+        for termination_type, bucket in summary["by_termination_type"].items()
+    ]
+    rows.append({"نوع إنهاء الخدمة": "الإجمالي", "عدد الموظفين": summary["employees"], "إجمالي الالتزام": summary["total_liability"]})
+    return pd.DataFrame(rows)
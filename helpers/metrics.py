@@ -0,0 +1,459 @@
+import bisect
+import logging
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ==========================
+# 📈 مقاييس Prometheus على مستوى العملية
+# ==========================
+# سجل واحد لكل عملية فيه عدّادات (counter) ومقاييس لحظية (gauge) ومدرجات تكرارية
+# (histogram) تُبلغ عنها المكونات المساعدة، ويعرضها خادم HTTP محلي صغير بصيغة Prometheus
+# النصية. التحديث على المسار الساخن بلا قفل: لكل خيط خلية خاصة لا يكتب فيها غيره، وتُجمع
+# الخلايا عند القراءة فقط.
+
+DEFAULT_METRICS = {
+    "ENABLED": False,
+    "HOST": "127.0.0.1",
+    "PORT": 9108,
+}
+# كل نسخة (replica) على نفس الجهاز تحتاج منفذًا خاصًا بها: متغير البيئة يحل محل PORT
+PORT_ENV = "METRICS_PORT"
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "alywork_"
+
+# حدود المدرجات الزمنية بالثواني
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value):
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs += [f'{name}="{_escape(value)}"' for name, value in extra]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _ThreadCells:
+    """
+    خلية قيم لكل خيط (بمعرّف الخيط).
+
+    يكتب كل خيط في خليته فقط، وإضافة مفتاح جديد للقاموس ذرية في CPython، فلا حاجة لقفل
+    عند التحديث. معرّفات الخيوط يُعاد استخدامها، فيبقى عدد الخلايا بعدد الخيوط المتزامنة تقريبًا.
+    """
+
+    __slots__ = ("_cells", "_size")
+
+    def __init__(self, size):
+        self._cells = {}
+        self._size = size
+
+    def cell(self):
+        ident = threading.get_ident()
+        cell = self._cells.get(ident)
+        if cell is None:
+            cell = self._cells[ident] = [0.0] * self._size
+        return cell
+
+    def totals(self):
+        totals = [0.0] * self._size
+        for cell in list(self._cells.values()):
+            for i, value in enumerate(cell):
+                totals[i] += value
+        return totals
+
+
+class CounterChild:
+    __slots__ = ("_cells",)
+
+    def __init__(self):
+        self._cells = _ThreadCells(1)
+
+    def inc(self, amount=1):
+        self._cells.cell()[0] += amount
+
+    def value(self):
+        return self._cells.totals()[0]
+
+
+class GaugeChild:
+    """قيمة لحظية: set() إسناد ذري، و inc()/dec() بقفل لأنهما ليسا على المسار الساخن"""
+
+    __slots__ = ("_value", "_lock", "_function")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+        self._function = None
+
+    def set(self, value):
+        self._value = value
+
+    def inc(self, amount=1):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount=1):
+        self.inc(-amount)
+
+    def set_function(self, function):
+        """قراءة القيمة من function() عند كل عرض بدل تحديثها"""
+        self._function = function
+
+    def value(self):
+        if self._function is not None:
+            return self._function()
+        return self._value
+
+
+class _HistogramTimer:
+    __slots__ = ("_child", "_start")
+
+    def __init__(self, child):
+        self._child = child
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._child.observe(time.perf_counter() - self._start)
+        return False
+
+
+class HistogramChild:
+    __slots__ = ("_bounds", "_cells")
+
+    def __init__(self, bounds):
+        self._bounds = bounds
+        # عدد لكل فئة (مع فئة +Inf) ثم المجموع ثم العدد الكلي
+        self._cells = _ThreadCells(len(bounds) + 3)
+
+    def observe(self, value):
+        cell = self._cells.cell()
+        cell[bisect.bisect_left(self._bounds, value)] += 1
+        cell[-2] += value
+        cell[-1] += 1
+
+    def time(self):
+        """قياس زمن كتلة with وتسجيله بالثواني"""
+        return _HistogramTimer(self)
+
+    def value(self):
+        """(الأعداد التراكمية لكل حد، المجموع، العدد)"""
+        totals = self._cells.totals()
+        cumulative, running = [], 0
+        for count in totals[:-2]:
+            running += count
+            cumulative.append(running)
+        return cumulative, totals[-2], totals[-1]
+
+
+class Metric:
+    """مقياس مُسمّى بتسميات اختيارية؛ بدون تسميات يعمل المقياس نفسه كابن وحيد"""
+
+    kind = None
+    # المقاييس المحسوبة عند العرض (CallbackMetric) لا أبناء لها
+    has_children = True
+
+    def __init__(self, name, documentation, labelnames=(), **options):
+        self.name = METRIC_PREFIX + name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._options = options
+        self._children = {}
+        self._lock = threading.Lock()
+        if self.has_children and not self.labelnames:
+            self._default = self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values, **labels):
+        """الابن الخاص بقيم التسميات (يُنشأ مرة واحدة ويُعاد استخدامه)"""
+        if labels:
+            values = tuple(labels[name] for name in self.labelnames)
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: متوقع التسميات {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def samples(self):
+        """(اللاحقة, قيم التسميات, تسميات إضافية, القيمة) لكل عينة"""
+        for key, child in list(self._children.items()):
+            yield "", key, (), child.value()
+
+    def exposition(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, key, extra, value in self.samples():
+            lines.append(f"{self.name}{suffix}{_format_labels(self.labelnames, key, extra)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        if not name.endswith("_total"):
+            name += "_total"
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return CounterChild()
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return GaugeChild()
+
+    def set(self, value):
+        self._default.set(value)
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+    def dec(self, amount=1):
+        self._default.dec(amount)
+
+    def set_function(self, function):
+        self._default.set_function(function)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames, buckets=tuple(sorted(buckets)))
+
+    def _new_child(self):
+        return HistogramChild(self._options["buckets"])
+
+    def observe(self, value):
+        self._default.observe(value)
+
+    def time(self):
+        return self._default.time()
+
+    def samples(self):
+        bounds = self._options["buckets"]
+        for key, child in list(self._children.items()):
+            cumulative, total, count = child.value()
+            for bound, value in zip(bounds + (math.inf,), cumulative):
+                yield "_bucket", key, (("le", _format_value(bound)),), value
+            yield "_sum", key, (), total
+            yield "_count", key, (), count
+
+
+class CallbackMetric(Metric):
+    """
+    مقياس تُقرأ قيمه من دالة عند كل عرض (مثل عدّادات TTLCache الموجودة أصلًا)، فلا كلفة
+    له على المسار الساخن. function تُرجع قاموس: قيم التسميات (tuple) -> القيمة.
+    """
+
+    has_children = False
+
+    def __init__(self, name, documentation, kind, function, labelnames=()):
+        self.kind = kind
+        self._function = function
+        super().__init__(name, documentation, labelnames)
+
+    def samples(self):
+        try:
+            values = self._function()
+        except Exception as e:
+            print(f"⚠️ تعذر قراءة المقياس {self.name}: {e}")
+            return
+        for key, value in values.items():
+            yield "", tuple(str(part) for part in key), (), value
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        """تسجيل مقياس مرة واحدة؛ إعادة التسجيل بنفس الاسم تُرجع المقياس الموجود"""
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(self, name, documentation, kind, function, labelnames=()):
+        return self.register(CallbackMetric(name, documentation, kind, function, labelnames))
+
+    def exposition(self):
+        """كل المقاييس بصيغة Prometheus النصية"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.exposition())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# مقاييس يُبلغ عنها أكثر من مكون (يميّز بينها label)
+WORKBOOK_LOAD_SECONDS = registry.histogram(
+    "workbook_load_seconds", "Time to open the shared workbook (includes parsing on a cold store)", ["component"])
+SEARCH_SECONDS = registry.histogram("search_seconds", "Search latency", ["source"])
+
+
+# ==========================
+# 🧠 الذاكرات المؤقتة (TTLCache)
+# ==========================
+# عدّادات TTLCache موجودة أصلًا، فتُقرأ عند العرض فقط دون أي كلفة على المسار الساخن.
+
+_caches = {}
+
+
+def register_cache(name, cache):
+    """عرض عدّادات ذاكرة TTLCache باسم name"""
+    _caches[name] = cache
+
+
+def _cache_stats(field):
+    return lambda: {(name,): cache.stats()[field] for name, cache in list(_caches.items())}
+
+
+registry.callback("cache_hits_total", "Cache lookups that found a valid entry", "counter", _cache_stats("hits"), ["cache"])
+registry.callback("cache_misses_total", "Cache lookups that missed", "counter", _cache_stats("misses"), ["cache"])
+registry.callback("cache_evictions_total", "Entries evicted by the LRU size limit", "counter", _cache_stats("evictions"), ["cache"])
+registry.callback("cache_expirations_total", "Entries dropped after their TTL", "counter", _cache_stats("expirations"), ["cache"])
+registry.callback("cache_entries", "Entries currently cached", "gauge", _cache_stats("size"), ["cache"])
+
+
+# ==========================
+# 👥 الجلسات النشطة
+# ==========================
+
+_sessions = set()
+_sessions_lock = threading.Lock()
+
+
+def track_current_session():
+    """تسجيل جلسة Streamlit الحالية ليُحسب عدد الجلسات النشطة عند العرض"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is not None and ctx.session_id not in _sessions:
+        with _sessions_lock:
+            _sessions.add(ctx.session_id)
+
+
+def _active_sessions():
+    from streamlit import runtime
+
+    if not runtime.exists():
+        return {(): len(_sessions)}
+    instance = runtime.get_instance()
+    with _sessions_lock:
+        _sessions.intersection_update({session for session in _sessions if instance.is_active_session(session)})
+        return {(): len(_sessions)}
+
+
+registry.callback("active_sessions", "Active Streamlit sessions in this process", "gauge", _active_sessions)
+
+
+# ==========================
+# 🌐 خادم العرض المحلي
+# ==========================
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.registry.exposition().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # طلبات الجمع الدورية لا تُكتب في سجل الخادم
+        pass
+
+
+def serve_metrics(host="127.0.0.1", port=DEFAULT_METRICS["PORT"], metrics_registry=registry):
+    """تشغيل خادم /metrics في خيط خلفي وإرجاعه (port=0 يختار منفذًا متاحًا)"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    server.registry = metrics_registry
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
+
+
+_server = None
+_server_started = False
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(config_path=None):
+    """
+    تشغيل خادم المقاييس المشترك للعملية إذا كان مفعّلًا في قسم METRICS، وإرجاعه.
+
+    المنفذ من متغير البيئة METRICS_PORT إن وُجد (منفذ مختلف لكل نسخة على نفس الجهاز)،
+    وإلا من PORT في الإعدادات.
+    """
+    global _server, _server_started
+    if _server_started:
+        return _server
+    # استيراد متأخر: data_loader نفسه يُبلغ عن مقاييسه في هذا السجل
+    from helpers.data_loader import CONFIG_PATH, load_config_section
+
+    with _server_lock:
+        if not _server_started:
+            _server_started = True
+            settings = load_config_section("METRICS", DEFAULT_METRICS, config_path or CONFIG_PATH)
+            if settings["ENABLED"]:
+                port = settings["PORT"]
+                if os.environ.get(PORT_ENV):
+                    try:
+                        port = int(os.environ[PORT_ENV])
+                    except ValueError:
+                        logger.error("قيمة غير صالحة في %s: %r", PORT_ENV, os.environ[PORT_ENV])
+                        return None
+                try:
+                    _server = serve_metrics(settings["HOST"], port)
+                except OSError:
+                    # نسخة أخرى على نفس الجهاز تستخدم المنفذ: تعمل هذه النسخة دون خادم مقاييس
+                    logger.exception(
+                        "تعذر تشغيل خادم المقاييس على %s:%s (حدد %s مختلفًا لكل نسخة)",
+                        settings["HOST"], port, PORT_ENV,
+                    )
+    return _server
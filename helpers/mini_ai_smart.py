@@ -1,38 +1,132 @@
 import pandas as pd
 
+from helpers.lazy_workbook import LazyWorkbook
+from helpers.metrics import SEARCH_SECONDS, WORKBOOK_LOAD_SECONDS, registry
+from helpers.search_index import BM25Index
+from helpers.workbook_cache import DEFAULT_CACHE_DIR
+from helpers.workbook_store import SyncedWorkbook, open_shared_workbook
+
+# الأوراق النصية المفهرسة للبحث: أعمدة النص (الأول هو النص المعروض) + عمود المثال + عمود المرجع
+SEARCH_SHEETS = {
+    "Legal_References_JO": {"text": ["ar_text_en", "notes"], "example": "notes", "reference": "article"},
+    "Employee_Rights": {"text": ["title", "eligibility_criteria", "claim_process", "notes"], "example": "claim_process", "reference": "legal_basis"},
+    "Employer_Obligations": {"text": ["description", "title", "compliance_checklist"], "example": "compliance_checklist", "reference": "article_ref"},
+    "Judicial_Precedents_JO": {"text": ["summary_ar", "case_type", "court", "outcome", "summary_en_summary_en", "tags"], "example": "outcome", "reference": "legal_article"},
+    "Know_Your_Rights": {"text": ["Right_Description_AR", "Right_Title_AR", "Right_Title_EN", "Right_Type", "Right_Description_EN"], "example": "Example_Case", "reference": "Legal_Basis"},
+    "Knowledge_Bank": {"text": ["Full_Text_AR", "Title_AR", "Title_EN", "Full_Text_EN"], "example": "Notes", "reference": "Article_Number"},
+    "Legal_Research_Center": {"text": ["Full_Text_AR", "Title_AR", "Title_EN", "Full_Text_EN", "Precedents_Summary"], "example": "Precedents_Summary", "reference": "Article_Number"},
+    "Legal_Compliance_Core": {"text": ["legal_text", "summary_short", "rule_category"], "example": "note", "reference": "article_ref"},
+    "Termination_Rules": {"text": ["severance_formula", "type", "notice_period"], "example": "examples", "reference": "legal_basis"},
+    "Penalties_and_Sanctions": {"text": ["violation_category", "penalty_amount_or_range", "notes"], "example": "penalty_amount_or_range", "reference": "legal_ref"},
+    "Legal_Complaints_Guide": {"text": ["Complaint_Type", "Required_Documents", "Filing_Authority", "Filing_Process_Steps", "Possible_Outcomes"], "example": "Filing_Process_Steps", "reference": "Applicable_Law_Articles"},
+    "Violation_Reference_Table": {"text": ["Violation_Type", "Penalty_Type", "Corrective_Action", "AI_Explanation"], "example": "Corrective_Action", "reference": "Legal_Reference"},
+    "Required_Documents_JO": {"text": ["ar_required_documents_en", "complaint_type"], "example": "complaint_type", "reference": "legal_reference"},
+}
+
+SEARCH_INDEX_BUILD_SECONDS = registry.histogram("search_index_build_seconds", "Time to build the BM25 search index")
+
+_load_seconds = WORKBOOK_LOAD_SECONDS.labels("mini_legal_ai")
+_search_seconds = SEARCH_SECONDS.labels("legal_ai")
+
+
+def _sheet_records(data, sheet):
+    """صفوف ورقة كقواميس؛ في الوضع الكسول لا تُحمَّل الورقة كاملة في الذاكرة للفهرسة"""
+    if isinstance(data, (LazyWorkbook, SyncedWorkbook)):
+        return data.iter_records(sheet)
+    return iter(data[sheet].to_dict("records"))
+
+
+def _cell_text(value):
+    """تحويل قيمة خلية إلى نص مع تجاهل القيم الفارغة"""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ""
+    return str(value).strip()
+
 class MiniLegalAI:
-    def __init__(self, workbook_path):
+    def __init__(self, workbook_path, cache_dir=DEFAULT_CACHE_DIR, lazy=True, preload=None, workers=1,
+                 optimize_dtypes=True):
         self.workbook_path = workbook_path
-        self.data = self.load_workbook()
+        # cache_dir=None يعطّل النسخة المُجمّعة ويقرأ Excel مباشرة
+        self.cache_dir = cache_dir
+        # lazy=True: تُحلَّل كل ورقة عند أول وصول إليها، و preload قائمة أوراق تُحمَّل مسبقًا
+        self.lazy = lazy
+        self.preload = preload
+        # عدد العمليات لتحليل الأوراق بالتوازي عند غياب النسخة المُجمّعة (0 = عدد الأنوية)
+        self.workers = workers
+        # ضغط أنواع الأعمدة بعد التحميل لتقليل الذاكرة المقيمة لكل عملية
+        self.optimize_dtypes = optimize_dtypes
+        # الأوراق وفهرس البحث مشتركان بين كل الجلسات عبر مخزن العملية
+        self.workbook = self.load_workbook()
 
     def load_workbook(self):
-        """تحميل ملف Excel بأمان دون تركه مفتوحًا"""
-        if not self.workbook_path or not os.path.exists(self.workbook_path):
-            return None
-        
-        with pd.ExcelFile(self.workbook_path) as xls:
-            # افترض أن لدينا عدة sheets نحتاجها
-            sheets = xls.sheet_names
-            data_dict = {}
-            for sheet in sheets:
-                data_dict[sheet] = pd.read_excel(xls, sheet_name=sheet)
-            return data_dict
+        """فتح ملف Excel من المخزن المشترك (نسخة واحدة للقراءة فقط لكل العملية)"""
+        with _load_seconds.time():
+            return open_shared_workbook(
+                self.workbook_path, self.cache_dir, self.lazy, self.preload,
+                workers=self.workers, optimize_dtypes=self.optimize_dtypes,
+            )
+
+    @property
+    def data(self):
+        """قاموس الأوراق الحالي، ويُعاد تحميله تلقائيًا إذا تغيّر الملف"""
+        return self.workbook.data if self.workbook is not None else None
+
+    @property
+    def index(self):
+        """فهرس BM25 المشترك لإصدار الملف الحالي"""
+        if self.workbook is None:
+            return BM25Index()
+        return self.workbook.derived("search_index", self.build_search_index)
+
+    def build_search_index(self, data=None):
+        """بناء فهرس BM25 مرة واحدة من الأوراق النصية"""
+        with SEARCH_INDEX_BUILD_SECONDS.time():
+            return self._build_search_index(data)
+
+    def _build_search_index(self, data):
+        index = BM25Index()
+        data = self.data if data is None else data
+        if not data:
+            return index
+        for sheet, columns in SEARCH_SHEETS.items():
+            if sheet not in data:
+                continue
+            text_columns = None
+            for row in _sheet_records(data, sheet):
+                if text_columns is None:
+                    text_columns = [col for col in columns["text"] if col in row]
+                if not text_columns:
+                    break
+                texts = [_cell_text(row.get(col)) for col in text_columns]
+                if not any(texts):
+                    continue
+                document = {
+                    "text": next(text for text in texts if text),
+                    "example": _cell_text(row.get(columns["example"])),
+                    "reference": _cell_text(row.get(columns["reference"])),
+                }
+                index.add(document, " ".join(texts + [document["reference"]]))
+        return index
 
     def advanced_search(self, query, top_n=3):
-        """محاكاة البحث الذكي"""
-        # هنا يمكن استخدام self.data بدل فتح الملف كل مرة
-        # مجرد مثال: إرجاع نتائج dummy
+        """البحث الذكي المرتب عبر الفهرس المقلوب (BM25)"""
         results = []
-        if self.data:
-            for i in range(min(top_n, 3)):
-                results.append({
-                    "text": f"نص قانوني تجريبي {i+1} لبحث '{query}'",
-                    "example": f"مثال {i+1}",
-                    "reference": f"المادة {i+1}",
-                    "score": 95 - i*5
-                })
+        with _search_seconds.time():
+            ranked = self.index.search(query, top_n=top_n)
+        if not ranked:
+            return results
+        # تحويل الدرجة إلى نسبة مئوية من أفضل نتيجة
+        best_score = ranked[0][1]
+        for document, score in ranked:
+            results.append({**document, "score": round(100 * score / best_score)})
         return results
 
     def reload(self):
-        """إعادة تحميل البيانات إذا تم تحديث الملف"""
-        self.data = self.load_workbook()
\ No newline at end of file
+        """إعادة تحميل البيانات وفهرس البحث قسرًا (التغييرات على الملف تُلتقط تلقائيًا)"""
+        if self.workbook is not None:
+            self.workbook.reload()
+
+    def close(self):
+        """تحرير مرجع الجلسة على ملف العمل المشترك"""
+        if self.workbook is not None:
+            self.workbook.close()
\ No newline at end of file
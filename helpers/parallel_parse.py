@@ -0,0 +1,81 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from helpers.dtype_optimizer import optimize_frame
+from helpers.workbook_cache import WorkbookCache
+
+# ==========================
+# ⚡ التحليل المتوازي لأوراق ملف العمل
+# ==========================
+# عند غياب النسخة المُجمّعة (أول تشغيل بعد كل إصدار للملف) تُوزَّع الأوراق على عمليات
+# منفصلة: تفتح كل عملية الملف مرة واحدة وتحلل مجموعتها (وتضغط أنواعها عند الطلب)، ثم تحفظها
+# مباشرة في النسخة المُجمّعة فلا تُنقل الجداول بين العمليات إلا عند تعطيل النسخة المُجمّعة.
+
+
+def resolve_workers(workers, sheet_count):
+    """عدد العمليات الفعلي: 0 أو None يعني عدد الأنوية، ولا يتجاوز عدد الأوراق"""
+    if not workers or workers < 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, sheet_count))
+
+
+def _parse_sheets(workbook_path, sheets, cache_dir, optimize_dtypes=False):
+    """عامل: تحليل مجموعة أوراق وحفظها في النسخة المُجمّعة، أو إرجاعها إن لم توجد"""
+    frames = pd.read_excel(workbook_path, sheet_name=list(sheets))
+    if optimize_dtypes:
+        frames = {sheet: optimize_frame(df) for sheet, df in frames.items()}
+    if not cache_dir:
+        return frames
+    cache = WorkbookCache(workbook_path, cache_dir, optimized=optimize_dtypes)
+    for sheet, df in frames.items():
+        cache.write_sheet(sheet, df)
+    return {}
+
+
+def parse_workbook_parallel(workbook_path, workers=None, cache=None, optimize_dtypes=False):
+    """
+    تحليل كل أوراق الملف على عدة عمليات.
+
+    Args:
+        workbook_path (str): مسار ملف Excel
+        workers (int): عدد العمليات (0 أو None = عدد الأنوية)
+        cache (WorkbookCache): النسخة المُجمّعة التي تكتب فيها العمليات، أو None
+        optimize_dtypes (bool): ضغط أنواع الأعمدة داخل العمليات قبل الحفظ
+
+    Returns:
+        dict | None: قاموس الأوراق عند غياب النسخة المُجمّعة، وإلا None بعد حفظها
+        (ويُعاد None أيضًا عند الفشل أو عند توفر نواة واحدة ليكمل المستدعي بالتحليل المتسلسل)
+    """
+    with pd.ExcelFile(workbook_path) as xls:
+        names = xls.sheet_names
+    workers = resolve_workers(workers, len(names))
+    if workers == 1:
+        # عملية واحدة لا تفيد: يكمل المستدعي بالتحليل المتسلسل دون كلفة إنشاء العمليات
+        return None
+    # توزيع دوري حتى تتقارب أحجام المجموعات
+    groups = [names[i::workers] for i in range(workers)]
+    cache_dir = None
+    if cache is not None:
+        cache.write_sheet_names(names)
+        cache_dir = cache.cache_dir
+
+    # spawn بدل fork: خادم Streamlit متعدد الخيوط، ونسخ عملية فيها خيوط غير آمن
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [
+                pool.submit(_parse_sheets, workbook_path, group, cache_dir, optimize_dtypes) for group in groups
+            ]
+            frames = {}
+            for future in futures:
+                frames.update(future.result())
+    except Exception as e:
+        print(f"⚠️ تعذر التحليل المتوازي لملف العمل، سيتم التحليل المتسلسل: {e}")
+        return None
+
+    if cache is not None:
+        return None
+    return {sheet: frames[sheet] for sheet in names}
@@ -0,0 +1,112 @@
+import math
+
+import pandas as pd
+
+from helpers.batch_calculators import (
+    calculate_end_of_service_batch,
+    calculate_unfair_dismissal_compensation_batch,
+    calculate_work_injury_compensation_batch,
+)
+from helpers.calculation_cache import memoize_calculation
+from helpers.legal_rules import current_rules
+
+# ==========================
+# 🔀 مقارنة السيناريوهات (شبكة ماذا-لو)
+# ==========================
+# تُبنى كل تركيبات قيم المحاور (الضرب الديكارتي) كجدول واحد، وتُحسب كلها بتمريرة متجهة
+# واحدة عبر الحاسبات الدفعية، ثم تُعرض كجدول محوري (صفوف × أعمدة) أو خريطة حرارية.
+# نتيجة كل شبكة مخزنة في ذاكرة الحسابات المشتركة (helpers.calculation_cache) بمفتاح المحاور
+# والمدخلات الثابتة وبصمة القواعد، فلا يُعاد الحساب عند إعادة تشغيل الصفحة بنفس المدخلات.
+
+# أقصى عدد خلايا للشبكة الواحدة (حماية الذاكرة من مدخلات كبيرة بالخطأ)
+MAX_GRID_CELLS = 1_000_000
+
+SWEEP_CALCULATORS = {
+    "end_of_service": {
+        "label": "💰 مكافأة نهاية الخدمة",
+        "function": calculate_end_of_service_batch,
+        "value": "amount",
+    },
+    "unfair_dismissal": {
+        "label": "⚖️ تعويض الفصل التعسفي",
+        "function": calculate_unfair_dismissal_compensation_batch,
+        "value": "amount",
+    },
+    "work_injury": {
+        "label": "🏥 تعويض إصابة العمل",
+        "function": calculate_work_injury_compensation_batch,
+        "value": "total_amount",
+    },
+}
+
+# أسماء المحاور كما تُعرض للمستخدم
+AXIS_LABELS = {
+    "last_salary": "الراتب (دينار)",
+    "basic_salary": "الراتب (دينار)",
+    "years": "سنوات الخدمة",
+    "months": "أشهر إضافية",
+    "service_years": "سنوات الخدمة",
+    "termination_type": "نوع الإنهاء",
+    "actual_notice": "الإشعار",
+    "dismissal_reason": "سبب الفصل",
+    "injury_type": "نوع الإصابة",
+    "disability_percentage": "نسبة العجز (%)",
+    "treatment_days": "أيام العلاج",
+    "medical_expenses": "المصاريف الطبية",
+}
+
+
+def grid_size(axes):
+    """عدد خلايا الشبكة لقيم المحاور المعطاة"""
+    return math.prod(len(values) for values in axes.values())
+
+
+def scenario_grid(axes):
+    """
+    كل تركيبات قيم المحاور كـ DataFrame (عمود لكل محور، صف لكل سيناريو).
+
+    Args:
+        axes (dict): اسم المحور -> قائمة قيمه، بالترتيب المطلوب في العرض
+    """
+    size = grid_size(axes)
+    if size > MAX_GRID_CELLS:
+        raise ValueError(f"الشبكة كبيرة جدًا: {size:,} سيناريو (الحد الأقصى {MAX_GRID_CELLS:,})")
+    index = pd.MultiIndex.from_product([list(values) for values in axes.values()], names=list(axes))
+    return index.to_frame(index=False)
+
+
+@memoize_calculation
+def run_sweep(calculator, axes, fixed=None, rules=None):
+    """
+    حساب كل سيناريوهات الشبكة بتمريرة واحدة.
+
+    Args:
+        calculator (str): مفتاح من SWEEP_CALCULATORS
+        axes (dict): المحاور المتغيرة وقيمها
+        fixed (dict): مدخلات ثابتة لكل السيناريوهات
+        rules: القواعد السارية (الافتراضي: اليوم)، نفسها لكل الشبكة
+
+    Returns:
+        DataFrame: أعمدة المحاور ثم نواتج الحاسبة
+    """
+    spec = SWEEP_CALCULATORS[calculator]
+    grid = scenario_grid(axes)
+    for column, value in (fixed or {}).items():
+        grid[column] = value
+    result = spec["function"](grid, rules=rules or current_rules())
+    # نواتج الحاسبة قد تكرر اسم محور (مثل medical_expenses) فيبقى عمود المحور وحده
+    sweep = pd.concat([grid[list(axes)], result.drop(columns=list(axes), errors="ignore")], axis=1)
+    sweep.attrs["axes"] = list(axes)
+    return sweep
+
+
+def sweep_pivot(sweep, rows, value, columns=None):
+    """
+    جدول محوري للنتائج: محور rows في الصفوف وباقي المحاور في الأعمدة.
+
+    المحاور غير المذكورة في rows أو columns تُجمَّع بالمتوسط.
+    """
+    columns = [column for column in columns or sweep.attrs.get("axes", []) if column != rows]
+    if not columns:
+        return sweep.groupby(rows, sort=False)[[value]].mean()
+    return sweep.pivot_table(index=rows, columns=columns, values=value, aggfunc="mean", sort=False)
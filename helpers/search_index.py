@@ -0,0 +1,62 @@
+import heapq
+import math
+from collections import defaultdict
+
+from helpers.arabic_text import tokenize
+
+
+class BM25Index:
+    """
+    فهرس مقلوب مع ترتيب BM25.
+
+    تُقسَّم كل وثيقة مرة واحدة عند الإضافة وتُخزَّن قوائم الورود (term -> [(doc_id, tf)])،
+    فيقتصر البحث على الوثائق التي تحتوي كلمات الاستعلام بدل المرور على كل الصفوف.
+    """
+
+    def __init__(self, k1=1.5, b=0.75, tokenizer=tokenize):
+        self.k1 = k1
+        self.b = b
+        self.tokenizer = tokenizer
+        self.postings = defaultdict(list)
+        self.doc_lengths = []
+        self.documents = []
+        self._total_length = 0
+
+    def add(self, document, text):
+        """إضافة وثيقة (أي كائن) مع النص المراد فهرسته، وإرجاع رقمها"""
+        doc_id = len(self.documents)
+        tokens = self.tokenizer(text)
+        frequencies = defaultdict(int)
+        for token in tokens:
+            frequencies[token] += 1
+        for token, tf in frequencies.items():
+            self.postings[token].append((doc_id, tf))
+        self.documents.append(document)
+        self.doc_lengths.append(len(tokens))
+        self._total_length += len(tokens)
+        return doc_id
+
+    def __len__(self):
+        return len(self.documents)
+
+    def _idf(self, token):
+        n = len(self.documents)
+        df = len(self.postings.get(token, ()))
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, query, top_n=5):
+        """إرجاع أفضل الوثائق كقائمة (document, score) مرتبة تنازليًا"""
+        if not self.documents:
+            return []
+        avg_length = self._total_length / len(self.documents) or 1
+        scores = defaultdict(float)
+        for token in set(self.tokenizer(query)):
+            postings = self.postings.get(token)
+            if not postings:
+                continue
+            idf = self._idf(token)
+            for doc_id, tf in postings:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+        ranked = heapq.nlargest(top_n, scores.items(), key=lambda item: item[1])
+        return [(self.documents[doc_id], score) for doc_id, score in ranked]
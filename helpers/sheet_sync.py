@@ -0,0 +1,241 @@
+import hashlib
+import http.client
+import io
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+
+import pandas as pd
+
+from helpers.data_loader import CONFIG_PATH, load_config_section
+from helpers.workbook_cache import _atomic_write
+from helpers.workbook_store import shared_store
+
+# ==========================
+# 🔄 المزامنة الخلفية لمصدر Google Sheets
+# ==========================
+# يجلب خيط خلفي تصدير CSV لكل ورقة كل SYNC_INTERVAL_MINUTES بطلبات مشروطة
+# (If-None-Match / If-Modified-Since)، ويقارن بصمة المحتوى بالنسخة المحفوظة، ثم يستبدل
+# الأوراق المتغيرة فقط دفعة واحدة. يُربط العامل بملف العمل في المخزن المشترك فتحل الأوراق
+# المجلوبة محل أوراقه بنفس الاسم لكل الجلسات، وطلبات المستخدمين لا تنتظر الشبكة أبدًا.
+# المزامنة معطلة افتراضيًا، ولا تُستبدل أي ورقة إلا عبر ربط صريح في SYNC_SHEETS.
+
+DEFAULT_SYNC_DIR = ".cache/sheet_sync"
+STATE_FILE = "state.json"
+
+DEFAULT_DATA_SOURCES = {
+    "WORKBOOK_PATH": "",
+    "SHEET_URL": "",
+    "AUTO_SYNC": False,
+    "SYNC_INTERVAL_MINUTES": 60,
+    # {اسم الورقة في ملف العمل: gid}؛ الأوراق غير المذكورة هنا لا تُستبدل أبدًا
+    "SYNC_SHEETS": {},
+}
+
+
+def sheet_sources(sheet_url, sheets):
+    """رابط تصدير لكل ورقة مربوطة صراحةً بـ gid"""
+    separator = "&" if "?" in sheet_url else "?"
+    return {name: f"{sheet_url}{separator}gid={gid}" for name, gid in sheets.items()}
+
+
+def _write_bytes(path, body):
+    with open(path, "wb") as f:
+        f.write(body)
+
+
+class SheetSyncWorker:
+    """
+    عامل مزامنة خلفي لأوراق CSV المنشورة.
+
+    Args:
+        sources (dict): اسم الورقة -> رابط تصدير CSV (قابل للاستبدال بخادم محلي في الاختبار)
+        cache_dir (str): مجلد النسخة المحفوظة والحالة (ETag / Last-Modified / البصمة)
+        interval_seconds (float): الفاصل بين دورات المزامنة
+        timeout (float): مهلة كل طلب شبكة
+    """
+
+    def __init__(self, sources, cache_dir=DEFAULT_SYNC_DIR, interval_seconds=3600, timeout=30):
+        self.sources = dict(sources)
+        self.cache_dir = cache_dir
+        self.interval_seconds = interval_seconds
+        self.timeout = timeout
+        self.version = 0
+        self.last_error = None
+        self._state = self._load_state()
+        # لقطة غير قابلة للتعديل تُستبدل كاملة عند كل تغيير، فيرى القارئ نسخة متسقة دائمًا
+        self._frames = self._load_cached_frames()
+        self._stop = threading.Event()
+        self._thread = None
+        self._sync_lock = threading.Lock()
+
+    # ------------------------------
+    # 💾 النسخة المحفوظة على القرص
+    # ------------------------------
+    def _csv_path(self, name):
+        return os.path.join(self.cache_dir, f"{hashlib.sha1(name.encode('utf-8')).hexdigest()[:12]}.csv")
+
+    def _load_state(self):
+        try:
+            with open(os.path.join(self.cache_dir, STATE_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_state(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        def write(tmp_path):
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._state, f, ensure_ascii=False, indent=2)
+
+        _atomic_write(os.path.join(self.cache_dir, STATE_FILE), write)
+
+    def _load_cached_frames(self):
+        frames = {}
+        for name in self.sources:
+            path = self._csv_path(name)
+            if name in self._state and os.path.exists(path):
+                try:
+                    frames[name] = pd.read_csv(path, encoding="utf-8-sig")
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ تعذر قراءة النسخة المحفوظة من الورقة {name}: {e}")
+                    self._state.pop(name, None)
+        return frames
+
+    # ------------------------------
+    # 🌐 الجلب المشروط
+    # ------------------------------
+    def _fetch(self, name, url):
+        """طلب مشروط: يعيد (المحتوى, الترويسات) أو None إذا لم يتغير (304)"""
+        request = urllib.request.Request(url)
+        state = self._state.get(name, {})
+        if state.get("etag"):
+            request.add_header("If-None-Match", state["etag"])
+        if state.get("last_modified"):
+            request.add_header("If-Modified-Since", state["last_modified"])
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.read(), response.headers
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            raise
+
+    def sync_once(self):
+        """دورة مزامنة واحدة، وإرجاع أسماء الأوراق التي تغيّرت"""
+        with self._sync_lock:
+            changed = {}
+            for name, url in self.sources.items():
+                try:
+                    fetched = self._fetch(name, url)
+                except http.client.IncompleteRead as e:
+                    # انقطع الاتصال قبل اكتمال المحتوى: لا يُحلَّل جزء من الورقة
+                    self.last_error = f"{name}: {e!r}"
+                    print(f"⚠️ استجابة ناقصة للورقة {name} ({len(e.partial)} بايت)، سيتم الإبقاء على النسخة الحالية")
+                    continue
+                except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+                    self.last_error = f"{name}: {e}"
+                    print(f"⚠️ تعذر مزامنة الورقة {name}، سيتم الإبقاء على النسخة الحالية: {e}")
+                    continue
+                if fetched is None:
+                    continue
+
+                body, headers = fetched
+                digest = hashlib.sha256(body).hexdigest()
+                state = self._state.setdefault(name, {})
+                state["etag"] = headers.get("ETag")
+                state["last_modified"] = headers.get("Last-Modified")
+                if state.get("sha256") == digest and name in self._frames:
+                    continue
+                try:
+                    df = pd.read_csv(io.BytesIO(body), encoding="utf-8-sig")
+                except (ValueError, UnicodeDecodeError) as e:
+                    self.last_error = f"{name}: {e}"
+                    print(f"⚠️ محتوى غير صالح للورقة {name}: {e}")
+                    continue
+
+                os.makedirs(self.cache_dir, exist_ok=True)
+                _atomic_write(self._csv_path(name), lambda tmp: _write_bytes(tmp, body))
+                state["sha256"] = digest
+                changed[name] = df
+
+            if changed:
+                self._frames = {**self._frames, **changed}
+                self.version += 1
+            if self._state:
+                self._save_state()
+            return list(changed)
+
+    # ------------------------------
+    # 📖 القراءة (لا تنتظر الشبكة أبدًا)
+    # ------------------------------
+    def get(self, name):
+        """آخر نسخة متاحة من الورقة، أو None إذا لم تُجلب بعد"""
+        return self._frames.get(name)
+
+    def frames(self):
+        """لقطة متسقة من كل الأوراق المتاحة"""
+        return self._frames
+
+    def frames_for(self, sheet_names):
+        """الأوراق المتاحة التي تحمل اسم ورقة موجودة في ملف العمل"""
+        return {name: df for name, df in self._frames.items() if name in sheet_names}
+
+    # ------------------------------
+    # 🧵 الخيط الخلفي
+    # ------------------------------
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.sync_once()
+            except Exception as e:
+                # لا يجوز أن يتوقف العامل بسبب خطأ غير متوقع في دورة واحدة
+                self.last_error = str(e)
+                print(f"⚠️ خطأ غير متوقع في مزامنة الأوراق: {e}")
+            self._stop.wait(self.interval_seconds)
+
+    def start(self):
+        """تشغيل العامل في الخلفية (مرة واحدة)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="sheet-sync", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def start_auto_sync(config_path=CONFIG_PATH):
+    """
+    تشغيل عامل المزامنة المشترك للعملية إذا كان AUTO_SYNC مفعّلًا وSYNC_SHEETS يربط أوراقًا
+    محددة، وربطه بملف العمل WORKBOOK_PATH في المخزن المشترك، وإرجاعه.
+    """
+    global _worker
+    if _worker is not None:
+        return _worker
+    settings = load_config_section("DATA_SOURCES", DEFAULT_DATA_SOURCES, config_path)
+    # بلا ملف عمل يُربط به لن يقرأ أحد الأوراق المجلوبة، فلا داعي لتشغيل العامل
+    if not settings["AUTO_SYNC"] or not settings["SHEET_URL"] or not settings["WORKBOOK_PATH"]:
+        return None
+    if not settings["SYNC_SHEETS"]:
+        print("⚠️ AUTO_SYNC مفعّل بدون SYNC_SHEETS (اسم الورقة -> gid)، لن تتم مزامنة أي ورقة")
+        return None
+    with _worker_lock:
+        if _worker is None:
+            worker = SheetSyncWorker(
+                sheet_sources(settings["SHEET_URL"], settings["SYNC_SHEETS"]),
+                interval_seconds=settings["SYNC_INTERVAL_MINUTES"] * 60,
+            )
+            shared_store.attach_source(settings["WORKBOOK_PATH"], worker)
+            _worker = worker.start()
+        return _worker
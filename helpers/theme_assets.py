@@ -0,0 +1,94 @@
+import functools
+import hashlib
+import os
+import re
+import threading
+
+import streamlit as st
+
+from helpers.data_loader import CONFIG_PATH, load_config_section
+
+# ==========================
+# 🎨 خط أنابيب ملفات التصميم (CSS)
+# ==========================
+# تُقرأ ملفات التصميم المحددة في UI_SETTINGS وتُصغَّر مرة واحدة لكل محتوى (حسب بصمة
+# SHA-256)، ثم تُحقن كعنصر <style> واحد مصغَّر.
+#
+# الإرسال مرة واحدة لكل جلسة غير ممكن: يحذف Streamlit من الصفحة في نهاية كل تشغيل كل عنصر
+# لم يُعَد إرساله فيه، فلو حُجب العنصر بعد أول تشغيل لاختفى التصميم عند أول تفاعل. لذلك
+# يُرسل في كل تشغيل، والوفر هو التصغير والتخزين فقط: الوضع المظلم 5.6 KB بدل 8.2 KB للملف
+# و9.7 KB للنص المضمّن السابق في app.py، والفاتح 7.5 KB بدل 11.2 KB.
+
+DEFAULT_UI_SETTINGS = {
+    "STYLES_LIGHT": "assets/styles_official.css",
+    "STYLES_DARK": "assets/styles_dark.css",
+}
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+# النصوص بين علامات التنصيص تبقى كما هي أثناء التصغير
+_STRING_RE = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')")
+_SPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_RE = re.compile(r"\s*([{};,>])\s*")
+
+_minified = {}
+_file_hashes = {}
+_lock = threading.Lock()
+
+
+def minify_css(css):
+    """تصغير CSS: حذف التعليقات والمسافات الزائدة وآخر فاصلة منقوطة في كل كتلة"""
+    css = _COMMENT_RE.sub("", css)
+    parts = _STRING_RE.split(css)
+    for i in range(0, len(parts), 2):
+        part = _SPACE_RE.sub(" ", parts[i])
+        part = _PUNCTUATION_RE.sub(r"\1", part)
+        # المسافة قبل ":" قد تكون جزءًا من المحدد (مثل ".a :hover") فتُحذف بعدها فقط
+        part = re.sub(r":\s+", ":", part)
+        parts[i] = part.replace(";}", "}")
+    return "".join(parts).strip()
+
+
+def _file_digest(path):
+    """بصمة محتوى الملف، تُعاد قراءتها فقط عند تغيّر وقت التعديل أو الحجم"""
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_hashes.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1], None
+    with open(path, "rb") as f:
+        content = f.read()
+    digest = hashlib.sha256(content).hexdigest()
+    _file_hashes[path] = (signature, digest)
+    return digest, content
+
+
+def load_css(paths):
+    """CSS مصغَّر ومدمج لعدة ملفات، مخزن حسب بصمة محتوى كل ملف"""
+    chunks = []
+    with _lock:
+        for path in paths:
+            if not path or not os.path.exists(path):
+                continue
+            digest, content = _file_digest(path)
+            if digest not in _minified:
+                if content is None:
+                    with open(path, "rb") as f:
+                        content = f.read()
+                _minified[digest] = minify_css(content.decode("utf-8"))
+            chunks.append(_minified[digest])
+    return "".join(chunks)
+
+
+@functools.lru_cache(maxsize=None)
+def theme_css_paths(theme="dark", config_path=CONFIG_PATH):
+    """ملفات التصميم للوضع المطلوب حسب UI_SETTINGS (تُقرأ الإعدادات مرة واحدة لكل عملية)"""
+    settings = load_config_section("UI_SETTINGS", DEFAULT_UI_SETTINGS, config_path)
+    key = "STYLES_DARK" if theme == "dark" else "STYLES_LIGHT"
+    return (settings[key],)
+
+
+def inject_theme_css(theme="dark"):
+    """حقن CSS الوضع المطلوب كعنصر <style> مصغَّر"""
+    css = load_css(theme_css_paths(theme))
+    if css:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
@@ -0,0 +1,90 @@
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    ذاكرة مؤقتة محدودة الحجم مع مدة صلاحية (TTL) وإخلاء الأقدم استخدامًا (LRU).
+
+    آمنة للاستخدام من عدة خيوط، وتحتفظ بعدّادات الإصابة والإخفاق والإخلاء لضبطها
+    في بيئة التشغيل.
+    """
+
+    def __init__(self, maxsize=32, ttl=600, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        """القيمة المخزنة إن كانت صالحة، مع نقلها إلى آخر القائمة (الأحدث استخدامًا)"""
+        with self._lock:
+            item = self._items.get(key, _MISSING)
+            if item is not _MISSING:
+                expires_at, value = item
+                if self.ttl is None or expires_at > self.timer():
+                    self._items.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._items[key]
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        """تخزين قيمة وإخلاء الأقدم استخدامًا عند تجاوز الحد الأقصى"""
+        expires_at = self.timer() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key, load):
+        """القيمة المخزنة أو نتيجة load() بعد تخزينها"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = load()
+            self.set(key, value)
+        return value
+
+    def pop(self, key, default=None):
+        with self._lock:
+            item = self._items.pop(key, _MISSING)
+        return default if item is _MISSING else item[1]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            return item is not None and (self.ttl is None or item[0] > self.timer())
+
+    def stats(self):
+        """عدّادات الأداء الحالية"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._items),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import shutil
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow اختياري: بدونه تُحفظ الأوراق بصيغة pickle
+    pa = None
+    feather = None
+
+DEFAULT_CACHE_DIR = ".cache/workbook"
+SHEETS_FILE = "sheets.json"
+# نسختان لكل إصدار من الملف: الأوراق كما حُلِّلت، والأوراق بعد ضغط الأنواع (dtype_optimizer).
+# لاحقة النسخة المضغوطة تتغير مع قواعد الضغط فلا تُقرأ أوراق ضُغطت بقواعد سابقة (v2: int32 كحد أدنى)
+RAW_VARIANT = "raw"
+COMPACT_VARIANT = "compact-v2"
+
+
+def workbook_fingerprint(workbook_path):
+    """بصمة ملف العمل: وقت آخر تعديل + SHA-256 للمحتوى"""
+    stat = os.stat(workbook_path)
+    digest = hashlib.sha256()
+    with open(workbook_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return f"{stat.st_mtime_ns}-{digest.hexdigest()[:16]}"
+
+
+def _atomic_write(path, write):
+    """كتابة ملف عبر ملف مؤقت ثم استبداله دفعة واحدة"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class WorkbookCache:
+    """
+    نسخة عمودية مُجمّعة من ملف Excel على القرص.
+
+    تُحوَّل كل ورقة مرة واحدة إلى ملف Arrow (Feather غير مضغوط) داخل مجلد
+    مفتاحه بصمة الملف، ثم تُقرأ لاحقًا عبر memory-map بدل تحليل openpyxl.
+    الأوراق التي لا يقبلها Arrow (أعمدة مختلطة الأنواع) تُحفظ بصيغة pickle.
+    optimized=True يستخدم نسخة الأوراق المضغوطة الأنواع، فلا يُعاد ضغطها عند القراءة.
+    """
+
+    def __init__(self, workbook_path, cache_dir=DEFAULT_CACHE_DIR, optimized=False):
+        self.workbook_path = workbook_path
+        self.cache_dir = cache_dir
+        self.optimized = optimized
+        self.key = workbook_fingerprint(workbook_path)
+        stem = os.path.splitext(os.path.basename(workbook_path))[0]
+        self.base_dir = os.path.join(cache_dir, stem)
+        self.root = os.path.join(self.base_dir, self.key, COMPACT_VARIANT if optimized else RAW_VARIANT)
+        self._names = None
+
+    # ------------------------------
+    # 📑 أسماء الأوراق ومسارات الملفات
+    # ------------------------------
+    def sheet_names(self):
+        """أسماء الأوراق المحفوظة بالترتيب، أو None إذا لم تُجمّع بعد"""
+        if self._names is None:
+            path = os.path.join(self.root, SHEETS_FILE)
+            if not os.path.exists(path):
+                return None
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._names = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                return None
+        return self._names
+
+    def _sheet_stem(self, sheet):
+        names = self.sheet_names() or []
+        if sheet not in names:
+            return None
+        return os.path.join(self.root, f"{names.index(sheet):03d}")
+
+    # ------------------------------
+    # 📥 القراءة
+    # ------------------------------
+    def read_sheet(self, sheet):
+        """قراءة ورقة واحدة من النسخة المُجمّعة، أو None إذا لم تكن محفوظة"""
+        stem = self._sheet_stem(sheet)
+        if stem is None:
+            return None
+        if feather is not None and os.path.exists(f"{stem}.arrow"):
+            return feather.read_table(f"{stem}.arrow", memory_map=True).to_pandas()
+        if os.path.exists(f"{stem}.pkl"):
+            return pd.read_pickle(f"{stem}.pkl")
+        return None
+
+    def load_all(self):
+        """تحميل كل الأوراق من النسخة المُجمّعة، أو None إذا كانت ناقصة"""
+        names = self.sheet_names()
+        if names is None:
+            return None
+        data_dict = {}
+        for sheet in names:
+            df = self.read_sheet(sheet)
+            if df is None:
+                return None
+            data_dict[sheet] = df
+        return data_dict
+
+    def is_complete(self):
+        """هل كل الأوراق محفوظة في النسخة المُجمّعة؟ (دون قراءتها)"""
+        names = self.sheet_names()
+        if names is None:
+            return False
+        for sheet in names:
+            stem = self._sheet_stem(sheet)
+            if not (os.path.exists(f"{stem}.arrow") or os.path.exists(f"{stem}.pkl")):
+                return False
+        return True
+
+    # ------------------------------
+    # 📤 الكتابة
+    # ------------------------------
+    def write_sheet_names(self, names):
+        """تسجيل أسماء الأوراق وحذف النسخ القديمة لنفس الملف"""
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, SHEETS_FILE)
+
+        def write(tmp_path):
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(list(names), f, ensure_ascii=False)
+
+        _atomic_write(path, write)
+        self._names = list(names)
+        self._prune_stale()
+
+    def write_sheet(self, sheet, df):
+        """حفظ ورقة واحدة بصيغة Arrow أو pickle عند تعذر التحويل"""
+        stem = self._sheet_stem(sheet)
+        if stem is None:
+            raise KeyError(f"الورقة {sheet} غير مسجلة في النسخة المُجمّعة")
+        if feather is not None:
+            try:
+                _atomic_write(
+                    f"{stem}.arrow",
+                    lambda tmp: feather.write_feather(df, tmp, compression="uncompressed"),
+                )
+                return
+            except (pa.ArrowException, TypeError, ValueError):
+                pass
+        _atomic_write(f"{stem}.pkl", df.to_pickle)
+
+    def store_all(self, data_dict):
+        """تجميع قاموس الأوراق كاملًا إلى القرص"""
+        self.write_sheet_names(data_dict.keys())
+        for sheet, df in data_dict.items():
+            self.write_sheet(sheet, df)
+
+    def _prune_stale(self):
+        """حذف النسخ المُجمّعة من إصدارات سابقة لملف العمل"""
+        for entry in os.listdir(self.base_dir):
+            if entry != self.key:
+                shutil.rmtree(os.path.join(self.base_dir, entry), ignore_errors=True)
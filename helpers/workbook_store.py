@@ -0,0 +1,341 @@
+import os
+import threading
+import weakref
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import pandas as pd
+
+from helpers.dtype_optimizer import optimize_frame, track_sheet
+from helpers.lazy_workbook import LazyWorkbook
+from helpers.parallel_parse import parse_workbook_parallel
+from helpers.workbook_cache import DEFAULT_CACHE_DIR, WorkbookCache
+
+# ==========================
+# 📚 مخزن ملفات العمل المشترك على مستوى العملية
+# ==========================
+# جلسات Streamlit خيوط داخل نفس العملية، لذلك يحتفظ المخزن بنسخة واحدة للقراءة فقط
+# من كل ملف عمل تتشاركها كل الجلسات مع عدّاد مراجع: تُحرَّر النسخة عند إغلاق آخر جلسة،
+# ويُعاد تحميلها تلقائيًا عند تغيّر وقت تعديل الملف (mtime). الأوراق مشتركة فلا يجوز
+# تعديلها في مكانها (مع copy-on-write في pandas ≥ 3 يُنسخ أي تعديل تلقائيًا).
+# يمكن ربط مصدر مزامنة بملف عمل (helpers.sheet_sync) فتحل أوراقه المجلوبة محل الأوراق
+# المقابلة في الملف لكل الجلسات، ويُعاد بناء النواتج المشتقة عند كل تغيير في المصدر.
+
+
+def load_workbook_data(workbook_path, cache_dir=DEFAULT_CACHE_DIR, lazy=True, preload=None,
+                       workers=1, optimize_dtypes=False):
+    """
+    تحميل ملف Excel كقاموس أوراق كسول أو كامل، عبر النسخة المُجمّعة إن وُجدت.
+
+    workers != 1 يحلل كل الأوراق على عدة عمليات عند غياب النسخة المُجمّعة
+    (0 = عدد الأنوية)، ثم يكمل التحميل منها كالمعتاد. optimize_dtypes يضغط أنواع
+    أعمدة كل ورقة مرة واحدة بعد تحليلها، وتُحفظ مضغوطة في النسخة المُجمّعة.
+    """
+    def freeze(data_dict):
+        if optimize_dtypes:
+            for sheet, df in data_dict.items():
+                track_sheet(df, workbook_path, sheet)
+        return MappingProxyType(data_dict)
+
+    # المسار السريع: النسخة العمودية المُجمّعة لنفس إصدار الملف
+    cache = WorkbookCache(workbook_path, cache_dir, optimized=optimize_dtypes) if cache_dir else None
+    if workers != 1 and (cache is None or not cache.is_complete()):
+        data_dict = parse_workbook_parallel(workbook_path, workers, cache, optimize_dtypes)
+        if data_dict is not None:
+            return freeze(data_dict)
+
+    if lazy:
+        return LazyWorkbook(workbook_path, cache=cache, preload=preload, optimize_dtypes=optimize_dtypes)
+
+    if cache is not None:
+        data_dict = cache.load_all()
+        if data_dict is not None:
+            return freeze(data_dict)
+
+    with pd.ExcelFile(workbook_path) as xls:
+        data_dict = {sheet: pd.read_excel(xls, sheet_name=sheet) for sheet in xls.sheet_names}
+    if optimize_dtypes:
+        data_dict = {sheet: optimize_frame(df) for sheet, df in data_dict.items()}
+
+    if cache is not None:
+        try:
+            cache.store_all(data_dict)
+        except OSError as e:
+            print(f"⚠️ تعذر حفظ النسخة المُجمّعة من ملف العمل: {e}")
+    return freeze(data_dict)
+
+
+class SyncedWorkbook(Mapping):
+    """قاموس أوراق ملف العمل مع استبدال الأوراق المجلوبة من مصدر المزامنة"""
+
+    def __init__(self, workbook, overrides):
+        self.workbook = workbook
+        self.overrides = overrides
+
+    def __getitem__(self, sheet):
+        if sheet in self.overrides:
+            return self.overrides[sheet]
+        return self.workbook[sheet]
+
+    def __iter__(self):
+        return iter(self.workbook)
+
+    def __len__(self):
+        return len(self.workbook)
+
+    def __contains__(self, sheet):
+        return sheet in self.workbook
+
+    def iter_records(self, sheet):
+        """صفوف الورقة كقواميس (تدفقيًا من الملف الكسول للأوراق غير المستبدلة)"""
+        if sheet not in self.overrides and isinstance(self.workbook, LazyWorkbook):
+            return self.workbook.iter_records(sheet)
+        return iter(self[sheet].to_dict("records"))
+
+
+class _Entry:
+    """نسخة واحدة محمّلة من ملف عمل مع عدد الجلسات التي تستخدمها"""
+
+    __slots__ = ("workbook", "mtime_ns", "refs", "derived", "derived_lock", "options", "view", "view_version")
+
+    def __init__(self, workbook, mtime_ns, options):
+        self.workbook = workbook
+        self.mtime_ns = mtime_ns
+        self.refs = 0
+        # خيارات التحميل (workers)، يُعاد استخدامها عند إعادة التحميل
+        self.options = options
+        # نواتج مبنية من الأوراق (مثل فهرس البحث) مشتركة أيضًا ومرتبطة بهذا الإصدار
+        self.derived = {}
+        self.derived_lock = threading.Lock()
+        # الأوراق كما تراها الجلسات (مع أوراق المزامنة) وإصدار المصدر الذي بُنيت منه
+        self.view = workbook
+        self.view_version = None
+
+
+def _merge_workers(current, requested):
+    """عدد عمليات التحليل عند إعادة التحميل: الأكبر بين الطلبات (0 أو None = كل الأنوية)"""
+    if not current or not requested:
+        return 0
+    return max(current, requested)
+
+
+class WorkbookStore:
+    """
+    مخزن ملفات العمل المشترك (نسخة واحدة لكل ملف وخيارات تحميل لكل عملية).
+
+    التحليل يجري خارج قفل المخزن: قفل لكل مفتاح يمنع تحميل نفس الملف مرتين، وأثناء إعادة
+    تحميل ملف تغيّر تبقى النسخة السابقة متاحة للجلسات الأخرى حتى تُستبدل النسخة الجديدة.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._load_locks = {}
+        # المسار المطلق -> مصدر مزامنة (له version و frames_for(أسماء الأوراق))
+        self._sources = {}
+
+    @staticmethod
+    def _key(workbook_path, cache_dir, lazy, optimize_dtypes=False):
+        # optimize_dtypes يغيّر أنواع الأعمدة فهو جزء من المفتاح؛ workers يغيّر سرعة التحليل فقط
+        return (os.path.abspath(workbook_path), cache_dir, lazy, bool(optimize_dtypes))
+
+    def _load_lock(self, key):
+        with self._lock:
+            return self._load_locks.setdefault(key, threading.Lock())
+
+    def _load(self, key, preload=None, workers=1):
+        path, cache_dir, lazy, optimize_dtypes = key
+        mtime_ns = os.stat(path).st_mtime_ns
+        workbook = load_workbook_data(
+            path, cache_dir, lazy, preload, workers=workers, optimize_dtypes=optimize_dtypes,
+        )
+        return _Entry(workbook, mtime_ns, {"workers": workers})
+
+    @staticmethod
+    def _changed(key, entry):
+        try:
+            return os.stat(key[0]).st_mtime_ns != entry.mtime_ns
+        except OSError:
+            # الملف حُذف أو يُستبدل الآن: نبقي النسخة الحالية
+            return False
+
+    def _reference(self, key, workers):
+        """زيادة مراجع النسخة المحمّلة إن وُجدت وإرجاعها"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refs += 1
+                entry.options["workers"] = _merge_workers(entry.options["workers"], workers)
+            return entry
+
+    def _current(self, key, force=False):
+        """
+        النسخة الحالية للمفتاح، مع إعادة التحميل إذا تغيّر الملف على القرص.
+
+        إذا كانت جلسة أخرى تعيد التحميل الآن تُعاد النسخة السابقة فورًا دون انتظار،
+        إلا عند force حيث ينتظر المستدعي النسخة الجديدة.
+        """
+        with self._lock:
+            seen = self._entries[key]
+        if not (force or self._changed(key, seen)):
+            return seen
+        load_lock = self._load_lock(key)
+        if not load_lock.acquire(blocking=force):
+            return seen
+        try:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is None:
+                raise KeyError(key)
+            if entry is not seen:
+                # أعادت جلسة أخرى التحميل بينما كنا ننتظر
+                return entry
+            fresh = self._load(key, **entry.options)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    # حُرِّر آخر مرجع أثناء التحميل
+                    return fresh
+                fresh.refs = entry.refs
+                self._entries[key] = fresh
+            return fresh
+        finally:
+            load_lock.release()
+
+    def acquire(self, workbook_path, cache_dir=DEFAULT_CACHE_DIR, lazy=True, preload=None, workers=1,
+                optimize_dtypes=False):
+        """
+        حجز مرجع على ملف العمل وإرجاع مفتاحه، أو None إذا لم يكن الملف موجودًا.
+
+        workers يُستخدم عند التحليل (أول تحميل أو إعادة التحميل)، وتتشارك الطلبات بأعداد
+        مختلفة نفس النسخة. optimize_dtypes جزء من المفتاح فلكل قيمة نسختها.
+        """
+        if not workbook_path or not os.path.exists(workbook_path):
+            return None
+        key = self._key(workbook_path, cache_dir, lazy, optimize_dtypes)
+        entry = self._reference(key, workers)
+        if entry is not None:
+            entry = self._current(key)
+        else:
+            # أول تحميل: جلسة واحدة تحلل الملف والبقية تنتظر على قفل المفتاح فقط
+            with self._load_lock(key):
+                entry = self._reference(key, workers)
+                if entry is None:
+                    fresh = self._load(key, preload, workers)
+                    with self._lock:
+                        entry = self._entries.setdefault(key, fresh)
+                        entry.refs += 1
+        for sheet in preload or []:
+            if sheet in entry.workbook:
+                entry.workbook[sheet]
+        return key
+
+    def release(self, key):
+        """تحرير مرجع، وحذف النسخة من الذاكرة عند تحرير آخر مرجع"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refs -= 1
+            if entry.refs <= 0:
+                del self._entries[key]
+
+    def attach_source(self, workbook_path, source):
+        """ربط مصدر مزامنة بملف عمل: أوراقه تحل محل أوراق الملف بنفس الاسم"""
+        with self._lock:
+            self._sources[os.path.abspath(workbook_path)] = source
+
+    def _view(self, key, entry):
+        """(الأوراق, النواتج المشتقة) للنسخة بعد تطبيق آخر إصدار من مصدر المزامنة"""
+        source = self._sources.get(key[0])
+        version = None if source is None else source.version
+        with self._lock:
+            if entry.view_version != version:
+                overrides = source.frames_for(list(entry.workbook)) if source is not None else {}
+                entry.view = SyncedWorkbook(entry.workbook, overrides) if overrides else entry.workbook
+                entry.view_version = version
+                entry.derived = {}
+            return entry.view, entry.derived
+
+    def workbook(self, key):
+        """قاموس الأوراق الحالي (يُعاد تحميله إذا تغيّر الملف أو مصدر المزامنة)"""
+        entry = self._current(key)
+        return self._view(key, entry)[0]
+
+    def version(self, key):
+        """إصدار النسخة الحالية: (mtime_ns للملف عند تحميلها, إصدار مصدر المزامنة أو None)"""
+        entry = self._current(key)
+        self._view(key, entry)
+        return entry.mtime_ns, entry.view_version
+
+    def derived(self, key, name, build):
+        """ناتج مشترك يُبنى مرة واحدة لكل إصدار من الملف ومصدر المزامنة عبر build(workbook)"""
+        entry = self._current(key)
+        workbook, derived = self._view(key, entry)
+        if name not in derived:
+            # قفل النسخة نفسها: بناء ناتج لا يوقف بقية الملفات ولا قراءة الأوراق
+            with entry.derived_lock:
+                if name not in derived:
+                    derived[name] = build(workbook)
+        return derived[name]
+
+    def reload(self, key):
+        """إعادة تحميل الملف قسرًا حتى لو لم يتغيّر وقت تعديله"""
+        self._current(key, force=True)
+
+    def stats(self):
+        """حالة المخزن: الملفات المحمّلة وعدد المراجع والأوراق المحلَّلة"""
+        with self._lock:
+            return [
+                {
+                    "path": path,
+                    "lazy": lazy,
+                    "optimize_dtypes": optimize_dtypes,
+                    "refs": entry.refs,
+                    "version": entry.mtime_ns,
+                    "loaded_sheets": len(entry.workbook.loaded_sheets())
+                    if isinstance(entry.workbook, LazyWorkbook) else len(entry.workbook),
+                }
+                for (path, _, lazy, optimize_dtypes), entry in self._entries.items()
+            ]
+
+
+class WorkbookHandle:
+    """
+    مرجع جلسة على ملف عمل مشترك.
+
+    يُحرَّر المرجع عند close() أو تلقائيًا عند تحرير الكائن من الذاكرة.
+    """
+
+    def __init__(self, store, key):
+        self.store = store
+        self.key = key
+        self._finalizer = weakref.finalize(self, store.release, key)
+
+    @property
+    def data(self):
+        return self.store.workbook(self.key)
+
+    @property
+    def version(self):
+        return self.store.version(self.key)
+
+    def derived(self, name, build):
+        return self.store.derived(self.key, name, build)
+
+    def reload(self):
+        self.store.reload(self.key)
+
+    def close(self):
+        self._finalizer()
+
+
+shared_store = WorkbookStore()
+
+
+def open_shared_workbook(workbook_path, cache_dir=DEFAULT_CACHE_DIR, lazy=True, preload=None, **options):
+    """فتح ملف عمل من المخزن المشترك، أو None إذا لم يكن الملف موجودًا (options: workers, optimize_dtypes)"""
+    key = shared_store.acquire(workbook_path, cache_dir, lazy, preload, **options)
+    if key is None:
+        return None
+    return WorkbookHandle(shared_store, key)
@@ -0,0 +1,93 @@
+import pandas as pd
+from openpyxl import load_workbook
+
+# ==========================
+# 🌊 قراءة XLSX تدفقية للقراءة فقط
+# ==========================
+# تُقرأ الورقة صفًا صفًا عبر openpyxl (read_only + iter_rows) دون بناء DataFrame كامل،
+# فيبقى استهلاك الذاكرة بحجم الدفعة الواحدة مهما كبرت الورقة.
+
+DEFAULT_BATCH_SIZE = 1_000
+
+
+def _header_names(row):
+    """أسماء الأعمدة من صف الترويسة بنفس قواعد pandas (Unnamed و .1 للمكرر)"""
+    names = []
+    seen = {}
+    for position, value in enumerate(row):
+        name = f"Unnamed: {position}" if value is None else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _select_sheet(workbook, sheet):
+    if sheet is None:
+        return workbook.worksheets[0]
+    if isinstance(sheet, int):
+        return workbook.worksheets[sheet]
+    return workbook[sheet]
+
+
+def iter_rows(source, sheet=None, header=True):
+    """
+    صفوف الورقة كقوائم قيم خام (بأنواعها الأصلية من Excel).
+
+    Args:
+        source: مسار الملف أو كائن ملف
+        sheet: اسم الورقة أو رقمها (الافتراضي: الأولى)
+        header (bool): هل الصف الأول ترويسة؟ إن كان كذلك تكون أول قيمة مُعادة أسماء الأعمدة
+
+    Yields:
+        list: أسماء الأعمدة أولًا (إن وُجدت ترويسة) ثم صفوف البيانات غير الفارغة
+    """
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = _select_sheet(workbook, sheet).iter_rows(values_only=True)
+        width = None
+        if header:
+            first = next(rows, None)
+            if first is None:
+                return
+            columns = _header_names(first)
+            width = len(columns)
+            yield columns
+        for row in rows:
+            if any(value is not None for value in row):
+                row = list(row)
+                if width is not None:
+                    # توحيد طول الصف مع الترويسة
+                    row = row[:width] + [None] * (width - len(row))
+                yield row
+    finally:
+        workbook.close()
+
+
+def iter_records(source, sheet=None):
+    """صفوف الورقة كقواميس {اسم العمود: القيمة} واحدًا تلو الآخر"""
+    rows = iter_rows(source, sheet)
+    columns = next(rows, None)
+    if columns is None:
+        return
+    for row in rows:
+        yield dict(zip(columns, row))
+
+
+def iter_row_batches(source, sheet=None, batch_size=DEFAULT_BATCH_SIZE):
+    """صفوف الورقة على دفعات من DataFrame بحجم batch_size على الأكثر"""
+    rows = iter_rows(source, sheet)
+    columns = next(rows, None)
+    if columns is None:
+        return
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield pd.DataFrame(batch, columns=columns)
+            batch = []
+    if batch:
+        yield pd.DataFrame(batch, columns=columns)
@@ -1,35 +1,268 @@
+import bisect
 import json
 import os
-from datetime import datetime
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from helpers.arabic_text import normalize_arabic, search_text
+from helpers.metrics import SEARCH_SECONDS, registry
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# عدد سجلات اليومية التي يُعاد بعدها كتابة اللقطة الكاملة وتفريغ اليومية
+COMPACT_EVERY = 200
+
+# طول المقاطع الحرفية (n-grams) في فهرس المفردات للمطابقة الجزئية (الكلمات الأقصر تُفهرس كاملة)
+GRAM_SIZE = 3
+
+MEMORY_WRITES = registry.counter("memory_writes", "Interactions added or updated in the assistant memory", ["op"])
+MEMORY_JOURNAL_WRITE_SECONDS = registry.histogram("memory_journal_write_seconds", "Journal append latency (fsync included)")
+MEMORY_COMPACTION_SECONDS = registry.histogram("memory_compaction_seconds", "Snapshot rewrite (compaction) latency")
+MEMORY_ENTRIES = registry.gauge("memory_entries", "Interactions held by the most recently changed assistant memory")
+
+_search_seconds = SEARCH_SECONDS.labels("memory")
+
 
 class AIMemoryManager:
-    def __init__(self, path="helpers/ai_memory.json"):
+    """
+    ذاكرة تفاعلات المساعد مع يومية كتابة مسبقة (JSON Lines).
+
+    كل إضافة أو تعديل يُلحق سطرًا واحدًا باليومية بدل إعادة كتابة ai_memory.json كاملًا،
+    وتُدمج اليومية في اللقطة كل COMPACT_EVERY سجلًا. عند التشغيل تُحمَّل اللقطة ثم
+    يُعاد تطبيق اليومية عليها، ويتجاوز رقم التسلسل (seq) ما دُمج سابقًا في اللقطة.
+    """
+    def __init__(self, path="helpers/ai_memory.json", compact_every=COMPACT_EVERY):
         self.path = path
+        self.journal_path = os.path.splitext(path)[0] + ".journal.jsonl"
+        self.compact_every = compact_every
+        self._seq = 0
+        self._journal_records = 0
+        self._journal_damaged = False
         self.memory = self.load_memory()
+        if self._journal_damaged:
+            # الدمج الفوري يمنع إلحاق سجلات جديدة بعد سطر مبتور
+            self.save_memory()
+        self._rebuild_indexes()
+        MEMORY_ENTRIES.set(len(self.memory))
+
+    @staticmethod
+    def _entry_search_text(entry):
+        return search_text(f"{entry.get('query', '')} {entry.get('response', '')}")
+
+    # ==========================
+    # 🗂️ الفهارس الثانوية
+    # ==========================
+    # الدور والوسوم والكلمات: قيمة -> مجموعة أرقام التفاعلات، والوقت: قائمة مرتبة من
+    # (timestamp, index) يُبحث فيها بالتنصيف. للمطابقة الجزئية يربط فهرس المقاطع كل مقطع
+    # بطول GRAM_SIZE بالكلمات المفهرسة التي تحتويه. تُحدَّث الفهارس عند كل إضافة أو تعديل.
+
+    def _rebuild_indexes(self):
+        """بناء كل الفهارس من الذاكرة الحالية"""
+        # نص موحد لكل تفاعل (الاستعلام + الرد) يُحسب مرة واحدة عند الإضافة أو التعديل
+        self._search_texts = []
+        self._role_index = defaultdict(set)
+        self._tag_index = defaultdict(set)
+        self._token_index = defaultdict(set)
+        self._gram_index = defaultdict(set)
+        self._time_index = []
+        for index, entry in enumerate(self.memory):
+            self._search_texts.append(self._entry_search_text(entry))
+            self._index_entry(index)
+
+    def _index_entry(self, index):
+        entry = self.memory[index]
+        self._role_index[entry.get("role")].add(index)
+        for tag in entry.get("context_tags") or []:
+            self._tag_index[normalize_arabic(tag)].add(index)
+        for token in set(self._search_texts[index].split()):
+            if token not in self._token_index:
+                for gram in self._token_grams(token):
+                    self._gram_index[gram].add(token)
+            self._token_index[token].add(index)
+        bisect.insort(self._time_index, (entry.get("timestamp", ""), index))
+
+    def _unindex_entry(self, index):
+        entry = self.memory[index]
+        self._discard(self._role_index, entry.get("role"), index)
+        for tag in entry.get("context_tags") or []:
+            self._discard(self._tag_index, normalize_arabic(tag), index)
+        for token in set(self._search_texts[index].split()):
+            self._discard(self._token_index, token, index)
+            if token not in self._token_index:
+                for gram in self._token_grams(token):
+                    self._discard(self._gram_index, gram, token)
+        position = bisect.bisect_left(self._time_index, (entry.get("timestamp", ""), index))
+        if position < len(self._time_index) and self._time_index[position][1] == index:
+            del self._time_index[position]
+
+    @staticmethod
+    def _discard(index_map, key, index):
+        postings = index_map.get(key)
+        if postings is not None:
+            postings.discard(index)
+            if not postings:
+                del index_map[key]
+
+    @staticmethod
+    def _token_grams(token):
+        """مقاطع الكلمة بطول GRAM_SIZE، أو الكلمة نفسها إذا كانت أقصر"""
+        if len(token) < GRAM_SIZE:
+            return {token}
+        return {token[start:start + GRAM_SIZE] for start in range(len(token) - GRAM_SIZE + 1)}
+
+    def _matching_tokens(self, part):
+        """الكلمات المفهرسة التي تحتوي part عبر فهرس المقاطع (يُتحقق فقط من الكلمات المرشحة)"""
+        if len(part) < GRAM_SIZE:
+            # جزء قصير: المرور على المقاطع المختلفة (عددها محدود) لا على المفردات
+            matches = set()
+            for gram, tokens in self._gram_index.items():
+                if part in gram:
+                    matches |= tokens
+            return matches
+        grams = sorted(
+            (self._gram_index.get(gram, set()) for gram in self._token_grams(part)),
+            key=len,
+        )
+        return {token for token in grams[0].intersection(*grams[1:]) if part in token}
+
+    def _keyword_candidates(self, needle):
+        """التفاعلات التي تحتوي كل كلمات العبارة (أو أجزاءها) — مرشحون للتحقق النهائي"""
+        candidates = None
+        for part in set(needle.split()):
+            matches = set()
+            for token in self._matching_tokens(part):
+                matches |= self._token_index[token]
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return set()
+        return candidates
+
+    @staticmethod
+    def _time_key(value):
+        """تحويل حد زمني (datetime أو نص أو مدة قبل الآن) إلى صيغة الطابع الزمني المخزن"""
+        if isinstance(value, timedelta):
+            value = datetime.now() - value
+        if isinstance(value, datetime):
+            return value.strftime(TIMESTAMP_FORMAT)
+        return str(value)
+
+    def _time_range(self, since=None, until=None):
+        start = 0
+        end = len(self._time_index)
+        if since is not None:
+            start = bisect.bisect_left(self._time_index, (self._time_key(since), -1))
+        if until is not None:
+            end = bisect.bisect_right(self._time_index, (self._time_key(until), len(self.memory)))
+        return {index for _, index in self._time_index[start:end]}
+
+    def query_memory(self, role=None, tag=None, since=None, until=None, keyword=None):
+        """
+        استعلام مركب باستخدام الفهارس، مثل: الدور=العمال والوسم=الأجور منذ أسبوع.
+
+        Args:
+            role (str): دور المستخدم
+            tag (str): وسم من context_tags (مطابقة عربية موحدة)
+            since / until: datetime أو نص بصيغة الطابع الزمني أو timedelta قبل الآن
+            keyword (str): كلمة أو عبارة في الاستعلام أو الرد
+
+        Returns:
+            list: التفاعلات المطابقة بترتيب إضافتها
+        """
+        filters = []
+        if role is not None:
+            filters.append(self._role_index.get(role, set()))
+        if tag is not None:
+            filters.append(self._tag_index.get(normalize_arabic(tag), set()))
+        needle = None
+        if keyword is not None:
+            needle = search_text(keyword)
+            if not needle:
+                return []
+            filters.append(self._keyword_candidates(needle))
+        if since is not None or until is not None:
+            filters.append(self._time_range(since, until))
+
+        if not filters:
+            return list(self.memory)
+        # التقاطع يبدأ بأصغر مجموعة
+        filters.sort(key=len)
+        indexes = set(filters[0])
+        for other in filters[1:]:
+            indexes &= other
+        if needle is not None:
+            indexes = {index for index in indexes if needle in self._search_texts[index]}
+        return [self.memory[index] for index in sorted(indexes)]
 
     def load_memory(self):
-        """تحميل الذاكرة من JSON أو إنشاء بنية جديدة"""
+        """تحميل اللقطة من JSON ثم إعادة تطبيق اليومية، أو إنشاء بنية جديدة"""
+        memory = []
         if os.path.exists(self.path):
             try:
                 with open(self.path, "r", encoding="utf-8") as f:
-                    return json.load(f).get("memory", [])
+                    snapshot = json.load(f)
+                memory = snapshot.get("memory", [])
+                self._seq = snapshot.get("seq", 0)
             except json.JSONDecodeError:
                 print("⚠️ خطأ في ملف ai_memory.json، سيتم إنشاء بنية فارغة")
-                return []
-        else:
-            return []
+        self._replay_journal(memory)
+        return memory
+
+    def _replay_journal(self, memory):
+        """تطبيق سجلات اليومية الأحدث من اللقطة على الذاكرة"""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # سطر أخير مبتور بسبب انقطاع أثناء الكتابة
+                    print("⚠️ تم تجاهل سجل تالف في يومية الذاكرة")
+                    self._journal_damaged = True
+                    continue
+                self._journal_records += 1
+                if record["seq"] <= self._seq:
+                    continue
+                self._seq = record["seq"]
+                if record["op"] == "add":
+                    memory.append(record["entry"])
+                elif record["op"] == "update" and 0 <= record["index"] < len(memory):
+                    memory[record["index"]].update(record["fields"])
+
+    def _append_journal(self, record):
+        """إلحاق سجل واحد باليومية وضمان وصوله إلى القرص"""
+        self._seq += 1
+        record["seq"] = self._seq
+        with MEMORY_JOURNAL_WRITE_SECONDS.time():
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        MEMORY_WRITES.labels(record["op"]).inc()
+        self._journal_records += 1
+        if self._journal_records >= self.compact_every:
+            self.save_memory()
 
     def save_memory(self):
-        """حفظ الذاكرة إلى JSON"""
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump({"memory": self.memory}, f, ensure_ascii=False, indent=4)
+        """حفظ لقطة كاملة للذاكرة إلى JSON (الدمج) ثم تفريغ اليومية"""
+        tmp_path = f"{self.path}.tmp"
+        with MEMORY_COMPACTION_SECONDS.time():
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"seq": self._seq, "memory": self.memory}, f, ensure_ascii=False, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        # لو انقطع التنفيذ هنا تُتجاهل سجلات اليومية لأن seq الخاص بها مدمج في اللقطة
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+        self._journal_records = 0
 
     def add_interaction(self, role, query, response, reference="", example="", notes="", context_tags=None):
         """إضافة تفاعل جديد"""
         if context_tags is None:
             context_tags = []
         new_entry = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": datetime.now().strftime(TIMESTAMP_FORMAT),
             "role": role,
             "query": query,
             "response": response,
@@ -39,30 +272,33 @@ class AIMemoryManager:
             "context_tags": context_tags
         }
         self.memory.append(new_entry)
-        self.save_memory()
+        self._search_texts.append(self._entry_search_text(new_entry))
+        self._index_entry(len(self.memory) - 1)
+        MEMORY_ENTRIES.set(len(self.memory))
+        self._append_journal({"op": "add", "entry": new_entry})
         return new_entry
 
     def search_memory(self, keyword, role=None):
         """البحث في الذاكرة باستخدام كلمة مفتاحية وخيار تحديد الدور"""
-        results = []
-        for entry in self.memory:
-            if (keyword.lower() in entry["query"].lower() or keyword.lower() in entry["response"].lower()):
-                if role is None or entry["role"] == role:
-                    results.append(entry)
-        return results
+        with _search_seconds.time():
+            return self.query_memory(role=role, keyword=keyword)
 
     def update_interaction(self, index, **kwargs):
         """تعديل تفاعل موجود بالاعتماد على index"""
         if 0 <= index < len(self.memory):
-            for key, value in kwargs.items():
-                if key in self.memory[index]:
-                    self.memory[index][key] = value
-            self.save_memory()
+            fields = {key: value for key, value in kwargs.items() if key in self.memory[index]}
+            self._unindex_entry(index)
+            self.memory[index].update(fields)
+            self._search_texts[index] = self._entry_search_text(self.memory[index])
+            self._index_entry(index)
+            self._append_journal({"op": "update", "index": index, "fields": fields})
             return self.memory[index]
         else:
             raise IndexError("❌ فهرس غير صالح للتعديل")
 
     def clear_memory(self):
-        """مسح كل الذاكرة"""
+        """مسح كل الذاكرة (لقطة فارغة مباشرة دون المرور باليومية)"""
         self.memory = []
-        self.save_memory()
\ No newline at end of file
+        self._rebuild_indexes()
+        self.save_memory()
+        MEMORY_ENTRIES.set(0)
\ No newline at end of file
@@ -0,0 +1,150 @@
+import multiprocessing
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from helpers import ai_logs_manager
+from helpers.ai_logs_manager import LOG_COLUMNS, AILogsManager
+from helpers.arabic_text import search_text
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return AILogsManager(str(tmp_path / "logs.csv"))
+
+
+def _expected(manager, keyword):
+    """البحث كما كان: قراءة كاملة عبر load_logs ثم مطابقة موحدة"""
+    df = manager.load_logs()
+    text = df.fillna("").astype(str).agg(" ".join, axis=1).map(search_text) if len(df) else pd.Series([], dtype=object)
+    return df[text.str.contains(search_text(keyword), regex=False)]
+
+
+def _assert_matches_load_logs(manager, keyword):
+    pd.testing.assert_frame_equal(manager.search_logs(keyword), _expected(manager, keyword))
+
+
+def test_search_matches_load_logs_across_appends(manager):
+    manager.log_interaction("العمال", "كيف أحسب مكافأة نهاية الخدمة؟", "المادة 32")
+    _assert_matches_load_logs(manager, "مكافاه")
+
+    # عمود notes كان فارغًا كله (float) ثم يحمل نصًا: تعاد القراءة كاملة بأنواع load_logs
+    manager.log_interaction("أصحاب العمل", "مكافأة الاستقالة", "المادة 32", notes="ممتاز")
+    _assert_matches_load_logs(manager, "مكافأة")
+    _assert_matches_load_logs(manager, "ممتاز")
+
+    manager.log_interaction("العمال", "الإجازة السنوية", "المادة 61", example="14", notes="جيد")
+    _assert_matches_load_logs(manager, "اجازه")
+    assert manager.search_logs("").empty
+
+
+def test_only_appended_rows_are_normalized(manager, monkeypatch):
+    for i in range(20):
+        manager.log_interaction("العمال", f"سؤال {i} عن المكافأة", "جواب", notes="ملاحظة")
+    manager.search_logs("المكافأة")
+
+    normalized = []
+    original = AILogsManager._normalize
+    monkeypatch.setattr(AILogsManager, "_normalize", staticmethod(lambda df: normalized.append(len(df)) or original(df)))
+    manager.log_interaction("العمال", "إصابة عمل", "جواب", notes="ملاحظة")
+    assert len(manager.search_logs("اصابه")) == 1
+    assert len(manager.search_logs("المكافأة")) == 20
+    assert normalized == [1]
+
+
+def test_truncated_or_replaced_file_is_rebuilt(manager):
+    manager.log_interaction("العمال", "مكافأة", "جواب")
+    manager.log_interaction("العمال", "مكافأة ثانية", "جواب")
+    assert len(manager.search_logs("مكافأة")) == 2
+
+    os.remove(manager.file_path)
+    pd.DataFrame(columns=LOG_COLUMNS).to_csv(manager.file_path, index=False, encoding="utf-8-sig")
+    manager.log_interaction("العمال", "مكافأة جديدة", "جواب")
+    _assert_matches_load_logs(manager, "مكافأة")
+    assert len(manager.search_logs("مكافأة")) == 1
+
+
+
+WRITERS = 6
+ROWS_PER_WRITER = 40
+LONG_RESPONSE = "نص طويل، مع فواصل و\"اقتباسات\"\nوأسطر " * 200
+
+
+def _write_rows(file_path, writer, barrier=None):
+    if barrier is not None:
+        # كل العمليات تنشئ الملف في اللحظة نفسها: فحص الحجم وكتابة الترويسة تحت القفل
+        barrier.wait()
+    manager = AILogsManager(file_path)
+    for row in range(ROWS_PER_WRITER):
+        manager.log_interaction(f"كاتب {writer}", f"سؤال {writer}-{row}", LONG_RESPONSE, notes=str(row))
+        if row % 15 == 14:
+            manager.flush()
+    manager.flush()
+
+
+def _assert_all_rows_intact(file_path):
+    with open(file_path, encoding="utf-8-sig") as f:
+        content = f.read()
+    assert content.startswith(",".join(LOG_COLUMNS))
+    assert content.count(",".join(LOG_COLUMNS)) == 1
+    logs = AILogsManager(file_path).load_logs()
+    assert len(logs) == WRITERS * ROWS_PER_WRITER
+    assert (logs["response"] == LONG_RESPONSE).all()
+    expected = {f"سؤال {writer}-{row}" for writer in range(WRITERS) for row in range(ROWS_PER_WRITER)}
+    assert set(logs["query"]) == expected
+
+
+@pytest.mark.skipif(ai_logs_manager.fcntl is None, reason="قفل الملفات بين العمليات يتطلب fcntl")
+def test_concurrent_process_appends_share_one_header(tmp_path):
+    file_path = str(tmp_path / "logs.csv")
+    context = multiprocessing.get_context("fork")
+    barrier = context.Barrier(WRITERS)
+    processes = [
+        context.Process(target=_write_rows, args=(file_path, writer, barrier)) for writer in range(WRITERS)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+    _assert_all_rows_intact(file_path)
+
+
+def test_concurrent_thread_appends_keep_every_row(tmp_path):
+    file_path = str(tmp_path / "logs.csv")
+    AILogsManager(file_path)
+    threads = [threading.Thread(target=_write_rows, args=(file_path, writer)) for writer in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    _assert_all_rows_intact(file_path)
+
+
+@pytest.mark.skipif(ai_logs_manager.fcntl is None, reason="قفل الملفات بين العمليات يتطلب fcntl")
+def test_flush_waits_for_the_file_lock_held_by_another_process(tmp_path):
+    file_path = str(tmp_path / "logs.csv")
+    AILogsManager(file_path)
+    context = multiprocessing.get_context("fork")
+    with open(file_path, "a", newline="", encoding="utf-8") as f:
+        ai_logs_manager.fcntl.flock(f.fileno(), ai_logs_manager.fcntl.LOCK_EX)
+        size = os.path.getsize(file_path)
+        process = context.Process(target=_write_rows, args=(file_path, 0))
+        process.start()
+        time.sleep(0.5)
+        # الكاتب الآخر ينتظر القفل: لم يُكتب شيء بعد
+        assert process.is_alive()
+        assert os.path.getsize(file_path) == size
+        f.write("ts,العمال,سؤال صاحب القفل,رد,,,\n")
+        f.flush()
+        ai_logs_manager.fcntl.flock(f.fileno(), ai_logs_manager.fcntl.LOCK_UN)
+    process.join(timeout=60)
+    assert process.exitcode == 0
+
+    logs = AILogsManager(file_path).load_logs()
+    assert len(logs) == ROWS_PER_WRITER + 1
+    assert logs["query"].iloc[0] == "سؤال صاحب القفل"
+    assert (logs["response"].iloc[1:] == LONG_RESPONSE).all()
@@ -0,0 +1,148 @@
+import json
+
+from logs.ai_memory_manager import AIMemoryManager
+
+
+def _manager(tmp_path, compact_every=100):
+    return AIMemoryManager(str(tmp_path / "ai_memory.json"), compact_every=compact_every)
+
+
+def _journal_lines(manager):
+    with open(manager.journal_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _snapshot(manager):
+    with open(manager.path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_journal_is_replayed_after_a_crash(tmp_path):
+    memory = _manager(tmp_path)
+    memory.add_interaction("العمال", "ما هي مكافأة نهاية الخدمة؟", "أجر شهر عن كل سنة")
+    memory.add_interaction("أصحاب العمل", "متى يُدفع الأجر؟", "خلال سبعة أيام")
+    memory.update_interaction(0, notes="المادة 32")
+    # لا حفظ للقطة: العملية "انهارت" بعد الكتابة في اليومية فقط
+    assert [record["seq"] for record in _journal_lines(memory)] == [1, 2, 3]
+
+    reopened = _manager(tmp_path)
+    assert reopened.memory == memory.memory
+    assert reopened._seq == 3
+
+
+def test_torn_last_line_is_skipped_and_compacted(tmp_path):
+    memory = _manager(tmp_path)
+    memory.add_interaction("العمال", "سؤال أول", "رد أول")
+    with open(memory.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "add", "entry": {"role": "الع')
+
+    reopened = _manager(tmp_path)
+    assert [entry["query"] for entry in reopened.memory] == ["سؤال أول"]
+    # الدمج الفوري يفرّغ اليومية فلا تُلحق السجلات الجديدة بعد السطر المبتور
+    assert _journal_lines(reopened) == []
+    reopened.add_interaction("العمال", "سؤال ثان", "رد ثان")
+    assert [entry["query"] for entry in _manager(tmp_path).memory] == ["سؤال أول", "سؤال ثان"]
+
+
+def test_compaction_keeps_seq(tmp_path):
+    memory = _manager(tmp_path, compact_every=3)
+    for number in range(4):
+        memory.add_interaction("العمال", f"سؤال {number}", f"رد {number}")
+
+    snapshot = _snapshot(memory)
+    assert snapshot["seq"] == 3
+    assert len(snapshot["memory"]) == 3
+    assert [record["seq"] for record in _journal_lines(memory)] == [4]
+
+    reopened = _manager(tmp_path, compact_every=3)
+    assert len(reopened.memory) == 4
+    assert reopened._seq == 4
+    reopened.add_interaction("العمال", "سؤال 4", "رد 4")
+    assert _journal_lines(reopened)[-1]["seq"] == 5
+
+
+def test_records_already_in_the_snapshot_are_not_applied_twice(tmp_path):
+    memory = _manager(tmp_path)
+    memory.add_interaction("العمال", "سؤال", "رد")
+    memory.update_interaction(0, notes="ملاحظة")
+    journal = _journal_lines(memory)
+    memory.save_memory()
+    # انقطاع بين استبدال اللقطة وتفريغ اليومية
+    with open(memory.journal_path, "w", encoding="utf-8") as f:
+        for record in journal:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    reopened = _manager(tmp_path)
+    assert reopened.memory == memory.memory
+    assert reopened._seq == 2
+
+
+def _index_state(memory):
+    return (
+        dict(memory._role_index),
+        dict(memory._tag_index),
+        dict(memory._token_index),
+        dict(memory._gram_index),
+        list(memory._time_index),
+    )
+
+
+def _populate(memory):
+    memory.add_interaction("العمال", "مكافأة نهاية الخدمة", "أجر شهر", context_tags=["الأجور"])
+    memory.add_interaction("أصحاب العمل", "ساعات العمل الإضافي", "بنسبة 125%", context_tags=["ساعات"])
+    memory.add_interaction("العمال", "الإجازة المرضية", "14 يومًا بأجر كامل", context_tags=["إجازات", "الأجور"])
+    for index, timestamp in enumerate(["2025-01-05 09:00:00", "2025-03-01 12:00:00", "2025-02-10 08:30:00"]):
+        memory.update_interaction(index, timestamp=timestamp)
+
+
+def test_indexes_answer_queries_after_add(tmp_path):
+    memory = _manager(tmp_path)
+    _populate(memory)
+
+    def queries(**filters):
+        return [entry["query"] for entry in memory.query_memory(**filters)]
+
+    assert queries(role="العمال") == ["مكافأة نهاية الخدمة", "الإجازة المرضية"]
+    assert queries(tag="الاجور") == ["مكافأة نهاية الخدمة", "الإجازة المرضية"]
+    assert queries(since="2025-02-01 00:00:00") == ["ساعات العمل الإضافي", "الإجازة المرضية"]
+    assert queries(until="2025-02-10 08:30:00") == ["مكافأة نهاية الخدمة", "الإجازة المرضية"]
+    assert queries(role="العمال", tag="الأجور", since="2025-02-01 00:00:00") == ["الإجازة المرضية"]
+    # مطابقة جزئية عبر فهرس المقاطع: جزء من كلمة، وجزء أقصر من طول المقطع
+    assert queries(keyword="مرض") == ["الإجازة المرضية"]
+    assert queries(keyword="اضا") == ["ساعات العمل الإضافي"]
+    assert queries(keyword="نهاية الخدمة") == ["مكافأة نهاية الخدمة"]
+    assert queries(keyword="الخدمة نهاية") == []
+
+
+def test_update_removes_stale_index_entries(tmp_path):
+    memory = _manager(tmp_path)
+    _populate(memory)
+    memory.update_interaction(1, role="العمال", query="العمل في يوم الجمعة", context_tags=["عطل"])
+
+    assert memory.query_memory(keyword="اضا") == []
+    assert memory.query_memory(tag="ساعات") == []
+    assert "أصحاب العمل" not in memory._role_index
+    assert not any("اضاف" in token for token in memory._token_index)
+    assert not any(token.startswith("اضاف") for tokens in memory._gram_index.values() for token in tokens)
+    assert [entry["query"] for entry in memory.query_memory(keyword="الجمعة")] == ["العمل في يوم الجمعة"]
+    assert len(memory._time_index) == 3
+
+    fresh = _manager(tmp_path)
+    assert _index_state(memory) == _index_state(fresh)
+
+
+def test_indexes_match_after_compaction(tmp_path):
+    memory = _manager(tmp_path, compact_every=4)
+    _populate(memory)
+    memory.add_interaction("العمال", "فصل تعسفي", "تعويض", context_tags=["الفصل"])
+    assert _journal_lines(memory) != [] and _snapshot(memory)["seq"] == 4
+
+    reopened = _manager(tmp_path, compact_every=4)
+    assert _index_state(reopened) == _index_state(memory)
+    reopened._rebuild_indexes()
+    assert _index_state(reopened) == _index_state(memory)
+    assert [entry["query"] for entry in reopened.query_memory(keyword="تعسف", tag="الفصل")] == ["فصل تعسفي"]
+
+    reopened.clear_memory()
+    assert _index_state(reopened) == ({}, {}, {}, {}, [])
+    assert reopened.query_memory(role="العمال") == []
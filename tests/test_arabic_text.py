@@ -0,0 +1,43 @@
+import pytest
+
+from helpers.arabic_text import light_stem, normalize_arabic, search_text, tokenize
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("الإجَازَةُ", "الاجازه"),
+    ("أجر آخر إنهاء", "اجر اخر انهاء"),
+    ("مستشفى مسؤول قائمة", "مستشفي مسوول قايمه"),
+    ("العـــمل", "العمل"),
+    ("٢٠٢٤", "2024"),
+    ("Overtime", "overtime"),
+    (None, ""),
+])
+def test_normalize_arabic(text, expected):
+    assert normalize_arabic(text) == expected
+
+
+@pytest.mark.parametrize("token, expected", [
+    ("الاجازه", "اجاز"),
+    ("والعمال", "عمال"),
+    ("للعامل", "عامل"),
+    ("اجازات", "اجاز"),
+    ("موظفين", "موظف"),
+    ("عمالها", "عمال"),
+    # لا يُجذَّع ما يترك جذرًا أقصر من اللازم
+    ("ال", "ال"),
+    ("في", "في"),
+    ("اجر", "اجر"),
+])
+def test_light_stem(token, expected):
+    assert light_stem(token) == expected
+
+
+def test_tokenize_unifies_inflections():
+    assert tokenize("الإجازات") == tokenize("إجازة") == ["اجاز"]
+    assert tokenize("مكافأة نهاية الخدمة، للعاملين!") == ["مكافا", "نها", "خدم", "عامل"]
+
+
+def test_search_text_supports_substring_matching():
+    haystack = search_text("طلب مكافأة نهاية الخدمة للعاملين")
+    assert search_text("مكافاه نهايه الخدمه") in haystack
+    assert search_text("") == ""
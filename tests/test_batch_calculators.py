@@ -0,0 +1,158 @@
+from itertools import product
+
+import pandas as pd
+import pytest
+
+from helpers import batch_calculators as batch
+from helpers import calculators
+from helpers.batch_calculators import AMOUNT_COLUMNS
+
+SALARIES = [0, 260, 437.5, 1000, 3333]
+
+# (الدالة المفردة، الدالة الدفعية، شبكة القيم لكل معامل، معاملات ثابتة للدالة المفردة فقط)
+CASES = [
+    (
+        calculators.calculate_end_of_service,
+        batch.calculate_end_of_service_batch,
+        {
+            "basic_salary": SALARIES,
+            "years": [0, 1, 2, 3, 4, 5, 7, 12],
+            "months": [0, 5, 11],
+            "termination_type": ["استقالة", "إنهاء من صاحب العمل", "إنهاء لأسباب تأديبية"],
+        },
+        {"service_type": ""},
+    ),
+    (
+        calculators.calculate_overtime,
+        batch.calculate_overtime_batch,
+        {
+            "basic_salary": SALARIES,
+            "overtime_hours": [0, 3, 17.5],
+            "overtime_days": [0, 2],
+            "work_day_type": ["عادي", "جمعة أو عطلة رسمية", "ليلي"],
+        },
+        {},
+    ),
+    (
+        calculators.calculate_annual_leave,
+        batch.calculate_annual_leave_batch,
+        {"basic_salary": SALARIES, "service_years": [0, 4, 5, 20], "requested_days": [0, 10, 14, 21, 30]},
+        {},
+    ),
+    (
+        calculators.calculate_sick_leave,
+        batch.calculate_sick_leave_batch,
+        {"basic_salary": SALARIES, "sick_days": [0, 7, 14, 15, 21, 28, 29, 60], "in_hospital": [False, True]},
+        {},
+    ),
+    (
+        calculators.calculate_notice_period,
+        batch.calculate_notice_period_batch,
+        {"basic_salary": SALARIES, "notice_days": [0, 30, 60], "actual_work_days": [0, 12, 30, 45]},
+        {},
+    ),
+    (calculators.calculate_maternity_leave, batch.calculate_maternity_leave_batch, {"basic_salary": SALARIES}, {}),
+    (calculators.calculate_paternity_leave, batch.calculate_paternity_leave_batch, {"basic_salary": SALARIES}, {}),
+    (
+        calculators.calculate_haj_leave,
+        batch.calculate_haj_leave_batch,
+        {"basic_salary": SALARIES, "service_years": [0, 4, 5, 9]},
+        {},
+    ),
+    (
+        calculators.calculate_work_injury_compensation,
+        batch.calculate_work_injury_compensation_batch,
+        {
+            "basic_salary": SALARIES + [100000],
+            "injury_type": ["وفاة", "عجز كلي دائم", "عجز جزئي دائم", "عجز مؤقت", "أخرى"],
+            "disability_percentage": [0, 35],
+            "medical_expenses": [0, 250.75],
+            "treatment_days": [0, 40],
+        },
+        {},
+    ),
+    (
+        calculators.calculate_social_security_contributions,
+        batch.calculate_social_security_contributions_batch,
+        {
+            "employee_salary": SALARIES + [7000],
+            "employee_rate": [7.5],
+            "employer_rate": [14.25],
+            "salary_ceiling": [3000, 5000],
+            "calculation_type": ["شهري", "ربع سنوي", "سنوي", "أخرى"],
+        },
+        {},
+    ),
+    (
+        calculators.calculate_unfair_dismissal_compensation,
+        batch.calculate_unfair_dismissal_compensation_batch,
+        {
+            "basic_salary": SALARIES,
+            "service_years": [0, 3, 10, 40],
+            "actual_notice": ["نعم", "لا", "جزئي"],
+            "dismissal_reason": list(batch.UNFAIR_DISMISSAL_REASONS) + ["أخرى"],
+        },
+        {},
+    ),
+    (
+        calculators.calculate_salary_delay_compensation,
+        batch.calculate_salary_delay_compensation_batch,
+        {"basic_salary": SALARIES, "delay_months": [0, 1, 4], "delay_days": [0, 9]},
+        {},
+    ),
+    (
+        calculators.calculate_accrued_leave_compensation,
+        batch.calculate_accrued_leave_compensation_batch,
+        {"basic_salary": SALARIES, "accrued_leave": [0, 3, 14.5], "service_years": [1]},
+        {},
+    ),
+    (
+        calculators.calculate_social_security_penalty,
+        batch.calculate_social_security_penalty_batch,
+        {"basic_salary": SALARIES, "unregistered_months": [0, 1, 18]},
+        {},
+    ),
+]
+
+
+def _grid(params):
+    return pd.DataFrame([dict(zip(params, values)) for values in product(*params.values())])
+
+
+@pytest.mark.parametrize(
+    "scalar, vectorized, params, extra",
+    CASES,
+    ids=[case[1].__name__ for case in CASES],
+)
+def test_batch_matches_scalar_exactly(scalar, vectorized, params, extra):
+    grid = _grid(params)
+    if "termination_type" in grid:
+        grid["last_salary"] = grid["basic_salary"]
+    result = vectorized(grid)
+
+    assert list(result.index) == list(grid.index)
+    for position, row in enumerate(grid.to_dict("records")):
+        expected = scalar(**row, **extra)
+        for column in AMOUNT_COLUMNS:
+            if column in expected:
+                assert result[column].iloc[position] == expected[column], (column, row)
+
+
+def test_batch_keeps_the_frame_index():
+    grid = pd.DataFrame({"basic_salary": [300.0, 450.0]}, index=["E7", "E9"])
+    result = batch.calculate_maternity_leave_batch(grid)
+    assert list(result.index) == ["E7", "E9"]
+
+
+def test_missing_required_column_is_reported():
+    with pytest.raises(KeyError):
+        batch.calculate_notice_period_batch(pd.DataFrame({"basic_salary": [300.0]}))
+
+
+def test_format_batch_result_formats_only_amount_columns():
+    result = batch.calculate_notice_period_batch(
+        pd.DataFrame({"basic_salary": [3000.0], "notice_days": [30], "actual_work_days": [0]})
+    )
+    formatted = batch.format_batch_result(result)
+    assert formatted["amount"].iloc[0] == "3,000 دينار"
+    assert formatted["unpaid_notice_days"].iloc[0] == result["unpaid_notice_days"].iloc[0]
@@ -0,0 +1,26 @@
+import datetime
+
+import pandas as pd
+
+from helpers.legal_rules import DEFAULT_RULES, RULES_SHEET, build_rule_set
+
+
+def test_workbook_without_rules_keeps_default_source():
+    workbook = {"Calculation_Inputs": pd.DataFrame({"Field_Name": ["LastMonthlyWage"], "Value": [None]})}
+    rule_set = build_rule_set(workbook)
+    assert rule_set.source == "defaults"
+    assert rule_set.version == build_rule_set().version
+
+
+def test_rules_sheet_adds_dated_versions():
+    workbook = {RULES_SHEET: pd.DataFrame({
+        "Rule_Key": ["MIN_WAGE", "UNKNOWN_KEY", "MIN_WAGE"],
+        "Rule_Value": [310, 1, "غير رقمي"],
+        "Effective_From": ["2030-01-01", None, "2031-01-01"],
+    })}
+    rule_set = build_rule_set(workbook)
+    assert rule_set.source == "workbook"
+    assert rule_set.value("MIN_WAGE", datetime.date(2029, 12, 31)) == DEFAULT_RULES["MIN_WAGE"][0]
+    assert rule_set.value("MIN_WAGE", datetime.date(2030, 1, 1)) == 310
+    assert rule_set.value("MIN_WAGE", datetime.date(2032, 1, 1)) == 310
+    assert "UNKNOWN_KEY" not in rule_set
@@ -0,0 +1,84 @@
+import io
+
+import pandas as pd
+import pytest
+
+from helpers.calculators import calculate_accrued_leave_compensation, calculate_end_of_service
+from helpers.liability_report import (
+    REPORT_COLUMNS,
+    UNKNOWN_TERMINATION_TYPE,
+    build_liability_report,
+    summary_frame,
+)
+
+ROSTER = """employee_id,salary,years,months,termination_type,accrued_leave
+E1,500,5,0,استقالة,10
+E2,420,4,6,إنهاء من صاحب العمل,0
+E3,300,2,3,إنهاء لأسباب تأديبية,5
+E4,600,6,0,,3
+E5,,3,0,استقالة,0
+E6,350,1,0,إنهاء من صاحب العمل,14
+"""
+
+
+def _build(text, chunksize=2, scenario=None):
+    output = io.StringIO()
+    summary = build_liability_report(io.StringIO(text), "roster.csv", output, scenario=scenario, chunksize=chunksize)
+    output.seek(0)
+    return summary, pd.read_csv(output)
+
+
+def _expected_liability(row):
+    eos = calculate_end_of_service(row.salary, row.years, row.months, row.termination_type, row.salary, "")["amount"]
+    leave = calculate_accrued_leave_compensation(row.salary, row.accrued_leave, row.years)["amount"]
+    return eos + leave
+
+
+def test_totals_match_scalar_calculators():
+    summary, report = _build(ROSTER)
+    valid = pd.read_csv(io.StringIO(ROSTER)).dropna(subset=["salary"]).fillna({"termination_type": ""})
+    expected = sum(_expected_liability(row) for row in valid.itertuples())
+
+    assert summary["employees"] == 5
+    assert summary["invalid_rows"] == 1
+    assert summary["total_liability"] == pytest.approx(expected)
+    assert report["total_liability"].sum() == pytest.approx(expected, abs=0.01)
+    assert summary["total_liability"] == pytest.approx(summary["end_of_service"] + summary["leave_compensation"])
+
+
+def test_termination_types_add_up_to_total():
+    summary, _ = _build(ROSTER)
+    buckets = summary["by_termination_type"]
+    assert buckets[UNKNOWN_TERMINATION_TYPE]["employees"] == 1
+    assert sum(bucket["employees"] for bucket in buckets.values()) == summary["employees"]
+    assert sum(bucket["total_liability"] for bucket in buckets.values()) == pytest.approx(summary["total_liability"])
+    assert summary_frame(summary).iloc[-1]["عدد الموظفين"] == summary["employees"]
+
+
+def test_chunk_size_does_not_change_result():
+    single, single_report = _build(ROSTER, chunksize=100)
+    chunked, chunked_report = _build(ROSTER, chunksize=1)
+    assert single == chunked
+    pd.testing.assert_frame_equal(single_report, chunked_report)
+
+
+def test_scenario_overrides_roster_column():
+    summary, report = _build(ROSTER, scenario="إنهاء لأسباب تأديبية")
+    assert set(report["termination_type"]) == {"إنهاء لأسباب تأديبية"}
+    assert summary["end_of_service"] == 0
+
+
+@pytest.mark.parametrize("text", [
+    "employee_id,salary,years,months,termination_type,accrued_leave\n",
+    "employee_id,salary,years,months,termination_type,accrued_leave\nE1,,,0,استقالة,0\n",
+])
+def test_empty_roster_writes_header(text):
+    summary, report = _build(text)
+    assert summary["employees"] == 0
+    assert list(report.columns) == REPORT_COLUMNS
+    assert report.empty
+
+
+def test_missing_columns_raise_value_error():
+    with pytest.raises(ValueError):
+        _build("employee_id,salary\nE1,500\n")
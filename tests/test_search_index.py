@@ -0,0 +1,73 @@
+import pandas as pd
+import pytest
+
+from helpers.mini_ai_smart import MiniLegalAI
+from helpers.search_index import BM25Index
+
+
+def _index(*texts):
+    index = BM25Index()
+    for number, text in enumerate(texts):
+        index.add(f"doc{number}", text)
+    return index
+
+
+def test_more_query_terms_rank_higher():
+    index = _index(
+        "مكافأة نهاية الخدمة للعامل",
+        "الإجازة السنوية للعامل",
+        "مكافأة العامل",
+        "ساعات العمل الإضافي",
+    )
+    ranked = [document for document, _ in index.search("مكافأة نهاية الخدمة")]
+    assert ranked[:2] == ["doc0", "doc2"]
+    assert "doc3" not in ranked
+
+
+def test_rare_terms_outweigh_common_ones():
+    index = _index("العامل العامل الأجر", "العامل الحج", "العامل الأجر", "العامل الأجر")
+    (best, best_score), (_, next_score) = index.search("العامل الحج", top_n=2)
+    assert best == "doc1"
+    assert best_score > next_score
+
+
+def test_shorter_documents_win_on_equal_term_frequency():
+    index = _index("إجازة الأمومة", "إجازة الأمومة وفق أحكام قانون العمل الأردني وتعديلاته اللاحقة", "أجر")
+    assert [document for document, _ in index.search("الأمومة")] == ["doc0", "doc1"]
+
+
+def test_query_matches_across_spelling_variants():
+    index = _index("الإجَازَةُ المَرَضِيَّة", "العمل الإضافي")
+    assert index.search("اجازه مرضيه")[0][0] == "doc0"
+
+
+def test_top_n_and_empty_results():
+    index = _index(*[f"عامل رقم {number}" for number in range(10)])
+    assert len(index.search("عامل", top_n=3)) == 3
+    assert index.search("مستشفى") == []
+    assert BM25Index().search("عامل") == []
+
+
+def test_scores_follow_bm25_formula():
+    index = _index("عامل عامل", "موظف")
+    k1, b = index.k1, index.b
+    idf = index._idf("عامل")
+    norm = k1 * (1 - b + b * 2 / 1.5)
+    assert index.search("عامل")[0][1] == pytest.approx(idf * 2 * (k1 + 1) / (2 + norm))
+
+
+def test_build_search_index_from_sheets():
+    ai = MiniLegalAI.__new__(MiniLegalAI)
+    data = {
+        "Knowledge_Bank": pd.DataFrame({
+            "Full_Text_AR": ["يستحق العامل مكافأة نهاية الخدمة", None],
+            "Title_AR": ["نهاية الخدمة", None],
+            "Notes": ["مثال", None],
+            "Article_Number": ["32", None],
+        }),
+        "Unrelated": pd.DataFrame({"text": ["مكافأة"]}),
+    }
+    index = ai.build_search_index(data)
+    assert len(index) == 1
+    (document, _), = index.search("المكافأة")
+    assert document == {"text": "يستحق العامل مكافأة نهاية الخدمة", "example": "مثال", "reference": "32"}
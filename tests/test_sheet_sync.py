@@ -0,0 +1,153 @@
+import hashlib
+import http.server
+import json
+import threading
+
+import pandas as pd
+import pytest
+
+from helpers import sheet_sync
+from helpers.sheet_sync import SheetSyncWorker, sheet_sources
+from helpers.workbook_store import SyncedWorkbook, WorkbookStore
+
+
+class _SheetServer(http.server.ThreadingHTTPServer):
+    """خادم CSV محلي بدل Google Sheets: ETag لكل محتوى و304 للطلبات المشروطة"""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SheetHandler)
+        self.sheets = {}
+        self.requests = []
+        self.truncate = False
+
+    def url(self, gid):
+        return f"http://127.0.0.1:{self.server_address[1]}/export?format=csv&gid={gid}"
+
+
+class _SheetHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        gid = self.path.rsplit("gid=", 1)[-1]
+        body = self.server.sheets[gid].encode("utf-8")
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        self.server.requests.append((gid, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "text/csv")
+        # استجابة ناقصة: الطول المعلن أكبر من المحتوى المرسل
+        self.send_header("Content-Length", str(len(body) + (100 if self.server.truncate else 0)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = _SheetServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def worker(server, tmp_path):
+    server.sheets["7"] = "Rule_Key,Rule_Value\nminimum_wage,290\n"
+    sources = {"Calculation_Inputs": server.url("7")}
+    return SheetSyncWorker(sources, cache_dir=str(tmp_path / "sync"), timeout=5)
+
+
+def test_sheet_sources_uses_explicit_gids():
+    sources = sheet_sources("https://example.test/export?format=csv", {"Legal_Calculators": 12})
+    assert sources == {"Legal_Calculators": "https://example.test/export?format=csv&gid=12"}
+
+
+def test_conditional_fetch_returns_304_when_unchanged(server, worker):
+    assert worker.sync_once() == ["Calculation_Inputs"]
+    assert worker.get("Calculation_Inputs")["Rule_Value"].tolist() == [290]
+    assert worker.version == 1
+
+    assert worker.sync_once() == []
+    assert worker.version == 1
+    # الطلب الثاني يحمل ETag الأول ويتلقى 304
+    assert server.requests[0][1] is None
+    assert server.requests[1][1] is not None
+
+    server.sheets["7"] = "Rule_Key,Rule_Value\nminimum_wage,300\n"
+    assert worker.sync_once() == ["Calculation_Inputs"]
+    assert worker.get("Calculation_Inputs")["Rule_Value"].tolist() == [300]
+    assert worker.version == 2
+
+
+def test_synced_copy_survives_restart(server, worker, tmp_path):
+    worker.sync_once()
+    restarted = SheetSyncWorker(worker.sources, cache_dir=worker.cache_dir, timeout=5)
+    assert restarted.get("Calculation_Inputs")["Rule_Value"].tolist() == [290]
+    # الحالة المحفوظة تجعل أول طلب بعد إعادة التشغيل مشروطًا
+    assert restarted.sync_once() == []
+    assert server.requests[-1][1] is not None
+
+
+def test_incomplete_read_keeps_current_copy(server, worker):
+    worker.sync_once()
+    server.sheets["7"] = "Rule_Key,Rule_Value\nminimum_wage,300\n"
+    server.truncate = True
+    assert worker.sync_once() == []
+    assert "IncompleteRead" in worker.last_error
+    assert worker.get("Calculation_Inputs")["Rule_Value"].tolist() == [290]
+
+
+def test_unreachable_source_keeps_current_copy(worker, server):
+    worker.sync_once()
+    worker.sources["Calculation_Inputs"] = "http://127.0.0.1:9/export?format=csv&gid=7"
+    worker.timeout = 1
+    assert worker.sync_once() == []
+    assert worker.last_error is not None
+    assert worker.get("Calculation_Inputs") is not None
+
+
+def test_only_mapped_sheets_override_the_workbook(server, worker, tmp_path):
+    path = tmp_path / "book.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"sync_id": [1]}).to_excel(writer, sheet_name="Dashboard_Summary", index=False)
+        pd.DataFrame({"Rule_Key": ["minimum_wage"], "Rule_Value": [260]}).to_excel(
+            writer, sheet_name="Calculation_Inputs", index=False
+        )
+
+    store = WorkbookStore()
+    key = store.acquire(str(path), cache_dir=str(tmp_path / "cache"), lazy=False)
+    store.attach_source(str(path), worker)
+    assert store.workbook(key)["Calculation_Inputs"]["Rule_Value"].tolist() == [260]
+
+    worker.sync_once()
+    workbook = store.workbook(key)
+    assert isinstance(workbook, SyncedWorkbook)
+    assert workbook["Calculation_Inputs"]["Rule_Value"].tolist() == [290]
+    # الورقة الأولى غير مربوطة فلا تُستبدل
+    assert workbook["Dashboard_Summary"]["sync_id"].tolist() == [1]
+    assert store.version(key)[1] == worker.version
+
+
+def test_auto_sync_requires_explicit_sheet_mapping(tmp_path, monkeypatch):
+    monkeypatch.setattr(sheet_sync, "_worker", None)
+    config = tmp_path / "config.json"
+    sources = {"WORKBOOK_PATH": "book.xlsx", "SHEET_URL": "http://127.0.0.1:9/export", "AUTO_SYNC": True}
+    config.write_text(json.dumps({"DATA_SOURCES": sources}), encoding="utf-8")
+    assert sheet_sync.start_auto_sync(str(config)) is None
+
+    sources["AUTO_SYNC"] = False
+    sources["SYNC_SHEETS"] = {"Calculation_Inputs": 7}
+    config.write_text(json.dumps({"DATA_SOURCES": sources}), encoding="utf-8")
+    assert sheet_sync.start_auto_sync(str(config)) is None
+
+
+def test_shipped_config_does_not_sync():
+    with open(sheet_sync.CONFIG_PATH, encoding="utf-8") as f:
+        sources = json.load(f)["DATA_SOURCES"]
+    assert not sources["AUTO_SYNC"]
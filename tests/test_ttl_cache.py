@@ -0,0 +1,100 @@
+import os
+
+import pandas as pd
+
+from helpers.data_loader import DataLoader
+from helpers.ttl_cache import TTLCache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=4, ttl=10, timer=timer)
+    cache.set("a", 1)
+    timer.now += 9.9
+    assert cache.get("a") == 1
+    assert "a" in cache
+    timer.now += 0.1
+    assert "a" not in cache
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 0
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"], stats["evictions"]) == (1, 1, 1, 0)
+
+
+def test_setting_again_restarts_the_ttl():
+    timer = FakeTimer()
+    cache = TTLCache(ttl=10, timer=timer)
+    cache.set("a", 1)
+    timer.now += 8
+    cache.set("a", 2)
+    timer.now += 8
+    assert cache.get("a") == 2
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = TTLCache(maxsize=3, ttl=None)
+    for key in "abc":
+        cache.set(key, key.upper())
+    assert cache.get("a") == "A"
+    cache.set("d", "D")
+    cache.set("e", "E")
+    # b ثم c هما الأقدم استخدامًا بعد قراءة a
+    assert [key for key in "abcde" if key in cache] == ["a", "d", "e"]
+    stats = cache.stats()
+    assert stats["size"] == 3
+    assert stats["evictions"] == 2
+    assert stats["expirations"] == 0
+
+
+def test_get_or_load_counts_hits_and_misses():
+    cache = TTLCache(maxsize=2, ttl=None)
+    loads = []
+
+    def load():
+        loads.append(1)
+        return len(loads)
+
+    assert [cache.get_or_load("k", load) for _ in range(4)] == [1, 1, 1, 1]
+    assert len(loads) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (3, 1)
+    assert stats["hit_rate"] == 0.75
+    assert TTLCache().stats()["hit_rate"] == 0.0
+
+
+def test_pop_and_clear():
+    cache = TTLCache(ttl=None)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_data_loader_caches_csv_until_the_file_changes(tmp_path):
+    path = str(tmp_path / "roster.csv")
+    pd.DataFrame({"salary": [500, 600]}).to_csv(path, index=False)
+    loader = DataLoader()
+    before = loader.cache_stats()
+
+    first = loader.load_csv(path)
+    assert loader.load_csv(path) is first
+    stats = loader.cache_stats()
+    assert stats["misses"] - before["misses"] == 1
+    assert stats["hits"] - before["hits"] == 1
+
+    pd.DataFrame({"salary": [700]}).to_csv(path, index=False)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert loader.load_csv(path)["salary"].tolist() == [700]
+    assert loader.cache_stats()["misses"] - before["misses"] == 2
+    assert loader.load_csv(str(tmp_path / "missing.csv")) is None
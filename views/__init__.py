@@ -0,0 +1,13 @@
+# ==========================
+# 🗂️ صفحات التطبيق - تُستورد عند أول انتقال إليها فقط
+# ==========================
+# معرّف الصفحة -> (الوحدة, دالة العرض)
+PAGE_MODULES = {
+    "home": ("views.home", "show_home_page"),
+    "workers": ("views.workers", "show_workers_section"),
+    "employers": ("views.employers", "show_employers_section"),
+    "researchers": ("views.researchers", "show_researchers_section"),
+    "calculators": ("views.calculators", "show_calculators_section"),
+    "complaints": ("views.complaints", "show_complaints_section"),
+    "settings": ("views.settings", "show_settings_section"),
+}
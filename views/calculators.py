@@ -0,0 +1,671 @@
+import time
+
+import streamlit as st
+
+from helpers.calculators import (
+    calculate_end_of_service,
+    calculate_overtime,
+    calculate_annual_leave,
+    calculate_sick_leave,
+    calculate_notice_period,
+    calculate_maternity_leave,
+    calculate_paternity_leave,
+    calculate_haj_leave,
+    calculate_work_injury_compensation,
+    calculate_social_security_contributions,
+    calculate_unfair_dismissal_compensation,
+    calculate_salary_delay_compensation,
+    calculate_accrued_leave_compensation,
+    calculate_social_security_penalty,
+)
+from helpers.legal_rules import UNFAIR_DISMISSAL_REASONS, current_rules
+from helpers.scenario_sweep import (
+    AXIS_LABELS,
+    MAX_GRID_CELLS,
+    SWEEP_CALCULATORS,
+    grid_size,
+    run_sweep,
+    sweep_pivot,
+)
+from views.common import show_breadcrumbs
+
+# ==========================
+# 🧮 قسم الحاسبات - النظام المتكامل والمصحح 100%
+# ==========================
+def show_calculators_section():
+    show_breadcrumbs("🧮 الحاسبات")
+    
+    st.markdown("""
+    <div class="header-with-logo">
+        <div class="logo-container">
+            <div class="logo-text">🧮</div>
+        </div>
+        <div style="text-align: center;">
+            <h1>🧮 الحاسبات القانونية المتكاملة</h1>
+            <p>أدوات حسابية دقيقة لحساب جميع المستحقات القانونية وفق قانون العمل الأردني</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.info("""
+    **💡 دليل الاستخدام:** 
+    اختر الآلة الحاسبة المناسبة من القائمة أدناه، ثم أدخل البيانات المطلوبة للحصول على نتائج دقيقة.
+    جميع الحسابات مبنية على قانون العمل الأردني رقم 8 لسنة 1996 وتعديلاته.
+    """)
+
+    # تبويبات الحاسبات الرئيسية: كل حاسبة fragment مستقل، فتغيير أي عنصر فيها
+    # يعيد رسمها وحدها دون الشريط الجانبي وباقي التبويبات
+    calculator_tabs = st.tabs([
+        "💰 نهاية الخدمة",
+        "⏰ العمل والإجازات", 
+        "🏥 تعويضات الإصابات",
+        "📊 الضمان الاجتماعي",
+        "⚖️ التعويضات القانونية",
+        "📈 حاسبات متقدمة",
+        "🔀 مقارنة السيناريوهات"
+    ])
+
+    with calculator_tabs[0]:
+        show_end_of_service_calculator()
+
+    with calculator_tabs[1]:
+        show_work_leave_calculator()
+
+    with calculator_tabs[2]:
+        show_compensation_calculator()
+
+    with calculator_tabs[3]:
+        show_social_security_calculator()
+
+    with calculator_tabs[4]:
+        show_legal_compensation_calculator()
+
+    with calculator_tabs[5]:
+        show_advanced_calculators()
+
+    with calculator_tabs[6]:
+        show_scenario_sweep()
+
+@st.fragment
+def show_end_of_service_calculator():
+    """حاسبة مستحقات نهاية الخدمة - مصححة حسب القانون"""
+    rules = current_rules()
+    st.markdown("#### 💰 حاسبة مكافأة نهاية الخدمة")
+    
+    with st.form("end_service_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            basic_salary = st.number_input(
+                "الراتب الأساسي (دينار)",
+                min_value=float(rules["MIN_WAGE"]),
+                value=500.0,
+                help=f"الحد الأدنى للأجور {rules['MIN_WAGE']:g} دينار"
+            )
+            years = st.number_input(
+                "سنوات الخدمة", 
+                min_value=0, 
+                max_value=50,
+                value=5
+            )
+            
+        with col2:
+            months = st.number_input(
+                "أشهر الخدمة",
+                min_value=0,
+                max_value=11,
+                value=0
+            )
+            termination_type = st.selectbox(
+                "نوع إنهاء الخدمة",
+                ["استقالة", "إنهاء من صاحب العمل", "إنهاء لأسباب تأديبية"],
+                help="اختر سبب إنهاء عقد العمل"
+            )
+        
+        # إضافة معلومات إضافية للحساب الدقيق
+        st.markdown("##### 📝 معلومات إضافية")
+        col3, col4 = st.columns(2)
+        with col3:
+            last_salary = st.number_input(
+                "آخر راتب تقاضاه العامل (دينار)",
+                min_value=float(rules["MIN_WAGE"]),
+                value=500.0,
+                help="لحساب المكافأة بدقة"
+            )
+        
+        with col4:
+            service_type = st.selectbox(
+                "نوع الخدمة",
+                ["مستمرة", "متقطعة"],
+                help="الخدمة المستمرة تحتسب بكامل المدة"
+            )
+        
+        if st.form_submit_button("🧮 احسب المكافأة", use_container_width=True):
+            result = calculate_end_of_service(basic_salary, years, months, termination_type, last_salary, service_type, rules=rules)
+            display_service_result(result)
+
+@st.fragment
+def show_work_leave_calculator():
+    """حاسبة العمل والإجازات - مصححة حسب القانون"""
+    rules = current_rules()
+    st.markdown("#### ⏰ حاسبة العمل والإجازات")
+    
+    calc_type = st.selectbox(
+        "اختر نوع الحساب",
+        [
+            "بدل العمل الإضافي",
+            "الإجازة السنوية", 
+            "الإجازة المرضية",
+            "بدل الإشعار",
+            "إجازة الأمومة",
+            "إجازة الأبوة",
+            "إجازة الحج"
+        ],
+        key="work_leave_type"
+    )
+    
+    with st.form("work_leave_form"):
+        basic_salary = st.number_input(
+            "الراتب الأساسي (دينار)",
+            min_value=float(rules["MIN_WAGE"]),
+            value=500.0,
+            key="wl_salary"
+        )
+        
+        if calc_type == "بدل العمل الإضافي":
+            col1, col2 = st.columns(2)
+            with col1:
+                overtime_hours = st.number_input("ساعات العمل الإضافي", min_value=0, value=8)
+                overtime_days = st.number_input("أيام العمل الإضافي", min_value=0, value=1)
+            with col2:
+                work_day_type = st.selectbox("نوع اليوم", ["عادي", "جمعة أو عطلة رسمية", "عمل ليلي"])
+            
+        elif calc_type == "الإجازة السنوية":
+            col1, col2 = st.columns(2)
+            with col1:
+                service_years = st.number_input("سنوات الخدمة", min_value=0, value=3)
+            with col2:
+                requested_days = st.number_input("أيام الإجازة المطلوبة", min_value=1, value=14)
+            
+        elif calc_type == "الإجازة المرضية":
+            col1, col2 = st.columns(2)
+            with col1:
+                sick_days = st.number_input("أيام الإجازة المرضية", min_value=0, value=10)
+            with col2:
+                in_hospital = st.checkbox("المريض مقيم في المستشفى")
+            
+        elif calc_type == "بدل الإشعار":
+            notice_days = st.number_input("أيام الإشعار المستحقة", min_value=0, value=30)
+            actual_work_days = st.number_input("الأيام الفعلية المتبقية", min_value=0, value=15)
+        
+        elif calc_type == "إجازة الأمومة":
+            st.info("إجازة الأمومة 10 أسابيع مدفوعة الأجر حسب المادة 70")
+            
+        elif calc_type == "إجازة الأبوة":
+            st.info("إجازة الأبوة 3 أيام مدفوعة الأجر حسب المادة 71")
+            
+        elif calc_type == "إجازة الحج":
+            service_years_haj = st.number_input("سنوات الخدمة للحج", min_value=5, value=5)
+            st.info("إجازة الحج 14 يوم بشرط 5 سنوات خدمة مستمرة (المادة 71)")
+        
+        if st.form_submit_button("🧮 احسب", use_container_width=True):
+            if calc_type == "بدل العمل الإضافي":
+                result = calculate_overtime(basic_salary, overtime_hours, overtime_days, work_day_type, rules=rules)
+            elif calc_type == "الإجازة السنوية":
+                result = calculate_annual_leave(basic_salary, service_years, requested_days, rules=rules)
+            elif calc_type == "الإجازة المرضية":
+                result = calculate_sick_leave(basic_salary, sick_days, in_hospital, rules=rules)
+            elif calc_type == "بدل الإشعار":
+                result = calculate_notice_period(basic_salary, notice_days, actual_work_days, rules=rules)
+            elif calc_type == "إجازة الأمومة":
+                result = calculate_maternity_leave(basic_salary, rules=rules)
+            elif calc_type == "إجازة الأبوة":
+                result = calculate_paternity_leave(basic_salary, rules=rules)
+            elif calc_type == "إجازة الحج":
+                result = calculate_haj_leave(basic_salary, service_years_haj, rules=rules)
+            
+            display_work_leave_result(result, calc_type)
+
+@st.fragment
+def show_compensation_calculator():
+    """حاسبة تعويضات الإصابات - مصححة حسب القانون"""
+    rules = current_rules()
+    st.markdown("#### 🏥 حاسبة تعويضات إصابات العمل")
+    
+    with st.form("compensation_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            basic_salary = st.number_input(
+                "الراتب الأساسي (دينار)",
+                min_value=float(rules["MIN_WAGE"]),
+                value=500.0,
+                key="comp_salary"
+            )
+            
+            injury_type = st.selectbox(
+                "نوع الإصابة",
+                [
+                    "وفاة",
+                    "عجز كلي دائم", 
+                    "عجز جزئي دائم",
+                    "عجز مؤقت"
+                ],
+                key="comp_type"
+            )
+        
+        with col2:
+            if injury_type == "عجز جزئي دائم":
+                disability_percentage = st.slider(
+                    "نسبة العجز (%)",
+                    min_value=1,
+                    max_value=99,
+                    value=30,
+                    key="comp_percent"
+                )
+            else:
+                disability_percentage = 0
+                
+            medical_expenses = st.number_input(
+                "المصاريف الطبية (دينار)",
+                min_value=0.0,
+                value=0.0,
+                key="comp_medical",
+                help="التكاليف الطبية الموثقة لإصابة العمل"
+            )
+            
+            # إضافة معلومات عن مدة العلاج للعجز المؤقت
+            if injury_type == "عجز مؤقت":
+                treatment_days = st.number_input(
+                    "أيام العلاج",
+                    min_value=1,
+                    value=30,
+                    key="comp_treatment_days"
+                )
+            else:
+                treatment_days = 0
+        
+        if st.form_submit_button("🧮 احسب التعويض", use_container_width=True):
+            result = calculate_work_injury_compensation(
+                basic_salary, injury_type, disability_percentage, medical_expenses, treatment_days, rules=rules
+            )
+            display_compensation_result(result)
+
+@st.fragment
+def show_social_security_calculator():
+    """حاسبة الضمان الاجتماعي - مصححة"""
+    rules = current_rules()
+    st.markdown("#### 🏛️ حاسبة اشتراك الضمان الاجتماعي")
+    
+    with st.form("social_security_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            basic_salary = st.number_input(
+                "الراتب الأساسي (دينار)",
+                min_value=float(rules["MIN_WAGE"]),
+                value=500.0,
+                key="ss_salary"
+            )
+            
+            # نسب الاشتراك حسب قانون الضمان الاجتماعي
+            st.info("نسب الاشتراك الافتراضية حسب قانون الضمان الاجتماعي")
+            
+        with col2:
+            employee_rate = st.number_input(
+                "نسبة اشتراك الموظف (%)",
+                min_value=0.0,
+                max_value=20.0,
+                value=float(rules["SS_EMPLOYEE_RATE"]),
+                key="ss_employee",
+                help=f"النسبة القانونية {rules['SS_EMPLOYEE_RATE']:g}%"
+            )
+            
+            employer_rate = st.number_input(
+                "نسبة اشتراك صاحب العمل (%)",
+                min_value=0.0,
+                max_value=20.0,
+                value=float(rules["SS_EMPLOYER_RATE"]),
+                key="ss_employer",
+                help=f"النسبة القانونية {rules['SS_EMPLOYER_RATE']:g}%"
+            )
+        
+        salary_ceiling = st.number_input(
+            "الحد الأقصى للأجر الخاضع (دينار)",
+            min_value=500.0,
+            value=float(rules["SS_SALARY_CEILING"]),
+            key="ss_ceiling",
+            help="الحد الأقصى للأجور الخاضعة للاشتراك"
+        )
+        
+        calculation_type = st.selectbox(
+            "فترة الحساب",
+            ["شهري", "ربع سنوي", "سنوي"],
+            key="ss_period"
+        )
+        
+        if st.form_submit_button("🧮 احسب الاشتراكات", use_container_width=True):
+            result = calculate_social_security_contributions(basic_salary, employee_rate, employer_rate, salary_ceiling, calculation_type)
+            display_social_security_result(result)
+
+def display_social_security_result(result):
+    """عرض نتيجة حساب الضمان الاجتماعي"""
+    st.success(f"""
+    ## 🏛️ نتائج حساب الضمان الاجتماعي
+    
+    **الاشتراكات الشهرية:**
+    - **نسبة الموظف:** {result['employee_share']:,.0f} دينار
+    - **نسبة صاحب العمل:** {result['employer_share']:,.0f} دينار
+    - **الإجمالي:** {result['total_share']:,.0f} دينار
+    """)
+    
+    with st.expander("📊 التفاصيل الكاملة", expanded=True):
+        for key, value in result['details'].items():
+            st.write(f"**{key}:** {value}")
+
+@st.fragment
+def show_legal_compensation_calculator():
+    """حاسبة التعويضات القانونية - مصححة"""
+    rules = current_rules()
+    st.markdown("#### ⚖️ حاسبة التعويضات القانونية")
+    
+    comp_type = st.selectbox(
+        "نوع التعويض",
+        [
+            "تعويض الفصل التعسفي",
+            "تعويض تأخر صرف الرواتب", 
+            "تعويض الإجازات المستحقة",
+            "تعويض عدم تسجيل في الضمان"
+        ],
+        key="legal_comp_type"
+    )
+    
+    with st.form("legal_comp_form"):
+        basic_salary = st.number_input(
+            "الراتب الأساسي (دينار)",
+            min_value=float(rules["MIN_WAGE"]),
+            value=500.0,
+            key="legal_comp_salary"
+        )
+        
+        if comp_type == "تعويض الفصل التعسفي":
+            col1, col2 = st.columns(2)
+            with col1:
+                service_years = st.number_input("سنوات الخدمة", min_value=0, value=3)
+                actual_notice = st.selectbox("تم إعطاء الإشعار؟", ["نعم", "لا", "جزئي"])
+            with col2:
+                dismissal_reason = st.selectbox("سبب الفصل", [
+                    "تعسفي بدون سبب مبرر", 
+                    "لأسباب اقتصادية غير حقيقية",
+                    "لأسباب تأديبية غير مثبتة",
+                    "تمييز على أساس الجنس أو الدين"
+                ])
+            
+        elif comp_type == "تعويض تأخر صرف الرواتب":
+            col1, col2 = st.columns(2)
+            with col1:
+                delay_months = st.number_input("أشهر التأخير", min_value=0, value=2)
+            with col2:
+                delay_days = st.number_input("أيام التأخير الإضافية", min_value=0, value=15)
+            
+        elif comp_type == "تعويض الإجازات المستحقة":
+            col1, col2 = st.columns(2)
+            with col1:
+                accrued_leave = st.number_input("أيام الإجازة المستحقة", min_value=0, value=21)
+            with col2:
+                service_years_leave = st.number_input("سنوات الخدمة للإجازة", min_value=0, value=3)
+            
+        elif comp_type == "تعويض عدم تسجيل في الضمان":
+            col1, col2 = st.columns(2)
+            with col1:
+                unregistered_months = st.number_input("أشهر عدم التسجيل", min_value=1, value=12)
+            with col2:
+                st.info("التعويض يشمل الاشتراكات المتأخرة والغرامات")
+        
+        if st.form_submit_button("🧮 احسب التعويض", use_container_width=True):
+            if comp_type == "تعويض الفصل التعسفي":
+                result = calculate_unfair_dismissal_compensation(basic_salary, service_years, actual_notice, dismissal_reason, rules=rules)
+            elif comp_type == "تعويض تأخر صرف الرواتب":
+                result = calculate_salary_delay_compensation(basic_salary, delay_months, delay_days, rules=rules)
+            elif comp_type == "تعويض الإجازات المستحقة":
+                result = calculate_accrued_leave_compensation(basic_salary, accrued_leave, service_years_leave, rules=rules)
+            elif comp_type == "تعويض عدم تسجيل في الضمان":
+                result = calculate_social_security_penalty(basic_salary, unregistered_months, rules=rules)
+            
+            display_legal_compensation_result(result, comp_type)
+
+@st.fragment
+def show_advanced_calculators():
+    """الحاسبات المتقدمة - محسنة"""
+    st.markdown("#### 📈 الحاسبات المتقدمة")
+    
+    advanced_calcs = {
+        "📊 حاسبة التدرج الوظيفي": {
+            "description": "حساب العلاوات والترقيات والزيادات الدورية",
+            "features": ["حساب العلاوات الدورية", "توقع الترقيات", "تحليل المسار الوظيفي"]
+        },
+        "💰 حاسبة التقييم المالي الشامل": {
+            "description": "تقييم جميع المستحقات والتعويضات المالية",
+            "features": ["تحليل المستحقات", "تقييم التعويضات", "محاكاة السيناريوهات"]
+        },
+        "📈 حاسبة المؤشرات الاقتصادية": {
+            "description": "ربط المستحقات بمؤشرات التضخم والتغيرات الاقتصادية",
+            "features": ["مراعاة التضخم", "تحليل القوة الشرائية", "تحديث القيم"]
+        },
+        "🏦 حاسبة التخطيط المالي للتقاعد": {
+            "description": "تخطيط المعاش والتقاعد والمدخرات طويلة الأجل",
+            "features": ["تخطيط التقاعد", "حساب المدخرات", "تحليل الاستثمارات"]
+        }
+    }
+    
+    for calc_name, calc_info in advanced_calcs.items():
+        with st.expander(f"{calc_name}", expanded=False):
+            st.write(f"**الوصف:** {calc_info['description']}")
+            st.write("**المميزات:**")
+            for feature in calc_info['features']:
+                st.write(f"• {feature}")
+            
+            # نموذج مبسط للحاسبة المتقدمة
+            if calc_name == "📊 حاسبة التدرج الوظيفي":
+                with st.form(f"advanced_{calc_name}"):
+                    current_salary = st.number_input("الراتب الحالي (دينار)", value=500)
+                    years_experience = st.number_input("سنوات الخبرة", value=3)
+                    performance_rating = st.selectbox("تقييم الأداء", ["ممتاز", "جيد جداً", "جيد", "مقبول"])
+                    
+                    if st.form_submit_button("تقدير التطور الوظيفي"):
+                        # حساب تقديري مبسط
+                        growth_factors = {"ممتاز": 1.15, "جيد جداً": 1.10, "جيد": 1.05, "مقبول": 1.02}
+                        growth_factor = growth_factors.get(performance_rating, 1.0)
+                        estimated_salary = current_salary * (growth_factor ** years_experience)
+                        
+                        st.success(f"**الراتب المتوقع:** {estimated_salary:,.0f} دينار")
+                        st.info(f"معدل النمو السنوي: {((growth_factor-1)*100):.1f}%")
+            
+            st.info("🛠️ هذه الآلة الحاسبة قيد التطوير وسيتم إضافتها بشكل كامل في التحديثات القادمة")
+
+def _parse_numbers(text):
+    """قائمة أرقام فريدة من نص مفصول بفواصل (تُتجاهل القيم غير الرقمية)"""
+    values = []
+    for part in text.replace("،", ",").split(","):
+        try:
+            value = float(part)
+        except ValueError:
+            continue
+        values.append(int(value) if value.is_integer() else value)
+    return list(dict.fromkeys(values))
+
+def _flatten_columns(pivot):
+    """أعمدة الجدول المحوري متعددة المستويات كنصوص مفردة للعرض"""
+    flat = pivot.copy()
+    flat.columns = [
+        " | ".join(str(part) for part in column) if isinstance(column, tuple) else str(column)
+        for column in pivot.columns
+    ]
+    flat.index.name = AXIS_LABELS.get(pivot.index.name, pivot.index.name)
+    return flat
+
+@st.fragment
+def show_scenario_sweep():
+    """مقارنة السيناريوهات - حساب شبكة كاملة من المدخلات دفعة واحدة"""
+    st.markdown("#### 🔀 مقارنة السيناريوهات (ماذا لو؟)")
+    st.caption("قارن عدة رواتب ومدد خدمة وأسباب إنهاء في جدول واحد بدلًا من تكرار الحساب لكل حالة")
+    
+    calculator = st.selectbox(
+        "الحاسبة",
+        list(SWEEP_CALCULATORS),
+        format_func=lambda key: SWEEP_CALCULATORS[key]["label"],
+        key="sweep_calculator"
+    )
+    salaries = _parse_numbers(st.text_input(
+        "قيم الراتب (دينار، مفصولة بفواصل)",
+        value="400, 500, 750, 1000, 1500",
+        key="sweep_salaries"
+    ))
+    
+    fixed = {}
+    col1, col2 = st.columns(2)
+    if calculator == "end_of_service":
+        with col1:
+            years = st.slider("مدى سنوات الخدمة", 1, 40, (1, 15), key="sweep_eos_years")
+        with col2:
+            termination_types = st.multiselect(
+                "نوع إنهاء الخدمة",
+                ["استقالة", "إنهاء من صاحب العمل", "إنهاء لأسباب تأديبية"],
+                default=["استقالة", "إنهاء من صاحب العمل"],
+                key="sweep_eos_termination"
+            )
+        axes = {
+            "last_salary": salaries,
+            "years": list(range(years[0], years[1] + 1)),
+            "termination_type": termination_types,
+        }
+    elif calculator == "unfair_dismissal":
+        with col1:
+            years = st.slider("مدى سنوات الخدمة", 0, 30, (1, 10), key="sweep_unfair_years")
+            notices = st.multiselect("تم إعطاء الإشعار؟", ["نعم", "لا", "جزئي"], default=["نعم", "لا"], key="sweep_unfair_notice")
+        with col2:
+            reasons = st.multiselect(
+                "سبب الفصل",
+                list(UNFAIR_DISMISSAL_REASONS),
+                default=list(UNFAIR_DISMISSAL_REASONS)[:1],
+                key="sweep_unfair_reason"
+            )
+        axes = {
+            "basic_salary": salaries,
+            "service_years": list(range(years[0], years[1] + 1)),
+            "actual_notice": notices,
+            "dismissal_reason": reasons,
+        }
+    else:
+        with col1:
+            injury_types = st.multiselect(
+                "نوع الإصابة",
+                ["وفاة", "عجز كلي دائم", "عجز جزئي دائم", "عجز مؤقت"],
+                default=["وفاة", "عجز جزئي دائم", "عجز مؤقت"],
+                key="sweep_injury_type"
+            )
+            percentages = st.slider("مدى نسبة العجز (%)", 10, 100, (10, 50), step=10, key="sweep_injury_percent")
+        with col2:
+            fixed["treatment_days"] = st.number_input("أيام العلاج (للعجز المؤقت)", min_value=0, value=30, key="sweep_injury_days")
+            fixed["medical_expenses"] = st.number_input("المصاريف الطبية (دينار)", min_value=0.0, value=0.0, key="sweep_injury_medical")
+        axes = {
+            "basic_salary": salaries,
+            "injury_type": injury_types,
+            "disability_percentage": list(range(percentages[0], percentages[1] + 1, 10)),
+        }
+    
+    if not all(axes.values()):
+        st.warning("⚠️ اختر قيمة واحدة على الأقل لكل محور")
+        return
+    size = grid_size(axes)
+    if size > MAX_GRID_CELLS:
+        st.error(f"⚠️ عدد السيناريوهات {size:,} يتجاوز الحد الأقصى {MAX_GRID_CELLS:,}")
+        return
+    
+    col3, col4 = st.columns(2)
+    with col3:
+        rows = st.selectbox(
+            "محور الصفوف",
+            list(axes),
+            index=1,
+            format_func=lambda axis: AXIS_LABELS.get(axis, axis),
+            key=f"sweep_rows_{calculator}"
+        )
+    with col4:
+        view = st.radio("طريقة العرض", ["جدول محوري", "خريطة حرارية"], horizontal=True, key="sweep_view")
+    
+    start = time.perf_counter()
+    sweep = run_sweep(calculator, axes, fixed)
+    pivot = _flatten_columns(sweep_pivot(sweep, rows, SWEEP_CALCULATORS[calculator]["value"]))
+    elapsed = time.perf_counter() - start
+    st.caption(f"⚡ {size:,} سيناريو في {elapsed * 1000:,.0f} ms — المبالغ بالدينار")
+    
+    if view == "جدول محوري":
+        st.dataframe(pivot.round(0), width="stretch")
+    else:
+        import plotly.express as px  # يُحمَّل فقط عند طلب الخريطة الحرارية
+        
+        figure = px.imshow(
+            pivot.to_numpy(),
+            x=list(pivot.columns),
+            y=[str(value) for value in pivot.index],
+            labels={"y": pivot.index.name, "color": "دينار"},
+            aspect="auto",
+            color_continuous_scale="Blues",
+            text_auto=".0f" if pivot.size <= 400 else False
+        )
+        st.plotly_chart(figure, width="stretch")
+    
+    st.download_button(
+        "📥 تحميل كل السيناريوهات (CSV)",
+        sweep.rename(columns=AXIS_LABELS).to_csv(index=False).encode("utf-8-sig"),
+        file_name=f"scenarios_{calculator}.csv",
+        mime="text/csv",
+        key="sweep_download"
+    )
+
+def display_service_result(result):
+    """عرض نتيجة مكافأة نهاية الخدمة"""
+    st.success(f"## 💰 المبلغ المستحق: {result['amount']:,.0f} دينار")
+    st.info(f"**الشرح:** {result['explanation']}")
+    
+    with st.expander("📊 التفاصيل الكاملة", expanded=True):
+        for key, value in result['details'].items():
+            st.write(f"**{key}:** {value}")
+
+def display_work_leave_result(result, calc_type):
+    """عرض نتيجة العمل والإجازات"""
+    st.success(f"## 💰 {calc_type}: {result['amount']:,.0f} دينار")
+    st.info(f"**الشرح:** {result['explanation']}")
+    
+    with st.expander("📊 التفاصيل الكاملة", expanded=True):
+        for key, value in result['details'].items():
+            st.write(f"**{key}:** {value}")
+
+def display_compensation_result(result):
+    """عرض نتيجة التعويض"""
+    st.success("## 🏥 نتائج حساب التعويض")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("التعويض الأساسي", f"{result['compensation']:,.0f} دينار")
+    with col2:
+        st.metric("المصاريف الطبية", f"{result['medical_expenses']:,.0f} دينار")
+    with col3:
+        st.metric("الإجمالي المستحق", f"{result['total_amount']:,.0f} دينار")
+    
+    st.info(f"**الشرح:** {result['explanation']}")
+    
+    with st.expander("📊 التفاصيل الكاملة", expanded=True):
+        for key, value in result['details'].items():
+            st.write(f"**{key}:** {value}")
+
+def display_legal_compensation_result(result, comp_type):
+    """عرض نتيجة التعويضات القانونية"""
+    st.success(f"## ⚖️ {comp_type}: {result['amount']:,.0f} دينار")
+    st.info(f"**الشرح:** {result['explanation']}")
+    
+    with st.expander("📊 التفاصيل الكاملة", expanded=True):
+        for key, value in result['details'].items():
+            st.write(f"**{key}:** {value}")
@@ -0,0 +1,49 @@
+import streamlit as st
+
+# ==========================
+# 🎯 إعدادات التطبيق الأساسية
+# ==========================
+def setup_application():
+    env_config = {
+        "APP_INFO": {
+            "APP_NAME": "SiraWork سيرا",
+            "VERSION": "v2.0.0",
+            "DESCRIPTION": "منصة توعوية تعليمية لمحاكاة القضايا العمالية"
+        },
+        "FOOTER": {
+            "TEXT": "© 2025 SiraWork سيرا — جميع الحقوق محفوظة"
+        }
+    }
+    return env_config
+
+config = setup_application()
+
+# ==========================
+# 🧮 دالة عرض المسارات
+# ==========================
+def show_breadcrumbs(section_name):
+    st.markdown(f"""
+    <div style='background: #f8f9fa; padding: 10px; border-radius: 5px; margin-bottom: 20px;'>
+        <strong>المسار:</strong> الرئيسية ▶ {section_name}
+    </div>
+    """, unsafe_allow_html=True)
+
+def show_metric_card(title, value, subtitle, icon="📊"):
+    """عرض بطاقة متركس بتصميم مظلم"""
+    st.markdown(f"""
+    <div style='
+        background: linear-gradient(135deg, #1E293B 0%, #334155 100%);
+        padding: 1.5rem;
+        border-radius: 12px;
+        border: 1px solid #475569;
+        text-align: center;
+        margin: 0.5rem;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.2);
+        transition: all 0.3s ease;
+    '>
+        <div style='font-size: 2rem; margin-bottom: 0.5rem;'>{icon}</div>
+        <h3 style='margin: 0; color: #F8FAFC; font-size: 1.8rem;'>{value}</h3>
+        <p style='margin: 0.5rem 0 0 0; color: #94A3B8; font-size: 0.9rem;'>{title}</p>
+        <p style='margin: 0.2rem 0 0 0; color: #CBD5E1; font-size: 0.8rem;'>{subtitle}</p>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,145 @@
+import streamlit as st
+
+from views.common import show_breadcrumbs
+
+# ==========================
+# 📝 قسم الشكاوى والمنازعات - النسخة المختصرة
+# ==========================
+def show_complaints_section():
+    show_breadcrumbs("📝 الشكاوى والمنازعات")
+    
+    st.markdown("""
+    <div class="header-with-logo">
+        <div class="logo-container">
+            <div class="logo-text">⚖️</div>
+        </div>
+        <div style="text-align: center;">
+            <h1>⚖️ الشكاوى والمنازعات العمالية</h1>
+            <p>إرشادات عامة حول آلية التعامل مع المنازعات العمالية</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.warning("""
+    **📢 تنويه هام:** 
+    هذه المنصة تقدم معلومات توعوية عامة فقط ولا تغني عن استشارة المختصين القانونيين.
+    يوصى بشدة بالاستعانة بمحامٍ مختص في النزاعات العمالية لتقييم كل حالة على حدة.
+    """)
+
+    # تبويب واحد فقط
+    st.markdown("## 🔍 دليل الجهات المختصة والاستشارة القانونية")
+
+    st.markdown("""
+    <div class="section-card">
+        <h3>👨‍⚖️ لماذا تحتاج إلى محامٍ مختص؟</h3>
+        <p>كل حالة نزاع عمالي لها ظروفها الخاصة وتفاصيلها التي تؤثر على النتيجة النهائية. 
+        المحامي المختص يمكنه:</p>
+        <ul>
+        <li>تحليل وقائع حالتك بدقة</li>
+        <li>تقييم المستندات والأدلة المتاحة</li>
+        <li>تحديد الحقوق والمستحقات القانونية</li>
+        <li>تمثيلك أمام الجهات المختصة</li>
+        <li>ضمان الالتزام بالمواعيد والإجراءات القانونية</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("## 🌐 الجهات الرسمية المختصة")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="feature-item">
+            <h4>🏛️ وزارة العمل الأردنية</h4>
+            <p><strong>الاختصاص:</strong> تلقي الشكاوى العمالية - التوفيق بين الأطراف</p>
+            <p><strong>الاتصال:</strong> هاتف: 065303200</p>
+            <p><strong>الموقع:</strong> <a href="https://www.mol.gov.jo" target="_blank">mol.gov.jo</a></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class="feature-item">
+            <h4>🛡️ منصة حمايتي</h4>
+            <p><strong>الاختصاص:</strong> المنصة الإلكترونية لتلقي الشكاوى العمالية</p>
+            <p><strong>الميزة:</strong> متابعة إلكترونية للشكاوى</p>
+            <p><strong>الرابط:</strong> <a href="https://hemayeh.jo" target="_blank">hemayeh.jo</a></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="feature-item">
+            <h4>📊 مؤسسة الضمان الاجتماعي</h4>
+            <p><strong>الاختصاص:</strong> منازعات الضمان والتأمينات الاجتماعية</p>
+            <p><strong>الاتصال:</strong> هاتف: 065850111</p>
+            <p><strong>الموقع:</strong> <a href="https://www.ssc.gov.jo" target="_blank">ssc.gov.jo</a></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class="feature-item">
+            <h4>⚖️ المحاكم النظامية</h4>
+            <p><strong>الاختصاص:</strong> الفصل في المنازعات التي لم تحل بالطرق الودية</p>
+            <p><strong>الإجراء:</strong> عبر مكاتب المحامين المختصين</p>
+            <p><strong>الإشراف:</strong> وزارة العدل</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("## 📞 معلومات الاتصال المباشرة")
+
+    contact_info = [
+        {
+            "الجهة": "مديرية العمل في عمان",
+            "الهاتف": "065303200",
+            "العنوان": "عمان - شارع الملكة رانيا العبدالله"
+        },
+        {
+            "الجهة": "مركز خدمة المجتمع - وزارة العمل",
+            "الهاتف": "065303135",
+            "العنوان": "عمان - مبنى الوزارة الرئيسي"
+        },
+        {
+            "الجهة": "شكاوى الضمان الاجتماعي",
+            "الهاتف": "065850111", 
+            "العنوان": "عمان - خلدا"
+        }
+    ]
+
+    for contact in contact_info:
+        st.markdown(f"""
+        <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 10px 0; border-right: 4px solid #2563EB;">
+            <h4 style="margin: 0 0 8px 0;">{contact['الجهة']}</h4>
+            <p style="margin: 4px 0;"><strong>📞 الهاتف:</strong> {contact['الهاتف']}</p>
+            <p style="margin: 4px 0;"><strong>📍 العنوان:</strong> {contact['العنوان']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("## 💼 نصائح عامة للتعامل مع المنازعات")
+
+    tips = [
+        "احتفظ بنسخ من جميع المستندات المتعلقة بالعمل (عقود، كشوف رواتب، مراسلات)",
+        "قم بتوثيق التواريخ والأحداث المهمة كتابياً",
+        "تجنب التوقيع على أي مستندات دون فهم محتواها بشكل كامل", 
+        "استشر محامياً مختصاً قبل اتخاذ أي إجراءات قانونية",
+        "احرص على الالتزام بالمواعيد القانونية المحددة"
+    ]
+
+    for tip in tips:
+        st.write(f"• {tip}")
+
+    st.markdown("""
+    <div class="warning-box">
+        <h4>⚖️ تنويه نهائي هام</h4>
+        <p><strong>هذه المنصة توعوية تعليمية فقط ولا تقدم أي خدمات استشارية قانونية.</strong></p>
+        <p>يجب استشارة محامٍ مختص في النزاعات العمالية للنظر في تفاصيل حالتك الخاصة وتقديم المشورة القانونية المناسبة.</p>
+        <p>كل حالة لها ظروفها الخاصة وتستدعي تقييماً قانونياً متخصصاً.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---")
+    st.markdown("""
+    <div style="text-align: center; color: #666; font-size: 0.9rem;">
+        <p>🔍 للمزيد من المعلومات، يرجى التواصل مباشرة مع الجهات المختصة أو الاستعانة بمحامٍ متخصص</p>
+    </div>
+    """, unsafe_allow_html=True)
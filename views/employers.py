@@ -0,0 +1,1261 @@
+import os
+import tempfile
+import weakref
+from datetime import datetime
+
+import streamlit as st
+
+from helpers.liability_report import build_liability_report, summary_frame
+
+# ==========================
+# 👔 قسم أصحاب العمل - الإصدار الشامل والموسع 2024
+# ==========================
+def show_employers_section():
+    """القسم الرئيسي لأصحاب العمل"""
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>👔 منصة أصحاب العمل - النظام القانوني المتكامل</h1>
+        <p>دليل شامل لجميع الالتزامات القانونية وأدوات الإدارة وفق قانون العمل الأردني وتعديلاته</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # شريط التحديثات الهام - محدث بالحد الأدنى الجديد
+    st.info("""
+    **📢 أحدث التعديلات التشريعية 2024:** 
+    - **الحد الأدنى للأجور:** 290 دينار لجميع العاملين
+    - **فترة التجربة:** 3 أشهر كحد أقصى (المادة 25)
+    - **إجازة الأمومة:** 10 أسابيع مدفوعة الأجر (المادة 69)
+    - **العمل المرن:** تنظيم جديد للعمل عن بُعد والعمل المرن
+    """)
+
+    # تبويبات رئيسية
+    employer_tabs = st.tabs([
+        "⚖️ الالتزامات القانونية", 
+        "📝 إدارة العقود",
+        "📑 التزامات نهاية الخدمة",
+        "🛡️ إدارة المخاطر"
+    ])
+
+    with employer_tabs[0]:
+        show_legal_obligations_section()
+
+    with employer_tabs[1]:
+        show_contracts_management_section()
+
+    with employer_tabs[2]:
+        show_liability_report_section()
+
+    with employer_tabs[3]:
+        show_risk_management_section()
+
+# ==========================
+# 📑 تقرير التزامات نهاية الخدمة
+# ==========================
+def show_liability_report_section():
+    """تقرير التزامات نهاية الخدمة والإجازات لكامل كشف الموظفين"""
+    st.markdown("#### 📑 تقرير التزامات نهاية الخدمة")
+
+    st.info("""
+    **📤 ارفع كشف الموظفين (CSV أو Excel)** بالأعمدة التالية:
+    `salary` (الراتب)، `years` (سنوات الخدمة)، `months` (أشهر الخدمة)،
+    `termination_type` (نوع إنهاء الخدمة)، و`accrued_leave` (أيام الإجازة المستحقة) و`employee_id` اختياريًا.
+    تتم معالجة الكشف على دفعات، لذا يمكن رفع كشوف بمئات آلاف الموظفين.
+    """)
+
+    roster_file = st.file_uploader("كشف الموظفين", type=["csv", "xlsx"], key="liability_roster")
+    scenario = st.selectbox(
+        "سيناريو إنهاء الخدمة",
+        ["حسب الكشف", "استقالة", "إنهاء من صاحب العمل", "إنهاء لأسباب تأديبية"],
+        key="liability_scenario",
+        help="اختر سيناريو موحدًا لكل الموظفين أو استخدم عمود termination_type من الكشف"
+    )
+
+    if roster_file is not None and st.button("🧮 إعداد التقرير", use_container_width=True, key="liability_run"):
+        previous = st.session_state.get("liability_report")
+        if previous:
+            previous["file"].remove()
+        st.session_state.liability_report = None
+
+        report_file = tempfile.NamedTemporaryFile("w", suffix=".csv", encoding="utf-8-sig", newline="", delete=False)
+        summary = None
+        try:
+            with report_file:
+                summary = build_liability_report(
+                    roster_file,
+                    roster_file.name,
+                    report_file,
+                    scenario=None if scenario == "حسب الكشف" else scenario
+                )
+        except ValueError as e:
+            st.error(f"❌ {e}")
+            return
+        finally:
+            # أي فشل (وليس ValueError فقط) يحذف الملف المؤقت
+            if summary is None:
+                _remove_report(report_file.name)
+        st.session_state.liability_report = {"summary": summary, "file": _ReportFile(report_file.name)}
+
+    report = st.session_state.get("liability_report")
+    if not report:
+        return
+
+    summary = report["summary"]
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("عدد الموظفين", f"{summary['employees']:,}")
+    with col2:
+        st.metric("مكافآت نهاية الخدمة", f"{summary['end_of_service']:,.0f} دينار")
+    with col3:
+        st.metric("إجمالي الالتزام", f"{summary['total_liability']:,.0f} دينار")
+
+    if summary["invalid_rows"]:
+        st.warning(f"⚠️ تم تجاهل {summary['invalid_rows']:,} صف لعدم صلاحية الراتب أو سنوات الخدمة")
+
+    summary_table = summary_frame(summary)
+    st.dataframe(summary_table, use_container_width=True, hide_index=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        # يُقرأ الملف عند الضغط على الزر فقط، لا في كل إعادة تشغيل للصفحة
+        st.download_button(
+            "⬇️ تنزيل التقرير التفصيلي (CSV)",
+            report["file"].read,
+            file_name="end_of_service_liability.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+    with col2:
+        st.download_button(
+            "⬇️ تنزيل الملخص (CSV)",
+            summary_table.to_csv(index=False).encode("utf-8-sig"),
+            file_name="end_of_service_liability_summary.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+
+def _remove_report(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class _ReportFile:
+    """
+    ملف تقرير الالتزامات المؤقت المحفوظ في الجلسة.
+
+    يُحذف عند استبداله بتقرير جديد، أو عند انتهاء الجلسة وتحرير حالتها، أو عند إغلاق التطبيق.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._finalizer = weakref.finalize(self, _remove_report, path)
+
+    def read(self):
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def remove(self):
+        self._finalizer()
+
+# ==========================
+# ⚖️ قسم الالتزامات القانونية
+# ==========================
+def show_legal_obligations_section():
+    """عرض الالتزامات القانونية الشاملة"""
+    
+    st.markdown("#### ⚖️ الالتزامات القانونية الشاملة")
+    
+    st.markdown("""
+    <div class="section-card">
+        <h4>📋 ملخص الالتزامات الأساسية</h4>
+        <p>يتحمل أصحاب العمل مسؤوليات قانونية شاملة تجاه العاملين وفقاً لأحدث تعديلات قانون العمل الأردني. 
+        يشمل هذا القسم جميع المواد القانونية المتعلقة بأصحاب العمل بشكل كامل ومفصل.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # تبويبات موسعة تشمل جميع المجالات
+    obligations_tabs = st.tabs([
+        "📋 التوظيف والتعاقد", 
+        "💰 الأجور والمستحقات",
+        "🛡️ السلامة والصحة", 
+        "📄 إنهاء الخدمة",
+        "👥 الفئات الخاصة",
+        "🏢 الإدارة والسجلات"
+    ])
+    
+    with obligations_tabs[0]:
+        show_employment_contract_obligations()
+    
+    with obligations_tabs[1]:
+        show_salary_benefits_obligations()
+    
+    with obligations_tabs[2]:
+        show_safety_health_obligations()
+    
+    with obligations_tabs[3]:
+        show_termination_obligations()
+    
+    with obligations_tabs[4]:
+        show_special_categories_obligations()
+    
+    with obligations_tabs[5]:
+        show_administration_records_obligations()
+
+# ==========================
+# 📋 التوظيف والتعاقد
+# ==========================
+def show_employment_contract_obligations():
+    """عرض التزامات التوظيف والتعاقد"""
+    
+    st.markdown("##### 📋 التزامات التوظيف والتعاقد")
+    
+    obligations = [
+        {
+            "icon": "📝",
+            "title": "عقد العمل المكتوب - المادة 13",
+            "details": "إبرام عقد عمل مكتوب قبل بدء الخدمة يتضمن جميع البيانات الأساسية للطرفين وبنود العمل",
+            "deadline": "قبل بدء العمل",
+            "law": "المادة 13",
+            "penalty": "بطلان الشروط + غرامة إدارية"
+        },
+        {
+            "icon": "⏱️",
+            "title": "فترة التجربة - المادة 25",
+            "details": "أقصى مدة للتجربة 3 أشهر فقط، ولا يجوز تجديدها، وإذا استمر العمل بعدها يصبح العقد غير محدد المدة",
+            "deadline": "3 أشهر كحد أقصى",
+            "law": "المادة 25",
+            "penalty": "بطلان فترة التجربة + اعتبار العقد دائم"
+        },
+        {
+            "icon": "📋",
+            "title": "اللوائح الداخلية - المادة 27",
+            "details": "إعداد لوائح تنظيم العمل ونشرها في مكان واضح تشمل نظام العمل وساعاته وفترات الراحة وإجراءات السلامة",
+            "deadline": "قبل التشغيل",
+            "law": "المادة 27",
+            "penalty": "غرامة 300 دينار"
+        }
+    ]
+    
+    for obligation in obligations:
+        with st.expander(f"{obligation['icon']} {obligation['title']}", expanded=True):
+            col1, col2 = st.columns([3, 2])
+            with col1:
+                st.write(f"**📋 التفاصيل:** {obligation['details']}")
+                st.write(f"**⏰ المهلة:** {obligation['deadline']}")
+            with col2:
+                st.write(f"**⚖️ القانون:** {obligation['law']}")
+                st.write(f"**💰 العقوبة:** {obligation['penalty']}")
+
+# ==========================
+# 💰 الأجور والمستحقات - محدث بالحد الأدنى الجديد
+# ==========================
+def show_salary_benefits_obligations():
+    """عرض التزامات الأجور والمستحقات"""
+    
+    st.markdown("##### 💰 التزامات الأجور والمستحقات")
+    
+    obligations = [
+        {
+            "icon": "💰",
+            "title": "الحد الأدنى للأجور - المادة 35",
+            "details": "290 دينار شهرياً لجميع العاملين في القطاع الخاص وفق أحدث تعديلات 2024",
+            "deadline": "مستمر",
+            "law": "المادة 35",
+            "penalty": "غرامة 500-1000 دينار + دفع الفرق للعامل"
+        },
+        {
+            "icon": "📅",
+            "title": "موعد صرف الأجور - المادة 55",
+            "details": "صرف الأجر في موعد لا يتجاوز اليوم السابع من الشهر التالي، وفي حالة التأخر يستحق العامل فوائد تأخير 8% سنوياً",
+            "deadline": "7 أيام من نهاية الشهر",
+            "law": "المادة 55",
+            "penalty": "غرامة + فوائد تأخير 8%"
+        },
+        {
+            "icon": "⏰",
+            "title": "العمل الإضافي - المادة 42",
+            "details": "125% من الأجر الأساسي للساعات النهارية، 150% للساعات الليلية وأيام العطل، حد أقصى ساعتين يومياً و10 ساعات أسبوعياً",
+            "deadline": "مع صرف الراتب",
+            "law": "المادة 42",
+            "penalty": "غرامة + دفع مستحقات العمل الإضافي"
+        }
+    ]
+    
+    for obligation in obligations:
+        with st.expander(f"{obligation['icon']} {obligation['title']}"):
+            col1, col2 = st.columns([3, 2])
+            with col1:
+                st.write(f"**📋 التفاصيل:** {obligation['details']}")
+                st.write(f"**⏰ المهلة:** {obligation['deadline']}")
+            with col2:
+                st.write(f"**⚖️ القانون:** {obligation['law']}")
+                st.write(f"**💰 العقوبة:** {obligation['penalty']}")
+
+# ==========================
+# 🛡️ السلامة والصحة
+# ==========================
+def show_safety_health_obligations():
+    """عرض التزامات السلامة والصحة المهنية"""
+    
+    st.markdown("##### 🛡️ التزامات السلامة والصحة المهنية")
+    
+    obligations = [
+        {
+            "icon": "🛡️",
+            "title": "وسائل الحماية الشخصية - المادة 78",
+            "details": "توفير وسائل الحماية الشخصية والوقاية للعاملين وإرشادهم لطريقة استعمالها والمحافظة عليها",
+            "deadline": "مستمر",
+            "law": "المادة 78",
+            "penalty": "غرامة + إغلاق المنشأة"
+        },
+        {
+            "icon": "🏥",
+            "title": "التدابير الوقائية - المادة 79",
+            "details": "اتخاذ التدابير اللازمة لحماية العاملين من الأخطار والأمراض المهنية وتوفير وسائل الإسعافات الأولية",
+            "deadline": "مستمر",
+            "law": "المادة 79",
+            "penalty": "غرامة + مسؤولية مدنية"
+        }
+    ]
+    
+    for obligation in obligations:
+        with st.expander(f"{obligation['icon']} {obligation['title']}"):
+            col1, col2 = st.columns([3, 2])
+            with col1:
+                st.write(f"**📋 التفاصيل:** {obligation['details']}")
+                st.write(f"**⏰ المهلة:** {obligation['deadline']}")
+            with col2:
+                st.write(f"**⚖️ القانون:** {obligation['law']}")
+                st.write(f"**💰 العقوبة:** {obligation['penalty']}")
+
+# ==========================
+# 📄 إنهاء الخدمة
+# ==========================
+def show_termination_obligations():
+    """عرض التزامات إنهاء الخدمة"""
+    
+    st.markdown("##### 📄 التزامات إنهاء الخدمة")
+    
+    obligations = [
+        {
+            "icon": "💼",
+            "title": "مكافأة نهاية الخدمة - المادة 38",
+            "details": "احتساب مكافأة نهاية الخدمة حسب مدة الخدمة وسبب الإنهاء (أجر شهرين عن كل سنة خدمة)",
+            "deadline": "عند إنهاء الخدمة",
+            "law": "المادة 38",
+            "penalty": "تعويض مضاعف + غرامات إدارية"
+        },
+        {
+            "icon": "⚖️",
+            "title": "الفصل التأديبي - المادة 29",
+            "details": "قصر الفصل على حالات محددة (تزوير، إخلال جسيم بالالتزامات، خسارة مادية جسيمة، إفشاء الأسرار)",
+            "deadline": "مستمر",
+            "law": "المادة 29",
+            "penalty": "بطلان الفصل إن لم تستوف الشروط"
+        }
+    ]
+    
+    for obligation in obligations:
+        with st.expander(f"{obligation['icon']} {obligation['title']}"):
+            col1, col2 = st.columns([3, 2])
+            with col1:
+                st.write(f"**📋 التفاصيل:** {obligation['details']}")
+                st.write(f"**⏰ المهلة:** {obligation['deadline']}")
+            with col2:
+                st.write(f"**⚖️ القانون:** {obligation['law']}")
+                st.write(f"**💰 العقوبة:** {obligation['penalty']}")
+
+# ==========================
+# 👥 الفئات الخاصة
+# ==========================
+def show_special_categories_obligations():
+    """عرض التزامات تجاه الفئات الخاصة"""
+    
+    st.markdown("##### 👥 التزامات تجاه الفئات الخاصة")
+    
+    obligations = [
+        {
+            "icon": "🤰",
+            "title": "إجازة الأمومة - المادة 69",
+            "details": "10 أسابيع مدفوعة الأجر (70 يوماً)، 6 أسابيع بعد الولادة إلزامياً، تشمل جميع العاملات بغض النظر عن مدة الخدمة",
+            "deadline": "قبل وبعد الولادة",
+            "law": "المادة 69",
+            "penalty": "غرامة + تعويض"
+        },
+        {
+            "icon": "👶",
+            "title": "ساعات الرضاعة - المادة 71",
+            "details": "ساعة رضاعة يومياً لمدة عام من تاريخ الولادة، يمكن تجميع هذه الساعات وتحويلها لإجازة",
+            "deadline": "سنة من الولادة",
+            "law": "المادة 71",
+            "penalty": "غرامة إدارية"
+        }
+    ]
+    
+    for obligation in obligations:
+        with st.expander(f"{obligation['icon']} {obligation['title']}"):
+            col1, col2 = st.columns([3, 2])
+            with col1:
+                st.write(f"**📋 التفاصيل:** {obligation['details']}")
+                st.write(f"**⏰ المهلة:** {obligation['deadline']}")
+            with col2:
+                st.write(f"**⚖️ القانون:** {obligation['law']}")
+                st.write(f"**💰 العقوبة:** {obligation['penalty']}")
+
+# ==========================
+# 🏢 الإدارة والسجلات
+# ==========================
+def show_administration_records_obligations():
+    """عرض الالتزامات الإدارية والتسجيلية"""
+    
+    st.markdown("##### 🏢 الالتزامات الإدارية والتسجيلية")
+    
+    obligations = [
+        {
+            "icon": "📊",
+            "title": "الإخطار بالتشغيل - المادة 8",
+            "details": "إرسال إشعار للوزارة يتضمن عدد العاملين وموقع العمل وطبيعة العمل وتاريخ المباشرة والأجر",
+            "deadline": "الشهر الأول من كل سنة",
+            "law": "المادة 8",
+            "penalty": "غرامة إدارية"
+        },
+        {
+            "icon": "📁",
+            "title": "مسك السجلات - المادة 9",
+            "details": "الاحتفاظ بالسجلات الواجبة بما فيها سجلات العمل والمتدربين",
+            "deadline": "مستمر",
+            "law": "المادة 9",
+            "penalty": "غرامة إدارية"
+        }
+    ]
+    
+    for obligation in obligations:
+        with st.expander(f"{obligation['icon']} {obligation['title']}"):
+            col1, col2 = st.columns([3, 2])
+            with col1:
+                st.write(f"**📋 التفاصيل:** {obligation['details']}")
+                st.write(f"**⏰ المهلة:** {obligation['deadline']}")
+            with col2:
+                st.write(f"**⚖️ القانون:** {obligation['law']}")
+                st.write(f"**💰 العقوبة:** {obligation['penalty']}")
+
+# ==========================
+# 📝 قسم إدارة العقود - النسخة المصححة
+# ==========================
+def show_contracts_management_section():
+    """عرض نظام إدارة العقود المصحح"""
+    
+    st.markdown("#### 📝 نظام إدارة العقود القانوني")
+    
+    st.markdown("""
+    <div style="background: #f8f9fa; padding: 20px; border-radius: 10px; border: 1px solid #dee2e6;">
+        <h4>💡 دليل الاستخدام</h4>
+        <p>يوفر هذا القسم نماذج عقود جاهزة ومحدثة وفق أحدث التعديلات القانونية. يمكنك نسخ النص مباشرة واستخدامه.</p>
+        <div style="background: #fff3cd; padding: 15px; border-radius: 5px; border: 1px solid #ffeaa7; margin-top: 10px;">
+        <strong>🛡️ تنويه هام:</strong> هذه النماذج لأغراض إرشادية فقط ولا تغني عن استشارة محامٍ متخصص. يتحمل المستخدم المسؤولية الكاملة عن استخدام هذه النماذج.
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    contracts_tabs = st.tabs(["📄 نماذج العقود", "🎯 منشئ العقود"])
+
+    with contracts_tabs[0]:
+        show_contract_templates()
+    
+    with contracts_tabs[1]:
+        show_contract_builder()
+
+# ==========================
+# 📄 نماذج العقود
+# ==========================
+def show_contract_templates():
+    """عرض مكتبة نماذج العقود"""
+    
+    st.markdown("##### 📄 مكتبة نماذج العقود القانونية")
+
+    contract_templates = [
+        {
+            "النوع": "عقد عمل دائم",
+            "الوصف": "عقد عمل دائم شامل مع جميع البنود القانونية",
+            "المميزات": [
+                "فترة التجربة 3 أشهر", "بنود العمل المرن", "سياسة الحماية من التحرش",
+                "التزامات الطرفين", "إنهاء الخدمة", "الضمان الاجتماعي", "الإجازات"
+            ]
+        },
+        {
+            "النوع": "عقد عمل مؤقت", 
+            "الوصف": "عقد عمل مؤقت شامل للمشاريع محددة المدة",
+            "المميزات": [
+                "مدة محددة", "بنود التمديد", "إنهاء مبكر", "تسليم المخرجات",
+                "الملكية الفكرية", "التسليم والمعايير"
+            ]
+        },
+        {
+            "النوع": "عقد عمل جزئي",
+            "الوصف": "عقد عمل جزئي شامل مع جميع الاستحقاقات النسبية", 
+            "المميزات": [
+                "ساعات مرنة", "أجر متناسب", "استحقاقات نسبية", "التأمينات",
+                "الإجازات", "الضمان الاجتماعي"
+            ]
+        }
+    ]
+    
+    for contract in contract_templates:
+        with st.expander(f"📄 {contract['النوع']}", expanded=False):
+            st.write(f"**📝 الوصف:** {contract['الوصف']}")
+            
+            st.write("**✨ المميزات:**")
+            for feature in contract['المميزات']:
+                st.write(f"• {feature}")
+            
+            if st.button(f"📋 عرض نص العقد", key=f"show_{contract['النوع']}"):
+                contract_content = generate_contract_content(contract['النوع'])
+                st.session_state.current_contract = contract_content
+                st.session_state.contract_type_name = contract['النوع']  # تغيير اسم المفتاح
+                st.rerun()
+    
+    # عرض نص العقد إذا تم اختياره
+    if hasattr(st.session_state, 'current_contract'):
+        show_contract_text()
+
+# ==========================
+# 🎯 منشئ العقود المحسن
+# ==========================
+def show_contract_builder():
+    """عرض منشئ العقود مع خيارات البنود الإضافية"""
+    
+    st.markdown("##### 🎯 منشئ العقود المتقدم")
+    
+    # تهيئة المتغيرات في حالة عدم وجودها
+    if 'custom_contract_data' not in st.session_state:
+        st.session_state.custom_contract_data = {}
+    
+    with st.form("contract_builder_form"):  # تغيير مفتاح النموذج
+        st.subheader("إنشاء عقد عمل مخصص")
+        
+        # القسم 1: المعلومات الأساسية
+        st.markdown("### 📋 المعلومات الأساسية")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            contract_type = st.selectbox("نوع العقد", [
+                "عقد عمل دائم",
+                "عقد عمل مؤقت", 
+                "عقد عمل جزئي"
+            ], key="builder_contract_type")  # تغيير المفتاح
+            
+            job_title = st.text_input("المسمى الوظيفي *", placeholder="مثال: محاسب، مهندس، مسوق", key="builder_job_title")
+            workplace = st.text_input("مكان العمل الرئيسي *", placeholder="مثال: عمان - الشميساني", key="builder_workplace")
+            
+        with col2:
+            salary = st.number_input("الراتب الأساسي (دينار) *", min_value=290, value=500, key="builder_salary")
+            probation_period = st.selectbox("فترة التجربة *", ["1 شهر", "2 أشهر", "3 أشهر"], key="builder_probation_period")
+            
+            if contract_type == "عقد عمل مؤقت":
+                contract_duration = st.text_input("مدة العقد *", placeholder="مثال: 6 أشهر، سنة واحدة", key="builder_contract_duration")
+            else:
+                contract_duration = ""
+        
+        # القسم 2: البنود الإلزامية الأساسية
+        st.markdown("### 📑 البنود الإلزامية الأساسية")
+        
+        mandatory_clauses = [
+            {
+                "id": "working_hours",
+                "title": "ساعات العمل والإجازات",
+                "description": "تنظيم ساعات العمل اليومية والأسبوعية والإجازات المختلفة",
+                "default": True
+            },
+            {
+                "id": "social_security", 
+                "title": "الضمان الاجتماعي",
+                "description": "التزام صاحب العمل بتسجيل العامل في الضمان الاجتماعي",
+                "default": True
+            },
+            {
+                "id": "contract_termination",
+                "title": "إنهاء العقد",
+                "description": "شروط وإجراءات إنهاء العقد من قبل الطرفين",
+                "default": True
+            },
+            {
+                "id": "confidentiality",
+                "title": "السرية",
+                "description": "التزام العامل بالمحافظة على أسرار العمل",
+                "default": True
+            }
+        ]
+        
+        for clause in mandatory_clauses:
+            st.checkbox(f"**{clause['title']}** - {clause['description']}", 
+                       value=clause['default'], 
+                       key=f"builder_mandatory_{clause['id']}")  # تغيير المفتاح
+        
+        # القسم 3: البنود الإضافية الاختيارية
+        st.markdown("### 🔧 البنود الإضافية الاختيارية")
+        
+        st.info("💡 اختر البنود الإضافية التي تناسب طبيعة العمل:")
+        
+        optional_clauses = [
+            {
+                "id": "intellectual_property",
+                "title": "الملكية الفكرية",
+                "description": "حقوق الملكية الفكرية للابتكارات والإبداعات خلال مدة العقد",
+                "details": """
+                - جميع الابتكارات والإبداعات خلال مدة العقد تعتبر ملكاً لصاحب العمل
+                - يتنازل العامل عن أي حقوق مادية أو معنوية في الابتكارات
+                - التعاون في تسجيل البراءات وحماية الحقوق الفكرية
+                """
+            },
+            {
+                "id": "non_competition",
+                "title": "عدم المنافسة",
+                "description": "منع العمل لدى المنافسين بعد انتهاء العقد",
+                "details": """
+                - يمتنع العامل عن العمل لدى جهات منافسة لمدة 6 أشهر بعد انتهاء العقد
+                - لا يسري هذا البند في حال إنهاء العقد من قبل صاحب العمل
+                - تحديد نطاق المنافسة الجغرافي والمهني
+                """
+            },
+            {
+                "id": "training",
+                "title": "التدريب والتأهيل",
+                "description": "تنظيم برامج التدريب والتطوير المهني",
+                "details": """
+                - يلتزم صاحب العمل بتوفير برامج تدريبية لتنمية مهارات العامل
+                - تحمل تكاليف التدريب من قبل صاحب العمل
+                - الالتزام بالعمل لمدة محددة بعد انتهاء التدريب المكلف
+                """
+            },
+            {
+                "id": "travel",
+                "title": "التنقل والسفر",
+                "description": "تنظيم المهام خارج مقر العمل والسفر",
+                "details": """
+                - بدل تنقل يومي عن أي مهمة خارج مقر العمل
+                - موافقة خطية مسبقة للمهام خارج المحافظة
+                - توفير تأمين صحي وسفر للمهام خارج المملكة
+                - تحمل كافة مصاريف السفر والإقامة
+                """
+            },
+            {
+                "id": "evaluation",
+                "title": "التقييم والمكافآت", 
+                "description": "نظام تقييم الأداء والحوافز والمكافآت",
+                "details": """
+                - تقييم أداء دوري كل 6 أشهر
+                - مكافآت مرتبطة بنتائج التقييم
+                - مكافأة نهاية سنة حسب الأداء
+                - نظام ترقيات واضح ومعلن
+                """
+            },
+            {
+                "id": "medical",
+                "title": "الخدمات الطبية",
+                "description": "التغطية الصحية والخدمات الطبية",
+                "details": """
+                - توفير تأمين صحي جماعي
+                - تحمل كلفة الفحوصات الطبية الدورية
+                - تغطية كاملة لإصابات العمل
+                - إجازة مرضية وفق أحكام القانون
+                """
+            },
+            {
+                "id": "equipment",
+                "title": "المعدات والأدوات",
+                "description": "توفير واستخدام معدات العمل",
+                "details": """
+                - توفير كافة المعدات والأدوات اللازمة للعمل
+                - مسؤولية العامل عن الحفاظ على المعدات
+                - استخدام المعدات لأغراض العمل فقط
+                - إجراءات تسليم المعدات عند انتهاء العقد
+                """
+            },
+            {
+                "id": "remote_work",
+                "title": "العمل عن بُعد",
+                "description": "تنظيم العمل عن بُعد والمرونة المكانية",
+                "details": """
+                - عدد أيام العمل عن بُعد المسموح بها أسبوعياً
+                - توفير اتصال إنترنت وأجهزة مناسبة
+                - ساعات العمل المرنة وطرق التواصل
+                - معايير تقييم الأداء للعمل عن بُعد
+                """
+            },
+            {
+                "id": "overtime",
+                "title": "العمل الإضافي",
+                "description": "تنظيم ساعات العمل الإضافي وأجوره",
+                "details": """
+                - موافقة خطية مسبقة على العمل الإضافي
+                - سقوط ساعات العمل الإضافي (144 ساعة سنوياً)
+                - أجور العمل الإضافي وفقاً للقانون (125%-150%)
+                - تسجيل دقيق لساعات العمل الإضافي
+                """
+            },
+            {
+                "id": "probation_details",
+                "title": "تفاصيل فترة التجربة",
+                "description": "تفاصيل إضافية عن فترة التجربة",
+                "details": """
+                - إمكانية إنهاء العقد خلال فترة التجربة دون إنذار
+                - تقييم أداء في نهاية فترة التجربة
+                - إمكانية تمديد فترة التجربة لمرة واحدة
+                - احتساب فترة التجربة من مدة الخدمة
+                """
+            }
+        ]
+        
+        # عرض البنود الاختيارية في أعمدة
+        cols = st.columns(2)
+        for idx, clause in enumerate(optional_clauses):
+            with cols[idx % 2]:
+                with st.expander(f"📌 {clause['title']}", expanded=False):
+                    st.write(clause['description'])
+                    st.text_area(
+                        "تفاصيل البند:", 
+                        value=clause['details'].strip(),
+                        height=150,
+                        key=f"builder_details_{clause['id']}",  # تغيير المفتاح
+                        disabled=False
+                    )
+                    selected = st.checkbox(f"إضافة {clause['title']}", key=f"builder_optional_{clause['id']}")  # تغيير المفتاح
+                    if selected:
+                        st.success(f"✓ سيتم إضافة بند {clause['title']}")
+        
+        # القسم 4: بنود خاصة مخصصة
+        st.markdown("### ✍️ بنود خاصة مخصصة")
+        
+        st.warning("""
+        **ملاحظة هامة:** البنود الخاصة يجب أن تكون متوافقة مع قانون العمل الأردني 
+        ولا تتعارض مع الحقوق الأساسية للعامل.
+        """)
+        
+        custom_clauses = st.text_area(
+            "البنود الخاصة الإضافية:",
+            placeholder="""
+مثال:
+- يحق للعامل الحصول على بدل نقل قدره 50 دينار شهرياً
+- يلتزم العامل بحضور دورات تدريبية تخصصية
+- تقدم الشركة وجبة غداء مجانية يومياً
+- يحق للعامل الحصول على تذاكر سفر سنوية
+            """.strip(),
+            height=150,
+            key="builder_custom_clauses"  # تغيير المفتاح
+        )
+        
+        # القسم 5: التأكيد والإنشاء
+        st.markdown("### ✅ التأكيد والإنشاء")
+        
+        col_confirm1, col_confirm2 = st.columns(2)
+        
+        with col_confirm1:
+            confirm_legal = st.checkbox("أقر بأن جميع البنود المضافة متوافقة مع قانون العمل الأردني", key="builder_confirm_legal")
+        
+        with col_confirm2:
+            confirm_review = st.checkbox("ألتزم بمراجعة العقد مع مختص قانوني قبل استخدامه", key="builder_confirm_review")
+        
+        submitted = st.form_submit_button("🎯 إنشاء العقد المتكامل", use_container_width=True)
+        
+        if submitted:
+            # التحقق من البيانات الأساسية
+            if not job_title or not workplace:
+                st.error("⚠️ يرجى ملء جميع الحقول الإلزامية (*)")
+            elif salary < 290:
+                st.error("⚠️ الراتب الأساسي أقل من الحد الأدنى للأجور (290 دينار)")
+            elif not confirm_legal or not confirm_review:
+                st.error("⚠️ يرجى الموافقة على تأكيدات السلامة القانونية")
+            else:
+                # جمع البيانات المختارة
+                selected_optional_clauses = []
+                for clause in optional_clauses:
+                    if st.session_state.get(f"builder_optional_{clause['id']}", False):
+                        selected_optional_clauses.append({
+                            "title": clause['title'],
+                            "details": clause['details'],
+                            "custom_details": st.session_state.get(f"builder_details_{clause['id']}", clause['details'])
+                        })
+                
+                # حفظ البيانات في الجلسة
+                st.session_state.custom_contract_data = {
+                    "type": contract_type,
+                    "job_title": job_title,
+                    "workplace": workplace,
+                    "salary": salary,
+                    "probation_period": probation_period,
+                    "contract_duration": contract_duration,
+                    "custom_clauses": custom_clauses,
+                    "selected_optional_clauses": selected_optional_clauses,
+                    # البنود الإلزامية
+                    "working_hours": st.session_state.get("builder_mandatory_working_hours", True),
+                    "social_security": st.session_state.get("builder_mandatory_social_security", True),
+                    "contract_termination": st.session_state.get("builder_mandatory_contract_termination", True),
+                    "confidentiality": st.session_state.get("builder_mandatory_confidentiality", True)
+                }
+                
+                # إنشاء العقد
+                try:
+                    generated_contract = generate_comprehensive_custom_contract(st.session_state.custom_contract_data)
+                    st.session_state.current_contract = generated_contract
+                    st.session_state.contract_type_name = "مخصص متكامل"  # استخدام المفتاح الجديد
+                    st.success("✅ تم إنشاء العقد المتكامل بنجاح! انزل لأسفل لنسخ النص")
+                    st.balloons()
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"❌ حدث خطأ في إنشاء العقد: {str(e)}")
+    
+    # عرض العقد المخصص إذا تم إنشاؤه
+    if hasattr(st.session_state, 'current_contract') and hasattr(st.session_state, 'contract_type_name') and st.session_state.contract_type_name == "مخصص متكامل":
+        show_comprehensive_contract_text()
+
+def generate_comprehensive_custom_contract(contract_data):
+    """إنشاء عقد مخصص شامل مع جميع البنود المختارة"""
+    
+    disclaimer = """\n
+⚠️ تنويه إخلاء المسؤولية:
+هذا النموذج معد لأغراض إرشادية فقط ولا يعتبر بديلاً عن الاستشارة القانونية المتخصصة. 
+يتحمل المستخدم المسؤولية الكاملة عن مراجعة العقد مع محامٍ مختص قبل استخدامه.
+"""
+    
+    base_contract = f"""📜 عقد عمل {contract_data['type']} شامل
+وفقاً لقانون العمل الأردني رقم (8) لسنة 1996 وتعديلاته
+
+تم إبرام هذا العقد في تاريخ ____ الموافق __/__/____
+
+بين:
+
+الطرف الأول: صاحب العمل
+الاسم: ____________________
+العنوان: __________________
+السجل التجاري: ____________
+
+و
+
+الطرف الثاني: العامل
+الاسم: ____________________
+العنوان: __________________
+رقم الهوية: _______________
+
+البند الأول: المعلومات الأساسية
+١.١. نوع العقد: {contract_data['type']}
+١.٢. المسمى الوظيفي: {contract_data['job_title']}
+١.٣. مكان العمل الرئيسي: {contract_data['workplace']}"""
+
+    if contract_data['type'] == "عقد عمل مؤقت" and contract_data['contract_duration']:
+        base_contract += f"\n١.٤. مدة العقد: {contract_data['contract_duration']}"
+
+    base_contract += f"""
+البند الثاني: الأجر والاستحقاقات المالية
+٢.١. الراتب الأساسي: {contract_data['salary']} دينار أردني
+٢.٢. طريقة الدفع: ______
+٢.٣. موعد صرف الراتب: ______
+٢.٤. الاستقطاعات: وفقاً لأحكام القانون والضمان الاجتماعي"""
+
+    base_contract += f"""
+البند الثالث: فترة التجربة
+٣.١. فترة التجربة: {contract_data['probation_period']}
+٣.٢. خلال فترة التجربة، يحق لأي من الطرفين إنهاء العقد دون إنذار مسبق."""
+
+    # البنود الإلزامية
+    if contract_data.get('working_hours', True):
+        base_contract += """
+البند الرابع: ساعات العمل والإجازات
+٤.١. ساعات العمل: ٨ ساعات يومياً أو ٤٨ ساعة أسبوعياً.
+٤.٢. الإجازة السنوية: ١٤ يوماً مدفوعة الأجر عن كل سنة خدمة.
+٤.٣. الإجازة المرضية: ١٤ يوماً بأجر كامل.
+٤.٤. إجازة الأمومة: ١٠ أسابيع مدفوعة الأجر.
+٤.٥. إجازة الأبوة: ٣ أيام مدفوعة الأجر."""
+
+    if contract_data.get('social_security', True):
+        base_contract += """
+البند الخامس: الضمان الاجتماعي
+٥.١. يلتزم صاحب العمل بتسجيل العامل في مؤسسة الضمان الاجتماعي.
+٥.٢. تتحمل الجهتان الاشتراكات وفقاً لأحكام القانون."""
+
+    if contract_data.get('contract_termination', True):
+        base_contract += """
+البند السادس: إنهاء العقد
+٦.١. يحق لأي طرف إنهاء العقد بإشعار خطي قبل ٣٠ يوماً على الأقل.
+٦.٢. في حال إنهاء العقد من قبل صاحب العمل دون سبب مشروع، يستحق العامل تعويضاً.
+٦.٣. حالات الفصل الفوري وفقاً لأحكام المادة (٨٨) من قانون العمل."""
+
+    if contract_data.get('confidentiality', True):
+        base_contract += """
+البند السابع: السرية
+٧.١. يلتزم العامل بالمحافظة على أسرار العمل وعدم إفشائها.
+٧.٢. يشمل ذلك المعلومات التقنية والتجارية والمالية."""
+
+    # البنود الاختيارية
+    clause_number = 8
+    for clause in contract_data.get('selected_optional_clauses', []):
+        base_contract += f"""
+البند {clause_number}: {clause['title']}
+{clause['custom_details']}"""
+        clause_number += 1
+
+    # البنود الخاصة المخصصة
+    if contract_data.get('custom_clauses'):
+        base_contract += f"""
+البند {clause_number}: بنود خاصة
+{contract_data['custom_clauses']}"""
+        clause_number += 1
+
+    base_contract += f"""
+البند {clause_number}: أحكام عامة
+{clause_number}.١. يخضع هذا العقد لأحكام قانون العمل الأردني.
+{clause_number}.٢. أي بند يخالف القانون يعتبر لاغياً وباطلاً.
+{clause_number}.٣. الحد الأدنى للأجور: ٢٩٠ ديناراً (تحديث ٢٠٢٤).
+{clause_number}.٤. تحل المنازعات عبر المفاوضات ثم المحاكم المختصة.
+
+توقيع صاحب العمل: __________
+الاسم: ____________________
+التاريخ: __/__/____
+
+توقيع العامل: __________
+الاسم: ____________________
+التاريخ: __/__/____
+
+شهادة الإقرار:
+أقر بأنني قد اطلعت على جميع بنود هذا العقد وفهمتها بشكل كامل
+ووافقت عليها بمحض إرادتي.
+
+توقيع العامل: __________
+التاريخ: __/__/____
+{disclaimer}"""
+    
+    return base_contract
+
+def show_comprehensive_contract_text():
+    """عرض نص العقد الشامل للنسخ"""
+    st.markdown("---")
+    st.markdown("##### 📝 العقد المتكامل الجاهز للنسخ")
+    
+    contract_content = st.session_state.current_contract
+    
+    # عرض إحصائية عن العقد
+    col_stats1, col_stats2, col_stats3 = st.columns(3)
+    
+    with col_stats1:
+        st.metric("عدد البنود", len(contract_content.split('البند')))
+    
+    with col_stats2:
+        st.metric("عدد الكلمات", len(contract_content.split()))
+    
+    with col_stats3:
+        st.metric("المستوى", "🛡️ شامل")
+    
+    # عرض النص في صندوق يمكن نسخه
+    st.text_area(
+        "**انسخ النص أدناه واستخدمه:**", 
+        value=contract_content,
+        height=500,
+        key="comprehensive_contract_text"
+    )
+    
+    # تعليمات النسخ المحسنة
+    st.markdown("""
+    <div style="background: #e8f5e8; padding: 20px; border-radius: 5px; border: 1px solid #4caf50;">
+    <h4>💡 تعليمات النسخ والاستخدام:</h4>
+    <ol>
+    <li><strong>اضغط داخل صندوق النص أعلاه</strong></li>
+    <li><strong>إضغط <kbd>Ctrl+A</kbd> (Windows) أو <kbd>Cmd+A</kbd> (Mac) لتحديد كل النص</strong></li>
+    <li><strong>إضغط <kbd>Ctrl+C</kbd> (Windows) أو <kbd>Cmd+C</kbd> (Mac) لنسخ النص</strong></li>
+    <li><strong>الصق النص في مستند Word أو أي محرر نصوص آخر</strong></li>
+    <li><strong>املأ المعلومات المطلوبة (______) حسب حالتك</strong></li>
+    <li><strong>راجع العقد مع محامٍ مختص قبل التوقيع</strong></li>
+    </ol>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    col_actions1, col_actions2, col_actions3 = st.columns(3)
+    
+    with col_actions1:
+        if st.button("🔄 إنشاء عقد جديد", use_container_width=True, key="new_contract_btn"):
+            # مسح البيانات من الجلسة
+            for key in ['current_contract', 'contract_type_name', 'custom_contract_data']:
+                if hasattr(st.session_state, key):
+                    delattr(st.session_state, key)
+            st.rerun()
+    
+    with col_actions2:
+        if st.button("📄 نماذج جاهزة", use_container_width=True, key="templates_btn"):
+            # مسح البيانات من الجلسة
+            for key in ['current_contract', 'contract_type_name', 'custom_contract_data']:
+                if hasattr(st.session_state, key):
+                    delattr(st.session_state, key)
+            st.rerun()
+    
+    with col_actions3:
+        if st.button("💾 حفظ المسودة", use_container_width=True, key="save_draft_btn"):
+            st.info("💾 يمكنك نسخ النص أعلاه وحفظه في ملف نصي")
+
+# ==========================
+# 🎯 دوال المساعدة
+# ==========================
+def show_contract_text():
+    """عرض نص العقد للنسخ"""
+    st.markdown("---")
+    st.markdown(f"##### 📝 نص العقد الجاهز للنسخ")
+    
+    contract_content = st.session_state.current_contract
+    
+    # عرض النص في صندوق يمكن نسخه
+    st.text_area(
+        "**انسخ النص أدناه واستخدمه:**", 
+        value=contract_content,
+        height=400,
+        key="contract_text_area"
+    )
+    
+    # زر مساعد للنسخ
+    st.markdown("""
+    <div style="background: #e8f5e8; padding: 15px; border-radius: 5px; border: 1px solid #4caf50;">
+    <h4>💡 تعليمات النسخ:</h4>
+    <ol>
+    <li>اضغط داخل صندوق النص أعلاه</li>
+    <li>إضغط <kbd>Ctrl+A</kbd> (Windows) أو <kbd>Cmd+A</kbd> (Mac) لتحديد كل النص</li>
+    <li>إضغط <kbd>Ctrl+C</kbd> (Windows) أو <kbd>Cmd+C</kbd> (Mac) لنسخ النص</li>
+    <li>الصق النص في مستند Word أو أي محرر نصوص آخر</li>
+    </ol>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("🔄 إنشاء عقد جديد", use_container_width=True, key="new_simple_btn"):
+            # مسح البيانات من الجلسة
+            if hasattr(st.session_state, 'current_contract'):
+                del st.session_state.current_contract
+            if hasattr(st.session_state, 'contract_type_name'):
+                del st.session_state.contract_type_name
+            if hasattr(st.session_state, 'custom_contract_data'):
+                del st.session_state.custom_contract_data
+            st.rerun()
+    
+    with col2:
+        if st.button("🏠 العودة للقائمة الرئيسية", use_container_width=True, key="home_btn"):
+            # مسح البيانات من الجلسة
+            if hasattr(st.session_state, 'current_contract'):
+                del st.session_state.current_contract
+            if hasattr(st.session_state, 'contract_type_name'):
+                del st.session_state.contract_type_name
+            st.rerun()
+
+# ... باقي الدوال generate_contract_content و generate_custom_contract تبقى كما هي ...
+
+# ==========================
+# 🎯 تشغيل قسم العقود
+# ==========================
+def run_contracts_section():
+    """تشغيل قسم إدارة العقود"""
+    # تهيئة حالة الجلسة إذا لم تكن موجودة
+    if 'custom_contract_data' not in st.session_state:
+        st.session_state.custom_contract_data = {}
+    
+    show_contracts_management_section()
+
+# ==========================
+# 🔍 المخاطر النشطة
+# ==========================
+def show_active_risks():
+    """عرض المخاطر القانونية النشطة"""
+    
+    st.markdown("##### 🔍 المخاطر القانونية النشطة والمحتملة")
+    
+    risk_categories = {
+        "المخاطر التعاقدية": [
+            "عقود عمل غير مكتملة أو غير محدثة",
+            "عدم تضمين البنود الإلزامية القانونية",
+            "فترات تجربة تتجاوز 3 أشهر",
+            "عقود شفهية غير موثقة"
+        ],
+        "المخاطر المالية": [
+            "عدم تطبيق الحد الأدنى للأجور (290 دينار)",
+            "تأخر صرف الرواتب عن الموعد القانوني",
+            "عدم دفع بدل العمل الإضافي",
+            "أخطاء في حساب مستحقات نهاية الخدمة"
+        ],
+        "مخاطر السلامة": [
+            "عدم توفير معدات الوقاية الشخصية",
+            "غياب التدريب على إجراءات السلامة",
+            "عدم الإبلاغ عن إصابات العمل",
+            "نقص في إجراءات الطوارئ"
+        ]
+    }
+    
+    for category, risks in risk_categories.items():
+        with st.expander(f"📁 {category}"):
+            for risk in risks:
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    st.write(f"• {risk}")
+                with col2:
+                    if st.button("🛠️ معالجة", key=f"action_{risk}"):
+                        st.success(f"تم تسجيل خطة معالجة لـ {risk}")
+
+# ==========================
+# 📋 السجلات والتفتيش
+# ==========================
+def show_records_inspection():
+    """عرض نظام السجلات والتفتيش"""
+    
+    st.markdown("##### 📋 السجلات الإلزامية ونظام التفتيش الداخلي")
+    
+    st.markdown("""
+    **السجلات الإلزامية التي يجب على صاحب العمل الاحتفاظ بها (المادة 26):**
+    
+    - سجل العاملين (الاسم، الرقم الوطني، تاريخ التعيين، الأجر، المسمى الوظيفي)
+    - سجل الأجور والبدلات والاستقطاعات
+    - سجل الإجازات (السنوية، المرضية، الأمومة)
+    - سجل العمل الإضافي
+    - سجل إصابات العمل والحوادث
+    - سجل العقوبات والإجراءات التأديبية
+    """)
+    
+    inspection_checklist = [
+        "التأكد من وجود عقود عمل مكتوبة لجميع العاملين",
+        "مراجعة تطبيق الحد الأدنى للأجور (290 دينار)",
+        "التأكد من تسجيل العاملين في الضمان الاجتماعي",
+        "مراجعة سجلات الإجازات والغياب",
+        "التأكد من وجود لوائح تنظيم العمل",
+        "مراجعة إجراءات السلامة والصحة المهنية"
+    ]
+    
+    st.markdown("##### 🔍 قائمة التفتيش الداخلي")
+    for i, item in enumerate(inspection_checklist):
+        st.checkbox(item, key=f"check_{i}")
+
+# ==========================
+# 🛠️ دوال مساعدة
+# ==========================
+def generate_contract_template(contract_type):
+    """إنشاء قوالب عقود مفصلة"""
+    
+    templates = {
+        "عقد عمل دائم": """
+        عقد عمل دائم
+        =============
+        
+        تم إبرام هذا العقد في يوم {التاريخ} بين:
+        
+        الطرف الأول: صاحب العمل
+        الاسم: ___________________
+        العنوان: ___________________
+        
+        الطرف الثاني: العامل
+        الاسم: ___________________
+        رقم الهوية: ___________________
+        
+        المادة 1: التعريفات
+        - العقد: عقد العمل هذا وملحقاته
+        - صاحب العمل: الطرف الأول
+        - العامل: الطرف الثاني
+        
+        المادة 2: المسمى الوظيفي ومكان العمل
+        - المسمى الوظيفي: {المسمى_الوظيفي}
+        - مكان العمل: {مكان_العمل}
+        
+        المادة 3: المدة وفترة التجربة
+        - نوع العقد: دائم
+        - فترة التجربة: 3 أشهر كحد أقصى
+        
+        المادة 4: الأجر والبدلات
+        - الراتب الأساسي: {الراتب_الأساسي} دينار (لا يقل عن الحد الأدنى 290 دينار)
+        - بدل السكن: {بدل_السكن} دينار
+        - بدل المواصلات: {بدل_المواصلات} دينار
+        
+        المادة 5: ساعات العمل والإجازات
+        - ساعات العمل: 8 ساعات يومياً
+        - الإجازة السنوية: 14 يوم عن كل سنة خدمة
+        
+        المادة 6: إنهاء الخدمة
+        - فترة الإخطار: شهر واحد
+        - مكافأة نهاية الخدمة: حسب القانون
+        
+        المادة 7: أحكام عامة
+        - يخضع هذا العقد لأحكام قانون العمل الأردني
+        - أي نزاع ينشأ عن هذا العقد يحسم وفقاً للقوانين النافذة
+        
+        توقيع صاحب العمل: _________________
+        توقيع العامل: _____________________
+        """,
+        
+        "عقد عمل مؤقت": """
+        عقد عمل مؤقت
+        =============
+        
+        تم إبرام هذا العقد في يوم {التاريخ} بين:
+        
+        الطرف الأول: صاحب العمل
+        الطرف الثاني: العامل
+        
+        المادة 1: الأطراف ومدة العقد
+        - مدة العقد: من {تاريخ_البدء} إلى {تاريخ_النهاية}
+        
+        المادة 2: طبيعة العمل
+        - العمل: {وصف_العمل}
+        - المخرجات المتوقعة: {المخرجات}
+        
+        المادة 3: الأجر والدفع
+        - الأجر الكلي: {الأجر_الكلي} دينار (لا يقل عن الحد الأدنى 290 دينار)
+        - خطة الدفع: {خطة_الدفع}
+        
+        المادة 4: إنهاء العقد
+        - ينتهي العقد تلقائياً بانتهاء مدته
+        - يمكن إنهاؤه مبكراً وفق الشروط القانونية
+        
+        توقيع صاحب العمل: _________________
+        توقيع العامل: _____________________
+        """,
+        
+        "عقد عمل جزئي": """
+        عقد عمل جزئي
+        =============
+        
+        تم إبرام هذا العقد في يوم {التاريخ} بين:
+        
+        الطرف الأول: صاحب العمل
+        الطرف الثاني: العامل
+        
+        المادة 1: طبيعة العمل
+        - نوع العمل: دوام جزئي
+        - ساعات العمل الأسبوعية: {ساعات_العمل}
+        - المسمى الوظيفي: {المسمى_الوظيفي}
+        
+        المادة 2: الأجر والاستحقاقات
+        - الأجر الأساسي: {الراتب_الأساسي} دينار (نسبة من الحد الأدنى 290 دينار)
+        - طريقة حساب الأجر: {طريقة_الحساب}
+        
+        المادة 3: الإجازات والاستحقاقات
+        - إجازة سنوية نسبية حسب ساعات العمل
+        - استحقاقات ضمان اجتماعي نسبية
+        
+        توقيع صاحب العمل: _________________
+        توقيع العامل: _____________________
+        """
+    }
+    
+    return templates.get(contract_type, "نموذج العقد غير متوفر حالياً")
+
+def generate_custom_contract(contract_data):
+    """إنشاء عقد مخصص بناءً على البيانات المدخلة"""
+    base_template = generate_contract_template(contract_data["type"])
+    
+    # استبدال البيانات في القالب
+    custom_contract = base_template.format(
+        التاريخ=datetime.now().strftime("%Y-%m-%d"),
+        اسم_العامل=contract_data["employee_name"],
+        المسمى_الوظيفي=contract_data["job_title"],
+        مكان_العمل=contract_data["workplace"],
+        الراتب_الأساسي=contract_data["salary"],
+        تاريخ_البدء=contract_data["start_date"],
+        تاريخ_النهاية=contract_data.get("contract_duration", "غير محدد"),
+        ساعات_العمل="24 ساعة أسبوعياً",
+        طريقة_الحساب="نسبة 60% من الراتب الكامل"
+    )
+    
+    return custom_contract
@@ -0,0 +1,127 @@
+import streamlit as st
+
+from views.common import config, show_metric_card
+
+# ==========================
+# 🏠 الصفحة الرئيسية - النسخة المظلمة
+# ==========================
+def show_home_page():
+    # عنوان المنصة مع الشعار الجديد بالتصميم المظلم
+    st.markdown("""
+    <div class="header-with-logo">
+        <div class="logo-container">
+            <img src="https://particular-yellow-al3ldejxbx.edgeone.app/file_000000003d007230993c051b37edb825.png" 
+                 class="logo-img" 
+                 alt="سيدة العدالة - شعار SiraWork">
+        </div>
+        <div style="text-align: center;">
+            <div class="platform-name-with-logo">SiraWork سيرا</div>
+            <div class="platform-subtitle">منصة توعوية تعليمية لمحاكاة القضايا العمالية</div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # تنويه مهم - مصغر
+    st.markdown("""
+    <div class="warning-box">
+        <h4>⚖️ تنويه هام</h4>
+        <p>منصة توعوية تعليمية - المعلومات مقدمة لأغراض التعلم والمعرفة العامة ولا تغني عن استشارة المختصين.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # إحصائيات سريعة
+    st.markdown("### 📈 نظرة سريعة على المنصة")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        show_metric_card("أداة حسابية", "6+", "حاسبات متخصصة", "🧮")
+    
+    with col2:
+        show_metric_card("مادة قانونية", "50+", "مادة قانونية", "⚖️")
+    
+    with col3:
+        show_metric_card("نموذج عقد", "8+", "نماذج جاهزة", "📝")
+    
+    with col4:
+        show_metric_card("دليل بحثي", "20+", "مصدر موثوق", "🔍")
+    
+    # الفئات المستهدفة
+    st.markdown("### 🎯 الفئات المستهدفة")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="feature-item">
+            <h4>👷 العمال</h4>
+            <p>تعرف على حقوقك العمالية وكيفية المطالبة بها</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="feature-item">
+            <h4>👔 أصحاب العمل</h4>
+            <p>التزم بالتشريعات والقوانين العمالية</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="feature-item">
+            <h4>🔬 الباحثين</h4>
+            <p>مواد بحثية ومراجع قانونية متخصصة</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # طريقة استخدام المنصة
+    st.markdown("### 📖 طريقة استخدام المنصة")
+    
+    st.markdown("""
+    <div class="section-card">
+        <h4>🚀 كيفية البدء:</h4>
+        <ol>
+            <li><strong>اختر فئتك</strong> من القائمة الجانبية (عامل، صاحب عمل، باحث)</li>
+            <li><strong>انتقل إلى القسم المناسب</strong> لاحتياجاتك</li>
+            <li><strong>استخدم الأدوات المتاحة</strong> في كل قسم</li>
+            <li><strong>اطلع على المعلومات التوعوية</strong> والشرح القانوني</li>
+        </ol>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # المميزات الرئيسية
+    st.markdown("### ✨ المميزات الرئيسية")
+    
+    features = [
+        {"icon": "⚡", "title": "سرعة الأداء", "desc": "تصميم سريع الاستجابة وسهل الاستخدام"},
+        {"icon": "🎨", "title": "واجهة مظلمة", "desc": "تصميم مظلم مريح للعين واحترافي"},
+        {"icon": "📱", "title": "متجاوب", "desc": "يعمل على جميع الأجهزة والشاشات"},
+        {"icon": "🔒", "title": "آمن", "desc": "لا يجمع أو يخزن أي بيانات شخصية"},
+        {"icon": "🆓", "title": "مجاني", "desc": "خدمة مجانية بالكامل بدون أي رسوم"},
+        {"icon": "📚", "title": "شامل", "desc": "يغطي جميع جوانب قانون العمل الأردني"}
+    ]
+    
+    cols = st.columns(3)
+    for idx, feature in enumerate(features):
+        with cols[idx % 3]:
+            st.markdown(f"""
+            <div style='
+                background: #1E293B;
+                padding: 1rem;
+                border-radius: 10px;
+                border: 1px solid #334155;
+                margin: 0.5rem 0;
+                text-align: center;
+                transition: all 0.3s ease;
+            '>
+                <div style='font-size: 2rem; margin-bottom: 0.5rem;'>{feature['icon']}</div>
+                <h4 style='margin: 0.5rem 0; color: #F8FAFC;'>{feature['title']}</h4>
+                <p style='margin: 0; color: #CBD5E1; font-size: 0.9rem;'>{feature['desc']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # تذييل الصفحة
+    st.markdown(f"""
+    <div class="footer">
+        {config.get("FOOTER", {}).get("TEXT", "© 2025 SiraWork سيرا — جميع الحقوق محفوظة")}
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,76 @@
+import json
+
+import pandas as pd
+import streamlit as st
+
+from helpers.data_loader import load_performance_settings
+from helpers.instrumentation import PROFILE_DUMP_PATH, profiler
+
+# قراءة الإعداد مرة واحدة لكل عملية بدل قراءة الملف في كل تشغيل للصفحة
+DEBUG_PANEL = bool(load_performance_settings()["DEBUG_PANEL"])
+
+# ==========================
+# 🐞 لوحة قياس الأداء (اختيارية)
+# ==========================
+# تظهر في الشريط الجانبي عند DEBUG_PANEL في إعدادات PERFORMANCE فقط، وتعرض أزمنة الصفحات
+# والحاسبات من النافذة المتدحرجة في helpers.instrumentation. لا تُفتح من الرابط: اللوحة تصفّر
+# القياس المشترك للعملية وتكتب ملفًا على الخادم، فهي لمشغّل الخادم لا لأي زائر.
+
+
+def debug_panel_enabled():
+    """هل لوحة القياس مفعّلة (DEBUG_PANEL)؟"""
+    return DEBUG_PANEL
+
+
+def profiling_frame(snapshot):
+    """جدول ملخص المقاطع للعرض (الأبطأ أولًا حسب p90)"""
+    rows = []
+    for name, stats in snapshot.items():
+        rows.append({
+            "المقطع": name,
+            "العدد": stats["count"],
+            "أخطاء": stats["errors"],
+            "p50 (ms)": stats["wall_ms"]["p50"],
+            "p90 (ms)": stats["wall_ms"]["p90"],
+            "p99 (ms)": stats["wall_ms"]["p99"],
+            "CPU p50 (ms)": stats["cpu_ms"]["p50"],
+            "ذروة الذاكرة p90 (KB)": stats["peak_kb"]["p90"] if stats["peak_kb"] else None,
+        })
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows).sort_values("p90 (ms)", ascending=False).round(3)
+
+
+def show_profiling_panel():
+    """لوحة القياس في الشريط الجانبي"""
+    with st.sidebar.expander("🐞 قياس الأداء", expanded=False):
+        if not profiler.enabled:
+            st.info("القياس معطّل (PROFILING_ENABLED)")
+            return
+        snapshot = profiler.snapshot()
+        frame = profiling_frame(snapshot)
+        if frame.empty:
+            st.caption("لا توجد قياسات بعد")
+        else:
+            st.dataframe(frame, hide_index=True, width="stretch")
+            selected = st.selectbox("المدرج التكراري", list(snapshot), key="profiling_histogram")
+            st.bar_chart(pd.Series(snapshot[selected]["histogram_ms"], name="عدد"))
+
+        st.download_button(
+            "⬇️ تنزيل JSON",
+            json.dumps(snapshot, ensure_ascii=False, indent=2),
+            file_name="profile_dump.json",
+            mime="application/json",
+            width="stretch",
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("💾 حفظ", key="profiling_dump", width="stretch"):
+                try:
+                    st.success(f"تم الحفظ في {profiler.dump(PROFILE_DUMP_PATH)}")
+                except OSError as e:
+                    st.error(f"تعذر الحفظ: {e}")
+        with col2:
+            if st.button("🧹 تصفير", key="profiling_reset", width="stretch"):
+                profiler.reset()
+                st.rerun()
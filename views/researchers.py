@@ -0,0 +1,576 @@
+import streamlit as st
+
+from views.common import show_breadcrumbs
+
+# ==========================
+# 🔬 قسم الباحثين - المنصة البحثية المتكاملة
+# ==========================
+def show_researchers_section():
+    show_breadcrumbs("🔬 قسم الباحثين")
+    
+    st.markdown("""
+    <div style="text-align: center; margin-bottom: 2rem;">
+        <h1>🔬 المنصة البحثية المتكاملة لقانون العمل الأردني</h1>
+        <p>منظمة علمية شاملة للمصادر الموثوقة - محدثة 2024</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.info("""
+    **💡 دليل الاستخدام:** 
+    هذا القسم يوجهك إلى المصادر الرسمية والموثوقة للبحث القانوني. 
+    جميع الروابط تم اختبارها وتحديثها لضمان عملها.
+    """)
+
+    # تبويبات رئيسية شاملة
+    research_tabs = st.tabs([
+        "📘 أساسيات البحث العلمي",
+        "📚 التشريعات والأنظمة", 
+        "🎓 الدراسات والأبحاث",
+        "🔍 أدوات البحث المتقدم",
+        "🌍 المقارنات الدولية",
+        "⚖️ المنصات القانونية"
+    ])
+
+    with research_tabs[0]:
+        show_research_basics()
+
+    with research_tabs[1]:
+        show_legislative_resources()
+
+    with research_tabs[2]:
+        show_academic_resources()
+
+    with research_tabs[3]:
+        show_research_tools()
+
+    with research_tabs[4]:
+        show_international_comparisons()
+        
+    with research_tabs[5]:
+        show_legal_platforms()
+
+# ==========================
+# 📘 أساسيات البحث العلمي - دليل تعليمي شامل
+# ==========================
+def show_research_basics():
+    st.markdown("#### 📘 أساسيات ومنهجيات البحث العلمي في القانون")
+    
+    st.markdown("""
+    **الهدف:** توفير دليل منهجي متكامل لإجراء البحوث القانونية بطريقة علمية واحترافية
+    """)
+
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("##### 🎯 مقدمة في البحث العلمي القانوني")
+        
+        st.markdown("""
+        البحث العلمي في المجال القانوني يهدف إلى:
+        - اكتشاف المعرفة الجديدة في مجال القانون
+        - تحليل الظواهر القانونية وتحليلها
+        - تطوير الحلول للمشكلات القانونية
+        - المساهمة في تطور التشريعات والأنظمة
+        """)
+        
+        st.markdown("##### 📊 أنواع البحوث القانونية")
+        
+        research_types = [
+            {
+                "النوع": "البحث النظري (المكتبي)",
+                "الوصف": "يعتمد على المصادر المكتوبة والتحليل النصي",
+                "الأدوات": ["الكتب", "المجلات", "التشريعات", "الأحكام القضائية"]
+            },
+            {
+                "النوع": "البحث التطبيقي", 
+                "الوصف": "يركز على تطبيق النظريات على حالات واقعية",
+                "الأدوات": ["دراسات الحالة", "الاستبيانات", "المقابلات"]
+            },
+            {
+                "النوع": "البحث المقارن",
+                "الوصف": "يقارن بين الأنظمة القانونية المختلفة",
+                "الأدوات": ["النماذج المقارنة", "التحليل المقارن", "الدراسات الدولية"]
+            }
+        ]
+        
+        for research_type in research_types:
+            with st.expander(f"📖 {research_type['النوع']}"):
+                st.write(f"**الوصف:** {research_type['الوصف']}")
+                st.write("**الأدوات المستخدمة:**")
+                for tool in research_type['الأدوات']:
+                    st.write(f"• {tool}")
+    
+    with col2:
+        st.markdown("##### 🚀 الخطوات المنهجية للبحث العلمي")
+        
+        research_steps = [
+            "❶ اختيار الموضوع وتحديد المشكلة",
+            "❷ المراجعة المكتبية والدراسات السابقة", 
+            "❸ تصميم منهجية البحث وأدواته",
+            "❹ جمع البيانات والمعلومات",
+            "❺ تحليل البيانات والمناقشة",
+            "❻ كتابة التقرير البحثي والنتائج"
+        ]
+        
+        for step in research_steps:
+            st.write(f"• {step}")
+        
+        st.markdown("##### 🔬 المنهجيات البحثية")
+        
+        methodologies = [
+            "المنهج التحليلي: تحليل النصوص القانونية",
+            "المنهج المقارن: مقارنة الأنظمة المختلفة",
+            "المنهج التاريخي: دراسة التطور التشريعي",
+            "المنهج الوصفي: وصف الظواهر القانونية"
+        ]
+        
+        for method in methodologies:
+            st.write(f"• {method}")
+
+    st.markdown("##### ⚖️ أخلاقيات البحث العلمي")
+    
+    ethics = [
+        "الالتزام بالموضوعية والحياد في التحليل",
+        "احترام حقوق الملكية الفكرية والمصادر",
+        "الحفاظ على سرية المعلومات الحساسة",
+        "الإفصاح عن مصادر التمويل والاهتمامات",
+        "الالتزام بالدقة والأمانة العلمية"
+    ]
+    
+    for ethic in ethics:
+        st.write(f"✅ {ethic}")
+
+# ==========================
+# 📚 التشريعات والأنظمة - موسوعة تشريعية شاملة
+# ==========================
+def show_legislative_resources():
+    st.markdown("#### 📚 المصادر التشريعية الرسمية")
+    
+    st.markdown("**الهدف:** توجيه الباحثين إلى المصادر الرسمية للتشريعات الأردنية")
+
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("##### التشريعات الأساسية")
+        
+        legislations = [
+            {
+                "اسم التشريع": "قانون العمل الأردني رقم 8 لسنة 1996",
+                "الوصف": "النص الأساسي لقانون العمل مع جميع التعديلات",
+                "رابط": "https://www.mol.gov.jo/AR/List/%D8%A7%D9%84%D9%82%D9%88%D8%A7%D9%86%D9%8A%D9%86",
+                "مصدر": "الموقع الرسمي لوزارة العمل"
+            },
+            {
+                "اسم التشريع": "دستور المملكة الأردنية",
+                "الوصف": "الدستور الأردني - الباب الثاني: حقوق الأردنيين وواجباتهم",
+                "رابط": "https://representatives.jo/Ar/Pages/%D8%A7%D9%84%D8%AF%D8%B3%D8%AA%D9%88%D8%B1",
+                "مصدر": "رئاسة الوزراء"
+            },
+            {
+                "اسم التشريع": "قانون الضمان الاجتماعي",
+                "الوصف": "قانون الضمان الاجتماعي الأردني وتعديلاته",
+                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://www.ssc.gov.jo/wp-content/uploads/2021/10/%25D9%2582%25D8%25A7%25D9%2586%25D9%2588%25D9%2586-%25D8%25A7%25D9%2584%25D8%25B6%25D9%2585%25D8%25A7%25D9%2586-%25D8%25A7%25D9%2584%25D8%25A7%25D8%25AC%25D8%25AA%25D9%2585%25D8%25A7%25D8%25B9%25D9%258A-%25D8%25B1%25D9%2582%25D9%2585-%25D9%25A1-%25D9%2584%25D8%25B3%25D9%2586%25D8%25A9-%25D9%25A2%25D9%25A0%25D9%25A1%25D9%25A4-1.pdf&ved=2ahUKEwi50dyM_-2QAxXvVKQEHeTkGTUQFnoECBoQAQ&usg=AOvVaw2zF0XzGu-PHO-CACZd9dWe",
+                "مصدر": "مؤسسة الضمان الاجتماعي"
+            }
+        ]
+        
+        for law in legislations:
+            with st.expander(f"📖 {law['اسم التشريع']}"):
+                st.write(f"**الوصف:** {law['الوصف']}")
+                st.write(f"**المصدر:** {law['مصدر']}")
+                st.markdown(f"[🌐 الانتقال للمصدر]({law['رابط']})")
+    
+    with col2:
+        st.markdown("##### الأنظمة والتعليمات")
+        
+        regulations = [
+            {
+                "النظام": "نظام العمل المؤقت",
+                "الوصف": "تنظيم عقود العمل المؤقتة والمرنة",
+                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://jordanianlaw.com/%25D8%25A7%25D9%2584%25D9%2582%25D9%2588%25D8%25A7%25D9%2586%25D9%258A%25D9%2586/%25D9%2582%25D8%25A7%25D9%2586%25D9%2588%25D9%2586-%25D8%25A7%25D9%2584%25D8%25B9%25D9%2585%25D9%2584-%25D8%25A7%25D9%2584%25D9%2585%25D8%25A4%25D9%2582%25D8%25AA/&ved=2ahUKEwiSu5am_-2QAxXLUaQEHU0rKWoQFnoECB4QAQ&usg=AOvVaw1v6PQchSfyw4q3pWVUvSPX",
+                "حالة": "ساري المفعول"
+            },
+            {
+                "النظام": "نظام السلامة والصحة المهنية",
+                "الوصف": "اشتراطات السلامة في بيئات العمل",
+                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://mol.gov.jo/AR/List/%25D8%25AA%25D8%25B4%25D8%25B1%25D9%258A%25D8%25B9%25D8%25A7%25D8%25AA_%25D8%25A7%25D9%2584%25D8%25B3%25D9%2584%25D8%25A7%25D9%2585%25D8%25A9_%25D9%2588%25D8%25A7%25D9%2584%25D8%25B5%25D8%25AD%25D8%25A9_%25D8%25A7%25D9%2584%25D9%2585%25D9%2587%25D9%2586%25D9%258A%25D8%25A9&ved=2ahUKEwj6wajB_-2QAxX8KvsDHb-5LGkQFnoECCsQBQ&usg=AOvVaw26C8c8Or82KoAK_FKsw6CQ",
+                "حالة": "ساري المفعول"
+            },
+            {
+                "النظام": "تعليمات الحد الأدنى للأجور",
+                "الوصف": "تنظيم وتحديث الحد الأدنى للأجور",
+                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://mol.gov.jo/ar/NewsDetails/%25D8%25A7%25D9%2584%25D8%25AB%25D9%2584%25D8%25A7%25D8%25AB%25D9%258A%25D8%25A9_%25D8%25AA%25D8%25B1%25D9%2581%25D8%25B9_%25D8%25A7%25D9%2584%25D8%25AD%25D8%25AF_%25D8%25A7%25D9%2584%25D8%25A3%25D8%25AF%25D9%2586%25D9%2589_%25D9%2584%25D9%2584%25D8%25A3%25D8%25AC%25D9%2588%25D8%25B1_%25D8%25A5%25D9%2584%25D9%2589_290_%25D8%25AF%25D9%258A%25D9%2586%25D8%25A7%25D8%25B1%25D8%25A7_%25D8%25A7%25D8%25B9%25D8%25AA%25D8%25A8%25D8%25A7%25D8%25B1%25D8%25A7%25D9%258B_%25D9%2585%25D9%2586_%25D8%25A8%25D8%25AF%25D8%25A7%25D9%258A%25D8%25A9_%25D8%25B9%25D8%25A7%25D9%2585_2025&ved=2ahUKEwiiwt_X_-2QAxVYTqQEHQ_LC1gQFnoECBoQAQ&usg=AOvVaw1JeFwKBGQfIiI0MDsBiLvc",
+                "حالة": "ساري المفعول"
+            }
+        ]
+        
+        for reg in regulations:
+            with st.expander(f"📋 {reg['النظام']}"):
+                st.write(f"**الوصف:** {reg['الوصف']}")
+                st.write(f"**الحالة:** {reg['حالة']}")
+                st.markdown(f"[📄 عرض النظام]({reg['رابط']})")
+
+    st.markdown("##### 🔍 منهجية تحليل النصوص التشريعية")
+    
+    analysis_methods = [
+        "التحليل النصي: دراسة صياغة النص وتركيبه اللغوي",
+        "التحليل السياقي: فهم النص في سياقه التشريعي والاجتماعي", 
+        "التحليل المقارن: مقارنة النص مع تشريعات مشابهة",
+        "التحليل التطبيقي: دراسة كيفية تطبيق النص عملياً",
+        "التحليل التطوري: تتبع تطور النص عبر التعديلات"
+    ]
+    
+    for method in analysis_methods:
+        st.write(f"• {method}")
+
+# ==========================
+# 🎓 الدراسات والأبحاث - قاعدة معرفية شاملة
+# ==========================
+def show_academic_resources():
+    st.markdown("#### 🎓 المصادر الأكاديمية والبحثية")
+    
+    st.markdown("**الهدف:** توجيه الباحثين إلى المصادر الأكاديمية والدراسات البحثية")
+
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("##### المجلات العلمية المحكمة")
+        
+        journals = [
+            {
+                "المجلة": "المجلة الأردنية للقانون",
+                "الناشر": "الجامعة الأردنية",
+                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://dsr.ju.edu.jo/djournals/index.php/Law/user/setLocale/ar_IQ%3Fsource%3D%252Fdjournals%252Findex.php%252FLaw%252Fsearch&ved=2ahUKEwiWkeD0_-2QAxWwT6QEHcnRA1UQFnoECCYQAQ&usg=AOvVaw1n3sJNVEj5QbM6yd3WHo36",
+                "التخصص": "القانون العام والخاص"
+            },
+            {
+                "المجلة": "مجلة الشريعة والقانون",
+                "الناشر": "جامعة الإمارات",
+                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://scholarworks.uaeu.ac.ae/sharia_and_law/&ved=2ahUKEwjtlMCLgO6QAxVIOPsDHXevGQMQFnoECCEQAQ&usg=AOvVaw3cMX6GLqdlEkXkpn4s0sPc",
+                "التخصص": "الفقه والقانون المقارن"
+            },
+            {
+                "المجلة": "مجلة جامعة النجاح للأبحاث",
+                "الناشر": "جامعة النجاح الوطنية",
+                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://www.dfaj.net/index.php%3Fr%3Djournals/Journal%26i%3D31&ved=2ahUKEwjJy7qpgO6QAxXhAfsDHSqDChMQFnoECCEQAQ&usg=AOvVaw0HDV_IngGzTgOETDZr7rY2",
+                "التخصص": "الأبحاث العلمية المحكمة"
+            }
+        ]
+        
+        for journal in journals:
+            with st.expander(f"🎓 {journal['المجلة']}"):
+                st.write(f"**الناشر:** {journal['الناشر']}")
+                st.write(f"**التخصص:** {journal['التخصص']}")
+                st.markdown(f"[📚 زيارة المجلة]({journal['رابط']})")
+    
+    with col2:
+        st.markdown("##### المراكز البحثية")
+        
+        research_centers = [
+            {
+                "المركز": "مركز الدراسات الاستراتيجية",
+                "الجامعة": "الجامعة الأردنية", 
+                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://jcss.org/&ved=2ahUKEwi7k4vDgO6QAxVgOPsDHYs-JEUQFnoECB8QAQ&usg=AOvVaw0OGAjjEqgcM8V9EVDORl56",
+                "الإصدارات": "تقارير - أوراق سياسات - دراسات"
+            },
+            {
+                "المركز": "مركز حقوق الإنسان",
+                "الجامعة": "الجامعة الأردنية",
+                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://international.ju.edu.jo/ar/arabic/Lists/Courses/Disp_Course.aspx%3FID%3D432%26dept%3D%2520%25D8%25A7%25D9%2584%25D8%25AA%25D9%2586%25D9%2585%25D9%258A%25D8%25A9%2520%25D8%25A7%25D9%2584%25D8%25AF%25D9%2588%25D9%2584%25D9%258A%25D8%25A9%26prog%3D%25D9%2585%25D8%25A7%25D8%25AC%25D8%25B3%25D8%25AA%25D9%258A%25D8%25B1%2520%25D8%25AD%25D9%2582%25D9%2588%25D9%2582%2520%25D8%25A7%25D9%2584%25D8%25A5%25D9%2586%25D8%25B3%25D8%25A7%25D9%2586%2520%25D9%2588%25D8%25A7%25D9%2584%25D8%25AA%25D9%2586%25D9%2585%25D9%258A%25D8%25A9%2520%25D8%25A7%25D9%2584%25D8%25A5%25D9%2586%25D8%25B3%25D8%25A7%25D9%2586%25D9%258A%25D8%25A9%2520%26deptName%3D%2520%25D8%25A7%25D9%2584%25D8%25AA%25D9%2586%25D9%2585%25D9%258A%25D8%25A9%2520%25D8%25A7%25D9%2584%25D8%25AF%25D9%2588%25D9%2584%25D9%258A%25D8%25A9&ved=2ahUKEwisxJntgO6QAxVJTKQEHY7IFXkQFnoECD4QAQ&usg=AOvVaw3QYRMaBMvid8OuvYYiof_t",
+                "الإصدارات": "دراسات حقوقية - تقارير - أبحاث"
+            },
+            {
+                "المركز": "مركز دراسات العمل والتنمية",
+                "الجامعة": "الجامعة الهاشمية",
+                "رابط": "https://https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://hu.edu.jo/unitCenter/%3Funitid%3D90000000&ved=2ahUKEwjM9IiGge6QAxV8OfsDHQJoFOUQFnoECB4QAQ&usg=AOvVaw02g8CBlbBp7Zgs4LioQ62X",
+                "الإصدارات": "أبحاث اقتصادية - دراسات سوق العمل"
+            }
+        ]
+        
+        for center in research_centers:
+            with st.expander(f"🔬 {center['المركز']}"):
+                st.write(f"**الجامعة:** {center['الجامعة']}")
+                st.write(f"**الإصدارات:** {center['الإصدارات']}")
+                st.markdown(f"[🌐 زيارة المركز]({center['رابط']})")
+
+    st.markdown("##### 📊 تصنيف الدراسات البحثية")
+    
+    research_categories = {
+        "الدراسات النظرية": [
+            "تحليل النصوص التشريعية",
+            "دراسة المبادئ القانونية", 
+            "تحليل الأطر النظرية"
+        ],
+        "الدراسات التطبيقية": [
+            "تحليل التطبيق العملي للتشريعات",
+            "دراسة تأثير القوانين على أرض الواقع",
+            "تحليل كفاءة الأنظمة"
+        ],
+        "الدراسات المقارنة": [
+            "مقارنة التشريعات العربية",
+            "دراسة النماذج الدولية", 
+            "تحليل التجارب المقارنة"
+        ]
+    }
+    
+    for category, studies in research_categories.items():
+        with st.expander(f"📁 {category}"):
+            for study in studies:
+                st.write(f"• {study}")
+
+# ==========================
+# 🔍 أدوات البحث المتقدم - حزمة أدوات شاملة
+# ==========================
+def show_research_tools():
+    st.markdown("#### 🔍 أدوات ومنهجيات البحث العلمي")
+    
+    st.markdown("**الهدف:** توجيه الباحثين إلى الأدوات والتقنيات المساعدة في البحث العلمي")
+
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("##### أدوات البحث القانوني")
+        
+        research_tools = [
+            {
+                "الأداة": "منشئ الاقتباس القانوني",
+                "الوصف": "توليد تلقائي للاقتباسات بأنظمة مختلفة",
+                "رابط": "https://www.citethisforme.com/",
+                "الميزة": "مجاني - متعدد الأنظمة"
+            },
+            {
+                "الأداة": "مدقق التشريعات",
+                "الوصف": "مقارنة النصوص التشريعية وكشف التعديلات",
+                "رابط": "https://www.diffchecker.com/",
+                "الميزة": "مقارنة تلقائية"
+            },
+            {
+                "الأداة": "محول PDF إلى Word",
+                "الوصف": "تحويل ملفات PDF إلى نص قابل للتعديل",
+                "رابط": "https://smallpdf.com/ar/pdf-to-word",
+                "الميزة": "مجاني - سهل الاستخدام"
+            }
+        ]
+        
+        for tool in research_tools:
+            with st.expander(f"🛠️ {tool['الأداة']}"):
+                st.write(f"**الوصف:** {tool['الوصف']}")
+                st.write(f"**الميزة:** {tool['الميزة']}")
+                st.markdown(f"[🔧 استخدام الأداة]({tool['رابط']})")
+    
+    with col2:
+        st.markdown("##### منصات إدارة البحث")
+        
+        management_tools = [
+            {
+                "المنصة": "Zotero - إدارة المراجع",
+                "الوصف": "أداة مجانية ومفتوحة المصدر لإدارة المراجع",
+                "رابط": "https://www.zotero.org/",
+                "التكلفة": "مجاني بالكامل"
+            },
+            {
+                "المنصة": "Mendeley - إدارة الأبحاث", 
+                "الوصف": "منصة متكاملة لإدارة الأبحاث والتعاون العلمي",
+                "رابط": "https://www.mendeley.com/",
+                "التكلفة": "مجاني مع خيارات متقدمة"
+            },
+            {
+                "المنصة": "Google Scholar",
+                "الوصف": "محرك بحث أكاديمي للبحث في الأبحاث العلمية",
+                "رابط": "https://scholar.google.com/",
+                "التكلفة": "مجاني بالكامل"
+            }
+        ]
+        
+        for tool in management_tools:
+            with st.expander(f"📊 {tool['المنصة']}"):
+                st.write(f"**الوصف:** {tool['الوصف']}")
+                st.write(f"**التكلفة:** {tool['التكلفة']}")
+                st.markdown(f"[🚀 تجربة المنصة]({tool['رابط']})")
+
+    st.markdown("##### 📈 منهجيات تحليل البيانات")
+    
+    analysis_methodologies = [
+        {
+            "المنهجية": "التحليل الوصفي",
+            "الوصف": "وصف البيانات والمعلومات المجمعة",
+            "التطبيقات": ["توصيف العينات", "تحليل التوزيعات", "دراسة الخصائص"]
+        },
+        {
+            "المنهجية": "التحليل الاستدلالي", 
+            "الوصف": "الاستدلال على خصائص المجتمع من العينة",
+            "التطبيقات": ["اختبار الفرضيات", "تحليل العلاقات", "التعميم"]
+        },
+        {
+            "المنهجية": "التحليل السببي",
+            "الوصف": "دراسة العلاقات السببية بين المتغيرات",
+            "التطبيقات": ["تحليل الأثر", "دراسة العلاقات", "التنبؤ"]
+        }
+    ]
+    
+    for methodology in analysis_methodologies:
+        with st.expander(f"📊 {methodology['المنهجية']}"):
+            st.write(f"**الوصف:** {methodology['الوصف']}")
+            st.markdown("**مجالات التطبيق:**")
+            for app in methodology['التطبيقات']:
+                st.write(f"• {app}")
+
+# ==========================
+# 🌍 المقارنات الدولية - نظام مقارن متكامل
+# ==========================
+def show_international_comparisons():
+    st.markdown("#### 🌍 الدراسات المقارنة والتجارب الدولية")
+    
+    st.markdown("**الهدف:** توجيه الباحثين إلى مصادر المقارنات التشريعية الدولية")
+
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("##### المنظمات الدولية")
+        
+        international_orgs = [
+            {
+                "المنظمة": "منظمة العمل الدولية (ILO)",
+                "الوصف": "المرجع العالمي لمعايير العمل الدولية",
+                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://mol.gov.jo/AR/List/%25D8%25A7%25D9%2584%25D8%25A7%25D8%25AA%25D9%2581%25D8%25A7%25D9%2582%25D9%258A%25D8%25A7%25D8%25AA_%25D8%25A7%25D9%2584%25D8%25AF%25D9%2588%25D9%2584%25D9%258A%25D8%25A9&ved=2ahUKEwiHwbKuge6QAxXlSKQEHZ5IFxsQFnoECBsQAQ&usg=AOvVaw3FwSpwkc8risJgwdx-S1pE",
+                "المحتوى": "اتفاقيات - توصيات - تقارير"
+            },
+            {
+                "المنظمة": "البنك الدولي - قسم العمل",
+                "الوصف": "تقارير عن أسواق العمل والتنظيم",
+                "رابط": "https://www.google.com/url?sa=t&source=web&rct=j&opi=89978449&url=https://www.albankaldawli.org/ar/topic/jobsandgrowth/overview&ved=2ahUKEwjYp4POge6QAxWDdaQEHcn1Ir4QFnoECBsQAQ&usg=AOvVaw26eJ9YxAME90ZWPx0XjYhg",
+                "المحتوى": "تقارير اقتصادية - دراسات تأثير"
+            },
+            {
+                "المنظمة": "منظمة التجارة العالمية",
+                "الوصف": "تنظيم التجارة وتأثيرها على العمالة", 
+                "رابط": "https://commonslibrary.parliament.uk/research-briefings/cbp-9942/",
+                "المحتوى": "دراسات تأثير العولمة على العمالة"
+            }
+        ]
+        
+        for org in international_orgs:
+            with st.expander(f"🌐 {org['المنظمة']}"):
+                st.write(f"**الوصف:** {org['الوصف']}")
+                st.write(f"**المحتوى:** {org['المحتوى']}")
+                st.markdown(f"[🏛️ زيارة المنظمة]({org['رابط']})")
+    
+    with col2:
+        st.markdown("##### قواعد البيانات الدولية")
+        
+        international_db = [
+            {
+                "القاعدة": "NATLEX - تشريعات العمل العالمية",
+                "الوصف": "قاعدة بيانات تشريعات العمل في مختلف الدول",
+                "رابط": "https://www.ilo.org/dyn/natlex/natlex4.home",
+                "التغطية": "187 دولة"
+            },
+            {
+                "القاعدة": "WIPO Lex - الملكية الفكرية",
+                "الوصف": "قاعدة بيانات تشريعات الملكية الفكرية العالمية", 
+                "رابط": "https://wipolex.wipo.int/ar/main/legislation",
+                "التغطية": "شاملة"
+            },
+            {
+                "القاعدة": "FAOLEX - التشريعات الزراعية",
+                "الوصف": "قاعدة بيانات التشريعات الزراعية والغذائية",
+                "رابط": "http://www.fao.org/faolex/ar/",
+                "التغطية": "شاملة"
+            }
+        ]
+        
+        for db in international_db:
+            with st.expander(f"📈 {db['القاعدة']}"):
+                st.write(f"**الوصف:** {db['الوصف']}")
+                st.write(f"**التغطية:** {db['التغطية']}")
+                st.markdown(f"[📊 الانتقال للقاعدة]({db['رابط']})")
+
+    st.markdown("##### 🔍 منهجيات البحث المقارن")
+    
+    comparison_methods = [
+        "المقارنة الوصفية: وصف الأنظمة القانونية المختلفة",
+        "المقارنة التحليلية: تحليل العوامل المؤثرة في الاختلافات", 
+        "المقارنة التقييمية: تقييم كفاءة النماذج المختلفة",
+        "المقارنة التطويرية: استخلاص الدروس والتوصيات"
+    ]
+    
+    for method in comparison_methods:
+        st.write(f"• {method}")
+
+# ==========================
+# ⚖️ المنصات القانونية - بيئة رقمية متكاملة
+# ==========================
+def show_legal_platforms():
+    st.markdown("#### ⚖️ المنصات والبيئات الرقمية القانونية")
+    
+    st.markdown("**الهدف:** التعريف بالمنصات الرقمية الشاملة للبحث والاستشارة القانونية")
+
+    st.markdown("##### منصة قسطاس القانونية")
+    
+    st.markdown("""
+    **قسطاس** - منصة رقمية شاملة تهدف إلى توحيد المرجعية القانونية العربية 
+    وتبسيط الوصول إلى التشريعات والقوانين
+    """)
+
+    # خدمات المنصة
+    st.markdown("##### الخدمات والأدوات المتاحة")
+    
+    services = [
+        {
+            "الخدمة": "محرك البحث التشريعي المتقدم",
+            "الوصف": "بحث ذكي في النصوص التشريعية العربية",
+            "الميزات": ["بحث دلالي", "مقارنة نصوص", "تتبع التعديلات"]
+        },
+        {
+            "الخدمة": "قاعدة الأحكام القضائية", 
+            "الوصف": "أحكام محاكم عربية في مختلف التخصصات",
+            "الميزات": ["تصنيف موضوعي", "تحليل اتجاهات", "إحصائيات قضائية"]
+        },
+        {
+            "الخدمة": "الأدوات البحثية المساعدة",
+            "الوصف": "حزمة أدوات دعم للبحث العلمي",
+            "الميزات": ["إدارة مراجع", "تحليل استشهادات", "قوالب بحث"]
+        }
+    ]
+    
+    for service in services:
+        with st.expander(f"⚖️ {service['الخدمة']}"):
+            st.write(f"**الوصف:** {service['الوصف']}")
+            st.markdown("**الميزات:**")
+            for feature in service['الميزات']:
+                st.write(f"• {feature}")
+
+    # كيفية الوصول - الجزء المصحح
+    st.markdown("##### كيفية الوصول إلى المنصة")
+    
+    access_info = [
+        {
+            "الطريقة": "الموقع الإلكتروني الرسمي",
+            "الرابط": "https://qistas.com",
+            "الوصف": "المنصة الرئيسية بجميع خدماتها"
+        },
+        {
+            "الطريقة": "البريد الإلكتروني",
+            "الرابط": "info@qistas.com", 
+            "الوصف": "للاستفسارات والدعم الفني"
+        }
+    ]
+    
+    for info in access_info:
+        with st.expander(f"📱 {info['الطريقة']}"):
+            st.write(f"**الرابط:** {info['الرابط']}")
+            st.write(f"**الوصف:** {info['الوصف']}")
+            if info['الطريقة'] == "الموقع الإلكتروني الرسمي":
+                st.markdown(f"[🚀 الانتقال مباشرة]({info['الرابط']})")
+
+    st.markdown("##### 📋 معايير تقييم المنصات القانونية")
+    
+    evaluation_criteria = [
+        "الشمولية والتغطية: مدى شمولية المحتوى",
+        "الدقة والموثوقية: دقة المعلومات وموثوقية المصادر",
+        "سهولة الاستخدام: مدى سهولة استخدام المنصة",
+        "الأداء والتقنية: كفاءة المنصة التقنية وسرعة أدائها",
+        "التكامل والربط: قدرة المنصة على التكامل مع أنظمة أخرى"
+    ]
+    
+    for criterion in evaluation_criteria:
+        st.write(f"✅ {criterion}")
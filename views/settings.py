@@ -0,0 +1,74 @@
+import streamlit as st
+
+from views.common import show_breadcrumbs
+
+# ==========================
+# ⚙️ قسم الإعدادات
+# ==========================
+def show_settings_section():
+    show_breadcrumbs("⚙️ الإعدادات")
+    
+    st.markdown("""
+    <div class="header-with-logo">
+        <div class="logo-container">
+            <div class="logo-text">⚙️</div>
+        </div>
+        <div style="text-align: center;">
+            <h1>⚙️ إعدادات المنصة وسياسات الخصوصية</h1>
+            <p>إدارة تفضيلاتك ومراجعة سياسات الاستخدام والخصوصية</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    settings_tabs = st.tabs(["🔒 الخصوصية والأمان", "📞 الدعم والاتصال", "ℹ️ عن المنصة"])
+
+    with settings_tabs[0]:
+        st.markdown("#### 🔒 سياسات الخصوصية والأمان")
+        
+        st.markdown("""
+        <div class="privacy-highlight">
+        <h4>🚫 سياسة عدم جمع البيانات</h4>
+        <p>هذه المنصة <strong>لا تجمع أو تخزين أي بيانات شخصية</strong> عن المستخدمين. 
+        جميع البيانات تُحفظ في جلسة المتصفح المؤقتة وتُمسح تلقائياً عند الإغلاق.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.warning("""
+        **⚠️ تنويه هام:**
+        هذه المنصة توعوية تعليمية فقط ولا تقدم أي خدمات استشارية قانونية.
+        المعلومات المقدمة لأغراض المعرفة العامة والتعليم فقط.
+        """)
+
+    with settings_tabs[1]:
+        st.markdown("#### 📞 قنوات الدعم والاتصال")
+        
+        st.info("""
+        **💼 للاستفسارات الفنية والدعم:**
+        نحن هنا لمساعدتك في أي استفسارات فنية أو تقنية متعلقة باستخدام المنصة.
+        """)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("##### 📧 البريد الإلكتروني")
+            st.markdown("""
+            <div style="background: #f0f9ff; padding: 1rem; border-radius: 10px; border-left: 4px solid #2563EB;">
+                <h4 style="margin: 0 0 0.5rem 0;">📧 sirawork2025@gmail.com</h4>
+                <p style="margin: 0; color: #666;">للأسئلة الفنية والدعم التقني</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with settings_tabs[2]:
+        st.markdown("#### ℹ️ معلومات عن منصة SiraWork")
+        
+        st.markdown("""
+        **🎯 رؤية المنصة:**
+        SiraWork منصة توعوية تعليمية تهدف إلى نشر الوعي القانوني في مجال حقوق العمل
+        وتوفير أدوات تعليمية تفاعلية للمستخدمين.
+        
+        **🏆 المميزات:**
+        - ✅ مجانية بالكامل
+        - ✅ لا تتطلب تسجيل دخول
+        - ✅ لا تتبع المستخدمين
+        - ✅ تحديثات مستمرة
+        """)
@@ -0,0 +1,844 @@
+import streamlit as st
+
+from views.common import show_breadcrumbs
+
+# ==========================
+# 👷 قسم العمال - الإصدار المدمج والمكتمل
+# ==========================
+def show_workers_section():
+    show_breadcrumbs("👷 قسم العمال")
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>👷 منصة حقوق العاملين في الأردن</h1>
+        <p>دليل شامل حسب قانون العمل الأردني رقم 8 لسنة 1996 وتعديلاته</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # شريط المعلومات حسب القانون
+    st.info("""
+    **📢 أحكام قانون العمل الأردني:** 
+    - قانون العمل رقم 8 لسنة 1996 وتعديلاته
+    - آخر تعديل: قانون معدل لقانون العمل
+    """)
+
+    worker_tabs = st.tabs([
+        "📋 الحقوق الأساسية", 
+        "👥 حقوق الفئات الخاصة",
+        "💰 الحقوق المالية",
+        "⏰ وقت العمل والإجازات", 
+        "🛡️ الحماية والسلامة",
+        "🔍 فحص الحقوق",
+        "📝 واجبات العامل"
+    ])
+
+    with worker_tabs[0]:
+        show_enhanced_basic_rights()
+
+    with worker_tabs[1]:
+        show_special_categories_rights()
+
+    with worker_tabs[2]:
+        show_enhanced_financial_rights()
+
+    with worker_tabs[3]:
+        show_enhanced_work_time()
+
+    with worker_tabs[4]:
+        show_enhanced_protection()
+
+    with worker_tabs[5]:
+        show_enhanced_rights_checker()
+        
+    with worker_tabs[6]:
+        show_worker_obligations()
+
+# ==========================
+# 📋 الحقوق الأساسية - مدمج ومكتمل
+# ==========================
+def show_enhanced_basic_rights():
+    st.markdown("#### 📋 الحقوق الأساسية - حسب قانون العمل الأردني")
+    
+    # الحقوق التعاقدية - كاملة من الإضافات
+    contract_expanders = [
+        {
+            "title": "📄 عقد العمل - المادة 13",
+            "content": """
+            **الشروط الإلزامية في العقد:**
+            - ينظم عقد العمل باللغة العربية
+            - على الأقل يحتفظ كل من الطرفين بنسخة منه
+            - يجوز للعامل إثبات حقوقه بجميع طرق الإثبات القانونية إذا لم يحرر العقد كتابة
+            - إذا كان العامل لا يحمل جنسية عربية فينظم نسخة أخرى من العقد بلغة أجنبية معتمدة
+            
+            **أحكام إضافية - المادة 14:**
+            - إذا أبرم عقد العمل لمدة محددة فإنه ينتهي من تلقاء نفسه بانتهاء مدته
+            - إذا استمر طرفاه في تنفيذه بعد انقضاء مدته اعتبر ذلك تجديداً له لمدة غير محدودة
+            - يعتبر العامل الذي يستخدم بانتظام بالقطعة في محل العمل عامل لمدة غير محدودة
+            """
+        },
+        {
+            "title": "⏳ فترة التجربة - المادة 25",
+            "content": """
+            **أحكام فترة التجربة:**
+            - يجوز لصاحب العمل استخدام أي عامل قيد التجربة للتحقق من كفاءته
+            - ألا تزيد مدة التجربة في أي حالة من الحالات على ثلاثة أشهر
+            - ألا يقل أجر العامل قيد التجربة عن الحد الأدنى المقرر للأجور
+            - يحق لصاحب العمل إنهاء استخدام العامل تحت التجربة دون إشعار أو مكافأة خلال هذه التجربة
+            - إذا استمر العامل في عمله بعد انتهاء هذه التجربة اعتبر العقد عقد عمل لمدة غير محدودة
+            """
+        },
+        {
+            "title": "🔄 إنهاء عقد العمل - المواد 28-30",
+            "content": """
+            **أسباب الفصل القانوني - المادة 28:**
+            - إذا انتحل العامل شخصية أو هوية غيره أو قدم شهادات أو وثائق مزورة
+            - إذا لم يقم العامل بالوفاء بالالتزامات المترتبة عليه بموجب عقد العمل
+            - إذا ارتكب العامل خطأ نشأ عنه خسارة مادية جسيمة لصاحب العمل
+            - إذا خالف العامل النظام الداخلي للمؤسسة بما في ذلك شروط سلامة العمل مرتين بعد إنذاره كتابياً
+            
+            **إنهاء العقد غير المحدد المدة - المادة 29:**
+            - إذا رغب أحد الطرفين في إنهاء عقد العمل غير المحدد المدة فيترتب عليه إشعار الطرف الآخر خطياً
+            - قبل شهر واحد على الأقل من التاريخ المحدد للإنهاء
+            - يبقى عقد العمل ساري المفعول طوال مدة الإشعار وتعتبر مدة الإشعار من مدة الخدمة
+            
+            **🚫 حالات عدم جواز الفصل - المادة 30:**
+            - المرأة العاملة الحامل ابتداء من الشهر السادس من حملها أو خلال إجازة الأمومة
+            - العامل المؤدي خدمة العلم أو الخدمة الاجتماعية في أثناء قيامه بتلك الخدمة
+            - العامل في أثناء إجازته السنوية أو المرضية
+            - العامل في أثناء إجازته الممنوحة له لأغراض التثقيف العمالي أو الحج
+            """
+        },
+        {
+            "title": "🔧 تغيير طبيعة العمل - المادة 15",
+            "content": """
+            **تغيير طبيعة العمل:**
+            - لا يلزم العامل بالقيام بعمل يختلف اختلافاً بيناً عن طبيعة العمل المتفق عليه في عقد العمل
+            - إلا إذا دعت الضرورة إلى ذلك لوقوع حادث أو لصالح ما نجم عنه أو في حالة القوة القاهرة
+            - يجب أن يكون ذلك في حدود طاقة العامل وفي حدود العرف الذي أقدم على هذا العمل
+            """
+        },
+        {
+            "title": "📍 تغيير مكان العمل - المادة 16",
+            "content": """
+            **تغيير مكان العمل:**
+            - لا يلزم العامل بالعمل في مكان غير المكان المخصص لعمله إذا أدى ذلك إلى تغيير مكان إقامته
+            - إلا إذا ورد نص صريح يجيز ذلك في عقد العمل
+            - يحق للعامل رفض النقل إذا كان سيتسبب في تغيير محل إقامته الدائم
+            """
+        }
+    ]
+    
+    for expander in contract_expanders:
+        with st.expander(expander["title"], expanded=False):
+            st.markdown(expander["content"])
+    
+    # إضافة مواد جديدة حول التفتيش والرقابة من الإضافات
+    st.markdown("##### 🔍 التفتيش والرقابة - المواد 5-10")
+    
+    inspection_rights = [
+        {
+            "title": "صلاحيات مفتش العمل - المادة 7",
+            "content": """
+            **صلاحيات مفتش العمل:**
+            - يمارس مفتش العمل أثناء قيامه بوظيفته الصلاحيات المخولة لأفراد الضابطة العدلية
+            - للمفتش الطلب من صاحب العمل إزالة المخالفة خلال مدة لا تزيد على سبعة أيام
+            - في حالة التخلف فللوزير أن يقرر إغلاق المؤسسة لحين إزالة المخالفة
+            - تحكم المحكمة على المخالف بإزالة المخالفة وبغرامة لا تقل عن خمسين ديناراً ولا تزيد على خمسمائة دينار
+            """
+        },
+        {
+            "title": "واجبات صاحب العمل - المادة 8",
+            "content": """
+            **الواجبات الإلزامية:**
+            - إرسال إشعار إلى الوزارة يتضمن عدد العمال وموقع عمل كل منهم وطبيعة عمله
+            - الاحتفاظ في المؤسسة بالسجلات الواجب عليه الاحتفاظ بها بما في ذلك سجلات العمل والمتدربين
+            - تقديم البيانات والمعلومات التي تطلبها الوزارة بشكل دوري
+            """
+        }
+    ]
+    
+    for right in inspection_rights:
+        with st.expander(f"🔍 {right['title']}"):
+            st.write(right['content'])
+    
+    # الحقوق الأساسية الأخرى من الأساسي
+    st.markdown("##### 🛡️ حقوق أساسية أخرى")
+    
+    basic_rights = [
+        {
+            "title": "الحقوق المكتسبة - المادة 4",
+            "content": "لا تؤثر أحكام هذا القانون على أي حق من الحقوق التي يمنحها للعامل أي قانون آخر أو عقد عمل إذا كان أي منها يرتب للعامل حقوقاً أفضل من الحقوق المقررة له بموجب أحكام هذا القانون"
+        },
+        {
+            "title": "تسليم شهادة الخدمة - المادة 31",
+            "content": "على صاحب العمل أن يورد للعامل عند انتهاء خدمته بناء على طلبه شهادة خدمة يذكر فيها اسم العامل ونوع عمله وتاريخ الالتحاق بالخدمة وتاريخ انتهاء الخدمة"
+        }
+    ]
+    
+    for right in basic_rights:
+        with st.expander(f"🛡️ {right['title']}"):
+            st.write(right['content'])
+
+# ==========================
+# 👥 حقوق الفئات الخاصة - مدمج من الأساسي
+# ==========================
+def show_special_categories_rights():
+    st.markdown("#### 👥 حقوق الفئات الخاصة - حسب قانون العمل الأردني")
+    
+    special_categories = st.tabs([
+        "👩 المرأة العاملة", 
+        "👦 العمال الأحداث", 
+        "🌍 غير الأردنيين",
+        "♿ ذوو الإعاقة"
+    ])
+    
+    with special_categories[0]:
+        st.markdown("**👩 حقوق المرأة العاملة**")
+        
+        women_rights = [
+            {
+                "title": "إجازة الأمومة - المادة 70",
+                "details": "عشرة أسابيع مدفوعة الأجر، على أن لا تقل المدة التي تقع بعد الوضع عن ستة أسابيع",
+                "conditions": "تشمل جميع العاملات بغض النظر عن مدة الخدمة"
+            },
+            {
+                "title": "الحماية من الفصل - المادة 71", 
+                "details": "يحظر فصل العاملة بسبب الحمل أو أثناء إجازة الأمومة",
+                "conditions": "الفصل خلال هذه الفترة يعتبر تعسفياً وباطلاً"
+            },
+            {
+                "title": "ساعات الرضاعة - المادة 72",
+                "details": "ساعة واحدة يومياً لرعاية الطفل لمدة عام من تاريخ الولادة",
+                "conditions": "يمكن تجميع هذه الساعات وتحويلها لإجازة"
+            }
+        ]
+        
+        for right in women_rights:
+            with st.expander(f"👩 {right['title']}"):
+                st.write(f"**التفاصيل:** {right['details']}")
+                st.write(f"**الشروط:** {right['conditions']}")
+                
+    with special_categories[1]:
+        st.markdown("**👦 حماية الأحداث - المواد 73-76**")
+        
+        youth_protections = [
+            {
+                "title": "الحد الأدنى للسن - المادة 73",
+                "details": "يجب ألا يقل سن الحدث عن ست عشرة سنة ميلادية",
+                "conditions": "يستثنى من ذلك بعض الأعمال الخفيفة غير المضرة بشروط"
+            },
+            {
+                "title": "ساعات العمل - المادة 74",
+                "details": "لا يجوز تشغيل الحدث أكثر من ست ساعات يومياً",
+                "conditions": "يجب أن تتخلل ساعات العمل فترة أو أكثر للراحة لا تقل في مجموعها عن ساعة واحدة"
+            },
+            {
+                "title": "العمل الليلي - المادة 75",
+                "details": "يحظر تشغيل الأحداث بين الساعة الثامنة مساءً والسادسة صباحاً",
+                "conditions": "يشمل ذلك العمل في المقاهي والمطاعم ليلاً"
+            }
+        ]
+        
+        for protection in youth_protections:
+            with st.expander(f"👦 {protection['title']}"):
+                st.write(f"**التفاصيل:** {protection['details']}")
+                st.write(f"**الشروط:** {protection['conditions']}")
+                
+    with special_categories[2]:
+        st.markdown("**🌍 حقوق العمال غير الأردنيين - المواد 12-14**")
+        
+        foreign_workers = [
+            {
+                "title": "ترخيص العمل - المادة 12",
+                "details": "لا يجوز استخدام أي عامل غير أردني إلا بموافقة الوزير أو من يفوضه",
+                "conditions": "يشترط أن يتطلب العمل خبرة وكفاءة غير متوافرة لدى العمال الأردنيين"
+            },
+            {
+                "title": "تصريح العمل - المادة 13",
+                "details": "يجب أن يحصل العامل غير الأردني على تصريح عمل من الوزير أو من يفوضه قبل استخدامه",
+                "conditions": "يكون مدته سنة أو جزءاً من السنة ما لم يقرر الوزير أن تكون مدته سنتين"
+            }
+        ]
+        
+        for right in foreign_workers:
+            with st.expander(f"🌍 {right['title']}"):
+                st.write(f"**التفاصيل:** {right['details']}")
+                st.write(f"**الشروط:** {right['conditions']}")
+                
+    with special_categories[3]:
+        st.markdown("**♿ حقوق ذوي الإعاقة - المادة 14 مكرر**")
+        
+        disability_rights = [
+            {
+                "title": "توفير فرص العمل - المادة 14 مكرر",
+                "details": "على صاحب العمل أن يشغل من العمال ذوي الإعاقة النسبة المحددة في قانون حقوق الأشخاص ذوي الإعاقة النافذ",
+                "conditions": "وفق الشروط الواردة فيه وإن يرسل الى الوزارة بياناً يحدد فيه الأعمال التي يشغلها ذوو الإعاقة وأجر كل منهم"
+            }
+        ]
+        
+        for right in disability_rights:
+            with st.expander(f"♿ {right['title']}"):
+                st.write(f"**التفاصيل:** {right['details']}")
+                st.write(f"**الشروط:** {right['conditions']}")
+
+# ==========================
+# 💰 الحقوق المالية - مدمج ومكتمل
+# ==========================
+def show_enhanced_financial_rights():
+    st.markdown("#### 💰 النظام المالي للعاملين - حسب قانون العمل الأردني")
+    
+    financial_tabs = st.tabs(["الأجور والرواتب", "المكافآت والحوافز", "الاستقطاعات", "الحماية المالية"])
+    
+    with financial_tabs[0]:
+        st.markdown("##### 💵 نظام الأجور والرواتب")
+        
+        salary_structure = [
+            {
+                "component": "الأجر - المادة 2",
+                "description": "كل ما يستحقه العامل لقاء عمله نقداً أو عيناً مضافاً إليه سائر الاستحقاقات الأخرى",
+                "details": "باستثناء الأمور المستحقة عن العمل الإضافي"
+            },
+            {
+                "component": "التمييز في الأجر - المادة 2",
+                "description": "عدم المساواة بين العاملين في الأجر عن كل عمل ذي قيمة متساوية دون أي تمييز قائم على الجنس",
+                "details": "يحظر التمييز في الأجر بين الجنسين عن العمل متساوي القيمة"
+            },
+            {
+                "component": "تحديد الأجر - المادة 47",
+                "description": "يحدد مقدار الأجر في العقد وإذا لم ينص عقد العمل عليه فيأخذ العامل الأجر المقدر لعمل من نفس النوع",
+                "details": "إذا لم يوجد تقدر المحكمة الأجر بمقتضى أحكام هذا القانون باعتباره نزاعاً عمالياً على الأجر"
+            }
+        ]
+        
+        for item in salary_structure:
+            with st.expander(f"💰 {item['component']}"):
+                st.write(f"**الوصف:** {item['description']}")
+                st.write(f"**التفاصيل:** {item['details']}")
+        
+        st.markdown("##### ⏰ مواعيد صرف الرواتب - المادة 55")
+        st.info("""
+        **المادة 55:** 
+        - يدفع الأجر وبدل العمل الإضافي خلال مدة لا تزيد على سبعة أيام من تاريخ استحقاقه
+        - لا يجوز لصاحب العمل حسم أي جزء منها إلا في الحالات التي يجيزها القانون
+        """)
+    
+    with financial_tabs[1]:
+        st.markdown("##### 🎁 نظام المكافآت والحوافز")
+        
+        bonus_types = [
+            {
+                "type": "مكافأة نهاية الخدمة - المادة 33",
+                "calculation": "تحسب على أساس آخر أجر تقاضاه العامل",
+                "details": """
+                **طريقة الحساب:**
+                - للعامل غير الخاضع لأحكام قانون الضمان الاجتماعي الذي تنتهي خدمته يحق الحصول على مكافأة نهاية الخدمة
+                - تعادل آخر أجر شهرين عن كل سنة من خدمته الفعلية
+                - تحتسب كسور السنة مكافأة نسبية
+                - إذا كان الأجر كله أو بعضه يحسب على أساس العمولة أو القطعة فيعتمد لحساب المكافأة المتوسط الشهري لما تقاضاه العامل فعلاً
+                """
+            },
+            {
+                "type": "بدل العمل الإضافي - المادة 54",
+                "calculation": "125% من الأجر المعتاد",
+                "details": """
+                **الشروط:**
+                - يجوز تشغيل العامل بموافقته أكثر من ساعات العمل اليومية أو الأسبوعية
+                - يتقاضي العامل عن ساعة العمل الإضافية أجراً لا يقل عن 25% من أجره المعتاد
+                - إذا اشتغل العامل في يوم عطلته الأسبوعية يتقاضى أجراً إضافياً لا يقل عن 50% من أجره المعتاد
+                """
+            }
+        ]
+        
+        for bonus in bonus_types:
+            with st.expander(f"🎁 {bonus['type']}"):
+                st.write(f"**طريقة الحساب:** {bonus['calculation']}")
+                st.markdown(bonus['details'])
+    
+    with financial_tabs[2]:
+        st.markdown("##### 💸 الاستقطاعات المسموحة - المادة 56")
+        
+        deductions = [
+            "استرداد ما قدم صاحب العمل من سلف للعامل بحيث لا يزيد كل قسط يتم استرداده على 10% من الأجر",
+            "استرداد أي مبلغ دفع للعامل زيادة على استحقاقه",
+            "اشتراكات الضمان الاجتماعي وأقساطها المستحقة على العامل",
+            "الغرامات التي تفرض على العامل بسبب مخالفته أحكام النظام الداخلي للمؤسسة أو عقد العمل",
+            "كل دين يستوفى تنفيذاً لحكم قضائي"
+        ]
+        
+        st.write("**الاستقطاعات القانونية:**")
+        for deduction in deductions:
+            st.write(f"📋 {deduction}")
+    
+    with financial_tabs[3]:
+        st.markdown("##### 🛡️ الحماية المالية - المواد 57-58")
+        
+        financial_protections = [
+            {
+                "title": "امتياز الأجور - المادة 57",
+                "content": """
+                **الحماية القانونية للأجور:**
+                - تعتبر الأجور والمبالغ المستحقة بموجب أحكام هذا القانون للعامل أو ورثته ديواناً مفضلاً امتيازاً عاماً
+                - في حالة إفلاس صاحب العمل يدفع المصفي للعامل أو لورثته فوراً ما يعادل أجر شهر واحد
+                - يتم الدفع قبل تسديد أي مصروفات أخرى بما في ذلك المصروفات القضائية
+                """
+            },
+            {
+                "title": "الحد الأدنى للأجور - المادة 58",
+                "content": """
+                **تحديد الحد الأدنى للأجور:**
+                - تشكل لجنة ثلاثية لتحديد الحد الأدنى للأجور بصورة عامة أو بالنسبة لمنطقة أو لمهنة معينة
+                - يؤخذ بعين الاعتبار مؤشرات تكاليف المعيشة التي تصدرها الجهات الرسمية المختصة
+                - يعاقب صاحب العمل بغرامة عن كل حالة يدفع فيها إلى عامل أجراً يقل عن الحد الأدنى للأجور
+                """
+            }
+        ]
+        
+        for protection in financial_protections:
+            with st.expander(f"🛡️ {protection['title']}"):
+                st.markdown(protection['content'])
+
+# ==========================
+# ⏰ وقت العمل والإجازات - مدمج ومكتمل
+# ==========================
+def show_enhanced_work_time():
+    st.markdown("#### ⏰ نظام وقت العمل والإجازات - حسب قانون العمل الأردني")
+    
+    time_tabs = st.tabs(["ساعات العمل", "الإجازات السنوية", "الإجازات الخاصة", "الإجازات الدينية"])
+    
+    with time_tabs[0]:
+        st.markdown("##### 🕒 نظام ساعات العمل - المواد 51-54")
+        
+        work_systems = [
+            {
+                "system": "ساعات العمل العادية - المادة 51",
+                "hours": "8 ساعات يومياً أو 48 ساعة أسبوعياً",
+                "breaks": "لا يحسب منها الوقت المخصص لتناول الطعام والراحة",
+                "details": "يجوز توزيع الحد الأقصى لساعات العمل الأسبوعية وفترات الراحة بحيث لا يزيد مجموعها على إحدى عشرة ساعة في اليوم"
+            },
+            {
+                "system": "العمل الإضافي - المادة 52",
+                "hours": "يجوز لصاحب العمل تشغيل العامل أكثر من ساعات العمل اليومية أو الأسبوعية",
+                "breaks": "يتقاضي العامل في أي من هذه الحالات الأجر الإضافي المنصوص عليه",
+                "details": "يشمل أعمال الجرد السنوي وأعمال منع الخسائر في البضائع مع عدم تجاوز 30 يوماً في السنة"
+            },
+            {
+                "system": "العطلة الأسبوعية - المادة 55",
+                "hours": "يوم الجمعة من كل أسبوع يوم العطلة الأسبوعية للعامل",
+                "breaks": "إلا إذا اقتضت طبيعة العمل غير ذلك",
+                "details": "يجوز للعامل بموافقة صاحب العمل جمع أيام عطلة الأسبوعية والحصول عليها خلال مدة لا تزيد على شهر"
+            }
+        ]
+        
+        for system in work_systems:
+            with st.expander(f"🕒 {system['system']}"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write(f"**الساعات:** {system['hours']}")
+                    st.write(f"**فترات الراحة:** {system['breaks']}")
+                with col2:
+                    st.write(f"**التفاصيل:** {system['details']}")
+    
+    with time_tabs[1]:
+        st.markdown("##### 🌴 الإجازة السنوية - المواد 57-60")
+        
+        vacation_data = {
+            "أقل من 5 سنوات": {"days": 14, "law": "المادة 57"},
+            "5 سنوات فأكثر": {"days": 21, "law": "المادة 57"}
+        }
+        
+        for service, info in vacation_data.items():
+            col1, col2 = st.columns([2,1])
+            with col1:
+                st.metric(f"الإجازة لـ {service}", f"{info['days']} يوم")
+            with col2:
+                st.write(f"**{info['law']}**")
+        
+        st.info("""
+        **أحكام الإجازة السنوية - المواد 58-60:**
+        - لا تحسب أيام العطل الرسمية والأعياد الدينية وأيام العطلة الأسبوعية من الإجازة السنوية
+        - إذا لم تبلغ مدة خدمة العامل السنة فيحق له الحصول على إجازة بأجر بنسبة المدة التي عمل خلالها
+        - يجوز تأجيل إجازة العامل عن أي سنة بالاتفاق بين العامل وصاحب العمل إلى السنة التالية
+        - إذا انتهت خدمة العامل قبل أن يستعمل إجازته السنوية فيحق له تقاضي الأجر عن الأيام التي لم يستعملها
+        """)
+    
+    with time_tabs[2]:
+        st.markdown("##### 🏥 الإجازات الخاصة والطارئة")
+        
+        special_leaves = [
+            {
+                "type": "الإجازة المرضية - المادة 68",
+                "duration": "14 يوماً خلال السنة الواحدة بأجر كامل",
+                "conditions": "بناء على تقرير من الطبيب المعتمد من قبل المؤسسة",
+                "law": "المادة 68"
+            },
+            {
+                "type": "إجازة الأمومة - المادة 70",
+                "duration": "10 أسابيع مدفوعة الأجر",
+                "conditions": "على أن لا تقل المدة التي تقع بعد الوضع عن 6 أسابيع",
+                "law": "المادة 70"
+            },
+            {
+                "type": "الإجازات الإضافية - المادة 71",
+                "duration": "14 يوماً في السنة مدفوعة الأجر",
+                "conditions": "للتحاق بدورة للثقافة العمالية أو أداء فريضة الحج أو الدراسة",
+                "law": "المادة 71"
+            }
+        ]
+        
+        for leave in special_leaves:
+            with st.expander(f"🏥 {leave['type']}"):
+                st.write(f"**المدة:** {leave['duration']}")
+                st.write(f"**الشروط:** {leave['conditions']}")
+                st.write(f"**القانون:** {leave['law']}")
+    
+    with time_tabs[3]:
+        st.markdown("##### 🕌 الإجازات الدينية والرسمية - المادة 54")
+        
+        religious_leaves = [
+            {
+                "type": "العمل في أيام العطل",
+                "details": "إذا اشتغل العامل في يوم عطلته الأسبوعية أو أيام الأعياد الدينية أو العطل الرسمية يتقاضى لقاء عمله عن ذلك اليوم أجراً إضافياً لا يقل عن 50% من أجره المعتاد",
+                "law": "المادة 54"
+            },
+            {
+                "type": "إجازة الحج",
+                "details": "يحق للعامل الحصول على إجازة مدفوعة الأجر لأداء فريضة الحج بشرط أن يكون قد عمل مدة خمس سنوات متواصلة على الأقل",
+                "law": "المادة 71"
+            }
+        ]
+        
+        for leave in religious_leaves:
+            with st.expander(f"🕌 {leave['type']}"):
+                st.write(f"**التفاصيل:** {leave['details']}")
+                st.write(f"**القانون:** {leave['law']}")
+
+# ==========================
+# 🛡️ الحماية والسلامة - مدمج من الأساسي
+# ==========================
+def show_enhanced_protection():
+    st.markdown("#### 🛡️ نظام الحماية والسلامة - حسب قانون العمل الأردني")
+    
+    protection_tabs = st.tabs(["السلامة المهنية", "الصحة المهنية", "الحماية الاجتماعية"])
+    
+    with protection_tabs[0]:
+        st.markdown("##### 🦺 السلامة والصحة المهنية - المواد 79-83")
+        
+        safety_obligations = [
+            {
+                "obligation": "توفير بيئة عمل آمنة - المادة 79",
+                "details": "توفير الاحتياطات والتدابير اللازمة لحماية العمال من الأخطار والأمراض التي قد تنجم عن العمل وعن الآلات المستعملة فيه",
+                "law": "المادة 79"
+            },
+            {
+                "obligation": "وسائل الحماية الشخصية - المادة 80",
+                "details": "توفير وسائل الحماية الشخصية والوقاية للعاملين من خلال العمل وأمراض المهنة كالملابس والنظارات والوقايات والأحذية وغيرها وإرشادهم إلى طريقة استعمالها والمحافظة عليها وعلى نظافتها",
+                "law": "المادة 80"
+            }
+        ]
+        
+        for obligation in safety_obligations:
+            with st.expander(f"🛡️ {obligation['obligation']}"):
+                st.write(f"**التفاصيل:** {obligation['details']}")
+                st.write(f"**القانون:** {obligation['law']}")
+    
+    with protection_tabs[1]:
+        st.markdown("##### 🏥 الصحة المهنية - المواد 81-85")
+        
+        health_obligations = [
+            {
+                "obligation": "الفحوصات الطبية - المادة 81",
+                "details": "إخضاع العامل للفحوصات الطبية التي تقتضي طبيعة العمل ضرورة إجراؤها قبل الالتحاق بالعمل أو بعد ذلك للتحقق من خلوه من الأمراض المعدية والسارية",
+                "law": "المادة 81"
+            },
+            {
+                "obligation": "الوقاية من المواد الخطرة - المادة 83",
+                "details": "اتخاذ الاحتياطات اللازمة لحماية المؤسسة والعاملين فيها من أخطار الحريق والانفجارات أو تخزين المواد الخطرة القابلة للاشتعال أو نقلها أو تداولها وتوفير الوسائل والأجهزة الفنية الكافية",
+                "law": "المادة 83"
+            }
+        ]
+        
+        for obligation in health_obligations:
+            with st.expander(f"🏥 {obligation['obligation']}"):
+                st.write(f"**التفاصيل:** {obligation['details']}")
+                st.write(f"**القانون:** {obligation['law']}")
+    
+    with protection_tabs[2]:
+        st.markdown("##### 🤝 الحماية الاجتماعية - المواد 86-96")
+        
+        social_protections = [
+            {
+                "obligation": "تعويض إصابات العمل - المادة 86",
+                "details": "إذا أصيب عامل بإصابة عمل أدت إلى وفاته أو ألحقت به ضرراً جسمانياً حال دون استمراره في العمل فعلى صاحب العمل نقل المصاب إلى مستشفى أو أي مركز طبي وتبليغ الجهات الأمنية المختصة بالحادث",
+                "law": "المادة 86"
+            },
+            {
+                "obligation": "مقدار التعويض - المادة 87",
+                "details": "إذا نشأ عن إصابة العمل وفاة العامل أو عجزه الكلي فيستحق على صاحب العمل تعويض يساوي أجر 1500 يوم عمل على أن لا يتجاوز التعويض خمسة آلاف دينار ولا يقل عن ألفي دينار",
+                "law": "المادة 87"
+            }
+        ]
+        
+        for protection in social_protections:
+            with st.expander(f"🤝 {protection['obligation']}"):
+                st.write(f"**التفاصيل:** {protection['details']}")
+                st.write(f"**القانون:** {protection['law']}")
+
+# ==========================
+# 🔍 فحص الحقوق - مدمج ومكتمل
+# ==========================
+def show_enhanced_rights_checker():
+    st.markdown("#### 🔍 المنظومة الشاملة لفحص الحقوق - كاملة")
+    
+    checker_tabs = st.tabs(["الفحص الشامل", "فحص المرأة", "فحص الأحداث", "فحص العقود", "فحص الأجور"])
+    
+    with checker_tabs[0]:
+        _comprehensive_rights_check()
+    
+    with checker_tabs[1]:
+        _women_rights_check()
+    
+    with checker_tabs[2]:
+        _youth_rights_check()
+    
+    with checker_tabs[3]:
+        _contract_check()
+    
+    with checker_tabs[4]:
+        _financial_check()
+
+@st.fragment
+def _comprehensive_rights_check():
+    """الفحص الشامل للحقوق (يُعاد رسمه وحده عند تغيير إجاباته)"""
+    st.markdown("##### ⚡ الفحص الفوري الشامل للحقوق")
+    
+    comprehensive_checks = [
+        "هل فترة التجربة لا تتجاوز 3 أشهر؟ - المادة 25",
+        "هل يصرف راتبك خلال 7 أيام من نهاية الشهر؟ - المادة 55",
+        "هل تحصل على إجازتك السنوية كاملة حسب مدة خدمتك؟ - المادة 57",
+        "هل يوجد عقد عمل مكتوب وموقع من الطرفين؟ - المادة 13",
+        "هل توجد بيئة عمل آمنة وخالية من المخاطر؟ - المادة 79",
+        "هل تحصل على بدل العمل الإضافي (125%)؟ - المادة 54",
+        "هل يتم خصم تأمينات اجتماعية من راتبك؟ - المادة 56",
+        "هل تحصل على إجازة مرضية مدفوعة الأجر؟ - المادة 68",
+        "هل يتم إشعارك قبل الفصل بشهر على الأقل؟ - المادة 29",
+        "هل تحصل على شهادة خدمة عند انتهاء العقد؟ - المادة 31"
+    ]
+    
+    violations = 0
+    results = []
+    
+    for i, check in enumerate(comprehensive_checks):
+        col1, col2, col3 = st.columns([3, 1, 1])
+        with col1:
+            st.write(f"{i+1}. {check}")
+        with col2:
+            answer = st.selectbox("", ["نعم", "لا"], key=f"comp_{i}", label_visibility="collapsed")
+        with col3:
+            if answer == "لا":
+                violations += 1
+                st.error("⚠️")
+                results.append(f"انتهاك: {check}")
+            else:
+                st.success("✅")
+    
+    st.metric("إجمالي الانتهاكات المحتملة", violations)
+    
+    if violations > 0:
+        st.error(f"🚨 هناك {violations} انتهاكات محتملة تحتاج متابعة فورية")
+        with st.expander("تفاصيل الانتهاكات"):
+            for result in results:
+                st.write(f"• {result}")
+    else:
+        st.success("✅ ممتاز! لا توجد انتهاكات واضحة - بيئة عمل متوافقة مع القانون")
+
+@st.fragment
+def _women_rights_check():
+    """فحص حقوق المرأة العاملة (يُعاد رسمه وحده عند تغيير إجاباته)"""
+    st.markdown("##### 👩 فحص حقوق المرأة العاملة")
+    
+    women_checks = [
+        "هل تحصل على إجازة أمومة 10 أسابيع؟ - المادة 70",
+        "هل تحصل على ساعة رضاعة يومية لمدة عام؟ - المادة 72", 
+        "هل يتم حمايتك من الفصل بسبب الحمل أو الأمومة؟ - المادة 71",
+        "هل تتساوى أجورك مع الرجل في العمل متساوي القيمة؟ - المادة 2",
+        "هل يحظر تشغيلك في أعمال شاقة أو خطرة؟ - المادة 73"
+    ]
+    
+    women_violations = 0
+    for i, check in enumerate(women_checks):
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.write(f"{i+1}. {check}")
+        with col2:
+            answer = st.selectbox("", ["نعم", "لا"], key=f"women_{i}", label_visibility="collapsed")
+            if answer == "لا":
+                women_violations += 1
+    
+    st.metric("انتهاكات حقوق المرأة", women_violations)
+    
+    if women_violations > 0:
+        st.warning("يجب التواصل مع مكتب تفتيش العمل المختص")
+
+@st.fragment
+def _youth_rights_check():
+    """فحص حقوق الأحداث (يُعاد رسمه وحده عند تغيير إجاباته)"""
+    st.markdown("##### 👦 فحص حقوق الأحداث")
+    
+    youth_checks = [
+        "هل عمرك 16 سنة أو أكثر؟ - المادة 73",
+        "هل ساعات العمل لا تتجاوز 6 ساعات يومياً؟ - المادة 74",
+        "هل لا تعمل بين الساعة 8 مساءً و6 صباحاً؟ - المادة 75",
+        "هل تحصل على فحوصات طبية دورية؟ - المادة 73",
+        "هل يتم توفير وسائل الحماية الشخصية لك؟ - المادة 80"
+    ]
+    
+    youth_violations = 0
+    for i, check in enumerate(youth_checks):
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.write(f"{i+1}. {check}")
+        with col2:
+            answer = st.selectbox("", ["نعم", "لا"], key=f"youth_{i}", label_visibility="collapsed")
+            if answer == "لا":
+                youth_violations += 1
+    
+    st.metric("انتهاكات حقوق الأحداث", youth_violations)
+
+@st.fragment
+def _contract_check():
+    """فحص العقد والشروط (يُعاد رسمه وحده عند تغيير إجاباته)"""
+    st.markdown("##### 📝 فحص العقد والشروط")
+    
+    contract_checks = [
+        "هل العقد مكتوب باللغة العربية؟ - المادة 13",
+        "هل تحتفظ بنسخة من العقد؟ - المادة 13",
+        "هل تم تحديد مدة العقد بوضوح؟ - المادة 14",
+        "هل تم تحديد الأجر والمزايا بوضوح؟ - المادة 47",
+        "هل تم تحديد ساعات العمل والراحة؟ - المادة 51",
+        "هل تم تحديد مكان العمل؟ - المادة 16",
+        "هل تم ذكر أسباب الفصل المحتملة؟ - المادة 28"
+    ]
+    
+    contract_violations = 0
+    for i, check in enumerate(contract_checks):
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.write(f"{i+1}. {check}")
+        with col2:
+            answer = st.selectbox("", ["نعم", "لا"], key=f"contract_{i}", label_visibility="collapsed")
+            if answer == "لا":
+                contract_violations += 1
+    
+    st.metric("مشاكل في العقد", contract_violations)
+
+@st.fragment
+def _financial_check():
+    """فحص النظام المالي (يُعاد رسمه وحده عند تغيير إجاباته)"""
+    st.markdown("##### 💰 فحص النظام المالي")
+    
+    financial_checks = [
+        "هل يصرف الراتب في الموعد المحدد؟ - المادة 55",
+        "هل تحصل على بدل العمل الإضافي؟ - المادة 54",
+        "هل يتم خصم التأمينات الاجتماعية بشكل صحيح؟ - المادة 56",
+        "هل تحصل على مكافأة نهاية الخدمة عند الاستحقاق؟ - المادة 33",
+        "هل هناك شفافية في الاستقطاعات؟ - المادة 56",
+        "هل يتوافق راتبك مع الحد الأدنى للأجور؟ - المادة 58"
+    ]
+    
+    financial_violations = 0
+    for i, check in enumerate(financial_checks):
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.write(f"{i+1}. {check}")
+        with col2:
+            answer = st.selectbox("", ["نعم", "لا"], key=f"financial_{i}", label_visibility="collapsed")
+            if answer == "لا":
+                financial_violations += 1
+    
+    st.metric("مشاكل مالية", financial_violations)
+
+# ==========================
+# 📝 واجبات العامل - مدمج ومكتمل
+# ==========================
+def show_worker_obligations():
+    st.markdown("#### 📝 واجبات والتزامات العمال - حسب قانون العمل الأردني")
+    
+    obligation_tabs = st.tabs(["الالتزامات الأساسية", "السلوك المهني", "المسؤوليات المالية", "الالتزامات العامة"])
+    
+    with obligation_tabs[0]:
+        st.markdown("##### 📋 الالتزامات الأساسية - المادة 19")
+        
+        basic_obligations = [
+            {
+                "obligation": "تنفيذ العمل المتفق عليه - المادة 19/أ",
+                "details": "تأدية العمل بنفسه وأن يبدل في تأديته عناية الشخص المعتاد",
+                "law": "المادة 19/أ"
+            },
+            {
+                "obligation": "الالتزام بأوامر صاحب العمل - المادة 19/ب",
+                "details": "الالتزام بأوامر صاحب العمل المتعلقة بتنفيذ العمل المتفق عليه وذلك ضمن الحدود التي لا تعرضه للخطر أو تخالف أحكام القوانين المعمول بها أو الآداب العامة",
+                "law": "المادة 19/ب"
+            },
+            {
+                "obligation": "الفحوصات الطبية - المادة 19/د",
+                "details": "الخضوع للفحوصات الطبية التي تقتضي طبيعة العمل ضرورة إجراؤها قبل الالتحاق بالعمل أو بعد ذلك للتحقق من خلوه من الأمراض المعدية والسارية",
+                "law": "المادة 19/د"
+            }
+        ]
+        
+        for obligation in basic_obligations:
+            with st.expander(f"📝 {obligation['obligation']}"):
+                st.write(f"**التفاصيل:** {obligation['details']}")
+                st.write(f"**القانون:** {obligation['law']}")
+    
+    with obligation_tabs[1]:
+        st.markdown("##### 💼 السلوك المهني - المادة 19")
+        
+        professional_conduct = [
+            {
+                "obligation": "المحافظة على أسرار العمل - المادة 19/ب",
+                "details": "المحافظة على أسرار صاحب العمل الصناعية والتجارية وأن لا يفشيها بأي صورة من الصور ولو بعد انقضاء عقد العمل وفقا لما يقتضيه الاتفاق أو العرف",
+                "law": "المادة 19/ب"
+            },
+            {
+                "obligation": "حرص على حفظ الممتلكات - المادة 19/ج",
+                "details": "الحرص على حفظ الأشياء المسلمة إليه لتأدية العمل ومنها أدوات العمل والمواد وسائر اللوازم الخاصة بصاحب العمل",
+                "law": "المادة 19/ج"
+            }
+        ]
+        
+        for conduct in professional_conduct:
+            with st.expander(f"💼 {conduct['obligation']}"):
+                st.write(f"**التفاصيل:** {conduct['details']}")
+                st.write(f"**القانون:** {conduct['law']}")
+    
+    with obligation_tabs[2]:
+        st.markdown("##### 💰 المسؤوليات المالية - المادة 19")
+        
+        financial_responsibilities = [
+            {
+                "obligation": "المسؤولية عن الأضرار - المادة 19",
+                "details": "إذا ثبت أن العامل قد تسبب في فقد أو إتلاف أدوات أو آلات أو منتجات يملكها أو يحوزها صاحب العمل أو كانت في عهدته العامل وكان ذلك ناشئاً عن خطأ العامل أو مخالفته تعليمات صاحب العمل فلصاحب العمل أن يقتطع من أجر العامل قيمة الأشياء المفقودة أو المتلفة أو كلفة إصلاحها",
+                "law": "المادة 19"
+            }
+        ]
+        
+        for responsibility in financial_responsibilities:
+            with st.expander(f"💰 {responsibility['obligation']}"):
+                st.write(f"**التفاصيل:** {responsibility['details']}")
+                st.write(f"**القانون:** {responsibility['law']}")
+    
+    with obligation_tabs[3]:
+        st.markdown("##### 📊 الالتزامات العامة")
+        
+        general_obligations = [
+            "الالتزام بمواعيد العمل الرسمية - المادة 51",
+            "احترام النظام الداخلي للمؤسسة - المادة 28",
+            "استخدام معدات السلامة الموفرة - المادة 80",
+            "الإبلاغ عن أي مخاطر في بيئة العمل - المادة 79",
+            "المحافظة على نظافة ومظهر مكان العمل - المادة 19"
+        ]
+        
+        st.write("**الالتزامات العامة للعامل:**")
+        for obligation in general_obligations:
+            st.write(f"📋 {obligation}")